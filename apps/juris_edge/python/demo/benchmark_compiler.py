@@ -0,0 +1,101 @@
+"""
+Micro-benchmark for closure-compiled DSL programs.
+
+Times the per-call cost of running synthesis-style programs through
+DSLInterpreter.create_program_function against compile_program, plus
+the cost of a ProgramCache lookup compared with compiling afresh.
+Primitive memoization is off by default so the table shows dispatch
+overhead rather than cache hits.
+
+Usage:
+    python demo/benchmark_compiler.py --repeat 2000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable, List
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.core.types import Grid
+from juris_agi.dsl.ast import ASTNode, ComposeNode, LiteralNode, PrimitiveNode
+from juris_agi.dsl.compiler import ProgramCache, compile_program
+from juris_agi.dsl.interpreter import DSLInterpreter
+
+UNARY = ["identity", "reflect_h", "reflect_v", "transpose", "crop_to_content"]
+GRID_SIZES = [3, 10, 30]
+
+
+def make_program(length: int, rng: random.Random) -> ASTNode:
+    """Composition mixing argument-free and literal-argument primitives."""
+    ops: List[ASTNode] = []
+    for _ in range(length):
+        if rng.random() < 0.3:
+            ops.append(PrimitiveNode("rotate90", [LiteralNode(rng.randint(1, 3))]))
+        else:
+            ops.append(PrimitiveNode(rng.choice(UNARY)))
+    return ops[0] if length == 1 else ComposeNode(ops)
+
+
+def _per_call_us(fn: Callable[[Grid], object], grids: List[Grid], repeat: int) -> float:
+    """Mean time per call in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for grid in grids:
+            fn(grid)
+    return (time.perf_counter() - start) / (repeat * len(grids)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="DSL compiler micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=1000, help="Passes over the grid set")
+    parser.add_argument("--grids", type=int, default=5, help="Random grids per size")
+    parser.add_argument("--memoize", action="store_true", help="Route primitives through the memo")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    np_rng = np.random.default_rng(args.seed)
+    interpreter = DSLInterpreter(memoize=args.memoize)
+
+    print(f"{'length':>6} {'size':>6} {'interpret us':>13} {'compiled us':>12} {'speedup':>8}")
+    for length in (1, 2, 4):
+        ast = make_program(length, rng)
+        interpreted = interpreter.create_program_function(ast)
+        compiled = compile_program(ast, memoize=args.memoize)
+        for size in GRID_SIZES:
+            grids = [Grid(np_rng.integers(0, 5, (size, size), dtype=np.int32))
+                     for _ in range(args.grids)]
+            for grid in grids:
+                assert interpreted(grid) == compiled(grid)
+            interpret_us = _per_call_us(interpreted, grids, args.repeat)
+            compiled_us = _per_call_us(compiled, grids, args.repeat)
+            print(f"{length:>6} {size:>4}^2 {interpret_us:>13.2f} {compiled_us:>12.2f} "
+                  f"{interpret_us / compiled_us:>7.2f}x")
+
+    programs = [make_program(4, rng) for _ in range(50)]
+    cache = ProgramCache()
+    for ast in programs:
+        cache.get(ast)
+    start = time.perf_counter()
+    for _ in range(args.repeat // 10 or 1):
+        for ast in programs:
+            compile_program(ast)
+    compile_us = (time.perf_counter() - start) / ((args.repeat // 10 or 1) * len(programs)) * 1e6
+    start = time.perf_counter()
+    for _ in range(args.repeat // 10 or 1):
+        for ast in programs:
+            cache.get(ast)
+    lookup_us = (time.perf_counter() - start) / ((args.repeat // 10 or 1) * len(programs)) * 1e6
+    print(f"compile {compile_us:.1f} us, cache lookup {lookup_us:.1f} us "
+          f"(hit rate {cache.hit_rate:.1%})")
+
+
+if __name__ == "__main__":
+    main()
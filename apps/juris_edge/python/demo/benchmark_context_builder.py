@@ -0,0 +1,231 @@
+"""
+Benchmarks for the context builder on large synthetic evidence contexts.
+
+Measures conflict detection and clustering on contexts where mature
+companies carry hundreds of claims per field (revenue, ARR, ...), and
+claim deduplication / selection on large contexts with many fields,
+comparing each against the quadratic baseline.
+
+Usage:
+    python demo/benchmark_context_builder.py --claims 10000 --select-claims 50000
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Callable
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.context_builder.conflicts import (
+    _are_values_conflicting,
+    _find_conflicting_pairs,
+    cluster_conflicts,
+    detect_conflicts,
+)
+from juris_agi.context_builder.quality import QualityScore, rank_claims_by_quality
+from juris_agi.context_builder.select_claims import (
+    _are_claims_duplicate,
+    _compute_claim_signature,
+    deduplicate_claims,
+    select_claims,
+)
+from juris_agi.evidence_client.types import (
+    Claim,
+    ClaimPolarity,
+    ContextSummary,
+    EvidenceContext,
+)
+
+NUMERIC_FIELDS = [
+    ("traction", "arr"),
+    ("traction", "revenue"),
+    ("traction", "growth_rate"),
+    ("traction", "customers"),
+    ("business_model", "gross_margin"),
+    ("capital_intensity", "burn_rate"),
+    ("capital_intensity", "runway_months"),
+    ("round_terms", "pre_money_valuation"),
+]
+TEXT_FIELDS = [
+    ("market_scope", "segment"),
+    ("team_quality", "founder_background"),
+]
+TEXT_VALUES = [
+    "enterprise software",
+    "enterprise software platform",
+    "consumer marketplace",
+    "repeat founders with prior exit",
+]
+
+
+def make_synthetic_claims(
+    num_claims: int,
+    outlier_rate: float = 0.02,
+    extra_fields: int = 0,
+    seed: int = 0,
+) -> list[Claim]:
+    """
+    Build a synthetic evidence context.
+
+    Numeric claims cluster tightly around a per-field true value, with a
+    small fraction of outliers (stale or misextracted numbers).
+    extra_fields adds per-period KPI fields, as seen for mature companies.
+    """
+    rng = random.Random(seed)
+    numeric_fields = NUMERIC_FIELDS + [
+        ("traction", f"kpi_{k:04d}") for k in range(extra_fields)
+    ]
+    fields = numeric_fields + TEXT_FIELDS
+    true_values = {key: rng.uniform(1e5, 1e7) for key in numeric_fields}
+
+    claims = []
+    for i in range(num_claims):
+        claim_type, field_name = fields[i % len(fields)]
+        if (claim_type, field_name) in true_values:
+            value = true_values[(claim_type, field_name)] * rng.uniform(0.95, 1.05)
+            if rng.random() < outlier_rate:
+                value *= rng.choice([0.3, 0.5, 2.0, 3.0])
+        elif rng.random() < outlier_rate:
+            value = rng.choice(TEXT_VALUES[1:])
+        else:
+            value = TEXT_VALUES[0]
+        claims.append(
+            Claim(
+                claim_id=f"claim_{i:06d}",
+                claim_type=claim_type,
+                field=field_name,
+                value=value,
+                confidence=rng.uniform(0.5, 1.0),
+                polarity=ClaimPolarity.NEUTRAL,
+            )
+        )
+    return claims
+
+
+def _group_claims(claims: list[Claim]) -> list[list[Claim]]:
+    """Group claims by (claim_type, field)."""
+    groups: dict[tuple[str, str], list[Claim]] = {}
+    for claim in claims:
+        groups.setdefault((claim.claim_type, claim.field), []).append(claim)
+    return list(groups.values())
+
+
+def find_pairs_all_pairs(groups: list[list[Claim]], numeric_threshold: float = 0.15) -> int:
+    """Baseline: compare every pair within each group."""
+    count = 0
+    for group in groups:
+        for i, claim1 in enumerate(group):
+            for claim2 in group[i + 1 :]:
+                if _are_values_conflicting(claim1.value, claim2.value, numeric_threshold)[0]:
+                    count += 1
+    return count
+
+
+def find_pairs_sweep(groups: list[list[Claim]], numeric_threshold: float = 0.15) -> int:
+    """Sorted sweep used by detect_conflicts."""
+    return sum(len(_find_conflicting_pairs(group, numeric_threshold)) for group in groups)
+
+
+def deduplicate_claims_linear(
+    claims: list[tuple[Claim, QualityScore]],
+) -> tuple[list[tuple[Claim, QualityScore]], int]:
+    """Baseline: check each claim against every kept claim."""
+    seen_signatures: set[str] = set()
+    result: list[tuple[Claim, QualityScore]] = []
+    duplicates_removed = 0
+    for claim, score in claims:
+        sig = _compute_claim_signature(claim)
+        if sig in seen_signatures or any(
+            _are_claims_duplicate(claim, seen) for seen, _ in result
+        ):
+            duplicates_removed += 1
+            continue
+        seen_signatures.add(sig)
+        result.append((claim, score))
+    return result, duplicates_removed
+
+
+def _timed(fn: Callable[[], object], repeat: int) -> tuple[float, object]:
+    """Best-of-N wall time in seconds, and the last result."""
+    best = float("inf")
+    result = None
+    for _ in range(repeat):
+        start = time.perf_counter()
+        result = fn()
+        best = min(best, time.perf_counter() - start)
+    return best, result
+
+
+def benchmark_conflicts(num_claims: int, repeat: int, seed: int) -> None:
+    """Benchmark detect_conflicts and cluster_conflicts."""
+    claims = make_synthetic_claims(num_claims, seed=seed)
+    groups = _group_claims(claims)
+
+    baseline_s, baseline_count = _timed(lambda: find_pairs_all_pairs(groups), repeat)
+    sweep_s, sweep_count = _timed(lambda: find_pairs_sweep(groups), repeat)
+    detect_s, conflicts = _timed(lambda: detect_conflicts(claims), repeat)
+    cluster_s, clusters = _timed(lambda: cluster_conflicts(conflicts), repeat)
+
+    assert sweep_count == baseline_count, "sweep disagrees with all-pairs baseline"
+
+    print(f"conflicts: {num_claims} claims, {len(conflicts)} conflicts, {len(clusters)} clusters")
+    print(f"  pair search, all pairs   {baseline_s * 1000:10.1f} ms")
+    print(f"  pair search, sweep       {sweep_s * 1000:10.1f} ms")
+    print(f"  detect_conflicts         {detect_s * 1000:10.1f} ms")
+    print(f"  cluster_conflicts        {cluster_s * 1000:10.1f} ms")
+
+
+def benchmark_selection(num_claims: int, repeat: int, seed: int, baseline: bool) -> None:
+    """Benchmark deduplicate_claims and select_claims."""
+    claims = make_synthetic_claims(
+        num_claims, outlier_rate=0.3, extra_fields=num_claims // 50, seed=seed
+    )
+    context = EvidenceContext(
+        context_id="benchmark",
+        deal_id="benchmark",
+        claims=claims,
+        summary=ContextSummary(
+            total_claims=len(claims),
+            claims_by_type={},
+            claims_by_polarity={},
+            avg_confidence=0.75,
+        ),
+    )
+    ranked = rank_claims_by_quality(claims)
+
+    dedup_s, (kept, _) = _timed(lambda: deduplicate_claims(ranked), repeat)
+    select_s, working_set = _timed(lambda: select_claims(context), repeat)
+
+    print(f"selection: {num_claims} claims, {len(kept)} after dedup, "
+          f"{working_set.total_claims} selected")
+    if baseline:
+        baseline_s, (baseline_kept, _) = _timed(lambda: deduplicate_claims_linear(ranked), 1)
+        assert [c.claim_id for c, _ in baseline_kept] == [c.claim_id for c, _ in kept]
+        print(f"  dedup, linear scan       {baseline_s * 1000:10.1f} ms")
+    print(f"  dedup, indexed           {dedup_s * 1000:10.1f} ms")
+    print(f"  select_claims            {select_s * 1000:10.1f} ms")
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Context builder benchmarks")
+    parser.add_argument("--claims", type=int, default=10_000, help="Claims per conflict context")
+    parser.add_argument(
+        "--select-claims", type=int, default=50_000, help="Claims per selection context"
+    )
+    parser.add_argument(
+        "--baseline", action="store_true", help="Also time the linear-scan deduplicator (slow)"
+    )
+    parser.add_argument("--repeat", type=int, default=3, help="Repetitions (best is reported)")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    benchmark_conflicts(args.claims, args.repeat, args.seed)
+    benchmark_selection(args.select_claims, args.repeat, args.seed, args.baseline)
+
+
+if __name__ == "__main__":
+    main()
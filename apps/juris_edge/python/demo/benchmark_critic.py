@@ -0,0 +1,108 @@
+"""
+Benchmark for CPU inference with the neural critic.
+
+Scores batches of beam-style candidate programs against one task and
+compares re-encoding the task on every call (the previous behaviour)
+with the cached task context, optionally with int8 quantization and
+torch.compile. The compiled column includes no warm-up cost; the first
+compiled batch is timed separately.
+
+Usage:
+    python demo/benchmark_critic.py --repeat 20 --compile
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+import warnings
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+import torch
+
+from juris_agi.core.types import ARCPair, ARCTask, Grid
+from juris_agi.cre.critic_neural import NeuralCriticImpl
+from juris_agi.dsl.ast import ASTNode, ComposeNode, LiteralNode, PrimitiveNode
+
+UNARY = ["identity", "reflect_h", "reflect_v", "transpose", "crop_to_content"]
+BATCH_SIZES = [1, 16, 200]
+
+
+def make_programs(count: int, rng: random.Random) -> List[ASTNode]:
+    programs: List[ASTNode] = []
+    for _ in range(count):
+        ops: List[ASTNode] = []
+        for _ in range(rng.randint(2, 5)):
+            if rng.random() < 0.3:
+                ops.append(PrimitiveNode("rotate90", [LiteralNode(rng.randint(1, 3))]))
+            else:
+                ops.append(PrimitiveNode(rng.choice(UNARY)))
+        programs.append(ComposeNode(ops))
+    return programs
+
+
+def make_task(size: int, rng: np.random.Generator) -> ARCTask:
+    pairs = [
+        ARCPair(input=Grid(rng.integers(0, 10, (size, size))),
+                output=Grid(rng.integers(0, 10, (size, size))))
+        for _ in range(4)
+    ]
+    return ARCTask(task_id="bench", train=pairs, test=[])
+
+
+def _per_batch_ms(critic: NeuralCriticImpl, programs: List[ASTNode], task: ARCTask,
+                  repeat: int, cached: bool = True) -> float:
+    """Mean time per score_batch call in milliseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        if not cached:
+            critic.clear_cache()
+        critic.score_batch(programs, task)
+    return (time.perf_counter() - start) / repeat * 1000
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Neural critic CPU inference benchmark")
+    parser.add_argument("--repeat", type=int, default=20, help="Calls per measurement")
+    parser.add_argument("--grid-size", type=int, default=30, help="Task grid side length")
+    parser.add_argument("--compile", action="store_true", help="Also time torch.compile")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+    warnings.filterwarnings("ignore")
+
+    torch.manual_seed(args.seed)
+    task = make_task(args.grid_size, np.random.default_rng(args.seed))
+    programs = make_programs(max(BATCH_SIZES), random.Random(args.seed))
+
+    critic = NeuralCriticImpl(device="cpu")
+    weights = Path(tempfile.gettempdir()) / "benchmark_critic.pt"
+    torch.save(critic.model.state_dict(), weights)
+    variants = {"int8": NeuralCriticImpl(model_path=str(weights), device="cpu", quantize=True)}
+    if args.compile:
+        compiled = NeuralCriticImpl(model_path=str(weights), device="cpu", compile=True)
+        start = time.perf_counter()
+        compiled.score_batch(programs, task)
+        print(f"torch.compile warm-up: {time.perf_counter() - start:.1f}s")
+        variants["compiled"] = compiled
+
+    header = f"{'batch':>6} {'uncached ms':>12} {'cached ms':>10}"
+    header += "".join(f" {name + ' ms':>12}" for name in variants)
+    print(header)
+    for batch in BATCH_SIZES:
+        subset = programs[:batch]
+        row = f"{batch:>6} {_per_batch_ms(critic, subset, task, args.repeat, cached=False):>12.2f} "
+        row += f"{_per_batch_ms(critic, subset, task, args.repeat):>10.2f}"
+        for variant in variants.values():
+            row += f" {_per_batch_ms(variant, subset, task, args.repeat):>12.2f}"
+        print(row)
+
+
+if __name__ == "__main__":
+    main()
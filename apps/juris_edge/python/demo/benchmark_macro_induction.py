@@ -0,0 +1,116 @@
+"""
+Benchmark for trace-based macro induction.
+
+Feeds synthetic solve traces to MacroInducer and compares it with the
+previous counting scheme (string slicing of every final_program and a
+list of occurrences per subprogram), then times a nightly-style run that
+loads saved statistics and processes only the traces written since.
+
+Usage:
+    python demo/benchmark_macro_induction.py --traces 200000 --new 2000
+"""
+
+import argparse
+import random
+import re
+import sys
+import tempfile
+import time
+from collections import Counter
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.mal.macro_induction import MacroInducer
+
+STEPS = ["rotate90(1)", "rotate90(2)", "reflect_h", "reflect_v", "transpose",
+         "recolor(1, 2)", "crop_to_content", "scale(2)", "tile_h(2)", "fill(3)"]
+
+
+def string_slicing_candidates(traces: List[Dict[str, Any]], inducer: MacroInducer) -> int:
+    """Baseline: count subprograms by slicing program strings, per occurrence."""
+    counts: Dict[str, List[Dict[str, Any]]] = {}
+    for trace in traces:
+        if not trace.get("success") or not trace.get("final_program"):
+            continue
+        source = trace["final_program"]
+        tags = inducer._extract_tags_from_trace(trace)
+        subprograms = [source]
+        if " >> " in source:
+            parts = source.split(" >> ")
+            for size in range(inducer.min_length, min(inducer.max_length + 1, len(parts) + 1)):
+                for i in range(len(parts) - size + 1):
+                    subprograms.append(" >> ".join(parts[i:i + size]))
+        subprograms += [m.group(0) for m in re.finditer(r'\b(\w+)\s*\([^)]*\)', source)]
+        for code in subprograms:
+            counts.setdefault(code, []).append({"task_id": trace["task_id"], "tags": tags})
+
+    kept = 0
+    for code, occurrences in counts.items():
+        if len(occurrences) >= inducer.min_frequency:
+            Counter(t for occ in occurrences for t in occ["tags"]).most_common(5)
+            list(dict.fromkeys(occ["task_id"] for occ in occurrences))
+            kept += 1
+    return kept
+
+
+def make_traces(count: int, rng: random.Random) -> List[Dict[str, Any]]:
+    programs = [" >> ".join(rng.choice(STEPS) for _ in range(rng.randint(1, 6)))
+                for _ in range(5000)]
+    traces = []
+    for _ in range(count):
+        dims = rng.choice([([[3, 3]], [[3, 3]]), ([[3, 3]], [[6, 6]]), ([[4, 4]], [[2, 2]])])
+        traces.append({
+            "success": rng.random() < 0.8,
+            "task_id": f"task_{rng.randrange(2000)}",
+            "final_program": rng.choice(programs),
+            "entries": [{"event_type": "task_loaded",
+                         "details": {"input_dims": dims[0], "output_dims": dims[1]}}],
+            "final_metrics": {"exact_match": rng.random() < 0.5},
+        })
+    return traces
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Macro induction benchmark")
+    parser.add_argument("--traces", type=int, default=200000, help="Traces already processed")
+    parser.add_argument("--new", type=int, default=2000, help="Traces since the last run")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    traces = make_traces(args.traces + args.new, random.Random(args.seed))
+    old, new = traces[:args.traces], traces[args.traces:]
+
+    start = time.perf_counter()
+    baseline_kept = string_slicing_candidates(traces, MacroInducer())
+    baseline_s = time.perf_counter() - start
+
+    start = time.perf_counter()
+    inducer = MacroInducer()
+    inducer.process_traces(traces)
+    kept = len(inducer.extract_candidates())
+    full_s = time.perf_counter() - start
+    assert kept == baseline_kept
+
+    with tempfile.TemporaryDirectory() as tmp:
+        state_path = str(Path(tmp) / "induction.json")
+        seeded = MacroInducer(state_path=state_path)
+        seeded.process_traces(old)
+        seeded.extract_candidates()
+        seeded.save()
+
+        start = time.perf_counter()
+        nightly = MacroInducer(state_path=state_path)
+        nightly.process_traces(new)
+        nightly.extract_candidates()
+        nightly.save()
+        incremental_s = time.perf_counter() - start
+
+    print(f"{'traces':>8} {'string slicing s':>17} {'token keys s':>13} {'incremental s':>14} {'candidates':>11}")
+    print(f"{len(traces):>8} {baseline_s:>17.2f} {full_s:>13.2f} {incremental_s:>14.2f} {kept:>11}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,106 @@
+"""
+Benchmark for MAL solution-memory retrieval.
+
+Fills an InMemoryStore (and optionally a PersistentMemoryStore) with
+synthetic solved tasks and times retrieval for new tasks.
+
+Usage:
+    python demo/benchmark_mal_retrieval.py --memories 100000
+"""
+
+import argparse
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.core.types import ARCPair, ARCTask, Grid
+from juris_agi.mal.retrieval import InMemoryStore, PersistentMemoryStore, SolutionMemory
+
+
+def make_task(rng: random.Random, task_id: str) -> ARCTask:
+    """Random ARC-sized task with 1-5 training pairs."""
+
+    def grid() -> Grid:
+        h, w = rng.randint(1, 30), rng.randint(1, 30)
+        return Grid.from_list([[rng.randint(0, 9) for _ in range(w)] for _ in range(h)])
+
+    train = [ARCPair(input=grid(), output=grid()) for _ in range(rng.randint(1, 5))]
+    return ARCTask(task_id=task_id, train=train, test=[])
+
+
+def fill_store(store: InMemoryStore, num_memories: int, seed: int) -> None:
+    """Store synthetic memories, reusing a pool of task feature dicts."""
+    rng = random.Random(seed)
+    pool = [store._extract_features(make_task(rng, f"pool_{i}")) for i in range(2000)]
+    for i in range(num_memories):
+        store.store(SolutionMemory(
+            task_id=f"task_{i:06d}",
+            program=None,
+            program_source=f"program_{i % 97}",
+            task_features=pool[rng.randrange(len(pool))],
+            success=rng.random() < 0.8,
+        ))
+
+
+def time_retrieval(store: InMemoryStore, queries: list[ARCTask], top_k: int) -> tuple[float, float]:
+    """Mean retrieval time and mean index search time, in milliseconds."""
+    features = [store._extract_features(q) for q in queries]
+    store.retrieve(queries[0], top_k)
+
+    start = time.perf_counter()
+    for query in queries:
+        store.retrieve(query, top_k)
+    retrieve_ms = (time.perf_counter() - start) / len(queries) * 1000
+
+    start = time.perf_counter()
+    for feats in features:
+        store._index.search(feats, top_k)
+    search_ms = (time.perf_counter() - start) / len(queries) * 1000
+    return retrieve_ms, search_ms
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="MAL retrieval benchmark")
+    parser.add_argument("--memories", type=int, default=100_000, help="Stored solved tasks")
+    parser.add_argument("--queries", type=int, default=200, help="Retrieval queries")
+    parser.add_argument("--top-k", type=int, default=5, help="Results per query")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    parser.add_argument(
+        "--persistent", action="store_true", help="Also benchmark a reopened PersistentMemoryStore"
+    )
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed + 1)
+    queries = [make_task(rng, f"query_{i}") for i in range(args.queries)]
+
+    store = InMemoryStore()
+    start = time.perf_counter()
+    fill_store(store, args.memories, args.seed)
+    fill_s = time.perf_counter() - start
+    retrieve_ms, search_ms = time_retrieval(store, queries, args.top_k)
+    print(f"InMemoryStore: {args.memories} memories (filled in {fill_s:.1f}s)")
+    print(f"  retrieve (incl. feature extraction) {retrieve_ms:8.3f} ms")
+    print(f"  index search                        {search_ms:8.3f} ms")
+
+    if args.persistent:
+        with tempfile.TemporaryDirectory() as tmpdir:
+            persistent = PersistentMemoryStore(tmpdir)
+            fill_store(persistent, args.memories, args.seed)
+            persistent.close()
+
+            start = time.perf_counter()
+            reopened = PersistentMemoryStore(tmpdir)
+            open_ms = (time.perf_counter() - start) * 1000
+            retrieve_ms, search_ms = time_retrieval(reopened, queries, args.top_k)
+            print(f"PersistentMemoryStore: reopened in {open_ms:.1f} ms")
+            print(f"  retrieve (incl. feature extraction) {retrieve_ms:8.3f} ms")
+            print(f"  index search                        {search_ms:8.3f} ms")
+
+
+if __name__ == "__main__":
+    main()
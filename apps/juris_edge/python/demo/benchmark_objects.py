@@ -0,0 +1,139 @@
+"""
+Micro-benchmark for connected-component object extraction.
+
+Compares the array-based labelling behind extract_connected_objects
+(scipy and NumPy union-find backends) and extract_objects_by_color
+against the pixel-by-pixel BFS they replaced, across ARC grid sizes.
+
+Usage:
+    python demo/benchmark_objects.py --repeat 200
+"""
+
+import argparse
+import sys
+import time
+from collections import deque
+from pathlib import Path
+from typing import Callable, List, Set, Tuple
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.core.types import Grid, GridObject
+from juris_agi.representation import objects
+from juris_agi.representation.objects import (
+    extract_connected_objects,
+    extract_objects_by_color,
+    find_bounding_box,
+)
+
+GRID_SIZES = [3, 10, 20, 30]
+
+
+def extract_connected_objects_bfs(
+    grid: Grid,
+    background_color: int = 0,
+    connectivity: int = 4,
+) -> List[GridObject]:
+    """Baseline: BFS over pixel sets."""
+    height, width = grid.shape
+    visited = np.zeros((height, width), dtype=bool)
+    found: List[GridObject] = []
+    if connectivity == 4:
+        neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1)]
+    else:
+        neighbors = [(dr, dc) for dr in (-1, 0, 1) for dc in (-1, 0, 1) if dr or dc]
+
+    for start_r in range(height):
+        for start_c in range(width):
+            if visited[start_r, start_c]:
+                continue
+            if grid[start_r, start_c] == background_color:
+                visited[start_r, start_c] = True
+                continue
+            component: Set[Tuple[int, int]] = set()
+            queue = deque([(start_r, start_c)])
+            visited[start_r, start_c] = True
+            while queue:
+                r, c = queue.popleft()
+                component.add((r, c))
+                for dr, dc in neighbors:
+                    nr, nc = r + dr, c + dc
+                    if 0 <= nr < height and 0 <= nc < width:
+                        if not visited[nr, nc] and grid[nr, nc] != background_color:
+                            visited[nr, nc] = True
+                            queue.append((nr, nc))
+            bbox = find_bounding_box(component)
+            found.append(GridObject(
+                pixels=frozenset(
+                    (r - bbox.min_row, c - bbox.min_col, int(grid[r, c]))
+                    for r, c in component
+                ),
+                bbox=bbox,
+                object_id=len(found),
+            ))
+    return found
+
+
+def extract_objects_by_color_bfs(grid: Grid, background_color: int = 0) -> List[GridObject]:
+    """Baseline: one BFS pass per color."""
+    found: List[GridObject] = []
+    for color in set(np.unique(grid.data).tolist()) - {background_color}:
+        mask = Grid(np.where(grid.data == color, color, 0))
+        found.extend(extract_connected_objects_bfs(mask))
+    return found
+
+
+def make_grid(size: int, rng: np.random.Generator) -> Grid:
+    """ARC-like grid: a few colors on a mostly-background canvas."""
+    data = rng.integers(1, 5, (size, size), dtype=np.int32)
+    data[rng.random((size, size)) < 0.5] = 0
+    return Grid(data)
+
+
+def _per_call_us(fn: Callable[[Grid], object], grids: List[Grid], repeat: int) -> float:
+    """Mean time per call in microseconds."""
+    start = time.perf_counter()
+    for _ in range(repeat):
+        for grid in grids:
+            fn(grid)
+    return (time.perf_counter() - start) / (repeat * len(grids)) * 1e6
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Object extraction micro-benchmark")
+    parser.add_argument("--repeat", type=int, default=100, help="Passes over the grid set")
+    parser.add_argument("--grids", type=int, default=20, help="Random grids per size")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    has_scipy = objects.HAS_SCIPY
+    print(f"{'size':>6} {'connect':>8} {'bfs us':>10} {'scipy us':>10} {'numpy us':>10}")
+    for size in GRID_SIZES:
+        grids = [make_grid(size, rng) for _ in range(args.grids)]
+        for connectivity in (4, 8):
+            bfs = _per_call_us(
+                lambda g: extract_connected_objects_bfs(g, 0, connectivity), grids, args.repeat
+            )
+            timings = []
+            for backend in (True, False):
+                if backend and not has_scipy:
+                    timings.append(float("nan"))
+                    continue
+                objects.HAS_SCIPY = backend
+                timings.append(_per_call_us(
+                    lambda g: extract_connected_objects(g, 0, connectivity), grids, args.repeat
+                ))
+            objects.HAS_SCIPY = has_scipy
+            print(f"{size:>4}^2 {connectivity:>8} {bfs:>10.1f} {timings[0]:>10.1f} "
+                  f"{timings[1]:>10.1f}")
+        by_color_bfs = _per_call_us(extract_objects_by_color_bfs, grids, args.repeat)
+        by_color = _per_call_us(extract_objects_by_color, grids, args.repeat)
+        print(f"{size:>4}^2 {'color':>8} {by_color_bfs:>10.1f} {'':>10} {by_color:>10.1f}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,100 @@
+"""
+Benchmark for near-miss refinement.
+
+Refines random near-miss programs on synthetic tasks and compares
+RefinementEngine against the previous behaviour (a full SymbolicCritic
+evaluation of every edit, no deduplication or score cache), across grid
+sizes. Both must end with the same refined program.
+
+Usage:
+    python demo/benchmark_refinement.py --tasks 20 --workers 4
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import Iterator, List, Tuple
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.core.types import ARCPair, ARCTask, Grid
+from juris_agi.cre.refinement import EditOperation, RefinementEngine
+from juris_agi.dsl.ast import ASTNode, ComposeNode, LiteralNode, PrimitiveNode
+from juris_agi.dsl.interpreter import make_program
+
+UNARY = ["identity", "reflect_h", "reflect_v", "transpose", "crop_to_content"]
+GRID_SIZES = [5, 15, 30]
+
+
+class FullCriticEngine(RefinementEngine):
+    """Baseline: full critique of every candidate edit, in order."""
+
+    def _select_unseen(self, candidates, seen) -> List[Tuple[EditOperation, ASTNode]]:
+        return candidates[:self.max_edits_per_iteration]
+
+    def _iter_scores(self, programs, task) -> Iterator[Tuple[bool, float]]:
+        for program in programs:
+            critique = self.critic.evaluate(program, task)
+            yield critique.is_certified, self._compute_score(critique)
+
+
+def make_program_ast(length: int, rng: random.Random) -> ASTNode:
+    """Random composition of synthesis-style primitives."""
+    ops: List[ASTNode] = []
+    for _ in range(length):
+        if rng.random() < 0.3:
+            ops.append(PrimitiveNode("rotate90", [LiteralNode(rng.randint(1, 3))]))
+        else:
+            ops.append(PrimitiveNode(rng.choice(UNARY)))
+    return ops[0] if length == 1 else ComposeNode(ops)
+
+
+def make_task(size: int, rng: random.Random) -> ARCTask:
+    """Task generated by a random program, so edits can reach it."""
+    target = make_program(make_program_ast(rng.randint(1, 3), rng))
+    np_rng = np.random.default_rng(rng.randrange(2**32))
+    pairs = []
+    for _ in range(3):
+        data = np_rng.integers(1, 5, (size, size), dtype=np.int32)
+        data[np_rng.random((size, size)) < 0.5] = 0
+        pairs.append(ARCPair(input=Grid(data), output=target(Grid(data))))
+    return ARCTask(task_id=f"bench_{size}", train=pairs, test=[])
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Refinement benchmark")
+    parser.add_argument("--tasks", type=int, default=20, help="Tasks per grid size")
+    parser.add_argument("--workers", type=int, default=1, help="Worker processes for scoring")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    print(f"{'size':>6} {'full critic ms':>15} {'engine ms':>10} {'speedup':>8} {'solved':>7}")
+    for size in GRID_SIZES:
+        cases = [(make_task(size, rng), make_program_ast(rng.randint(1, 3), rng))
+                 for _ in range(args.tasks)]
+        baseline = FullCriticEngine()
+        engine = RefinementEngine(max_workers=args.workers)
+
+        start = time.perf_counter()
+        expected = [baseline.refine(program, task) for task, program in cases]
+        baseline_ms = (time.perf_counter() - start) / len(cases) * 1000
+
+        start = time.perf_counter()
+        results = [engine.refine(program, task) for task, program in cases]
+        engine_ms = (time.perf_counter() - start) / len(cases) * 1000
+
+        for old, new in zip(expected, results):
+            assert (old.refined_program, old.new_score) == (new.refined_program, new.new_score)
+        solved = sum(r.success for r in results)
+        print(f"{size:>4}^2 {baseline_ms:>15.1f} {engine_ms:>10.1f} "
+              f"{baseline_ms / engine_ms:>7.1f}x {solved:>4}/{len(cases)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,103 @@
+"""
+Benchmark for counterfactual robustness checking.
+
+Checks a set of candidate programs against one task three ways:
+a fresh counterfactual suite per program (what a per-program
+check_robustness call does), one suite shared through check_programs,
+and the shared suite with a pass threshold so testing stops once each
+verdict is settled.
+
+Usage:
+    python demo/benchmark_robustness.py --programs 20 --tests 20
+"""
+
+import argparse
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.core.types import ARCPair, ARCTask, Grid
+from juris_agi.dsl.ast import ASTNode, ComposeNode, PrimitiveNode
+from juris_agi.wme.counterfactuals import (
+    GridPerturbationGenerator,
+    StructuralCounterfactualGenerator,
+)
+from juris_agi.wme.robustness import RobustnessChecker
+
+UNARY = ["identity", "reflect_h", "reflect_v", "transpose", "crop_to_content"]
+GRID_SIZES = [5, 15, 30]
+
+
+def make_checker(tests: int, seed: int, **kwargs) -> RobustnessChecker:
+    return RobustnessChecker(
+        generators=[GridPerturbationGenerator(seed=seed), StructuralCounterfactualGenerator(seed=seed)],
+        num_tests_per_generator=tests,
+        **kwargs,
+    )
+
+
+def make_task(size: int, rng: np.random.Generator) -> ARCTask:
+    pairs = []
+    for _ in range(3):
+        data = rng.integers(1, 5, (size, size), dtype=np.int32)
+        data[rng.random((size, size)) < 0.5] = 0
+        pairs.append(ARCPair(input=Grid(data), output=Grid(data.T.copy())))
+    return ARCTask(task_id=f"bench_{size}", train=pairs, test=[])
+
+
+def make_programs(count: int, rng: np.random.Generator) -> List[ASTNode]:
+    return [
+        ComposeNode([PrimitiveNode(str(name)) for name in rng.choice(UNARY, size=2)])
+        for _ in range(count)
+    ]
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Robustness checking benchmark")
+    parser.add_argument("--programs", type=int, default=20, help="Candidate programs per task")
+    parser.add_argument("--tests", type=int, default=20, help="Counterfactuals per generator and pair")
+    parser.add_argument("--threshold", type=float, default=0.5, help="Pass threshold for early exit")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = np.random.default_rng(args.seed)
+    print(f"{'size':>6} {'per-program ms':>15} {'shared ms':>10} {'early-exit ms':>14} "
+          f"{'tests run':>10} {'agree':>6}")
+    for size in GRID_SIZES:
+        task = make_task(size, rng)
+        programs = make_programs(args.programs, rng)
+
+        checker = make_checker(args.tests, args.seed)
+        start = time.perf_counter()
+        for program in programs:
+            checker.check_robustness(program, task)
+        separate_ms = (time.perf_counter() - start) * 1000
+
+        start = time.perf_counter()
+        shared = make_checker(args.tests, args.seed).check_programs(programs, task)
+        shared_ms = (time.perf_counter() - start) * 1000
+
+        early_checker = make_checker(args.tests, args.seed, pass_threshold=args.threshold,
+                                     confidence=0.95)
+        start = time.perf_counter()
+        early = early_checker.check_programs(programs, task)
+        early_ms = (time.perf_counter() - start) * 1000
+
+        agree = sum(
+            quick.analysis["verdict"] == ("pass" if full.overall_score >= args.threshold else "fail")
+            for full, quick in zip(shared, early)
+        )
+        run = sum(r.num_tests for r in early)
+        total = sum(r.num_tests for r in shared)
+        print(f"{size:>4}^2 {separate_ms:>15.1f} {shared_ms:>10.1f} {early_ms:>14.1f} "
+              f"{run:>5}/{total} {agree:>3}/{len(programs)}")
+
+
+if __name__ == "__main__":
+    main()
@@ -0,0 +1,90 @@
+"""
+Benchmark for the shared task-feature context.
+
+Runs the task analyses a solve performs (regime, difficulty, WME
+analysis, memory retrieval features, macro tags and the constraint
+extraction behind synthesis) on random tasks, with the shared
+TaskFeatureCache disabled and enabled, and reports the feature lookups
+served from the context.
+
+Usage:
+    python demo/benchmark_task_features.py --tasks 200 --size 20
+"""
+
+import argparse
+import random
+import sys
+import time
+from pathlib import Path
+from typing import List
+
+import numpy as np
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.controller.refusal import RefusalChecker
+from juris_agi.controller.router import determine_regime
+from juris_agi.core.metrics import extract_constraints_from_task
+from juris_agi.core.types import ARCPair, ARCTask, Grid
+from juris_agi.mal.retrieval import InMemoryStore, extract_task_tags
+from juris_agi.representation.task_context import get_task_feature_cache
+from juris_agi.wme.world_model import HeuristicWorldModel
+
+
+def make_tasks(count: int, size: int, rng: random.Random) -> List[ARCTask]:
+    def grid() -> Grid:
+        data = np.array([[rng.choice([0, 0, 0, 1, 2, 3]) for _ in range(size)] for _ in range(size)])
+        return Grid(data)
+
+    return [
+        ARCTask(
+            task_id=f"task_{i}",
+            train=[ARCPair(grid(), grid()) for _ in range(3)],
+            test=[ARCPair(grid(), grid())],
+        )
+        for i in range(count)
+    ]
+
+
+def analyze(tasks: List[ARCTask]) -> float:
+    world_model, store, checker = HeuristicWorldModel(), InMemoryStore(), RefusalChecker()
+    start = time.perf_counter()
+    for task in tasks:
+        determine_regime(task)
+        checker.estimate_difficulty(task)
+        world_model.analyze_task(task)
+        store._extract_features(task)
+        extract_task_tags(task)
+        extract_constraints_from_task(task)
+        # Synthesis and the controller ask again later in the solve
+        extract_constraints_from_task(task)
+        determine_regime(task)
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Task feature cache benchmark")
+    parser.add_argument("--tasks", type=int, default=200, help="Tasks to analyze")
+    parser.add_argument("--size", type=int, default=20, help="Grid height and width")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    tasks = make_tasks(args.tasks, args.size, random.Random(args.seed))
+    cache = get_task_feature_cache()
+
+    cache.enabled = False
+    uncached_s = analyze(tasks)
+
+    cache.enabled = True
+    cache.clear()
+    cached_s = analyze(tasks)
+    stats = cache.stats()
+
+    print(f"{'tasks':>6} {'uncached s':>11} {'shared s':>9} {'feature hits':>13} {'feature misses':>15}")
+    print(f"{len(tasks):>6} {uncached_s:>11.2f} {cached_s:>9.2f} "
+          f"{stats['feature_hits']:>13} {stats['feature_misses']:>15}")
+
+
+if __name__ == "__main__":
+    main()
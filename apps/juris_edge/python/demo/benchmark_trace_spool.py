@@ -0,0 +1,97 @@
+"""
+Benchmark for streaming trace serialization.
+
+Logs a synthesis-heavy trace (one candidate_scored event per evaluated
+candidate) and compares the previous path, with every entry in memory
+and the trace dumped as indented JSON, against spooled traces written
+as compact JSONL, with per-candidate events kept and sampled.
+
+Usage:
+    python demo/benchmark_trace_spool.py --candidates 100000
+"""
+
+import argparse
+import json
+import sys
+import tempfile
+import time
+import tracemalloc
+from pathlib import Path
+from typing import Callable, Optional, Tuple
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.core.trace import JSONLTraceWriter, SolveTrace, TraceEntry
+from juris_agi.core.trace_spool import TraceLevel, TracePolicy
+
+
+def log_candidates(trace: SolveTrace, candidates: int) -> None:
+    """Log a solve the way the synthesizer does, one event per candidate."""
+    trace.log("task_loaded", "cre", num_train_pairs=3, input_dims=[[10, 10]] * 3)
+    for i in range(candidates):
+        if trace.should_log("candidate_scored"):
+            trace.add_entry(TraceEntry.now(
+                "candidate_scored", "cre",
+                program=f"rotate90({i % 4}) >> recolor({i % 10}, {(i + 1) % 10})",
+                score=round(50.0 - i % 97 * 0.5, 2), depth=i % 4,
+            ))
+    trace.finalize(success=True, program="rotate90(1)")
+
+
+def measure(run: Callable[[], Path]) -> Tuple[float, float, int]:
+    """Seconds, peak traced memory in MB (from a second run) and output size in bytes."""
+    start = time.perf_counter()
+    path = run()
+    seconds = time.perf_counter() - start
+    size = path.stat().st_size
+    path.unlink()
+    tracemalloc.start()
+    run().unlink()
+    _, peak = tracemalloc.get_traced_memory()
+    tracemalloc.stop()
+    return seconds, peak / 1e6, size
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Trace serialization benchmark")
+    parser.add_argument("--candidates", type=int, default=100000, help="Candidates scored per solve")
+    parser.add_argument("--sample", type=int, default=10, help="Keep 1 in N candidate events")
+    args = parser.parse_args()
+
+    with tempfile.TemporaryDirectory() as tmp:
+        def in_memory() -> Path:
+            trace = SolveTrace.start("bench")
+            log_candidates(trace, args.candidates)
+            path = Path(tmp) / "bench.json"
+            with open(path, "w") as f:
+                json.dump(trace.to_dict(), f, indent=2)
+            return path
+
+        def spooled(policy: Optional[TracePolicy]) -> Callable[[], Path]:
+            def run() -> Path:
+                writer = JSONLTraceWriter(tmp)
+                trace = writer.start_trace("bench", policy)
+                log_candidates(trace, args.candidates)
+                path = writer.write_trace(trace, session_id="bench")
+                trace.close()
+                Path(f"{path}.idx").unlink()
+                return path
+            return run
+
+        rows = [
+            ("in memory, indented", measure(in_memory)),
+            ("spooled, debug", measure(spooled(TracePolicy(TraceLevel.DEBUG)))),
+            (f"spooled, 1 in {args.sample}", measure(spooled(TracePolicy(
+                TraceLevel.DEBUG, sample_every={"candidate_scored": args.sample},
+            )))),
+            ("spooled, info", measure(spooled(None))),
+        ]
+
+    print(f"{'mode':<22} {'seconds':>8} {'peak MB':>8} {'file MB':>8}")
+    for mode, (seconds, peak_mb, size) in rows:
+        print(f"{mode:<22} {seconds:>8.2f} {peak_mb:>8.1f} {size / 1e6:>8.1f}")
+
+
+if __name__ == "__main__":
+    main()
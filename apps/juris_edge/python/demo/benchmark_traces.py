@@ -0,0 +1,106 @@
+"""
+Benchmark for reading JSONL trace archives.
+
+Writes a synthetic archive of solve traces and compares the previous
+reader, which parsed every line of every file, with the indexed reader
+for successful-program extraction, a single-task lookup and an
+incremental read of newly appended traces. With zstandard installed the
+archive is also compressed and read back.
+
+Usage:
+    python demo/benchmark_traces.py --traces 20000 --entries 30
+"""
+
+import argparse
+import json
+import random
+import sys
+import tempfile
+import time
+from pathlib import Path
+from typing import Any, Dict, List
+
+PROJECT_ROOT = Path(__file__).parent.parent
+sys.path.insert(0, str(PROJECT_ROOT))
+
+from juris_agi.core.trace import JSONLTraceReader, JSONLTraceWriter, SolveTrace
+from juris_agi.core.trace_index import ZSTD_AVAILABLE, session_key
+
+SESSIONS = 10
+
+
+def full_parse(trace_dir: Path) -> List[Dict[str, Any]]:
+    """Baseline: parse every line of every trace file."""
+    traces = []
+    for path in sorted(trace_dir.glob("traces_*.jsonl")):
+        with open(path) as f:
+            for line in f:
+                if line.strip():
+                    traces.append(json.loads(line))
+    return traces
+
+
+def make_trace(i: int, entries: int, rng: random.Random) -> SolveTrace:
+    trace = SolveTrace.start(f"task_{i % 400:04d}")
+    for step in range(entries):
+        trace.log("synthesis", "cre", step=step, program=f"candidate_{rng.randrange(10**6)}",
+                  score=rng.random())
+    trace.finalize(success=rng.random() < 0.1, program=f"program_{i}")
+    return trace
+
+
+def _seconds(fn) -> float:
+    start = time.perf_counter()
+    fn()
+    return time.perf_counter() - start
+
+
+def main() -> None:
+    parser = argparse.ArgumentParser(description="Trace archive reading benchmark")
+    parser.add_argument("--traces", type=int, default=20000, help="Traces in the archive")
+    parser.add_argument("--entries", type=int, default=30, help="Log entries per trace")
+    parser.add_argument("--seed", type=int, default=0, help="Random seed")
+    args = parser.parse_args()
+
+    rng = random.Random(args.seed)
+    with tempfile.TemporaryDirectory() as tmp:
+        trace_dir = Path(tmp)
+        writer = JSONLTraceWriter(str(trace_dir))
+        per_session = args.traces // SESSIONS
+        for s in range(SESSIONS):
+            writer.write_traces([make_trace(s * per_session + i, args.entries, rng)
+                                 for i in range(per_session)], session_id=f"{s:03d}")
+        size_mb = sum(p.stat().st_size for p in trace_dir.glob("*.jsonl")) / 2**20
+
+        reader = JSONLTraceReader(str(trace_dir))
+        _, cursor = reader.read_since()
+        writer.write_traces([make_trace(i, args.entries, rng) for i in range(100)], session_id="new")
+
+        rows = [
+            ("successful programs",
+             lambda: [t for t in full_parse(trace_dir) if t["success"]],
+             lambda: reader.get_successful_programs()),
+            ("one task",
+             lambda: [t for t in full_parse(trace_dir) if t["task_id"] == "task_0007"],
+             lambda: list(reader.query(task_id="task_0007"))),
+            ("100 new traces",
+             lambda: full_parse(trace_dir)[-100:],
+             lambda: reader.read_since(cursor)),
+        ]
+        print(f"archive: {args.traces} traces, {size_mb:.1f} MB")
+        print(f"{'read':>22} {'full parse ms':>14} {'indexed ms':>11}")
+        for label, baseline, indexed in rows:
+            print(f"{label:>22} {_seconds(baseline) * 1000:>14.1f} {_seconds(indexed) * 1000:>11.1f}")
+
+        if ZSTD_AVAILABLE:
+            for path in reader.list_trace_files():
+                writer.compress_session(session_key(path)[len("traces_"):])
+            zst_mb = sum(p.stat().st_size for p in trace_dir.glob("*.zst")) / 2**20
+            print(f"\ncompressed: {zst_mb:.1f} MB")
+            for label, indexed in [("successful programs", reader.get_successful_programs),
+                                   ("one task", lambda: list(reader.query(task_id="task_0007")))]:
+                print(f"{label:>22} {'':>14} {_seconds(indexed) * 1000:>11.1f}")
+
+
+if __name__ == "__main__":
+    main()
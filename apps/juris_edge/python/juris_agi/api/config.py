@@ -16,12 +16,16 @@ class APIConfig:
 
     # Redis
     redis_url: str = "redis://localhost:6379/0"
-    redis_max_connections: int = 10
+    redis_max_connections: int = 10  # Shared pool for request handlers
+    redis_stream_max_connections: int = 100  # Pool for SSE streams, each holds one while waiting
+    redis_timeout_seconds: float = 2.0  # Per Redis call, and pool checkout wait
 
     # Job settings
     job_timeout_seconds: int = 600  # 10 minutes max
     job_ttl_seconds: int = 3600  # Keep results for 1 hour
     max_pending_jobs: int = 1000
+    job_events_max: int = 1000  # Approximate cap on each job's event stream
+    sse_keepalive_seconds: int = 15  # Idle time before an SSE keep-alive comment
 
     # Storage
     storage_backend: str = "local"  # "local" or "s3"
@@ -50,9 +54,13 @@ class APIConfig:
             debug=os.getenv("JURIS_DEBUG", "false").lower() == "true",
             redis_url=os.getenv("REDIS_URL", "redis://localhost:6379/0"),
             redis_max_connections=int(os.getenv("REDIS_MAX_CONNECTIONS", "10")),
+            redis_stream_max_connections=int(os.getenv("REDIS_STREAM_MAX_CONNECTIONS", "100")),
+            redis_timeout_seconds=float(os.getenv("REDIS_TIMEOUT_SECONDS", "2.0")),
             job_timeout_seconds=int(os.getenv("JOB_TIMEOUT_SECONDS", "600")),
             job_ttl_seconds=int(os.getenv("JOB_TTL_SECONDS", "3600")),
             max_pending_jobs=int(os.getenv("MAX_PENDING_JOBS", "1000")),
+            job_events_max=int(os.getenv("JOB_EVENTS_MAX", "1000")),
+            sse_keepalive_seconds=int(os.getenv("SSE_KEEPALIVE_SECONDS", "15")),
             storage_backend=os.getenv("STORAGE_BACKEND", "local"),
             storage_local_path=os.getenv("STORAGE_LOCAL_PATH", "/tmp/juris_storage"),
             s3_bucket=os.getenv("S3_BUCKET"),
@@ -83,6 +91,9 @@ class WorkerConfig:
     job_timeout_seconds: int = 600
     health_check_interval: int = 30
 
+    # Job state
+    job_events_max: int = 1000  # Approximate cap on each job's event stream
+
     # Storage
     storage_backend: str = "local"  # "local" or "s3"
     storage_local_path: str = "/tmp/juris_storage"
@@ -103,6 +114,15 @@ class WorkerConfig:
     # Device
     device: str = "auto"  # "auto", "cuda", "cpu"
 
+    # CPU inference
+    neural_on_cpu: bool = False  # Load neural models even without a GPU
+    quantize_models: bool = False  # Dynamic int8 quantization on CPU
+    compile_models: bool = False  # torch.compile model inference
+
+    # Job execution
+    warm_start: bool = True  # Reuse models, registry, storage and Redis pool across jobs
+    fork_jobs: bool = True  # Run each job in a forked RQ work-horse (False: in-process)
+
     @classmethod
     def from_env(cls) -> "WorkerConfig":
         """Load configuration from environment variables."""
@@ -114,6 +134,7 @@ class WorkerConfig:
             max_concurrent_jobs=int(os.getenv("MAX_CONCURRENT_JOBS", "1")),
             job_timeout_seconds=int(os.getenv("JOB_TIMEOUT_SECONDS", "600")),
             health_check_interval=int(os.getenv("HEALTH_CHECK_INTERVAL", "30")),
+            job_events_max=int(os.getenv("JOB_EVENTS_MAX", "1000")),
             storage_backend=os.getenv("STORAGE_BACKEND", "local"),
             storage_local_path=os.getenv("STORAGE_LOCAL_PATH", "/tmp/juris_storage"),
             s3_bucket=os.getenv("S3_BUCKET"),
@@ -126,4 +147,9 @@ class WorkerConfig:
             sketcher_model_path=os.getenv("SKETCHER_MODEL_PATH"),
             critic_model_path=os.getenv("CRITIC_MODEL_PATH"),
             device=os.getenv("DEVICE", "auto"),
+            neural_on_cpu=os.getenv("NEURAL_ON_CPU", "false").lower() == "true",
+            quantize_models=os.getenv("QUANTIZE_MODELS", "false").lower() == "true",
+            compile_models=os.getenv("COMPILE_MODELS", "false").lower() == "true",
+            warm_start=os.getenv("WORKER_WARM_START", "true").lower() == "true",
+            fork_jobs=os.getenv("WORKER_FORK_JOBS", "true").lower() == "true",
         )
@@ -0,0 +1,353 @@
+"""
+Job state and progress events for solve and VC jobs.
+
+In Redis each job is a hash under juris:job:{id} (juris:vcjob:{id} for
+VC jobs) holding one JSON-encoded value per field, so a status update
+writes only the fields that changed. Progress events are appended to a
+Redis stream at juris:job:{id}:events; readers follow it by stream ID,
+which the server also uses as the SSE event id. Large payloads
+(predictions, traces) are kept in artifact storage and the hash holds
+their storage keys.
+
+MemoryJobStore offers the same interface for standalone mode. The API
+server uses the asyncio counterparts, AsyncRedisJobStore (with per-call
+timeouts and latency metrics) and AsyncMemoryJobStore.
+"""
+
+import asyncio
+import json
+import threading
+import time
+import uuid
+from datetime import datetime
+from typing import Any, Awaitable, Dict, Iterable, List, Optional, Tuple
+
+JOB_PREFIX = "juris:job:"
+VC_JOB_PREFIX = "juris:vcjob:"
+EVENTS_SUFFIX = ":events"
+
+# Statuses after which a job gets no further updates
+TERMINAL_STATUSES = frozenset({"completed", "failed", "timeout"})
+
+StreamEvent = Tuple[str, Dict[str, Any]]
+
+
+def make_event(
+    event_type: str,
+    data: Optional[Dict[str, Any]] = None,
+    message: Optional[str] = None,
+) -> Dict[str, Any]:
+    """A job event in the same shape as VCJobEvent."""
+    return {
+        "event_id": f"evt_{uuid.uuid4().hex[:8]}",
+        "event_type": event_type,
+        "timestamp": datetime.utcnow().isoformat(),
+        "data": data or {},
+        "message": message,
+    }
+
+
+def encode_fields(fields: Dict[str, Any]) -> Dict[str, str]:
+    """JSON-encode each value for storage as a hash field."""
+    return {name: json.dumps(value, default=str) for name, value in fields.items()}
+
+
+def decode_fields(raw: Dict[str, str]) -> Dict[str, Any]:
+    return {name: json.loads(value) for name, value in raw.items()}
+
+
+def _decode_stream(response: Any) -> List[StreamEvent]:
+    """Events from an XREAD reply for a single stream."""
+    if not response:
+        return []
+    _, entries = response[0]
+    return [(stream_id, json.loads(values["event"])) for stream_id, values in entries]
+
+
+class _RedisKeys:
+    """Key layout and settings shared by the Redis job stores."""
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = JOB_PREFIX,
+        ttl_seconds: int = 3600,
+        max_events: int = 1000,
+    ):
+        self.client = client
+        self.prefix = prefix
+        self.ttl_seconds = ttl_seconds
+        self.max_events = max_events
+
+    def key(self, job_id: str) -> str:
+        return f"{self.prefix}{job_id}"
+
+    def events_key(self, job_id: str) -> str:
+        return f"{self.prefix}{job_id}{EVENTS_SUFFIX}"
+
+
+class RedisJobStore(_RedisKeys):
+    """
+    Job hashes and event streams in Redis.
+
+    Args:
+        client: Redis client created with decode_responses=True
+        prefix: Key prefix, JOB_PREFIX or VC_JOB_PREFIX
+        ttl_seconds: Expiry refreshed on every write
+        max_events: Approximate cap on each job's event stream
+    """
+
+    def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Store a new job, replacing any job with the same ID."""
+        pipe = self.client.pipeline()
+        pipe.delete(self.key(job_id), self.events_key(job_id))
+        pipe.hset(self.key(job_id), mapping=encode_fields(fields))
+        pipe.expire(self.key(job_id), self.ttl_seconds)
+        pipe.execute()
+
+    def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        """Write the given fields, leaving the rest of the job untouched."""
+        if not fields:
+            return
+        pipe = self.client.pipeline()
+        pipe.hset(self.key(job_id), mapping=encode_fields(fields))
+        pipe.expire(self.key(job_id), self.ttl_seconds)
+        pipe.execute()
+
+    def get(self, job_id: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        """
+        Fields of a job, or None if it does not exist.
+
+        Args:
+            job_id: Job to read
+            fields: Only read these fields (all when None); missing ones
+                are left out of the result
+        """
+        if fields is None:
+            raw = self.client.hgetall(self.key(job_id))
+            return decode_fields(raw) if raw else None
+
+        fields = list(fields)
+        pipe = self.client.pipeline()
+        pipe.hmget(self.key(job_id), fields)
+        pipe.exists(self.key(job_id))
+        values, exists = pipe.execute()
+        if not exists:
+            return None
+        return decode_fields({
+            name: value for name, value in zip(fields, values) if value is not None
+        })
+
+    def append_event(self, job_id: str, event: Dict[str, Any]) -> str:
+        """Append an event to the job's stream and return its stream ID."""
+        pipe = self.client.pipeline()
+        pipe.xadd(
+            self.events_key(job_id),
+            {"event": json.dumps(event, default=str)},
+            maxlen=self.max_events,
+            approximate=True,
+        )
+        pipe.expire(self.events_key(job_id), self.ttl_seconds)
+        stream_id, _ = pipe.execute()
+        return stream_id
+
+    def read_events(
+        self,
+        job_id: str,
+        after: str = "0",
+        block_ms: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> List[StreamEvent]:
+        """
+        Events after the given stream ID, oldest first.
+
+        With block_ms, waits up to that long for new events when there
+        are none yet; returns an empty list on timeout.
+        """
+        return _decode_stream(self.client.xread(
+            {self.events_key(job_id): after or "0"}, count=count, block=block_ms,
+        ))
+
+
+class AsyncRedisJobStore(_RedisKeys):
+    """
+    RedisJobStore for redis.asyncio clients.
+
+    Each operation is one round trip (writes are pipelined) and is
+    bounded by timeout seconds, plus block_ms for blocking event reads.
+
+    Args:
+        client: redis.asyncio client created with decode_responses=True
+        prefix: Key prefix, JOB_PREFIX or VC_JOB_PREFIX
+        ttl_seconds: Expiry refreshed on every write
+        max_events: Approximate cap on each job's event stream
+        timeout: Seconds allowed per operation (None waits indefinitely)
+        metrics: LatencyMetrics recording each operation's latency
+    """
+
+    def __init__(
+        self,
+        client: Any,
+        prefix: str = JOB_PREFIX,
+        ttl_seconds: int = 3600,
+        max_events: int = 1000,
+        timeout: Optional[float] = None,
+        metrics: Optional[Any] = None,
+    ):
+        super().__init__(client, prefix, ttl_seconds, max_events)
+        self.timeout = timeout
+        self.metrics = metrics
+
+    async def _call(self, operation: str, awaitable: Awaitable, timeout: Optional[float] = None) -> Any:
+        timeout = self.timeout if timeout is None else timeout
+        if self.metrics is None:
+            return await asyncio.wait_for(awaitable, timeout)
+        return await self.metrics.timed(operation, awaitable, timeout)
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        pipe = self.client.pipeline()
+        pipe.delete(self.key(job_id), self.events_key(job_id))
+        pipe.hset(self.key(job_id), mapping=encode_fields(fields))
+        pipe.expire(self.key(job_id), self.ttl_seconds)
+        await self._call("job_create", pipe.execute())
+
+    async def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        if not fields:
+            return
+        pipe = self.client.pipeline()
+        pipe.hset(self.key(job_id), mapping=encode_fields(fields))
+        pipe.expire(self.key(job_id), self.ttl_seconds)
+        await self._call("job_update", pipe.execute())
+
+    async def get(self, job_id: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        if fields is None:
+            raw = await self._call("job_get", self.client.hgetall(self.key(job_id)))
+            return decode_fields(raw) if raw else None
+
+        fields = list(fields)
+        pipe = self.client.pipeline(transaction=False)
+        pipe.hmget(self.key(job_id), fields)
+        pipe.exists(self.key(job_id))
+        values, exists = await self._call("job_get", pipe.execute())
+        if not exists:
+            return None
+        return decode_fields({
+            name: value for name, value in zip(fields, values) if value is not None
+        })
+
+    async def append_event(self, job_id: str, event: Dict[str, Any]) -> str:
+        pipe = self.client.pipeline()
+        pipe.xadd(
+            self.events_key(job_id),
+            {"event": json.dumps(event, default=str)},
+            maxlen=self.max_events,
+            approximate=True,
+        )
+        pipe.expire(self.events_key(job_id), self.ttl_seconds)
+        stream_id, _ = await self._call("event_append", pipe.execute())
+        return stream_id
+
+    async def read_events(
+        self,
+        job_id: str,
+        after: str = "0",
+        block_ms: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> List[StreamEvent]:
+        timeout = self.timeout
+        if block_ms is not None and timeout is not None:
+            timeout += block_ms / 1000
+        response = await self._call(
+            "event_read",
+            self.client.xread({self.events_key(job_id): after or "0"}, count=count, block=block_ms),
+            timeout,
+        )
+        return _decode_stream(response)
+
+
+class MemoryJobStore:
+    """In-process job store with the RedisJobStore interface (no expiry)."""
+
+    def __init__(self, max_events: int = 1000):
+        self.max_events = max_events
+        self._jobs: Dict[str, Dict[str, Any]] = {}
+        self._events: Dict[str, List[StreamEvent]] = {}
+        self._sequence = 0
+        self._changed = threading.Condition()
+
+    def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        with self._changed:
+            self._jobs[job_id] = dict(fields)
+            self._events[job_id] = []
+
+    def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        with self._changed:
+            self._jobs.setdefault(job_id, {}).update(fields)
+
+    def get(self, job_id: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        job = self._jobs.get(job_id)
+        if job is None:
+            return None
+        if fields is None:
+            return dict(job)
+        return {name: job[name] for name in fields if name in job}
+
+    def append_event(self, job_id: str, event: Dict[str, Any]) -> str:
+        with self._changed:
+            self._sequence += 1
+            stream_id = f"{self._sequence}-0"
+            events = self._events.setdefault(job_id, [])
+            events.append((stream_id, event))
+            del events[:-self.max_events]
+            self._changed.notify_all()
+        return stream_id
+
+    def read_events(
+        self,
+        job_id: str,
+        after: str = "0",
+        block_ms: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> List[StreamEvent]:
+        after_seq = int((after or "0").split("-")[0])
+        deadline = time.monotonic() + (block_ms or 0) / 1000
+        with self._changed:
+            while True:
+                new = [
+                    (stream_id, event) for stream_id, event in self._events.get(job_id, [])
+                    if int(stream_id.split("-")[0]) > after_seq
+                ]
+                remaining = deadline - time.monotonic()
+                if new or block_ms is None or remaining <= 0:
+                    return new[:count] if count else new
+                self._changed.wait(remaining)
+
+
+class AsyncMemoryJobStore:
+    """Asyncio interface to a MemoryJobStore; blocking event reads wait in a thread."""
+
+    def __init__(self, store: Optional[MemoryJobStore] = None):
+        self.store = store or MemoryJobStore()
+
+    async def create(self, job_id: str, fields: Dict[str, Any]) -> None:
+        self.store.create(job_id, fields)
+
+    async def update(self, job_id: str, fields: Dict[str, Any]) -> None:
+        self.store.update(job_id, fields)
+
+    async def get(self, job_id: str, fields: Optional[Iterable[str]] = None) -> Optional[Dict[str, Any]]:
+        return self.store.get(job_id, fields)
+
+    async def append_event(self, job_id: str, event: Dict[str, Any]) -> str:
+        return self.store.append_event(job_id, event)
+
+    async def read_events(
+        self,
+        job_id: str,
+        after: str = "0",
+        block_ms: Optional[int] = None,
+        count: Optional[int] = None,
+    ) -> List[StreamEvent]:
+        if block_ms is None:
+            return self.store.read_events(job_id, after, None, count)
+        return await asyncio.to_thread(self.store.read_events, job_id, after, block_ms, count)
@@ -34,6 +34,8 @@ from .models import (
     BudgetConfig,
 )
 from .local_config import get_local_config, LocalPoCConfig, is_local_poc_mode
+from .job_store import JOB_PREFIX, RedisJobStore, make_event
+from ..core.storage import StorageClient, StorageConfig
 
 # Evidence extraction models
 from pydantic import BaseModel, Field
@@ -63,6 +65,10 @@ _jobs: Dict[str, Dict[str, Any]] = {}
 # Global state
 _redis_client = None
 _job_queue = None
+_storage_client: Optional[StorageClient] = None
+
+# Seconds queued jobs are kept in Redis
+JOB_TTL_SECONDS = 3600
 
 
 def get_redis():
@@ -101,6 +107,31 @@ def get_queue():
     return _job_queue
 
 
+def get_job_store() -> Optional[RedisJobStore]:
+    """Job hashes shared with the worker, or None without Redis."""
+    redis_client = get_redis()
+    if redis_client is None:
+        return None
+    return RedisJobStore(redis_client, JOB_PREFIX, JOB_TTL_SECONDS)
+
+
+def get_storage() -> StorageClient:
+    """Artifact storage the worker saves queued job results and traces to."""
+    global _storage_client
+    if _storage_client is None:
+        _storage_client = StorageClient(StorageConfig.from_env())
+    return _storage_client
+
+
+def _load_artifact(key: str) -> Optional[Dict[str, Any]]:
+    """Load a JSON artifact referenced by a job, or None if unavailable."""
+    try:
+        return get_storage().backend.get_json(key)
+    except Exception as e:
+        logger.warning(f"Failed to load artifact {key}: {e}")
+        return None
+
+
 @asynccontextmanager
 async def lifespan(app: FastAPI):
     """Application lifespan handler."""
@@ -244,16 +275,13 @@ async def solve_task(request: SolveRequest):
         )
     else:
         # Async mode - queue job
-        redis_client = get_redis()
+        store = get_job_store()
         queue = get_queue()
 
-        if redis_client and queue:
+        if store and queue:
             try:
-                redis_client.setex(
-                    f"juris:job:{job_id}",
-                    3600,
-                    json.dumps(job_data),
-                )
+                store.create(job_id, job_data)
+                store.append_event(job_id, make_event("job_queued", {"status": JobStatus.PENDING.value}))
                 queue.enqueue(
                     "juris_agi.api.worker.process_job",
                     job_id,
@@ -291,14 +319,12 @@ async def get_job(
     job_data = None
 
     # Check Redis first
-    redis_client = get_redis()
-    if redis_client:
+    store = get_job_store()
+    if store:
         try:
-            raw = redis_client.get(f"juris:job:{job_id}")
-            if raw:
-                job_data = json.loads(raw)
-        except Exception:
-            pass
+            job_data = store.get(job_id)
+        except Exception as e:
+            logger.error(f"Failed to fetch job: {e}")
 
     # Check in-memory storage
     if job_data is None:
@@ -327,14 +353,17 @@ async def get_job(
         result_url=job_data.get("result_url"),
     )
 
-    # Add predictions
-    if "predictions" in job_data:
-        for i, pred in enumerate(job_data["predictions"]):
-            result.predictions.append(PredictionResult(
-                test_index=i,
-                prediction=GridData(data=pred["data"]),
-                confidence=pred.get("confidence", 0.0),
-            ))
+    # Add predictions; queued jobs keep them in the worker's result artifact
+    predictions = job_data.get("predictions")
+    if predictions is None and job_data.get("result_key"):
+        artifact = _load_artifact(job_data["result_key"])
+        predictions = artifact.get("predictions") if artifact else None
+    for i, pred in enumerate(predictions or []):
+        result.predictions.append(PredictionResult(
+            test_index=i,
+            prediction=GridData(data=pred["data"]),
+            confidence=pred.get("confidence", 0.0),
+        ))
 
     # Include trace data if requested
     if include_trace and job_data.get("trace_path"):
@@ -343,6 +372,8 @@ async def get_job(
                 result.trace_data = json.load(f)
         except Exception:
             pass
+    elif include_trace and job_data.get("trace_key"):
+        result.trace_data = _load_artifact(job_data["trace_key"])
 
     return result
 
@@ -0,0 +1,103 @@
+"""
+Latency histograms for the API server.
+
+Histograms have fixed buckets and render in the Prometheus text
+exposition format, so GET /metrics can be scraped without adding a
+metrics client dependency.
+"""
+
+import asyncio
+import time
+from bisect import bisect_left
+from dataclasses import dataclass, field
+from typing import Any, Awaitable, Dict, List, Optional, Tuple
+
+# Upper bounds in seconds; slower observations land in the +Inf bucket
+DEFAULT_BUCKETS = (0.0005, 0.001, 0.0025, 0.005, 0.01, 0.025, 0.05, 0.1, 0.25, 0.5, 1.0, 2.5, 5.0)
+
+
+@dataclass
+class LatencyHistogram:
+    """Counts of observations per bucket, with their total."""
+    buckets: Tuple[float, ...] = DEFAULT_BUCKETS
+    counts: List[int] = field(default_factory=list)  # Per bucket, last is +Inf
+    count: int = 0
+    total: float = 0.0
+
+    def __post_init__(self):
+        if not self.counts:
+            self.counts = [0] * (len(self.buckets) + 1)
+
+    def observe(self, seconds: float) -> None:
+        self.counts[bisect_left(self.buckets, seconds)] += 1
+        self.count += 1
+        self.total += seconds
+
+    def cumulative(self) -> List[int]:
+        """Observations at or below each bucket bound, ending with +Inf."""
+        running, result = 0, []
+        for n in self.counts:
+            running += n
+            result.append(running)
+        return result
+
+
+class LatencyMetrics:
+    """
+    Latency histograms keyed by operation and outcome ("ok" or "error").
+
+    Args:
+        name: Metric name, e.g. juris_redis_call_seconds
+        description: HELP text
+        buckets: Bucket upper bounds in seconds
+    """
+
+    def __init__(self, name: str, description: str, buckets: Tuple[float, ...] = DEFAULT_BUCKETS):
+        self.name = name
+        self.description = description
+        self.buckets = tuple(buckets)
+        self._histograms: Dict[Tuple[str, str], LatencyHistogram] = {}
+
+    def observe(self, operation: str, seconds: float, error: bool = False) -> None:
+        key = (operation, "error" if error else "ok")
+        histogram = self._histograms.get(key)
+        if histogram is None:
+            histogram = self._histograms[key] = LatencyHistogram(self.buckets)
+        histogram.observe(seconds)
+
+    async def timed(self, operation: str, awaitable: Awaitable, timeout: Optional[float] = None) -> Any:
+        """
+        Await with an optional timeout, recording the latency.
+
+        Failures and timeouts are recorded with outcome "error" and
+        re-raised (asyncio.TimeoutError for timeouts).
+        """
+        start = time.perf_counter()
+        failed = True
+        try:
+            result = await asyncio.wait_for(awaitable, timeout)
+            failed = False
+            return result
+        finally:
+            self.observe(operation, time.perf_counter() - start, error=failed)
+
+    def histogram(self, operation: str, error: bool = False) -> Optional[LatencyHistogram]:
+        return self._histograms.get((operation, "error" if error else "ok"))
+
+    def reset(self) -> None:
+        self._histograms.clear()
+
+    def render(self) -> str:
+        """The histograms in Prometheus text exposition format."""
+        lines = [
+            f"# HELP {self.name} {self.description}",
+            f"# TYPE {self.name} histogram",
+        ]
+        bounds = [repr(b) for b in self.buckets] + ["+Inf"]
+        for (operation, outcome), histogram in sorted(self._histograms.items()):
+            labels = f'operation="{operation}",outcome="{outcome}"'
+            for bound, n in zip(bounds, histogram.cumulative()):
+                lines.append(f'{self.name}_bucket{{{labels},le="{bound}"}} {n}')
+            lines.append(f"{self.name}_sum{{{labels}}} {histogram.total}")
+            lines.append(f"{self.name}_count{{{labels}}} {histogram.count}")
+        return "\n".join(lines) + "\n"
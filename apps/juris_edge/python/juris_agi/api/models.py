@@ -135,6 +135,9 @@ class JobResult(BaseModel):
     started_at: Optional[datetime] = None
     completed_at: Optional[datetime] = None
     runtime_seconds: Optional[float] = None
+    setup_seconds: Optional[float] = Field(
+        default=None, description="Worker setup time charged to this job (0 when warm)"
+    )
 
     # Result
     success: bool = False
@@ -4,20 +4,28 @@ FastAPI server for JURIS-AGI cloud deployment.
 Endpoints:
 - POST /solve : Submit a task for solving
 - GET /jobs/{job_id} : Get job status and results
+- GET /jobs/{job_id}/events/stream : Server-sent job progress events
 - GET /health : Health check
+- GET /metrics : Redis call latency histograms (Prometheus text format)
+
+Redis is used through a shared redis.asyncio connection pool, so slow
+Redis calls wait without blocking the event loop; each call has a
+timeout and its latency is recorded for /metrics.
 """
 
+import asyncio
 import json
 import logging
 import os
 import uuid
 from contextlib import asynccontextmanager
 from datetime import datetime
-from typing import Optional
+from typing import Any, Dict, Optional, Union
 
-from fastapi import FastAPI, HTTPException, BackgroundTasks, Query
+from fastapi import FastAPI, HTTPException, BackgroundTasks, Header, Query
+from fastapi.concurrency import run_in_threadpool
 from fastapi.middleware.cors import CORSMiddleware
-from fastapi.responses import JSONResponse
+from fastapi.responses import JSONResponse, PlainTextResponse, StreamingResponse
 
 from .models import (
     SolveRequest,
@@ -37,15 +45,28 @@ from .vc_models import (
     VCJobEvent,
 )
 from .config import APIConfig
+from .job_store import (
+    JOB_PREFIX,
+    TERMINAL_STATUSES,
+    VC_JOB_PREFIX,
+    AsyncMemoryJobStore,
+    AsyncRedisJobStore,
+    MemoryJobStore,
+    make_event,
+)
+from .metrics import LatencyMetrics
+from ..core.storage import StorageClient, StorageConfig
 
 # Optional Redis import
 try:
     import redis
+    import redis.asyncio as aioredis
     from rq import Queue
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
     redis = None
+    aioredis = None
     Queue = None
 
 # Check for PyTorch
@@ -60,10 +81,27 @@ except ImportError:
 # Logger
 logger = logging.getLogger(__name__)
 
+PRIORITY_QUEUES = ("juris_high", "juris_default", "juris_low")
+
 # Global state
 _config: Optional[APIConfig] = None
-_redis_client: Optional["redis.Redis"] = None
-_job_queue: Optional["Queue"] = None
+_redis_client: Optional["aioredis.Redis"] = None
+_redis_stream_client: Optional["aioredis.Redis"] = None
+# Serialize pool creation so concurrent first requests share one pool
+_redis_lock = asyncio.Lock()
+_redis_stream_lock = asyncio.Lock()
+_rq_connection: Optional["redis.Redis"] = None
+_storage_client: Optional[StorageClient] = None
+
+# Job stores for standalone mode (lost on restart), keyed by prefix
+_memory_job_stores: Dict[str, AsyncMemoryJobStore] = {}
+
+# Latency of every Redis call made by this process
+redis_metrics = LatencyMetrics(
+    "juris_redis_call_seconds", "Latency of Redis calls made by the API server",
+)
+
+JobStore = Union[AsyncRedisJobStore, AsyncMemoryJobStore]
 
 
 def get_config() -> APIConfig:
@@ -74,32 +112,147 @@ def get_config() -> APIConfig:
     return _config
 
 
-def get_redis() -> Optional["redis.Redis"]:
-    """Get Redis client."""
+async def _connect(max_connections: int) -> Optional["aioredis.Redis"]:
+    """Client on a new connection pool, or None if Redis does not answer."""
+    config = get_config()
+    # Requests wait up to the call timeout for a free connection instead of failing
+    pool = aioredis.BlockingConnectionPool.from_url(
+        config.redis_url,
+        max_connections=max_connections,
+        timeout=config.redis_timeout_seconds,
+        decode_responses=True,
+    )
+    client = aioredis.Redis(connection_pool=pool)
+    try:
+        await redis_metrics.timed("ping", client.ping(), config.redis_timeout_seconds)
+        return client
+    except Exception as e:
+        logger.warning(f"Failed to connect to Redis: {e}")
+        await client.aclose()
+        await pool.disconnect()
+        return None
+
+
+async def get_redis() -> Optional["aioredis.Redis"]:
+    """Get the shared asyncio Redis client, or None in standalone mode."""
     global _redis_client
     if _redis_client is None and REDIS_AVAILABLE:
-        config = get_config()
-        try:
-            _redis_client = redis.from_url(
-                config.redis_url,
-                max_connections=config.redis_max_connections,
-                decode_responses=True,
-            )
-            _redis_client.ping()
-        except Exception as e:
-            logger.warning(f"Failed to connect to Redis: {e}")
-            _redis_client = None
+        async with _redis_lock:
+            if _redis_client is None:
+                _redis_client = await _connect(get_config().redis_max_connections)
     return _redis_client
 
 
-def get_queue() -> Optional["Queue"]:
-    """Get RQ job queue."""
-    global _job_queue
-    if _job_queue is None and REDIS_AVAILABLE:
-        redis_client = get_redis()
-        if redis_client:
-            _job_queue = Queue("juris_default", connection=redis_client)
-    return _job_queue
+async def get_redis_stream() -> Optional["aioredis.Redis"]:
+    """
+    Get the Redis client for SSE streams.
+
+    Blocking stream reads hold a connection for up to the keep-alive
+    interval, so they use their own pool and cannot starve handlers.
+    """
+    global _redis_stream_client
+    if _redis_stream_client is None and await get_redis() is not None:
+        async with _redis_stream_lock:
+            if _redis_stream_client is None:
+                _redis_stream_client = await _connect(get_config().redis_stream_max_connections)
+    return _redis_stream_client
+
+
+def get_queue(name: str = "juris_default") -> Optional["Queue"]:
+    """
+    Get an RQ job queue.
+
+    RQ needs a synchronous connection (without decoded responses), so
+    enqueueing uses its own client and runs in the threadpool.
+    """
+    global _rq_connection
+    if not REDIS_AVAILABLE:
+        return None
+    if _rq_connection is None:
+        config = get_config()
+        _rq_connection = redis.from_url(
+            config.redis_url,
+            max_connections=config.redis_max_connections,
+            socket_timeout=config.redis_timeout_seconds,
+            socket_connect_timeout=config.redis_timeout_seconds,
+        )
+    return Queue(name, connection=_rq_connection)
+
+
+async def _enqueue(queue_name: str, function: str, job_id: str) -> None:
+    """Enqueue an RQ job without blocking the event loop."""
+    config = get_config()
+    queue = get_queue(queue_name)
+    await redis_metrics.timed(
+        "enqueue",
+        run_in_threadpool(queue.enqueue, function, job_id, job_timeout=config.job_timeout_seconds),
+        config.redis_timeout_seconds,
+    )
+
+
+async def get_job_store(prefix: str = JOB_PREFIX, streaming: bool = False) -> JobStore:
+    """
+    Store for solve or VC (VC_JOB_PREFIX) jobs: Redis when connected, else in memory.
+
+    Args:
+        prefix: JOB_PREFIX or VC_JOB_PREFIX
+        streaming: Use the SSE stream pool for blocking event reads
+    """
+    config = get_config()
+    redis_client = await (get_redis_stream() if streaming else get_redis())
+    if redis_client:
+        return AsyncRedisJobStore(
+            redis_client, prefix, config.job_ttl_seconds, config.job_events_max,
+            timeout=config.redis_timeout_seconds, metrics=redis_metrics,
+        )
+    if prefix not in _memory_job_stores:
+        _memory_job_stores[prefix] = AsyncMemoryJobStore(MemoryJobStore(config.job_events_max))
+    return _memory_job_stores[prefix]
+
+
+def get_storage() -> StorageClient:
+    """Get the artifact storage client holding job results and traces."""
+    global _storage_client
+    if _storage_client is None:
+        config = get_config()
+        _storage_client = StorageClient(StorageConfig(
+            backend=config.storage_backend,
+            local_path=config.storage_local_path,
+            s3_bucket=config.s3_bucket,
+            s3_endpoint=config.s3_endpoint,
+            s3_region=config.s3_region or "us-east-1",
+            s3_access_key=config.s3_access_key,
+            s3_secret_key=config.s3_secret_key,
+            presigned_url_expiry=config.presigned_url_expiry,
+        ))
+    return _storage_client
+
+
+async def _load_artifact(key: str) -> Optional[Dict[str, Any]]:
+    """
+    Load a JSON artifact referenced by a job, or None if unavailable.
+
+    Storage reads block (disk or S3), so they run in the threadpool.
+    """
+    try:
+        return await run_in_threadpool(get_storage().backend.get_json, key)
+    except Exception as e:
+        logger.warning(f"Failed to load artifact {key}: {e}")
+        return None
+
+
+async def close_redis() -> None:
+    """Close the Redis clients and their connection pools."""
+    global _redis_client, _redis_stream_client, _rq_connection, _redis_lock, _redis_stream_lock
+    for client in (_redis_client, _redis_stream_client):
+        if client is not None:
+            await client.aclose()
+            await client.connection_pool.disconnect()
+    if _rq_connection is not None:
+        _rq_connection.close()
+    _redis_client = _redis_stream_client = _rq_connection = None
+    # The next event loop gets fresh locks
+    _redis_lock, _redis_stream_lock = asyncio.Lock(), asyncio.Lock()
 
 
 @asynccontextmanager
@@ -109,12 +262,13 @@ async def lifespan(app: FastAPI):
     logger.info("Starting JURIS-AGI API server...")
     config = get_config()
 
-    # Create trace storage directory
-    os.makedirs(config.trace_storage_path, exist_ok=True)
+    # Create artifact storage directory
+    if config.storage_backend == "local":
+        os.makedirs(config.storage_local_path, exist_ok=True)
 
     # Initialize Redis connection
     if REDIS_AVAILABLE:
-        redis_client = get_redis()
+        redis_client = await get_redis()
         if redis_client:
             logger.info("Connected to Redis")
         else:
@@ -128,10 +282,7 @@ async def lifespan(app: FastAPI):
 
     # Shutdown
     logger.info("Shutting down JURIS-AGI API server...")
-    global _redis_client
-    if _redis_client:
-        _redis_client.close()
-        _redis_client = None
+    await close_redis()
 
 
 def create_app(config: Optional[APIConfig] = None) -> FastAPI:
@@ -175,7 +326,7 @@ async def health_check():
     Returns the status of the API server and its dependencies.
     """
     config = get_config()
-    redis_client = get_redis()
+    redis_client = await get_redis()
 
     # Check Redis connection
     redis_connected = False
@@ -184,12 +335,17 @@ async def health_check():
 
     if redis_client:
         try:
-            redis_client.ping()
+            # Count workers and pending jobs in one round trip
+            pipe = redis_client.pipeline(transaction=False)
+            pipe.get("juris:worker_count")
+            for name in PRIORITY_QUEUES:
+                pipe.llen(f"rq:queue:{name}")
+            worker_count, *queue_lengths = await redis_metrics.timed(
+                "health", pipe.execute(), config.redis_timeout_seconds,
+            )
             redis_connected = True
-
-            # Count workers and pending jobs
-            worker_count = int(redis_client.get("juris:worker_count") or 0)
-            pending_jobs = int(redis_client.llen("rq:queue:juris_default") or 0)
+            worker_count = int(worker_count or 0)
+            pending_jobs = sum(int(n or 0) for n in queue_lengths)
         except Exception:
             redis_connected = False
 
@@ -204,6 +360,16 @@ async def health_check():
     )
 
 
+@app.get("/metrics", response_class=PlainTextResponse, tags=["Health"])
+async def get_metrics():
+    """
+    Latency histograms of Redis calls, by operation and outcome.
+
+    Served in the Prometheus text exposition format.
+    """
+    return PlainTextResponse(redis_metrics.render(), media_type="text/plain; version=0.0.4")
+
+
 @app.post("/solve", response_model=SolveResponse, tags=["Solve"])
 async def submit_solve_request(
     request: SolveRequest,
@@ -215,8 +381,8 @@ async def submit_solve_request(
 
     Returns a job ID that can be used to check the status and retrieve results.
     """
-    config = get_config()
-    redis_client = get_redis()
+    redis_client = await get_redis()
+    store = await get_job_store()
 
     # Generate job ID
     job_id = f"job_{uuid.uuid4().hex[:12]}"
@@ -238,32 +404,19 @@ async def submit_solve_request(
     if redis_client:
         # Store job in Redis
         try:
-            redis_client.setex(
-                f"juris:job:{job_id}",
-                config.job_ttl_seconds,
-                json.dumps(job_data),
-            )
+            await store.create(job_id, job_data)
+            await store.append_event(job_id, make_event("job_queued", {"status": JobStatus.PENDING.value}))
 
             # Enqueue job
-            queue = get_queue()
-            if queue:
-                queue_name = f"juris_{priority}"
-                priority_queue = Queue(queue_name, connection=redis_client)
-                priority_queue.enqueue(
-                    "juris_agi.api.worker.process_job",
-                    job_id,
-                    job_timeout=config.job_timeout_seconds,
-                )
+            await _enqueue(f"juris_{priority}", "juris_agi.api.worker.process_job", job_id)
         except Exception as e:
             logger.error(f"Failed to enqueue job: {e}")
             raise HTTPException(status_code=503, detail="Failed to enqueue job")
     else:
         # Run synchronously in standalone mode
-        background_tasks.add_task(run_job_sync, job_id, job_data)
-        # Store in memory (simple dict, lost on restart)
-        if not hasattr(app.state, "jobs"):
-            app.state.jobs = {}
-        app.state.jobs[job_id] = job_data
+        await store.create(job_id, job_data)
+        await store.append_event(job_id, make_event("job_queued", {"status": JobStatus.PENDING.value}))
+        background_tasks.add_task(run_job_sync, job_id, store.store)
 
     # Estimate completion time based on budget
     estimated_time = min(
@@ -289,22 +442,12 @@ async def get_job_result(
 
     Returns the current status, and if completed, the predictions and program.
     """
-    config = get_config()
-    redis_client = get_redis()
-
     job_data = None
 
-    if redis_client:
-        try:
-            raw_data = redis_client.get(f"juris:job:{job_id}")
-            if raw_data:
-                job_data = json.loads(raw_data)
-        except Exception as e:
-            logger.error(f"Failed to fetch job: {e}")
-
-    # Fallback to in-memory storage
-    if job_data is None and hasattr(app.state, "jobs"):
-        job_data = app.state.jobs.get(job_id)
+    try:
+        job_data = await (await get_job_store()).get(job_id)
+    except Exception as e:
+        logger.error(f"Failed to fetch job: {e}")
 
     if job_data is None:
         raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
@@ -320,6 +463,7 @@ async def get_job_result(
         started_at=datetime.fromisoformat(job_data["started_at"]) if job_data.get("started_at") else None,
         completed_at=datetime.fromisoformat(job_data["completed_at"]) if job_data.get("completed_at") else None,
         runtime_seconds=job_data.get("runtime_seconds"),
+        setup_seconds=job_data.get("setup_seconds"),
         success=job_data.get("success", False),
         program=job_data.get("program"),
         robustness_score=job_data.get("robustness_score"),
@@ -330,26 +474,38 @@ async def get_job_result(
         result_url=job_data.get("result_url"),
     )
 
-    # Add predictions
-    if "predictions" in job_data:
-        for i, pred in enumerate(job_data["predictions"]):
-            result.predictions.append(PredictionResult(
-                test_index=i,
-                prediction=GridData(data=pred["data"]),
-                confidence=pred.get("confidence", 0.0),
-            ))
+    # Add predictions, kept in the result artifact unless stored inline
+    predictions = job_data.get("predictions")
+    if predictions is None and job_data.get("result_key"):
+        artifact = await _load_artifact(job_data["result_key"])
+        predictions = artifact.get("predictions") if artifact else None
+    for i, pred in enumerate(predictions or []):
+        result.predictions.append(PredictionResult(
+            test_index=i,
+            prediction=GridData(data=pred["data"]),
+            confidence=pred.get("confidence", 0.0),
+        ))
 
     # Include trace data if requested
-    if include_trace and job_data.get("trace_path"):
-        try:
-            with open(job_data["trace_path"]) as f:
-                result.trace_data = json.load(f)
-        except Exception:
-            pass
+    if include_trace and job_data.get("trace_key"):
+        result.trace_data = await _load_artifact(job_data["trace_key"])
 
     return result
 
 
+@app.get("/jobs/{job_id}/events/stream", tags=["Jobs"])
+async def stream_job_events(
+    job_id: str,
+    last_event_id: Optional[str] = Header(default=None),
+):
+    """
+    Stream progress events for a solve job as server-sent events.
+
+    See _event_stream for the event format and reconnection.
+    """
+    return await _event_stream(await get_job_store(streaming=True), job_id, last_event_id)
+
+
 @app.delete("/jobs/{job_id}", tags=["Jobs"])
 async def cancel_job(job_id: str):
     """
@@ -357,28 +513,27 @@ async def cancel_job(job_id: str):
 
     Returns success if the job was cancelled.
     """
-    redis_client = get_redis()
+    redis_client = await get_redis()
 
     if redis_client:
         try:
-            raw_data = redis_client.get(f"juris:job:{job_id}")
-            if not raw_data:
+            store = await get_job_store()
+            job_data = await store.get(job_id, ["status"])
+            if job_data is None:
                 raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
 
-            job_data = json.loads(raw_data)
             if job_data.get("status") in [JobStatus.COMPLETED.value, JobStatus.FAILED.value]:
                 raise HTTPException(status_code=400, detail="Cannot cancel completed job")
 
             # Mark as failed/cancelled
-            job_data["status"] = JobStatus.FAILED.value
-            job_data["error_message"] = "Cancelled by user"
-            job_data["completed_at"] = datetime.utcnow().isoformat()
-
-            redis_client.setex(
-                f"juris:job:{job_id}",
-                get_config().job_ttl_seconds,
-                json.dumps(job_data),
-            )
+            await store.update(job_id, {
+                "status": JobStatus.FAILED.value,
+                "error_message": "Cancelled by user",
+                "completed_at": datetime.utcnow().isoformat(),
+            })
+            await store.append_event(job_id, make_event(
+                "job_cancelled", {"status": JobStatus.FAILED.value}, "Cancelled by user",
+            ))
 
             return {"message": f"Job {job_id} cancelled"}
         except HTTPException:
@@ -390,15 +545,53 @@ async def cancel_job(job_id: str):
     raise HTTPException(status_code=503, detail="Redis not available")
 
 
+async def _event_stream(store: JobStore, job_id: str, last_event_id: Optional[str]) -> StreamingResponse:
+    """
+    Server-sent events for a job's event stream.
+
+    Each event is sent with its stream ID as the SSE id and its
+    event_type as the SSE event name, so a client reconnecting with
+    Last-Event-ID resumes where it left off. The response ends after the
+    event that puts the job in a terminal status; while the job is idle
+    a keep-alive comment is sent every sse_keepalive_seconds. Waiting
+    for events holds one connection from the stream pool per open stream.
+    """
+    if await store.get(job_id, ["status"]) is None:
+        raise HTTPException(status_code=404, detail=f"Job {job_id} not found")
+    block_ms = get_config().sse_keepalive_seconds * 1000
+
+    async def events():
+        after = last_event_id or "0"
+        while True:
+            batch = await store.read_events(job_id, after, block_ms)
+            if not batch:
+                job_data = await store.get(job_id, ["status"])
+                if job_data is None or job_data.get("status") in TERMINAL_STATUSES:
+                    return
+                yield ": keep-alive\n\n"
+                continue
+            for stream_id, event in batch:
+                after = stream_id
+                yield (
+                    f"id: {stream_id}\n"
+                    f"event: {event['event_type']}\n"
+                    f"data: {json.dumps(event, default=str)}\n\n"
+                )
+            if batch[-1][1].get("data", {}).get("status") in TERMINAL_STATUSES:
+                return
+
+    return StreamingResponse(
+        events(),
+        media_type="text/event-stream",
+        headers={"Cache-Control": "no-cache", "X-Accel-Buffering": "no"},
+    )
+
+
 # =============================================================================
 # VC Decision Endpoints
 # =============================================================================
 
 
-# In-memory storage for VC jobs (standalone mode)
-_vc_jobs: dict[str, dict] = {}
-
-
 @app.post("/vc/solve", response_model=VCSolveResponse, tags=["VC Decision"])
 async def submit_vc_solve_request(
     request: VCSolveRequest,
@@ -423,7 +616,7 @@ async def submit_vc_solve_request(
     job_id = f"vcjob_{uuid.uuid4().hex[:12]}"
     created_at = datetime.utcnow()
 
-    # Create job data
+    # Create job data; events go to the job's event stream
     job_data = {
         "job_id": job_id,
         "status": VCJobStatus.PENDING.value,
@@ -435,34 +628,24 @@ async def submit_vc_solve_request(
         "historical_decisions": request.historical_decisions,
         "include_trace": request.include_trace,
         "include_events": request.include_events,
-        "events": [],
     }
 
-    redis_client = get_redis()
+    redis_client = await get_redis()
+    store = await get_job_store(VC_JOB_PREFIX)
 
     if redis_client:
         # Store job in Redis
         try:
-            redis_client.setex(
-                f"juris:vcjob:{job_id}",
-                get_config().job_ttl_seconds,
-                json.dumps(job_data),
-            )
+            await store.create(job_id, job_data)
             # Enqueue job for processing
-            queue = get_queue()
-            if queue:
-                queue.enqueue(
-                    "juris_agi.api.worker.process_vc_job",
-                    job_id,
-                    job_timeout=get_config().job_timeout_seconds,
-                )
+            await _enqueue("juris_default", "juris_agi.api.worker.process_vc_job", job_id)
         except Exception as e:
             logger.error(f"Failed to enqueue VC job: {e}")
             raise HTTPException(status_code=503, detail="Failed to enqueue job")
     else:
         # Run synchronously in standalone mode
-        _vc_jobs[job_id] = job_data
-        background_tasks.add_task(run_vc_job_sync, job_id, job_data)
+        await store.create(job_id, job_data)
+        background_tasks.add_task(run_vc_job_sync, job_id, store.store)
 
     return VCSolveResponse(
         job_id=job_id,
@@ -483,7 +666,7 @@ async def get_vc_job_result(
 
     Returns the decision, policies, uncertainty analysis, and events.
     """
-    job_data = await _get_vc_job_data(job_id)
+    job_data = await _get_vc_job_data(job_id, include_trace=include_trace)
 
     # Build response from job data
     result = VCJobResult(
@@ -574,6 +757,22 @@ async def get_vc_job_events(job_id: str):
     return {"job_id": job_id, "events": events}
 
 
+@app.get("/vc/jobs/{job_id}/events/stream", tags=["VC Decision"])
+async def stream_vc_job_events(
+    job_id: str,
+    last_event_id: Optional[str] = Header(default=None),
+):
+    """
+    Stream events for a VC job as server-sent events.
+
+    Pushes each processing event as it happens instead of requiring
+    clients to poll /vc/jobs/{job_id}/events.
+    """
+    return await _event_stream(
+        await get_job_store(VC_JOB_PREFIX, streaming=True), job_id, last_event_id,
+    )
+
+
 @app.get("/vc/jobs/{job_id}/trace", tags=["VC Decision"])
 async def get_vc_job_trace(job_id: str):
     """
@@ -581,48 +780,56 @@ async def get_vc_job_trace(job_id: str):
 
     Returns the full execution trace for debugging and audit.
     """
-    job_data = await _get_vc_job_data(job_id)
+    job_data = await _get_vc_job_data(job_id, include_trace=True)
 
     return {
         "job_id": job_id,
-        "trace": job_data.get("trace_data", {}),
+        "trace": job_data.get("trace_data") or {},
     }
 
 
-async def _get_vc_job_data(job_id: str) -> dict:
-    """Get VC job data from Redis or in-memory storage."""
-    redis_client = get_redis()
-    job_data = None
+async def _get_vc_job_data(job_id: str, include_trace: bool = False) -> dict:
+    """
+    Get VC job data from Redis or in-memory storage.
 
-    if redis_client:
-        try:
-            raw_data = redis_client.get(f"juris:vcjob:{job_id}")
-            if raw_data:
-                job_data = json.loads(raw_data)
-        except Exception as e:
-            logger.error(f"Failed to fetch VC job: {e}")
+    Events are read from the job's event stream; trace data is loaded
+    from artifact storage only when include_trace is set.
+    """
+    store = await get_job_store(VC_JOB_PREFIX)
+    job_data = None
 
-    # Fallback to in-memory storage
-    if job_data is None:
-        job_data = _vc_jobs.get(job_id)
+    try:
+        job_data = await store.get(job_id)
+        if job_data is not None:
+            job_data["events"] = [event for _, event in await store.read_events(job_id)]
+    except Exception as e:
+        logger.error(f"Failed to fetch VC job: {e}")
 
     if job_data is None:
         raise HTTPException(status_code=404, detail=f"VC job {job_id} not found")
 
+    if include_trace and "trace_data" not in job_data and job_data.get("trace_key"):
+        job_data["trace_data"] = await _load_artifact(job_data["trace_key"])
+
     return job_data
 
 
-async def run_vc_job_sync(job_id: str, job_data: dict):
+async def run_vc_job_sync(job_id: str, store: MemoryJobStore):
     """
     Run a VC job synchronously (standalone mode without Redis).
     """
     from ..vc.orchestrator import VCOrchestrator, OrchestratorConfig
     from .vc_models import DirectClaim, VCConstraints
 
+    job_data = store.get(job_id)
+    updates: Dict[str, Any] = {}
+
     try:
         # Update status
-        job_data["status"] = VCJobStatus.FETCHING_CONTEXT.value
-        job_data["started_at"] = datetime.utcnow().isoformat()
+        store.update(job_id, {
+            "status": VCJobStatus.FETCHING_CONTEXT.value,
+            "started_at": datetime.utcnow().isoformat(),
+        })
 
         # Build claims if provided
         claims = None
@@ -643,57 +850,66 @@ async def run_vc_job_sync(job_id: str, job_data: dict):
             claims=claims,
             constraints=constraints,
             historical_decisions=job_data.get("historical_decisions"),
+            on_event=lambda event: store.append_event(job_id, event.model_dump(mode="json")),
         )
 
         # Update job data with results
-        job_data["status"] = result.status.value
-        job_data["completed_at"] = datetime.utcnow().isoformat()
-        job_data["runtime_seconds"] = result.runtime_seconds
-        job_data["context_id"] = result.context_id
+        updates["status"] = result.status.value
+        updates["completed_at"] = datetime.utcnow().isoformat()
+        updates["runtime_seconds"] = result.runtime_seconds
+        updates["context_id"] = result.context_id
 
         if result.working_set:
-            job_data["working_set"] = result.working_set.model_dump()
+            updates["working_set"] = result.working_set.model_dump(mode="json")
 
         if result.decision:
-            job_data["decision"] = result.decision.model_dump()
+            updates["decision"] = result.decision.model_dump(mode="json")
 
         if result.policies:
-            job_data["policies"] = [p.model_dump() for p in result.policies]
+            updates["policies"] = [p.model_dump(mode="json") for p in result.policies]
 
         if result.uncertainty:
-            job_data["uncertainty"] = result.uncertainty.model_dump()
-
-        if result.events:
-            job_data["events"] = [e.model_dump() for e in result.events]
+            updates["uncertainty"] = result.uncertainty.model_dump(mode="json")
 
         if result.trace_data:
-            job_data["trace_data"] = result.trace_data
+            updates["trace_data"] = result.trace_data
 
         if result.error_message:
-            job_data["error_message"] = result.error_message
+            updates["error_message"] = result.error_message
 
     except Exception as e:
-        job_data["status"] = VCJobStatus.FAILED.value
-        job_data["completed_at"] = datetime.utcnow().isoformat()
-        job_data["error_message"] = str(e)
+        updates["status"] = VCJobStatus.FAILED.value
+        updates["completed_at"] = datetime.utcnow().isoformat()
+        updates["error_message"] = str(e)
         logger.exception(f"VC job {job_id} failed")
 
+    store.update(job_id, updates)
+    store.append_event(job_id, make_event(
+        f"job_{updates['status']}", {"status": updates["status"]}, updates.get("error_message"),
+    ))
+
 
 # =============================================================================
 # Standalone Mode (no Redis)
 # =============================================================================
 
-async def run_job_sync(job_id: str, job_data: dict):
+async def run_job_sync(job_id: str, store: MemoryJobStore):
     """
     Run a job synchronously (standalone mode without Redis).
     """
     from ..core.types import ARCTask, ARCPair, Grid
     from ..controller.router import MetaController, ControllerConfig
 
+    job_data = store.get(job_id)
+    updates: Dict[str, Any] = {}
+
     try:
         # Update status
-        job_data["status"] = JobStatus.RUNNING.value
-        job_data["started_at"] = datetime.utcnow().isoformat()
+        store.update(job_id, {
+            "status": JobStatus.RUNNING.value,
+            "started_at": datetime.utcnow().isoformat(),
+        })
+        store.append_event(job_id, make_event("job_started", {"status": JobStatus.RUNNING.value}))
 
         # Parse task
         task_payload = job_data["task"]
@@ -733,15 +949,15 @@ async def run_job_sync(job_id: str, job_data: dict):
         runtime = time.time() - start_time
 
         # Update job data
-        job_data["status"] = JobStatus.COMPLETED.value
-        job_data["completed_at"] = datetime.utcnow().isoformat()
-        job_data["runtime_seconds"] = runtime
-        job_data["success"] = result.success
+        updates["status"] = JobStatus.COMPLETED.value
+        updates["completed_at"] = datetime.utcnow().isoformat()
+        updates["runtime_seconds"] = runtime
+        updates["success"] = result.success
 
         if result.success:
-            job_data["program"] = result.audit_trace.program_source
-            job_data["robustness_score"] = result.audit_trace.robustness_score
-            job_data["synthesis_iterations"] = result.audit_trace.synthesis_iterations
+            updates["program"] = result.audit_trace.program_source
+            updates["robustness_score"] = result.audit_trace.robustness_score
+            updates["synthesis_iterations"] = result.audit_trace.synthesis_iterations
 
             # Generate predictions
             predictions = []
@@ -750,16 +966,23 @@ async def run_job_sync(job_id: str, job_data: dict):
                     "data": pred.data.tolist(),
                     "confidence": result.audit_trace.robustness_score,
                 })
-            job_data["predictions"] = predictions
+            updates["predictions"] = predictions
         else:
-            job_data["error_message"] = result.error_message
+            updates["error_message"] = result.error_message
 
     except Exception as e:
-        job_data["status"] = JobStatus.FAILED.value
-        job_data["completed_at"] = datetime.utcnow().isoformat()
-        job_data["error_message"] = str(e)
+        updates["status"] = JobStatus.FAILED.value
+        updates["completed_at"] = datetime.utcnow().isoformat()
+        updates["error_message"] = str(e)
         logger.exception(f"Job {job_id} failed")
 
+    store.update(job_id, updates)
+    store.append_event(job_id, make_event(
+        f"job_{updates['status']}",
+        {"status": updates["status"], "success": updates.get("success", False)},
+        updates.get("error_message"),
+    ))
+
 
 # =============================================================================
 # Error Handlers
@@ -3,13 +3,14 @@ Worker for processing JURIS-AGI solve jobs.
 
 The worker:
 - Pulls jobs from Redis queues (via RQ)
-- Loads model weights once at startup
+- Loads model weights once at startup and keeps them warm across jobs
 - Runs the solver with budget limits
 - Writes results and trace to storage (local or S3)
-- Updates Redis job state
+- Updates Redis job state field by field and streams progress events
 """
 
-import json
+import asyncio
+import atexit
 import logging
 import os
 import signal
@@ -20,20 +21,23 @@ from pathlib import Path
 from typing import Optional, Dict, Any
 
 from .config import WorkerConfig
+from .job_store import JOB_PREFIX, VC_JOB_PREFIX, RedisJobStore, make_event
 from .models import JobStatus
+from .vc_models import VCJobStatus
 from ..core.storage import StorageClient, StorageConfig
 from ..core.model_registry import ModelRegistry
 
 # Optional imports
 try:
     import redis
-    from rq import Worker, Queue, Connection
+    from rq import Worker, SimpleWorker, Queue, Connection
     from rq.job import Job
     REDIS_AVAILABLE = True
 except ImportError:
     REDIS_AVAILABLE = False
     redis = None
     Worker = None
+    SimpleWorker = None
     Queue = None
 
 try:
@@ -60,17 +64,24 @@ class JurisWorker:
 
     def __init__(self, config: Optional[WorkerConfig] = None):
         self.config = config or WorkerConfig.from_env()
+        self.redis_pool: Optional["redis.ConnectionPool"] = None
         self.redis_client: Optional["redis.Redis"] = None
+        self.jobs: Optional[RedisJobStore] = None
+        self.vc_jobs: Optional[RedisJobStore] = None
         self.storage_client: Optional[StorageClient] = None
         self.model_registry: Optional[ModelRegistry] = None
         self.device = None
         self.sketcher = None
         self.critic = None
+        self.setup_seconds = 0.0
+        self.jobs_processed = 0
         self._running = False
+        self._registered = False
 
     def setup(self):
         """Initialize worker resources."""
         logger.info("Setting up JURIS-AGI worker...")
+        start_time = time.time()
 
         # Determine device
         if self.config.device == "auto":
@@ -83,19 +94,29 @@ class JurisWorker:
 
         logger.info(f"Using device: {self.device}")
 
-        # Connect to Redis
+        # Connect to Redis. The pool reconnects in forked children, so
+        # work-horses can share a client created before the fork.
         if REDIS_AVAILABLE:
             try:
-                self.redis_client = redis.from_url(
+                self.redis_pool = redis.ConnectionPool.from_url(
                     self.config.redis_url,
                     decode_responses=True,
                 )
+                self.redis_client = redis.Redis(connection_pool=self.redis_pool)
                 self.redis_client.ping()
                 logger.info("Connected to Redis")
             except Exception as e:
                 logger.error(f"Failed to connect to Redis: {e}")
                 raise
 
+            ttl = self.config.job_timeout_seconds * 2  # Keep longer for retrieval
+            self.jobs = RedisJobStore(
+                self.redis_client, JOB_PREFIX, ttl, self.config.job_events_max,
+            )
+            self.vc_jobs = RedisJobStore(
+                self.redis_client, VC_JOB_PREFIX, ttl, self.config.job_events_max,
+            )
+
         # Setup storage client
         storage_config = StorageConfig(
             backend=self.config.storage_backend,
@@ -119,18 +140,26 @@ class JurisWorker:
         # Load models
         self._load_models()
 
-        # Register worker with Redis
-        if self.redis_client:
-            self.redis_client.incr("juris:worker_count")
+        self.setup_seconds = time.time() - start_time
+        logger.info(f"Worker setup complete in {self.setup_seconds:.2f}s")
+
+    def register(self):
+        """
+        Count this process in juris:worker_count until teardown.
 
-        logger.info("Worker setup complete")
+        Only long-lived worker processes register; per-job setups in
+        work-horses would never get to decrement the count.
+        """
+        if self.redis_client and not self._registered:
+            self.redis_client.incr("juris:worker_count")
+            self._registered = True
 
     def _load_models(self):
         """Load neural models if available."""
         from ..cre.sketcher_model import get_sketcher, SketcherConfig
         from ..cre.critic_neural import get_critic, CriticConfig
 
-        use_neural = TORCH_AVAILABLE and self.device != "cpu"
+        use_neural = TORCH_AVAILABLE and (self.device != "cpu" or self.config.neural_on_cpu)
 
         logger.info(f"Loading models (neural={use_neural})...")
 
@@ -148,6 +177,9 @@ class JurisWorker:
             use_neural=use_neural,
             config=critic_config,
             model_path=self.config.critic_model_path,
+            device=self.device,
+            quantize=self.config.quantize_models and self.device == "cpu",
+            compile=self.config.compile_models,
         )
 
         logger.info("Models loaded")
@@ -158,10 +190,18 @@ class JurisWorker:
 
         if self.redis_client:
             try:
-                self.redis_client.decr("juris:worker_count")
+                if self._registered:
+                    self.redis_client.decr("juris:worker_count")
+                    self._registered = False
                 self.redis_client.close()
             except Exception:
                 pass
+            self.redis_client = None
+            self.jobs = None
+            self.vc_jobs = None
+        if self.redis_pool:
+            self.redis_pool.disconnect()
+            self.redis_pool = None
 
         logger.info("Worker teardown complete")
 
@@ -172,18 +212,29 @@ class JurisWorker:
             return
 
         self.setup()
+        self.register()
         self._running = True
+        if self.config.warm_start:
+            # Jobs run by this process (or forked from it) reuse this setup
+            _set_warm_worker(self)
 
         # Setup signal handlers
         signal.signal(signal.SIGTERM, self._handle_signal)
         signal.signal(signal.SIGINT, self._handle_signal)
 
+        # CUDA state does not survive fork, so GPU workers run jobs in-process
+        worker_class = Worker
+        if not self.config.fork_jobs or self.device == "cuda":
+            worker_class = SimpleWorker
+
         try:
             with Connection(self.redis_client):
                 queues = [Queue(name) for name in self.config.queue_names]
-                worker = Worker(queues, name=f"juris-worker-{os.getpid()}")
+                worker = worker_class(queues, name=f"juris-worker-{os.getpid()}")
 
-                logger.info(f"Starting worker on queues: {self.config.queue_names}")
+                logger.info(
+                    f"Starting {worker_class.__name__} on queues: {self.config.queue_names}"
+                )
                 worker.work(
                     with_scheduler=False,
                     logging_level="INFO",
@@ -192,6 +243,8 @@ class JurisWorker:
             logger.exception(f"Worker error: {e}")
         finally:
             self._running = False
+            if _warm_worker is self:
+                _set_warm_worker(None)
             self.teardown()
 
     def _handle_signal(self, signum, frame):
@@ -199,30 +252,42 @@ class JurisWorker:
         logger.info(f"Received signal {signum}, shutting down...")
         self._running = False
 
-    def process_job(self, job_id: str) -> Dict[str, Any]:
+    def process_job(self, job_id: str, setup_seconds: float = 0.0) -> Dict[str, Any]:
         """
         Process a single solve job.
 
         This is the function called by RQ.
+
+        Args:
+            job_id: Job to process
+            setup_seconds: Worker setup time paid by this job (0 when the
+                worker was already warm), reported next to the solve time
+
+        Returns:
+            The job fields written by this run
         """
-        from ..core.types import ARCTask, ARCPair, Grid
         from ..controller.router import MetaController, ControllerConfig, determine_regime
-        from ..core.trace import TraceWriter
 
         logger.info(f"Processing job: {job_id}")
 
         # Fetch job data
-        raw_data = self.redis_client.get(f"juris:job:{job_id}")
-        if not raw_data:
+        job_data = self.jobs.get(
+            job_id, ["task_id", "task", "budget", "return_trace", "created_at"],
+        )
+        if job_data is None:
             raise ValueError(f"Job {job_id} not found")
 
-        job_data = json.loads(raw_data)
-
         # Update status to running
-        job_data["status"] = JobStatus.RUNNING.value
-        job_data["started_at"] = datetime.utcnow().isoformat()
-        self._update_job(job_id, job_data)
-
+        written = {
+            "status": JobStatus.RUNNING.value,
+            "started_at": datetime.utcnow().isoformat(),
+            "setup_seconds": setup_seconds,
+        }
+        self.jobs.update(job_id, written)
+        self.jobs.append_event(job_id, make_event("job_started", {"status": written["status"]}))
+        self.jobs_processed += 1
+
+        updates: Dict[str, Any] = {}
         try:
             # Parse task
             task = self._parse_task(job_data)
@@ -237,7 +302,8 @@ class JurisWorker:
 
             # Determine regime
             regime_decision = determine_regime(task)
-            job_data["regime"] = regime_decision.regime.name
+            updates["regime"] = regime_decision.regime.name
+            self.jobs.append_event(job_id, make_event("regime_selected", {"regime": updates["regime"]}))
 
             # Create controller and solve
             controller = MetaController(config)
@@ -247,15 +313,15 @@ class JurisWorker:
             runtime = time.time() - start_time
 
             # Update job with results
-            job_data["status"] = JobStatus.COMPLETED.value
-            job_data["completed_at"] = datetime.utcnow().isoformat()
-            job_data["runtime_seconds"] = runtime
-            job_data["success"] = result.success
+            updates["status"] = JobStatus.COMPLETED.value
+            updates["completed_at"] = datetime.utcnow().isoformat()
+            updates["runtime_seconds"] = runtime
+            updates["success"] = result.success
 
             if result.success:
-                job_data["program"] = result.audit_trace.program_source
-                job_data["robustness_score"] = result.audit_trace.robustness_score
-                job_data["synthesis_iterations"] = result.audit_trace.synthesis_iterations
+                updates["program"] = result.audit_trace.program_source
+                updates["robustness_score"] = result.audit_trace.robustness_score
+                updates["synthesis_iterations"] = result.audit_trace.synthesis_iterations
 
                 # Generate predictions
                 predictions = []
@@ -264,30 +330,116 @@ class JurisWorker:
                         "data": pred.data.tolist(),
                         "confidence": result.audit_trace.robustness_score,
                     })
-                job_data["predictions"] = predictions
 
-                # Save trace and result artifacts
+                # Save trace and result artifacts; the job keeps references
                 if job_data.get("return_trace"):
-                    trace_url = self._save_trace(job_id, job_data["task_id"], result.audit_trace)
-                    job_data["trace_url"] = trace_url
+                    updates.update(self._save_trace(job_id, job_data["task_id"], result.audit_trace))
 
-                # Save result artifact
-                result_url = self._save_result(job_id, job_data["task_id"], job_data)
-                job_data["result_url"] = result_url
+                saved = self._save_result(
+                    job_id, job_data["task_id"],
+                    {**job_data, **written, **updates, "predictions": predictions},
+                )
+                updates.update(saved)
+                if not saved:
+                    updates["predictions"] = predictions  # Storage failed, keep them inline
             else:
-                job_data["error_message"] = result.error_message
+                updates["error_message"] = result.error_message
 
-            logger.info(f"Job {job_id} completed: success={result.success}")
+            logger.info(
+                f"Job {job_id} completed: success={result.success}, "
+                f"setup={setup_seconds:.2f}s, solve={runtime:.2f}s"
+            )
 
         except Exception as e:
             logger.exception(f"Job {job_id} failed")
-            job_data["status"] = JobStatus.FAILED.value
-            job_data["completed_at"] = datetime.utcnow().isoformat()
-            job_data["error_message"] = str(e)
+            updates["status"] = JobStatus.FAILED.value
+            updates["completed_at"] = datetime.utcnow().isoformat()
+            updates["error_message"] = str(e)
 
         # Save final state
-        self._update_job(job_id, job_data)
-        return job_data
+        self.jobs.update(job_id, updates)
+        self.jobs.append_event(job_id, make_event(
+            f"job_{updates['status']}",
+            {"status": updates["status"], "success": updates.get("success", False)},
+            updates.get("error_message"),
+        ))
+        return {"job_id": job_id, "task_id": job_data["task_id"], **written, **updates}
+
+    def process_vc_job(self, job_id: str, setup_seconds: float = 0.0) -> Dict[str, Any]:
+        """
+        Process a single VC decision job.
+
+        Orchestrator events are appended to the job's event stream as they
+        happen; the trace is saved to storage and referenced by key.
+
+        Args:
+            job_id: Job to process
+            setup_seconds: Worker setup time paid by this job
+
+        Returns:
+            The job fields written by this run
+        """
+        from ..vc.orchestrator import VCOrchestrator, OrchestratorConfig
+        from .vc_models import DirectClaim, VCConstraints
+
+        logger.info(f"Processing VC job: {job_id}")
+
+        job_data = self.vc_jobs.get(job_id)
+        if job_data is None:
+            raise ValueError(f"VC job {job_id} not found")
+
+        written = {
+            "status": VCJobStatus.FETCHING_CONTEXT.value,
+            "started_at": datetime.utcnow().isoformat(),
+            "setup_seconds": setup_seconds,
+        }
+        self.vc_jobs.update(job_id, written)
+        self.jobs_processed += 1
+
+        updates: Dict[str, Any] = {}
+        try:
+            claims = None
+            if job_data.get("claims"):
+                claims = [DirectClaim(**c) for c in job_data["claims"]]
+
+            orchestrator = VCOrchestrator(config=OrchestratorConfig(
+                include_trace=job_data.get("include_trace", True),
+            ))
+            result = asyncio.run(orchestrator.solve(
+                deal_id=job_data.get("deal_id"),
+                question=job_data.get("question"),
+                claims=claims,
+                constraints=VCConstraints(**job_data.get("constraints", {})),
+                historical_decisions=job_data.get("historical_decisions"),
+                on_event=lambda event: self.vc_jobs.append_event(job_id, event.model_dump(mode="json")),
+            ))
+
+            updates["status"] = result.status.value
+            updates["completed_at"] = datetime.utcnow().isoformat()
+            updates["runtime_seconds"] = result.runtime_seconds
+            updates["context_id"] = result.context_id
+            for name in ("working_set", "decision", "uncertainty"):
+                value = getattr(result, name)
+                if value:
+                    updates[name] = value.model_dump(mode="json")
+            if result.policies:
+                updates["policies"] = [p.model_dump(mode="json") for p in result.policies]
+            if result.error_message:
+                updates["error_message"] = result.error_message
+            if result.trace_data:
+                updates.update(self._save_trace(job_id, job_data.get("deal_id") or "vc", result.trace_data))
+
+        except Exception as e:
+            logger.exception(f"VC job {job_id} failed")
+            updates["status"] = VCJobStatus.FAILED.value
+            updates["completed_at"] = datetime.utcnow().isoformat()
+            updates["error_message"] = str(e)
+
+        self.vc_jobs.update(job_id, updates)
+        self.vc_jobs.append_event(job_id, make_event(
+            f"job_{updates['status']}", {"status": updates["status"]}, updates.get("error_message"),
+        ))
+        return {"job_id": job_id, **written, **updates}
 
     def _parse_task(self, job_data: Dict[str, Any]) -> "ARCTask":
         """Parse task from job data."""
@@ -315,23 +467,18 @@ class JurisWorker:
             test=test_pairs,
         )
 
-    def _update_job(self, job_id: str, job_data: Dict[str, Any]):
-        """Update job data in Redis."""
-        if self.redis_client:
-            self.redis_client.setex(
-                f"juris:job:{job_id}",
-                self.config.job_timeout_seconds * 2,  # Keep longer for retrieval
-                json.dumps(job_data),
-            )
+    def _save_trace(self, job_id: str, task_id: str, trace) -> Dict[str, str]:
+        """
+        Save execution trace to storage using StorageClient.
 
-    def _save_trace(self, job_id: str, task_id: str, trace) -> Optional[str]:
-        """Save execution trace to storage using StorageClient."""
+        Returns the trace_key and trace_url job fields, or {} on failure.
+        """
         if not self.storage_client:
             logger.warning("No storage client available")
-            return None
+            return {}
 
         try:
-            trace_data = trace.to_dict()
+            trace_data = trace if isinstance(trace, dict) else trace.to_dict()
             metadata = {
                 "job_id": job_id,
                 "task_id": task_id,
@@ -349,19 +496,23 @@ class JurisWorker:
             # Get URL for the trace
             url = self.storage_client.get_trace_url(
                 trace_key,
-                expiry_seconds=self.config.presigned_url_expiry,
+                expiry=self.config.presigned_url_expiry,
             )
-            return url
+            return {"trace_key": trace_key, "trace_url": url}
 
         except Exception as e:
             logger.warning(f"Failed to save trace: {e}")
-            return None
+            return {}
 
-    def _save_result(self, job_id: str, task_id: str, job_data: Dict[str, Any]) -> Optional[str]:
-        """Save job result to storage using StorageClient."""
+    def _save_result(self, job_id: str, task_id: str, job_data: Dict[str, Any]) -> Dict[str, str]:
+        """
+        Save job result to storage using StorageClient.
+
+        Returns the result_key and result_url job fields, or {} on failure.
+        """
         if not self.storage_client:
             logger.warning("No storage client available")
-            return None
+            return {}
 
         try:
             # Build result data (subset of job_data for artifact)
@@ -376,6 +527,7 @@ class JurisWorker:
                 "regime": job_data.get("regime"),
                 "synthesis_iterations": job_data.get("synthesis_iterations"),
                 "runtime_seconds": job_data.get("runtime_seconds"),
+                "setup_seconds": job_data.get("setup_seconds"),
                 "created_at": job_data.get("created_at"),
                 "completed_at": job_data.get("completed_at"),
             }
@@ -398,35 +550,95 @@ class JurisWorker:
             # Get URL for the result
             url = self.storage_client.get_result_url(
                 result_key,
-                expiry_seconds=self.config.presigned_url_expiry,
+                expiry=self.config.presigned_url_expiry,
             )
-            return url
+            return {"result_key": result_key, "result_url": url}
 
         except Exception as e:
             logger.warning(f"Failed to save result: {e}")
-            return None
+            return {}
 
 
 # =============================================================================
 # RQ Job Function
 # =============================================================================
 
-def process_job(job_id: str) -> Dict[str, Any]:
+# Worker state shared by every job run in this process
+_warm_worker: Optional[JurisWorker] = None
+
+
+def _set_warm_worker(worker: Optional[JurisWorker]) -> None:
+    global _warm_worker
+    _warm_worker = worker
+
+
+def _teardown_warm_worker() -> None:
+    """Release the warm worker at interpreter exit."""
+    if _warm_worker is not None:
+        _warm_worker.teardown()
+        _set_warm_worker(None)
+
+
+def _warm_up(config: Optional[WorkerConfig] = None) -> JurisWorker:
+    """Set up this process's warm worker if there is none yet."""
+    if _warm_worker is None:
+        worker = JurisWorker(config)
+        worker.setup()
+        _set_warm_worker(worker)
+        atexit.register(_teardown_warm_worker)
+    return _warm_worker
+
+
+def preload_worker(config: Optional[WorkerConfig] = None) -> JurisWorker:
     """
-    Process a job - called by RQ.
+    Set up this process's warm worker ahead of the first job.
 
-    This is a module-level function that RQ can import and execute.
+    Call from the RQ worker process before it starts forking work-horses
+    (e.g. from an ``rq worker -c <settings>`` module) so every work-horse
+    inherits the loaded models, registry, storage client and Redis pool.
+    JurisWorker.run() does this itself when warm_start is enabled.
     """
+    worker = _warm_up(config)
+    worker.register()
+    return worker
+
+
+def _run_job(method: str, job_id: str) -> Dict[str, Any]:
+    """Run a JurisWorker job method on a warm or freshly set-up worker."""
+    config = WorkerConfig.from_env()
+    if config.warm_start:
+        was_warm = _warm_worker is not None
+        worker = _warm_up(config)
+        return getattr(worker, method)(
+            job_id, setup_seconds=0.0 if was_warm else worker.setup_seconds,
+        )
+
     # Create worker instance (will use env config)
-    worker = JurisWorker()
+    worker = JurisWorker(config)
     worker.setup()
 
     try:
-        return worker.process_job(job_id)
+        return getattr(worker, method)(job_id, setup_seconds=worker.setup_seconds)
     finally:
         worker.teardown()
 
 
+def process_job(job_id: str) -> Dict[str, Any]:
+    """
+    Process a job - called by RQ.
+
+    This is a module-level function that RQ can import and execute.
+    With warm_start (the default) the worker is set up once per process
+    and reused; otherwise each job sets up and tears down its own.
+    """
+    return _run_job("process_job", job_id)
+
+
+def process_vc_job(job_id: str) -> Dict[str, Any]:
+    """Process a VC decision job - called by RQ, like process_job."""
+    return _run_job("process_vc_job", job_id)
+
+
 # =============================================================================
 # CLI Entry Point
 # =============================================================================
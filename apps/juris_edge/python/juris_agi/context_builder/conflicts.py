@@ -242,6 +242,106 @@ def _determine_severity(
     return ConflictSeverity.MEDIUM
 
 
+def _is_sweepable(value: Any) -> bool:
+    """Check if a value can take part in the sorted numeric sweep."""
+    return isinstance(value, (int, float)) and math.isfinite(value)
+
+
+def _find_conflicting_pairs(
+    group_claims: list[Claim],
+    threshold: float,
+) -> list[tuple[int, int, Optional[float]]]:
+    """
+    Find conflicting claim pairs within a (claim_type, field) group.
+
+    Finite numeric values are handled with a sorted sweep: among values of
+    the same sign, the relative delta grows monotonically with distance in
+    sorted order, so the values agreeing with a given value form a
+    contiguous window and every value past the window conflicts with it.
+    Only boundary pairs and actual conflicts are passed to
+    _are_values_conflicting. All other values are compared pairwise, with
+    repeated strings compared once.
+
+    Returns:
+        (i, j, value_delta) index pairs with i < j, in the same order as an
+        all-pairs comparison of the group.
+    """
+    pairs: list[tuple[int, int, Optional[float]]] = []
+
+    def check(i: int, j: int) -> None:
+        if i > j:
+            i, j = j, i
+        is_conflict, value_delta = _are_values_conflicting(
+            group_claims[i].value, group_claims[j].value, threshold
+        )
+        if is_conflict:
+            pairs.append((i, j, value_delta))
+
+    negatives: list[int] = []
+    zeros: list[int] = []
+    positives: list[int] = []
+    others: list[int] = []
+    for idx, claim in enumerate(group_claims):
+        value = claim.value
+        if not _is_sweepable(value):
+            others.append(idx)
+        elif value > 0:
+            positives.append(idx)
+        elif value < 0:
+            negatives.append(idx)
+        else:
+            zeros.append(idx)
+
+    # Same-sign runs: sweep in order of increasing magnitude
+    for run in (positives, negatives):
+        run.sort(key=lambda idx: abs(group_claims[idx].value))
+        hi = 0
+        for pos, i in enumerate(run):
+            hi = max(hi, pos + 1)
+            while hi < len(run) and not _are_values_conflicting(
+                group_claims[i].value, group_claims[run[hi]].value, threshold
+            )[0]:
+                hi += 1
+            for j in run[hi:]:
+                check(i, j)
+
+    # Values of different sign (or zero vs non-zero) always go through the
+    # full comparison; zeros never conflict with each other
+    for a, b in ((positives, negatives), (zeros, positives), (zeros, negatives)):
+        for i in a:
+            for j in b:
+                check(i, j)
+
+    # Non-numeric or non-finite values are compared with everything. Equal
+    # strings always compare the same way, so each distinct string is
+    # compared once and the result applies to every claim carrying it.
+    buckets: dict[Any, list[int]] = {}
+    for i in others:
+        value = group_claims[i].value
+        key = ("str", value) if isinstance(value, str) else ("idx", i)
+        buckets.setdefault(key, []).append(i)
+
+    def check_bucket(members: list[int], j_members: list[int]) -> None:
+        is_conflict, value_delta = _are_values_conflicting(
+            group_claims[members[0]].value, group_claims[j_members[0]].value, threshold
+        )
+        if is_conflict:
+            for i in members:
+                for j in j_members:
+                    pairs.append((min(i, j), max(i, j), value_delta))
+
+    sweepable = negatives + zeros + positives
+    bucket_list = list(buckets.values())
+    for pos, members in enumerate(bucket_list):
+        for j in sweepable:
+            check_bucket(members, [j])
+        for j_members in bucket_list[pos + 1:]:
+            check_bucket(members, j_members)
+
+    pairs.sort(key=lambda pair: (pair[0], pair[1]))
+    return pairs
+
+
 def detect_conflicts(
     claims: list[Claim],
     numeric_threshold: float = 0.15,
@@ -275,47 +375,41 @@ def detect_conflicts(
         if len(group_claims) < 2:
             continue
 
-        # Compare all pairs
-        for i, claim1 in enumerate(group_claims):
-            for claim2 in group_claims[i + 1 :]:
-                is_conflict, value_delta = _are_values_conflicting(
-                    claim1.value, claim2.value, numeric_threshold
-                )
-
-                if not is_conflict:
-                    continue
-
-                temporal_gap = _calculate_temporal_gap(claim1, claim2)
-                conflict_type = _determine_conflict_type(
-                    claim1, claim2, is_conflict, temporal_gap
-                )
-                severity = _determine_severity(
-                    conflict_type, claim1, claim2, value_delta
-                )
-
-                # Generate description
-                description = _generate_conflict_description(
-                    claim1, claim2, conflict_type, value_delta, temporal_gap
-                )
-
-                # Generate resolution hint
-                resolution_hint = _generate_resolution_hint(
-                    conflict_type, claim1, claim2, temporal_gap
-                )
-
-                conflict_counter += 1
-                conflicts.append(
-                    DetectedConflict(
-                        conflict_id=f"conflict_{conflict_counter:04d}",
-                        conflict_type=conflict_type,
-                        claims=[claim1, claim2],
-                        severity=severity,
-                        description=description,
-                        resolution_hint=resolution_hint,
-                        value_delta=value_delta,
-                        temporal_gap_days=temporal_gap,
-                    )
+        for i, j, value_delta in _find_conflicting_pairs(group_claims, numeric_threshold):
+            claim1 = group_claims[i]
+            claim2 = group_claims[j]
+
+            temporal_gap = _calculate_temporal_gap(claim1, claim2)
+            conflict_type = _determine_conflict_type(
+                claim1, claim2, True, temporal_gap
+            )
+            severity = _determine_severity(
+                conflict_type, claim1, claim2, value_delta
+            )
+
+            # Generate description
+            description = _generate_conflict_description(
+                claim1, claim2, conflict_type, value_delta, temporal_gap
+            )
+
+            # Generate resolution hint
+            resolution_hint = _generate_resolution_hint(
+                conflict_type, claim1, claim2, temporal_gap
+            )
+
+            conflict_counter += 1
+            conflicts.append(
+                DetectedConflict(
+                    conflict_id=f"conflict_{conflict_counter:04d}",
+                    conflict_type=conflict_type,
+                    claims=[claim1, claim2],
+                    severity=severity,
+                    description=description,
+                    resolution_hint=resolution_hint,
+                    value_delta=value_delta,
+                    temporal_gap_days=temporal_gap,
                 )
+            )
 
     return conflicts
 
@@ -404,39 +498,42 @@ def cluster_conflicts(conflicts: list[DetectedConflict]) -> list[ConflictCluster
     # Create clusters
     for (claim_type, field_name), type_conflicts in by_type_field.items():
         # Further cluster by shared claims using union-find
-        claim_to_conflicts: dict[str, list[DetectedConflict]] = {}
-        for conflict in type_conflicts:
-            for claim in conflict.claims:
-                if claim.claim_id not in claim_to_conflicts:
-                    claim_to_conflicts[claim.claim_id] = []
-                claim_to_conflicts[claim.claim_id].append(conflict)
+        parent = list(range(len(type_conflicts)))
 
-        # Build connected components
-        visited_conflicts: set[str] = set()
+        def find(idx: int) -> int:
+            while parent[idx] != idx:
+                parent[idx] = parent[parent[idx]]
+                idx = parent[idx]
+            return idx
 
-        def dfs(conflict: DetectedConflict, component: list[DetectedConflict]):
-            if conflict.conflict_id in visited_conflicts:
-                return
-            visited_conflicts.add(conflict.conflict_id)
-            component.append(conflict)
+        claim_owner: dict[str, int] = {}
+        for idx, conflict in enumerate(type_conflicts):
             for claim in conflict.claims:
-                for related in claim_to_conflicts.get(claim.claim_id, []):
-                    dfs(related, component)
-
-        for conflict in type_conflicts:
-            if conflict.conflict_id not in visited_conflicts:
-                component: list[DetectedConflict] = []
-                dfs(conflict, component)
-                if component:
-                    cluster_counter += 1
-                    clusters.append(
-                        ConflictCluster(
-                            cluster_id=f"cluster_{cluster_counter:04d}",
-                            conflicts=component,
-                            primary_claim_type=claim_type,
-                            primary_field=field_name,
-                        )
-                    )
+                owner = claim_owner.setdefault(claim.claim_id, idx)
+                root_a, root_b = find(owner), find(idx)
+                if root_a != root_b:
+                    # Keep the earliest conflict as root so clusters come out
+                    # in order of first appearance
+                    if root_a < root_b:
+                        parent[root_b] = root_a
+                    else:
+                        parent[root_a] = root_b
+
+        # Build connected components
+        components: dict[int, list[DetectedConflict]] = {}
+        for idx, conflict in enumerate(type_conflicts):
+            components.setdefault(find(idx), []).append(conflict)
+
+        for component in components.values():
+            cluster_counter += 1
+            clusters.append(
+                ConflictCluster(
+                    cluster_id=f"cluster_{cluster_counter:04d}",
+                    conflicts=component,
+                    primary_claim_type=claim_type,
+                    primary_field=field_name,
+                )
+            )
 
     return clusters
 
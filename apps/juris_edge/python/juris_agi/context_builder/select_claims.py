@@ -5,6 +5,7 @@ Converts a large EvidenceContext into a high-signal EvidenceWorkingSet
 suitable for reasoning.
 """
 
+from bisect import bisect_left, bisect_right
 from dataclasses import dataclass, field
 from datetime import datetime
 from typing import Any, Optional
@@ -149,41 +150,168 @@ def _are_claims_duplicate(
     return v1 == v2
 
 
+def _is_indexable_number(value: Any) -> bool:
+    """Check if a value can be stored in the sorted numeric index."""
+    return isinstance(value, (int, float)) and abs(value) < 1e300
+
+
+@dataclass
+class _DuplicateBucket:
+    """Kept claims for one (claim_type, field), indexed by value kind."""
+
+    claims: list[Claim] = field(default_factory=list)
+    # Finite non-zero numbers, by sign, sorted by magnitude
+    positive_keys: list[float] = field(default_factory=list)
+    positive_claims: list[Claim] = field(default_factory=list)
+    negative_keys: list[float] = field(default_factory=list)
+    negative_claims: list[Claim] = field(default_factory=list)
+    has_zero: bool = False
+    strings: set[str] = field(default_factory=set)
+    lists: set[frozenset[str]] = field(default_factory=set)
+    # Values only comparable by equality (None, dicts, non-finite numbers, ...)
+    others: list[Claim] = field(default_factory=list)
+
+
+class _DuplicateIndex:
+    """
+    Near-duplicate lookup over kept claims.
+
+    Gives the same answers as checking _are_claims_duplicate against every
+    kept claim, but only looks at the claim's (claim_type, field) bucket:
+    numbers are found by a window search over sorted magnitudes, strings
+    and lists by their normalized keys.
+    """
+
+    def __init__(self, numeric_tolerance: float = 0.05):
+        self.numeric_tolerance = numeric_tolerance
+        self._buckets: dict[tuple[str, str], _DuplicateBucket] = {}
+
+    def is_duplicate(self, claim: Claim) -> bool:
+        """Check whether a kept claim is a near-duplicate of this one."""
+        bucket = self._buckets.get((claim.claim_type, claim.field))
+        if bucket is None:
+            return False
+
+        value = claim.value
+        if isinstance(value, (int, float)):
+            if self._numeric_match(claim, bucket):
+                return True
+        elif isinstance(value, str):
+            if value.lower().strip() in bucket.strings:
+                return True
+        elif isinstance(value, list):
+            if frozenset(str(x).lower() for x in value) in bucket.lists:
+                return True
+        else:
+            return any(
+                _are_claims_duplicate(claim, seen, self.numeric_tolerance)
+                for seen in bucket.claims
+            )
+
+        return any(
+            _are_claims_duplicate(claim, seen, self.numeric_tolerance)
+            for seen in bucket.others
+        )
+
+    def add(self, claim: Claim) -> None:
+        """Record a kept claim."""
+        key = (claim.claim_type, claim.field)
+        bucket = self._buckets.get(key)
+        if bucket is None:
+            bucket = _DuplicateBucket()
+            self._buckets[key] = bucket
+        bucket.claims.append(claim)
+
+        value = claim.value
+        if _is_indexable_number(value):
+            if value == 0:
+                bucket.has_zero = True
+            else:
+                keys, claims = (
+                    (bucket.positive_keys, bucket.positive_claims)
+                    if value > 0
+                    else (bucket.negative_keys, bucket.negative_claims)
+                )
+                magnitude = abs(value)
+                pos = bisect_right(keys, magnitude)
+                keys.insert(pos, magnitude)
+                claims.insert(pos, claim)
+        elif isinstance(value, str):
+            bucket.strings.add(value.lower().strip())
+        elif isinstance(value, list):
+            bucket.lists.add(frozenset(str(x).lower() for x in value))
+        else:
+            bucket.others.append(claim)
+
+    def _numeric_match(self, claim: Claim, bucket: _DuplicateBucket) -> bool:
+        """Find a kept number within the relative tolerance window."""
+        value = claim.value
+        tolerance = self.numeric_tolerance
+
+        if not _is_indexable_number(value):
+            # NaN, infinities and huge ints never fall within a window
+            return any(
+                _are_claims_duplicate(claim, seen, tolerance)
+                for seen in bucket.claims
+                if _is_indexable_number(seen.value)
+            )
+        if value == 0:
+            return bucket.has_zero
+        if tolerance >= 2:
+            # Window spans both signs - compare with every number
+            return any(
+                _are_claims_duplicate(claim, seen, tolerance)
+                for seen in bucket.positive_claims + bucket.negative_claims
+            )
+
+        keys, claims = (
+            (bucket.positive_keys, bucket.positive_claims)
+            if value > 0
+            else (bucket.negative_keys, bucket.negative_claims)
+        )
+        # Same-sign a, b are duplicates iff b lies in
+        # [a * (2 - t) / (2 + t), a * (2 + t) / (2 - t)]; widen slightly for
+        # rounding and confirm each candidate with the exact check
+        magnitude = abs(value)
+        lo = magnitude * (2 - tolerance) / (2 + tolerance) * (1 - 1e-9)
+        hi = magnitude * (2 + tolerance) / (2 - tolerance) * (1 + 1e-9)
+        for pos in range(bisect_left(keys, lo), bisect_right(keys, hi)):
+            if _are_claims_duplicate(claim, claims[pos], tolerance):
+                return True
+        return False
+
+
 def deduplicate_claims(
     claims: list[tuple[Claim, QualityScore]],
+    numeric_tolerance: float = 0.05,
 ) -> tuple[list[tuple[Claim, QualityScore]], int]:
     """
     Remove near-duplicate claims, keeping the highest quality version.
 
     Args:
         claims: List of (claim, score) tuples, sorted by quality descending
+        numeric_tolerance: Relative tolerance for numeric near-duplicates
 
     Returns:
         Tuple of (deduplicated claims, count of duplicates removed)
     """
-    seen_signatures: dict[str, tuple[Claim, QualityScore]] = {}
+    seen_signatures: set[str] = set()
+    index = _DuplicateIndex(numeric_tolerance)
     result: list[tuple[Claim, QualityScore]] = []
     duplicates_removed = 0
 
     for claim, score in claims:
         sig = _compute_claim_signature(claim)
 
-        # Check for exact signature match
-        if sig in seen_signatures:
+        # Check for exact signature match, then near-duplicates among the
+        # kept claims of the same (claim_type, field)
+        if sig in seen_signatures or index.is_duplicate(claim):
             duplicates_removed += 1
             continue
 
-        # Check for near-duplicates against all seen claims
-        is_duplicate = False
-        for seen_claim, _ in result:
-            if _are_claims_duplicate(claim, seen_claim):
-                is_duplicate = True
-                duplicates_removed += 1
-                break
-
-        if not is_duplicate:
-            seen_signatures[sig] = (claim, score)
-            result.append((claim, score))
+        seen_signatures.add(sig)
+        index.add(claim)
+        result.append((claim, score))
 
     return result, duplicates_removed
 
@@ -9,6 +9,7 @@ from enum import Enum, auto
 from typing import Optional, List, Dict, Any
 
 from ..core.types import ARCTask
+from ..representation.task_context import TaskFeatureContext, get_task_context
 
 
 class RefusalReason(Enum):
@@ -159,11 +160,17 @@ class RefusalChecker:
         """
         Estimate task difficulty.
 
-        Returns metrics that help predict solvability.
+        Returns metrics that help predict solvability. Memoized in the
+        task's shared feature context.
         """
         if not task.train:
             return {"difficulty": "unknown", "solvable_estimate": 0.0}
 
+        context = get_task_context(task)
+        return dict(context.get("difficulty", lambda: self._estimate_difficulty(context)))
+
+    def _estimate_difficulty(self, context: TaskFeatureContext) -> Dict[str, Any]:
+        task = context.task
         metrics: Dict[str, Any] = {}
 
         # Grid complexity
@@ -178,10 +185,7 @@ class RefusalChecker:
         metrics["avg_output_size"] = avg_output_size
 
         # Color complexity
-        all_colors = set()
-        for pair in task.train:
-            all_colors |= pair.input.palette
-            all_colors |= pair.output.palette
+        all_colors = set().union(*context.palettes("input"), *context.palettes("output"))
         metrics["num_colors"] = len(all_colors)
 
         # Dimension change complexity
@@ -19,7 +19,8 @@ Budget Allocation:
 - Robustness phase: WME robustness checking
 """
 
-from dataclasses import dataclass, field
+from concurrent.futures import ProcessPoolExecutor
+from dataclasses import dataclass, field, replace
 from typing import List, Dict, Any, Optional, Tuple
 from datetime import datetime
 from enum import Enum, auto
@@ -36,6 +37,7 @@ from ..cre.synthesizer import BeamSearchSynthesizer, SynthesisConfig, SynthesisR
 import time
 from ..cre.critic_symbolic import SymbolicCritic, CriticResult
 from ..cre.refinement import RefinementEngine
+from .scheduler import PhaseScheduler, SolvePhase
 
 from ..wme.world_model import HeuristicWorldModel, WorldModelState
 from ..wme.robustness import RobustnessChecker
@@ -43,6 +45,7 @@ from ..wme.robustness import RobustnessChecker
 from ..mal.retrieval import InMemoryStore, create_memory_from_solution
 from ..mal.macro_induction import MacroLibrary
 from ..mal.gating import GatingMechanism, GatingMode
+from ..representation.task_context import TaskFeatureContext, get_task_context
 
 
 # ============================================================================
@@ -90,10 +93,9 @@ def determine_regime(task: ARCTask) -> RegimeDecision:
         task: The ARC task to classify
 
     Returns:
-        RegimeDecision with regime classification
+        RegimeDecision with regime classification (memoized in the
+        task's shared feature context)
     """
-    features: Dict[str, Any] = {}
-
     if not task.train:
         return RegimeDecision(
             regime=TaskRegime.UNCERTAIN,
@@ -102,6 +104,15 @@ def determine_regime(task: ARCTask) -> RegimeDecision:
             rationale="No training examples",
         )
 
+    context = get_task_context(task)
+    decision = context.get("regime", lambda: _determine_regime(context))
+    return replace(decision, features=dict(decision.features))
+
+
+def _determine_regime(context: TaskFeatureContext) -> RegimeDecision:
+    task = context.task
+    features: Dict[str, Any] = {}
+
     # Feature 1: Dimension consistency
     dim_ratios = []
     for pair in task.train:
@@ -128,8 +139,8 @@ def determine_regime(task: ARCTask) -> RegimeDecision:
         features["same_dims"] = False
 
     # Feature 2: Palette consistency
-    input_palettes = [pair.input.palette for pair in task.train]
-    output_palettes = [pair.output.palette for pair in task.train]
+    input_palettes = context.palettes("input")
+    output_palettes = context.palettes("output")
 
     # Do all palettes match?
     features["consistent_input_palette"] = len(set(map(frozenset, input_palettes))) == 1
@@ -137,7 +148,7 @@ def determine_regime(task: ARCTask) -> RegimeDecision:
 
     # Palette preserved?
     features["palette_preserved"] = all(
-        pair.input.palette == pair.output.palette for pair in task.train
+        i == o for i, o in zip(input_palettes, output_palettes)
     )
 
     # Feature 3: Number of training examples
@@ -284,12 +295,20 @@ class MetaController:
         """
         start_time = time.time()
         trace = SolveTrace.start(task.task_id)
+        # Feature lookups are logged for this solve only, not the shared context's lifetime
+        feature_stats = get_task_context(task).stats()
         attempts: List[SolveAttempt] = []
         synth_result: Optional[SynthesisResult] = None
+        # Tracks wall time per phase for the audit trace; budgets are not enforced
+        scheduler = PhaseScheduler(
+            total_time=self.config.max_time_seconds,
+            total_iterations=self.config.max_synthesis_iterations,
+        )
 
         trace.log("start", "controller", task_id=task.task_id)
 
         # Step 1: Analyze task with WME (advisory)
+        scheduler.start_phase(SolvePhase.PRIORS)
         wme_state = None
         if self.config.enable_wme:
             trace.log("wme_analysis", "wme")
@@ -319,10 +338,11 @@ class MetaController:
                         trace.log("memory_hit", "mal", success=True)
                         return self._create_result(
                             task, mem_program, critique, trace, attempts, "memory",
-                            start_time=start_time,
+                            start_time=start_time, scheduler=scheduler, feature_stats=feature_stats,
                         )
 
         # Step 3: Run synthesis (CRE)
+        scheduler.start_phase(SolvePhase.SYNTHESIS)
         trace.log("synthesis_start", "cre")
 
         synthesis_config = SynthesisConfig(
@@ -337,6 +357,7 @@ class MetaController:
             pass
 
         synth_result = self.synthesizer.synthesize(task, synthesis_config)
+        scheduler.end_phase(iterations_used=synth_result.iterations, success=synth_result.success)
 
         trace.log(
             "synthesis_complete",
@@ -362,15 +383,18 @@ class MetaController:
             if critique.is_certified:
                 return self._create_result(
                     task, synth_result.program, critique, trace, attempts, "synthesis",
-                    synth_result=synth_result, start_time=start_time,
+                    synth_result=synth_result, start_time=start_time, scheduler=scheduler,
+                    feature_stats=feature_stats,
                 )
 
             # Not certified - try refinement
             if self.config.enable_refinement:
+                scheduler.start_phase(SolvePhase.REFINEMENT)
                 trace.log("refinement_start", "cre")
                 refined = self.refinement_engine.refine(
                     synth_result.program, task, critique
                 )
+                scheduler.end_phase(iterations_used=refined.iterations, success=refined.success)
                 trace.log(
                     "refinement_complete",
                     "cre",
@@ -384,28 +408,34 @@ class MetaController:
                     if refined_critique.is_certified:
                         return self._create_result(
                             task, refined.refined_ast, refined_critique, trace, attempts, "refinement",
-                            synth_result=synth_result, start_time=start_time,
+                            synth_result=synth_result, start_time=start_time, scheduler=scheduler,
+                            feature_stats=feature_stats,
                             refinement_edits=[e.describe() for e in refined.edits_applied],
                         )
 
         # Step 4: If synthesis didn't find solution, try near-miss refinement
         if synth_result.program and not synth_result.success:
             if self.config.enable_refinement:
+                scheduler.start_phase(SolvePhase.REFINEMENT)
                 critique = self.critic.evaluate(synth_result.program, task)
                 refined = self.refinement_engine.refine(synth_result.program, task, critique)
+                scheduler.end_phase(iterations_used=refined.iterations, success=refined.success)
 
                 if refined.success and refined.refined_ast:
                     refined_critique = self.critic.evaluate(refined.refined_ast, task)
                     if refined_critique.is_certified:
                         return self._create_result(
                             task, refined.refined_ast, refined_critique, trace, attempts, "refinement",
-                            synth_result=synth_result, start_time=start_time,
+                            synth_result=synth_result, start_time=start_time, scheduler=scheduler,
+                            feature_stats=feature_stats,
                             refinement_edits=[e.describe() for e in refined.edits_applied],
                         )
 
         # Step 5: Failed - return best effort
         trace.log("solve_failed", "controller")
+        self._log_feature_cache(task, trace, feature_stats)
         trace.finalize(success=False)
+        scheduler.end_phase()
 
         best_program = synth_result.program if synth_result and synth_result.program else PrimitiveNode("identity")
         best_source = ast_to_source(best_program)
@@ -434,6 +464,7 @@ class MetaController:
                 runtime_seconds=runtime,
                 symbolic_diffs=symbolic_diffs,
                 near_miss_count=len(synth_result.near_misses) if synth_result else 0,
+                phase_summary=scheduler.get_phase_summary(),
             ),
             error_message="Could not find certified solution",
         )
@@ -449,6 +480,8 @@ class MetaController:
         synth_result: Optional[SynthesisResult] = None,
         start_time: Optional[float] = None,
         refinement_edits: Optional[List[str]] = None,
+        scheduler: Optional[PhaseScheduler] = None,
+        feature_stats: Optional[Dict[str, Any]] = None,
     ) -> SolverResult:
         """Create a successful solver result."""
         program_source = ast_to_source(program)
@@ -456,8 +489,14 @@ class MetaController:
         # Compute robustness
         robustness_score = 0.0
         if self.config.compute_robustness:
+            if scheduler is not None:
+                scheduler.start_phase(SolvePhase.ROBUSTNESS)
             robustness_result = self.robustness_checker.check_robustness(program, task)
             robustness_score = robustness_result.overall_score
+            if scheduler is not None:
+                scheduler.end_phase(iterations_used=robustness_result.num_tests, success=True)
+        if scheduler is not None:
+            scheduler.end_phase()
 
         # Store in memory
         if self.config.enable_mal:
@@ -477,6 +516,7 @@ class MetaController:
         runtime = time.time() - start_time if start_time else 0.0
 
         trace.final_program = program_source
+        self._log_feature_cache(task, trace, feature_stats)
         trace.finalize(success=True, program=program_source)
 
         return SolverResult(
@@ -503,9 +543,21 @@ class MetaController:
                 refinement_applied=method == "refinement",
                 refinement_improved=method == "refinement",
                 refinement_edits=refinement_edits or [],
+                phase_summary=scheduler.get_phase_summary() if scheduler is not None else {},
             ),
         )
 
+    def _log_feature_cache(
+        self,
+        task: ARCTask,
+        trace: SolveTrace,
+        before: Optional[Dict[str, Any]] = None,
+    ) -> None:
+        """Log how many of this solve's task-feature lookups were served from the shared context."""
+        context = get_task_context(task)
+        stats = context.stats_since(before) if before is not None else context.stats()
+        trace.log("feature_cache", "controller", **stats)
+
     def _build_diff_summaries(self, critique: CriticResult) -> List[SymbolicDiffSummary]:
         """Build symbolic diff summaries from critique."""
         summaries = []
@@ -547,6 +599,49 @@ class MetaController:
     def solve_batch(
         self,
         tasks: List[ARCTask],
+        max_workers: int = 1,
     ) -> List[SolverResult]:
-        """Solve multiple tasks."""
-        return [self.solve(task) for task in tasks]
+        """
+        Solve multiple tasks.
+
+        With max_workers > 1 tasks are solved in a process pool, each
+        worker running its own controller built from this config. Workers
+        start with an empty memory store, so tasks in a batch cannot reuse
+        each other's solutions; certified programs are added to this
+        controller's memory afterwards. Results are in task order.
+        """
+        if max_workers <= 1 or len(tasks) < 2:
+            return [self.solve(task) for task in tasks]
+
+        with ProcessPoolExecutor(
+            max_workers=min(max_workers, len(tasks)),
+            initializer=_init_batch_worker,
+            initargs=(self.config,),
+        ) as executor:
+            results = list(executor.map(_solve_in_worker, tasks))
+
+        if self.config.enable_mal:
+            for task, result in zip(tasks, results):
+                program = result.audit_trace.program_ast
+                if result.success and program is not None:
+                    self.memory_store.store(create_memory_from_solution(
+                        task, program, success=True,
+                        robustness_score=result.audit_trace.robustness_score,
+                    ))
+                    self.macro_library.add_program(program, task_context=task.task_id)
+        return results
+
+
+# Controller owned by each solve_batch worker process
+_worker_controller: Optional[MetaController] = None
+
+
+def _init_batch_worker(config: ControllerConfig) -> None:
+    """Build the worker's controller once, not per task."""
+    global _worker_controller
+    _worker_controller = MetaController(config)
+
+
+def _solve_in_worker(task: ARCTask) -> SolverResult:
+    """Solve one task with the worker's controller."""
+    return _worker_controller.solve(task)
@@ -2,6 +2,7 @@
 
 from .types import (
     Grid,
+    FrozenGrid,
     Color,
     Point,
     BoundingBox,
@@ -22,6 +23,7 @@ from .metrics import (
     score_solution,
 )
 from .trace import SolveTrace, TraceEntry, TraceWriter, TraceContext
+from .trace_spool import TraceLevel, TracePolicy
 from .storage import (
     StorageConfig,
     StorageBackend,
@@ -39,6 +41,7 @@ from .model_registry import (
 __all__ = [
     # Types
     "Grid",
+    "FrozenGrid",
     "Color",
     "Point",
     "BoundingBox",
@@ -64,6 +67,8 @@ __all__ = [
     "TraceEntry",
     "TraceWriter",
     "TraceContext",
+    "TraceLevel",
+    "TracePolicy",
     # Storage
     "StorageConfig",
     "StorageBackend",
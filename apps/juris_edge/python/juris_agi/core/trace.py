@@ -2,11 +2,23 @@
 Trace schema and writer for audit trails.
 """
 
+import gzip
 import json
 from dataclasses import dataclass, field, asdict
 from datetime import datetime
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional, Tuple
+
+from .trace_index import (
+    TraceIndexEntry,
+    append_index,
+    compress_trace_file,
+    encode_trace,
+    iter_entries,
+    load_index,
+    session_key,
+)
+from .trace_spool import SPOOL_DIR, TracePolicy, TraceSpool
 
 
 @dataclass
@@ -43,9 +55,40 @@ class SolveTrace:
     uncertainty_metrics: Dict[str, Any] = field(default_factory=dict)
     regime: Optional[str] = None
 
+    # Recording policy and spool (see trace_spool); None records every
+    # event and keeps entries in memory
+    policy: Optional[TracePolicy] = field(default=None, repr=False, compare=False)
+    spool: Optional[TraceSpool] = field(default=None, repr=False, compare=False)
+    dropped_events: Dict[str, int] = field(default_factory=dict)
+    _event_counts: Dict[str, int] = field(default_factory=dict, repr=False, compare=False)
+
     def add_entry(self, entry: TraceEntry) -> None:
         """Add an entry to the trace."""
-        self.entries.append(entry)
+        if self.spool is not None:
+            self.spool.append(asdict(entry))
+        else:
+            self.entries.append(entry)
+
+    def should_log(self, event_type: str) -> bool:
+        """
+        Whether the next event of this type is recorded under the policy.
+
+        Events that are filtered out or sampled away are counted in
+        dropped_events. Check this before building expensive details.
+        """
+        policy = self.policy
+        if policy is None:
+            return True
+        if policy.enabled(event_type):
+            every = policy.sample_every.get(event_type, 1)
+            if every <= 1:
+                return True
+            seen = self._event_counts.get(event_type, 0)
+            self._event_counts[event_type] = seen + 1
+            if seen % every == 0:
+                return True
+        self.dropped_events[event_type] = self.dropped_events.get(event_type, 0) + 1
+        return False
 
     def log(
         self,
@@ -54,7 +97,19 @@ class SolveTrace:
         **details: Any
     ) -> None:
         """Convenience method to log an event."""
-        self.add_entry(TraceEntry.now(event_type, component, **details))
+        if self.should_log(event_type):
+            self.add_entry(TraceEntry.now(event_type, component, **details))
+
+    @property
+    def entry_count(self) -> int:
+        """Recorded entries, in memory or spooled."""
+        return len(self.entries) + (len(self.spool) if self.spool is not None else 0)
+
+    def close(self) -> None:
+        """Delete the spool; spooled entries are discarded."""
+        if self.spool is not None:
+            self.spool.close()
+            self.spool = None
 
     def finalize(self, success: bool, program: Optional[str] = None) -> None:
         """Mark the trace as complete."""
@@ -64,19 +119,60 @@ class SolveTrace:
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for serialization."""
-        return {
+        entries = [asdict(e) for e in self.entries]
+        if self.spool is not None:
+            entries += self.spool.read_entries()
+        return self._fields(entries)
+
+    def _fields(self, entries: Any) -> Dict[str, Any]:
+        fields = {
             "task_id": self.task_id,
             "start_time": self.start_time,
             "end_time": self.end_time,
             "success": self.success,
             "final_program": self.final_program,
             "final_metrics": self.final_metrics,
-            "entries": [asdict(e) for e in self.entries],
+            "entries": entries,
             # Budget and uncertainty
             "budget_per_phase": self.budget_per_phase,
             "uncertainty_metrics": self.uncertainty_metrics,
             "regime": self.regime,
         }
+        if self.dropped_events:
+            fields["dropped_events"] = self.dropped_events
+        return fields
+
+    def iter_encoded(self) -> Iterator[bytes]:
+        """
+        The trace as one compact JSONL line, in chunks.
+
+        Spooled entries are streamed from disk, so the whole trace is
+        never held in memory. The bytes equal encode_trace(to_dict()).
+        """
+        if self.spool is None:
+            yield encode_trace(self.to_dict())
+            return
+
+        def dump(value: Any) -> bytes:
+            return json.dumps(value, separators=(",", ":")).encode()
+
+        separator = b"{"
+        for key, value in self._fields(None).items():
+            yield separator + dump(key) + b":"
+            separator = b","
+            if key != "entries":
+                yield dump(value)
+                continue
+            yield b"["
+            comma = b""
+            for entry in self.entries:
+                yield comma + dump(asdict(entry))
+                comma = b","
+            for line in self.spool.iter_encoded():
+                yield comma + line
+                comma = b","
+            yield b"]"
+        yield b"}\n"
 
     def log_budget(self, phase_budgets: Dict[str, Any]) -> None:
         """Log budget allocation and usage per phase."""
@@ -124,31 +220,70 @@ class SolveTrace:
         )
 
     @classmethod
-    def start(cls, task_id: str) -> "SolveTrace":
+    def start(
+        cls,
+        task_id: str,
+        policy: Optional[TracePolicy] = None,
+        spool: Optional[TraceSpool] = None,
+    ) -> "SolveTrace":
         """Create a new trace for a task."""
         return cls(
             task_id=task_id,
             start_time=datetime.now().isoformat(),
+            policy=policy,
+            spool=spool,
         )
 
 
 class TraceWriter:
-    """Writes traces to disk."""
+    """
+    Writes traces to disk, one JSON file per trace.
 
-    def __init__(self, output_dir: Path):
+    Traces are pretty-printed with indent spaces; indent=None writes
+    compact JSON, streamed from the trace's spool when it has one.
+    compress writes gzip files (.json.gz).
+    """
+
+    def __init__(self, output_dir: Path, indent: Optional[int] = 2, compress: bool = False):
         self.output_dir = Path(output_dir)
         self.output_dir.mkdir(parents=True, exist_ok=True)
+        self.indent = indent
+        self.compress = compress
+
+    def start_trace(
+        self,
+        task_id: str,
+        policy: Optional[TracePolicy] = None,
+        buffer_entries: int = 256,
+    ) -> SolveTrace:
+        """Start a trace whose entries are spooled under the output directory."""
+        spool = TraceSpool(self.output_dir / SPOOL_DIR, buffer_entries)
+        return SolveTrace.start(task_id, policy or TracePolicy(), spool)
 
     def write(self, trace: SolveTrace) -> Path:
         """Write a trace to a JSON file."""
         filename = f"{trace.task_id}_{trace.start_time.replace(':', '-')}.json"
+        if self.compress:
+            filename += ".gz"
         filepath = self.output_dir / filename
 
-        with open(filepath, "w") as f:
-            json.dump(trace.to_dict(), f, indent=2)
+        with (gzip.open if self.compress else open)(filepath, "wb") as f:
+            if self.indent is not None:
+                f.write(json.dumps(trace.to_dict(), indent=self.indent).encode())
+            else:
+                for chunk in trace.iter_encoded():
+                    f.write(chunk)
 
         return filepath
 
+    @staticmethod
+    def read(filepath: Path) -> Dict[str, Any]:
+        """Load a trace written by write(), compressed or not."""
+        filepath = Path(filepath)
+        opener = gzip.open if filepath.suffix == ".gz" else open
+        with opener(filepath, "rb") as f:
+            return json.loads(f.read())
+
     def write_summary(
         self,
         traces: List[SolveTrace],
@@ -184,7 +319,7 @@ class TraceContext:
     """Context manager for tracing a solve attempt."""
 
     def __init__(self, task_id: str, writer: Optional[TraceWriter] = None):
-        self.trace = SolveTrace.start(task_id)
+        self.trace = writer.start_trace(task_id) if writer else SolveTrace.start(task_id)
         self.writer = writer
 
     def __enter__(self) -> SolveTrace:
@@ -200,7 +335,10 @@ class TraceContext:
             )
             self.trace.finalize(success=False)
         if self.writer:
-            self.writer.write(self.trace)
+            try:
+                self.writer.write(self.trace)
+            finally:
+                self.trace.close()
 
 
 # ============================================================================
@@ -212,7 +350,10 @@ class JSONLTraceWriter:
     JSONL writer for solve traces.
 
     Appends traces to a single file, one JSON object per line.
-    More efficient for batch processing and streaming reads.
+    More efficient for batch processing and streaming reads. Each file
+    gets a sidecar index (see trace_index) that is appended as traces
+    are written. Traces from start_trace spool their entries to disk
+    while the solve runs and are streamed into the file when written.
     """
 
     def __init__(self, trace_dir: str = "traces"):
@@ -234,6 +375,26 @@ class JSONLTraceWriter:
             session_id = self._current_session
         return self.trace_dir / f"traces_{session_id}.jsonl"
 
+    def start_trace(
+        self,
+        task_id: str,
+        policy: Optional[TracePolicy] = None,
+        buffer_entries: int = 256,
+    ) -> SolveTrace:
+        """
+        Start a trace that spools its entries under the trace directory.
+
+        Args:
+            task_id: Task identifier
+            policy: Events to record (default: TracePolicy(), INFO level)
+            buffer_entries: Entries held in memory between flushes
+
+        Returns:
+            A SolveTrace to close() once written
+        """
+        spool = TraceSpool(self.trace_dir / SPOOL_DIR, buffer_entries)
+        return SolveTrace.start(task_id, policy or TracePolicy(), spool)
+
     def write_trace(
         self,
         trace: SolveTrace,
@@ -249,13 +410,7 @@ class JSONLTraceWriter:
         Returns:
             Path to the trace file
         """
-        trace_path = self.get_session_path(session_id)
-
-        with open(trace_path, "a") as f:
-            json.dump(trace.to_dict(), f, separators=(",", ":"))
-            f.write("\n")
-
-        return trace_path
+        return self.write_traces([trace], session_id)
 
     def write_traces(
         self,
@@ -274,19 +429,56 @@ class JSONLTraceWriter:
         """
         trace_path = self.get_session_path(session_id)
 
-        with open(trace_path, "a") as f:
+        entries = []
+        with open(trace_path, "ab") as f:
+            offset = f.seek(0, 2)
             for trace in traces:
-                json.dump(trace.to_dict(), f, separators=(",", ":"))
-                f.write("\n")
+                length = 0
+                for chunk in trace.iter_encoded():
+                    f.write(chunk)
+                    length += len(chunk)
+                entries.append(TraceIndexEntry.from_trace(trace._fields(None), offset, length))
+                offset += length
+        append_index(trace_path, entries)
 
         return trace_path
 
+    def compress_session(
+        self,
+        session_id: Optional[str] = None,
+        frame_traces: int = 64,
+    ) -> Path:
+        """
+        Rewrite a finished session as a compressed segment.
+
+        Requires zstandard. When the current session is compressed, later
+        writes go to a new session.
+
+        Args:
+            session_id: Session to compress (default: current session)
+            frame_traces: Traces per compressed frame
+
+        Returns:
+            Path to the compressed segment
+        """
+        path = compress_trace_file(self.get_session_path(session_id), frame_traces)
+        if session_id is None or session_id == self._current_session:
+            self._current_session = None
+        return path
+
+
+# Records consumed per session, as returned by JSONLTraceReader.read_since
+TraceCursor = Dict[str, int]
+
 
 class JSONLTraceReader:
     """
     Reader for JSONL trace files.
 
-    Supports streaming and filtering traces.
+    Supports streaming and filtering traces. Filters on task_id, success
+    and timestamps are applied to the sidecar indexes, so only matching
+    traces are read and parsed. Compressed segments (traces_*.jsonl.zst)
+    are read like plain files.
     """
 
     def __init__(self, trace_dir: str = "traces"):
@@ -294,10 +486,91 @@ class JSONLTraceReader:
         self.trace_dir = Path(trace_dir)
 
     def list_trace_files(self) -> List[Path]:
-        """List all JSONL trace files in the directory."""
+        """List all JSONL trace files and compressed segments in the directory."""
         if not self.trace_dir.exists():
             return []
-        return sorted(self.trace_dir.glob("traces_*.jsonl"))
+        files = [*self.trace_dir.glob("traces_*.jsonl"), *self.trace_dir.glob("traces_*.jsonl.zst")]
+        # A compressed segment precedes later writes to the same session
+        return sorted(files, key=lambda p: (session_key(p), not p.name.endswith(".zst")))
+
+    def index(self, trace_path: Path) -> List[TraceIndexEntry]:
+        """Index entries of a trace file, bringing its sidecar up to date."""
+        return load_index(Path(trace_path))
+
+    def query(
+        self,
+        task_id: Optional[str] = None,
+        success: Optional[bool] = None,
+        since: Optional[str] = None,
+        until: Optional[str] = None,
+        limit: Optional[int] = None,
+        trace_paths: Optional[List[Path]] = None,
+    ) -> Iterator[Dict[str, Any]]:
+        """
+        Iterate over traces matching all given filters.
+
+        Args:
+            task_id: Only traces for this task
+            success: Only successful (True) or failed (False) solves
+            since: Only traces started at or after this ISO timestamp
+            until: Only traces started before this ISO timestamp
+            limit: Maximum number of traces to yield
+            trace_paths: Files to search (default: all trace files)
+
+        Yields:
+            Trace dictionaries, in file order
+        """
+        def matches(entry: TraceIndexEntry) -> bool:
+            if task_id is not None and entry.task_id != task_id:
+                return False
+            if success is not None and entry.success != success:
+                return False
+            if since is not None and (entry.start_time or "") < since:
+                return False
+            if until is not None and (entry.start_time or "") >= until:
+                return False
+            return True
+
+        if limit is not None and limit <= 0:
+            return
+        count = 0
+        for trace_path in self.list_trace_files() if trace_paths is None else trace_paths:
+            selected = [e for e in self.index(trace_path) if matches(e)]
+            for _, trace in iter_entries(trace_path, selected):
+                yield trace
+                count += 1
+                if limit is not None and count >= limit:
+                    return
+
+    def read_since(
+        self,
+        cursor: Optional[TraceCursor] = None,
+        success_only: bool = False,
+    ) -> Tuple[List[Dict[str, Any]], TraceCursor]:
+        """
+        Read the traces written since a cursor.
+
+        Args:
+            cursor: From a previous call (None reads everything)
+            success_only: If True, only return successful solves; the
+                cursor still moves past the others
+
+        Returns:
+            Tuple of (new traces, cursor to pass next time)
+        """
+        position = dict(cursor or {})
+        consumed: TraceCursor = {}
+        traces = []
+        for trace_path in self.list_trace_files():
+            key = session_key(trace_path)
+            entries = self.index(trace_path)
+            first = consumed.get(key, 0)  # Records in earlier files of the session
+            start = max(0, position.get(key, 0) - first)
+            selected = [e for e in entries[start:] if e.success or not success_only]
+            traces.extend(trace for _, trace in iter_entries(trace_path, selected))
+            consumed[key] = first + len(entries)
+        # Sessions whose files have gone keep their position
+        return traces, {**position, **consumed}
 
     def read_traces(
         self,
@@ -325,27 +598,11 @@ class JSONLTraceReader:
         if not trace_path.exists():
             return []
 
-        traces = []
-        with open(trace_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    trace = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                if success_only and not trace.get("success", False):
-                    continue
-
-                traces.append(trace)
-
-                if limit is not None and len(traces) >= limit:
-                    break
-
-        return traces
+        return list(self.query(
+            success=True if success_only else None,
+            limit=limit,
+            trace_paths=[trace_path],
+        ))
 
     def read_all_traces(
         self,
@@ -360,11 +617,7 @@ class JSONLTraceReader:
         Returns:
             List of all trace dictionaries
         """
-        all_traces = []
-        for trace_path in self.list_trace_files():
-            traces = self.read_traces(trace_path, success_only=success_only)
-            all_traces.extend(traces)
-        return all_traces
+        return list(self.query(success=True if success_only else None))
 
     def get_successful_programs(self) -> List[Dict[str, Any]]:
         """
@@ -374,7 +627,7 @@ class JSONLTraceReader:
             List of dicts with program, task_id, and metrics
         """
         successful = []
-        for trace in self.read_all_traces(success_only=True):
+        for trace in self.query(success=True):
             if trace.get("final_program"):
                 successful.append({
                     "task_id": trace["task_id"],
@@ -408,35 +661,28 @@ class JSONLTraceReader:
         if not trace_path.exists():
             return
 
-        with open(trace_path, "r") as f:
-            for line in f:
-                line = line.strip()
-                if not line:
-                    continue
-
-                try:
-                    trace = json.loads(line)
-                except json.JSONDecodeError:
-                    continue
-
-                if success_only and not trace.get("success", False):
-                    continue
-
-                yield trace
+        yield from self.query(success=True if success_only else None, trace_paths=[trace_path])
 
 
-def create_trace_from_task(task, task_id: str = "unknown") -> SolveTrace:
+def create_trace_from_task(
+    task,
+    task_id: str = "unknown",
+    trace: Optional[SolveTrace] = None,
+) -> SolveTrace:
     """
     Create a SolveTrace initialized with task features.
 
     Args:
         task: ARCTask instance
         task_id: Task identifier
+        trace: Trace to initialize, e.g. from a writer's start_trace
+            (default: a new in-memory trace)
 
     Returns:
         Initialized SolveTrace
     """
-    trace = SolveTrace.start(task_id)
+    if trace is None:
+        trace = SolveTrace.start(task_id)
 
     # Store task feature info in initial log entry
     input_dims = [pair.input.shape for pair in task.train]
@@ -0,0 +1,334 @@
+"""
+Sidecar indexes and compressed segments for JSONL trace files.
+
+Each traces_<session>.jsonl file gets a traces_<session>.jsonl.idx
+sidecar with one JSON row per trace:
+
+    [offset, length, task_id, success, start_time, end_time]
+
+giving the byte range of the trace's line and the fields readers filter
+on, so filtered reads seek straight to the matching traces instead of
+parsing every line.
+
+A finished session can be rewritten as a zstd-compressed segment
+(traces_<session>.jsonl.zst) of independent frames holding up to
+frame_traces traces each. Its rows carry the frame's byte range as two
+extra fields, and offset/length then locate the trace in the
+decompressed frame. Compression needs the optional zstandard package.
+
+The writer appends rows as it writes traces. A reader extends an index
+that lags its file (traces from an older writer, or a crash after the
+last trace append) by scanning only the unindexed tail. An index whose
+rows do not chain, each trace starting where the previous one ended,
+has a gap or a duplicate (a crash between the two appends followed by
+more writes, or racing writers) and is rebuilt by a full scan, as is
+one that no longer fits the file.
+"""
+
+import json
+import os
+from dataclasses import dataclass
+from pathlib import Path
+from typing import Any, Dict, Iterable, Iterator, List, Optional, Tuple
+
+try:
+    import zstandard
+    ZSTD_AVAILABLE = True
+except ImportError:
+    ZSTD_AVAILABLE = False
+
+INDEX_SUFFIX = ".idx"
+COMPRESSED_SUFFIX = ".zst"
+
+
+@dataclass
+class TraceIndexEntry:
+    """Location and filter fields of one trace in a trace file."""
+    offset: int
+    length: int
+    task_id: Optional[str]
+    success: bool
+    start_time: Optional[str]
+    end_time: Optional[str]
+    frame_offset: Optional[int] = None  # Compressed segments only
+    frame_length: Optional[int] = None
+
+    @property
+    def end(self) -> int:
+        """Byte position in the trace file just past this trace."""
+        if self.frame_offset is None:
+            return self.offset + self.length
+        return self.frame_offset + self.frame_length
+
+    def to_row(self) -> List[Any]:
+        row = [self.offset, self.length, self.task_id, self.success, self.start_time, self.end_time]
+        if self.frame_offset is not None:
+            row += [self.frame_offset, self.frame_length]
+        return row
+
+    @classmethod
+    def from_row(cls, row: List[Any]) -> "TraceIndexEntry":
+        return cls(*row)
+
+    @classmethod
+    def from_trace(cls, trace: Dict[str, Any], offset: int, length: int) -> "TraceIndexEntry":
+        return cls(
+            offset=offset,
+            length=length,
+            task_id=trace.get("task_id"),
+            success=bool(trace.get("success", False)),
+            start_time=trace.get("start_time"),
+            end_time=trace.get("end_time"),
+        )
+
+
+def _require_zstd() -> None:
+    if not ZSTD_AVAILABLE:
+        raise RuntimeError("zstandard is required for compressed trace segments")
+
+
+def index_path(trace_path: Path) -> Path:
+    """Sidecar index path of a trace file."""
+    return trace_path.with_name(trace_path.name + INDEX_SUFFIX)
+
+
+def is_compressed(trace_path: Path) -> bool:
+    return trace_path.name.endswith(COMPRESSED_SUFFIX)
+
+
+def session_key(trace_path: Path) -> str:
+    """Name shared by a session's plain and compressed trace files."""
+    name = trace_path.name
+    if name.endswith(COMPRESSED_SUFFIX):
+        name = name[:-len(COMPRESSED_SUFFIX)]
+    return name[:-len(".jsonl")] if name.endswith(".jsonl") else name
+
+
+def encode_trace(trace: Dict[str, Any]) -> bytes:
+    """One JSONL line for a trace dict."""
+    return json.dumps(trace, separators=(",", ":")).encode() + b"\n"
+
+
+def append_index(trace_path: Path, entries: Iterable[TraceIndexEntry]) -> None:
+    """Append rows for newly written traces to the sidecar index."""
+    rows = "".join(json.dumps(e.to_row(), separators=(",", ":")) + "\n" for e in entries)
+    if rows:
+        with open(index_path(trace_path), "a") as f:
+            f.write(rows)
+
+
+def _write_index(path: Path, entries: List[TraceIndexEntry]) -> None:
+    """Replace an index file atomically."""
+    tmp = path.with_name(path.name + ".tmp")
+    with open(tmp, "w") as f:
+        for entry in entries:
+            f.write(json.dumps(entry.to_row(), separators=(",", ":")) + "\n")
+    os.replace(tmp, path)
+
+
+def _read_index(path: Path) -> List[TraceIndexEntry]:
+    """Rows of an index file, in file order."""
+    entries: List[TraceIndexEntry] = []
+    if not path.exists():
+        return entries
+    with open(path) as f:
+        for line in f:
+            try:
+                entry = TraceIndexEntry.from_row(json.loads(line))
+            except (ValueError, TypeError):
+                continue  # Torn or malformed row
+            entries.append(entry)
+    return entries
+
+
+def _chained(entries: List[TraceIndexEntry]) -> bool:
+    """Whether every entry starts where the previous one ended, from byte 0."""
+    previous: Optional[TraceIndexEntry] = None
+    for entry in entries:
+        if entry.frame_offset is None:
+            expected = previous.end if previous else 0
+            if entry.offset != expected:
+                return False
+        elif previous is not None and entry.frame_offset == previous.frame_offset:
+            if entry.offset != previous.offset + previous.length:
+                return False
+        elif entry.frame_offset != (previous.end if previous else 0) or entry.offset != 0:
+            return False
+        previous = entry
+    return True
+
+
+def _scan_lines(data: bytes, base: int) -> Iterator[Tuple[int, int, Dict[str, Any]]]:
+    """(offset, length, trace) for each complete, parseable line in data."""
+    position = 0
+    while True:
+        newline = data.find(b"\n", position)
+        if newline < 0:
+            return  # Incomplete last line, possibly still being written
+        line = data[position:newline + 1]
+        if line.strip():
+            try:
+                trace = json.loads(line)
+            except json.JSONDecodeError:
+                trace = None
+            if isinstance(trace, dict):
+                yield base + position, len(line), trace
+        position = newline + 1
+
+
+def _scan_plain(trace_path: Path, start: int) -> List[TraceIndexEntry]:
+    """Index entries for the traces at or after byte start."""
+    with open(trace_path, "rb") as f:
+        f.seek(start)
+        data = f.read()
+    return [
+        TraceIndexEntry.from_trace(trace, offset, length)
+        for offset, length, trace in _scan_lines(data, start)
+    ]
+
+
+def _scan_compressed(trace_path: Path) -> List[TraceIndexEntry]:
+    """Index entries for a compressed segment, frame by frame."""
+    _require_zstd()
+    data = trace_path.read_bytes()
+    entries = []
+    frame_offset = 0
+    while frame_offset < len(data):
+        decompressor = zstandard.ZstdDecompressor().decompressobj()
+        frame = decompressor.decompress(data[frame_offset:])
+        frame_length = len(data) - frame_offset - len(decompressor.unused_data)
+        for offset, length, trace in _scan_lines(frame, 0):
+            entry = TraceIndexEntry.from_trace(trace, offset, length)
+            entry.frame_offset, entry.frame_length = frame_offset, frame_length
+            entries.append(entry)
+        frame_offset += frame_length
+    return entries
+
+
+def load_index(trace_path: Path, update: bool = True) -> List[TraceIndexEntry]:
+    """
+    Index entries for every complete trace in a trace file.
+
+    Args:
+        trace_path: Plain or compressed trace file
+        update: Save rows found by scanning back to the sidecar; skipped
+            quietly if the directory is read-only
+
+    Returns:
+        Entries in file order
+    """
+    path = index_path(trace_path)
+    entries = _read_index(path)
+    size = trace_path.stat().st_size
+
+    if is_compressed(trace_path):
+        if entries and entries[-1].end == size and _chained(entries):
+            return entries
+        entries, new, rewrite = _scan_compressed(trace_path), [], True
+    else:
+        covered = entries[-1].end if entries else 0
+        # Truncated or replaced file, or rows with a gap or duplicate
+        rewrite = covered > size or not _chained(entries)
+        if rewrite:
+            entries, covered = [], 0
+        new = _scan_plain(trace_path, covered) if covered < size else []
+        entries += new
+
+    if update and (rewrite or new):
+        try:
+            if rewrite:
+                _write_index(path, entries)
+            else:
+                append_index(trace_path, new)
+        except OSError:
+            pass
+    return entries
+
+
+def iter_entries(
+    trace_path: Path,
+    entries: Iterable[TraceIndexEntry],
+) -> Iterator[Tuple[TraceIndexEntry, Dict[str, Any]]]:
+    """
+    Parse the traces for the given entries of one file.
+
+    Only the selected lines are read and parsed; for compressed segments
+    each frame is decompressed once for consecutive entries in it.
+    """
+    frame_key: Optional[int] = None
+    frame = b""
+    with open(trace_path, "rb") as f:
+        for entry in entries:
+            if entry.frame_offset is None:
+                f.seek(entry.offset)
+                line = f.read(entry.length)
+            else:
+                if entry.frame_offset != frame_key:
+                    _require_zstd()
+                    f.seek(entry.frame_offset)
+                    frame = zstandard.ZstdDecompressor().decompressobj().decompress(
+                        f.read(entry.frame_length)
+                    )
+                    frame_key = entry.frame_offset
+                line = frame[entry.offset:entry.offset + entry.length]
+            try:
+                yield entry, json.loads(line)
+            except json.JSONDecodeError:
+                continue
+
+
+def compress_trace_file(
+    trace_path: Path,
+    frame_traces: int = 64,
+    level: int = 3,
+) -> Path:
+    """
+    Rewrite a plain trace file as an indexed zstd-compressed segment.
+
+    The plain file and its index are removed afterwards, so the session
+    should not be written to again.
+
+    Args:
+        trace_path: traces_<session>.jsonl file
+        frame_traces: Traces per independently decompressible frame
+        level: zstd compression level
+
+    Returns:
+        Path of the compressed segment
+    """
+    _require_zstd()
+    if is_compressed(trace_path):
+        return trace_path
+    target = trace_path.with_name(trace_path.name + COMPRESSED_SUFFIX)
+    if target.exists():
+        raise FileExistsError(f"Compressed segment already exists: {target}")
+
+    entries = load_index(trace_path, update=False)
+    compressor = zstandard.ZstdCompressor(level=level)
+    tmp = target.with_name(target.name + ".tmp")
+    compressed: List[TraceIndexEntry] = []
+
+    with open(trace_path, "rb") as src, open(tmp, "wb") as dst:
+        for start in range(0, len(entries), frame_traces):
+            frame_entries = entries[start:start + frame_traces]
+            lines = []
+            for entry in frame_entries:
+                src.seek(entry.offset)
+                lines.append(src.read(entry.length))
+            frame = compressor.compress(b"".join(lines))
+            frame_offset = dst.tell()
+            dst.write(frame)
+
+            position = 0
+            for entry, line in zip(frame_entries, lines):
+                compressed.append(TraceIndexEntry(
+                    position, len(line), entry.task_id, entry.success,
+                    entry.start_time, entry.end_time, frame_offset, len(frame),
+                ))
+                position += len(line)
+
+    _write_index(index_path(target), compressed)
+    os.replace(tmp, target)
+    trace_path.unlink()
+    index_path(trace_path).unlink(missing_ok=True)
+    return target
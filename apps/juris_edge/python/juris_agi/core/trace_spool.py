@@ -0,0 +1,129 @@
+"""
+Trace policies and disk spools for in-flight traces.
+
+A TracePolicy decides which events a SolveTrace records: each event
+type has a TraceLevel (per-candidate scores are DEBUG, everything else
+INFO), events above the policy's verbosity are dropped, and
+high-frequency types can be sampled down to one in every N.
+
+A TraceSpool holds the entries of a trace that is still being solved.
+Each entry is encoded as a compact JSON line when it is logged and
+flushed to a per-trace file once buffer_entries lines are pending, so
+a long solve keeps at most that many entries in memory. Writers stream
+the spooled lines straight into the trace's record; the bytes are the
+same as for an in-memory trace, so readers see no difference. The
+spool file is removed when the spool is closed or garbage collected.
+"""
+
+import json
+import os
+import tempfile
+import weakref
+from dataclasses import dataclass, field
+from enum import IntEnum
+from pathlib import Path
+from typing import Any, Dict, Iterator, List
+
+SPOOL_DIR = ".spool"
+
+
+class TraceLevel(IntEnum):
+    """Verbosity of trace events, from always-recorded to diagnostic."""
+    SUMMARY = 0  # Only the final outcome (finalize, result fields)
+    INFO = 1     # Phase-level events (task_loaded, budget_update, ...)
+    DEBUG = 2    # High-frequency events (candidate_scored, ...)
+
+
+# Event types logged below INFO; unlisted types are INFO
+DEFAULT_EVENT_LEVELS: Dict[str, TraceLevel] = {
+    "candidate_scored": TraceLevel.DEBUG,
+}
+
+
+@dataclass
+class TracePolicy:
+    """
+    Which events a trace records.
+
+    Args:
+        verbosity: Highest level recorded
+        event_levels: Level per event type (others are INFO)
+        sample_every: Record only every Nth event of these types
+    """
+    verbosity: TraceLevel = TraceLevel.INFO
+    event_levels: Dict[str, TraceLevel] = field(default_factory=lambda: dict(DEFAULT_EVENT_LEVELS))
+    sample_every: Dict[str, int] = field(default_factory=dict)
+
+    def level_of(self, event_type: str) -> TraceLevel:
+        return self.event_levels.get(event_type, TraceLevel.INFO)
+
+    def enabled(self, event_type: str) -> bool:
+        """Whether events of this type are recorded at all."""
+        return self.level_of(event_type) <= self.verbosity
+
+
+def _discard(handle: Any, path: str) -> None:
+    handle.close()
+    try:
+        os.unlink(path)
+    except FileNotFoundError:
+        pass
+
+
+class TraceSpool:
+    """
+    File-backed entry list for one in-flight trace.
+
+    Args:
+        directory: Where to create the spool file
+        buffer_entries: Encoded entries held in memory before flushing
+    """
+
+    def __init__(self, directory: Path, buffer_entries: int = 256):
+        directory = Path(directory)
+        directory.mkdir(parents=True, exist_ok=True)
+        fd, path = tempfile.mkstemp(prefix="trace_", suffix=".jsonl", dir=directory)
+        self.path = Path(path)
+        self.buffer_entries = max(1, buffer_entries)
+        self._file = os.fdopen(fd, "w+b")
+        self._pending: List[bytes] = []
+        self._count = 0
+        self._finalizer = weakref.finalize(self, _discard, self._file, path)
+
+    def __len__(self) -> int:
+        return self._count
+
+    def append(self, entry: Dict[str, Any]) -> None:
+        """Encode an entry; values JSON cannot represent are stored as strings."""
+        self._pending.append(json.dumps(entry, separators=(",", ":"), default=str).encode())
+        self._count += 1
+        if len(self._pending) >= self.buffer_entries:
+            self.flush()
+
+    def flush(self) -> None:
+        if self._pending:
+            self._file.write(b"\n".join(self._pending) + b"\n")
+            self._file.flush()
+            self._pending = []
+
+    def iter_encoded(self) -> Iterator[bytes]:
+        """Each entry's compact JSON, in logging order."""
+        self.flush()
+        self._file.seek(0)
+        try:
+            for line in self._file:
+                yield line.rstrip(b"\n")
+        finally:
+            self._file.seek(0, os.SEEK_END)
+
+    def read_entries(self) -> List[Dict[str, Any]]:
+        return [json.loads(line) for line in self.iter_encoded()]
+
+    @property
+    def closed(self) -> bool:
+        return not self._finalizer.alive
+
+    def close(self) -> None:
+        """Delete the spool file; the entries are gone afterwards."""
+        self._pending = []
+        self._finalizer()
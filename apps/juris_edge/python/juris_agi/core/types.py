@@ -104,6 +104,49 @@ class Grid:
     def full(cls, height: int, width: int, fill_value: Color) -> "Grid":
         return cls(np.full((height, width), fill_value, dtype=np.int32))
 
+    def freeze(self) -> "FrozenGrid":
+        """Return an immutable copy of this grid."""
+        return FrozenGrid(self.data.copy())
+
+
+class FrozenGrid(Grid):
+    """
+    Immutable grid with a precomputed content hash.
+
+    The array is marked read-only and the hash (shape, dtype and bytes)
+    is computed once, so frozen grids can be shared and used as cache keys.
+    The grid takes ownership of the array it is given; use Grid.freeze()
+    to freeze a copy. copy() returns a mutable Grid.
+    """
+
+    def __post_init__(self):
+        super().__post_init__()
+        self.data.flags.writeable = False
+        content = (self.data.shape, self.data.dtype.str, self.data.tobytes())
+        object.__setattr__(self, "_content", content)
+        object.__setattr__(self, "content_hash", hash(content))
+
+    def __setattr__(self, name, value):
+        if "content_hash" in self.__dict__:
+            raise AttributeError("FrozenGrid is immutable")
+        object.__setattr__(self, name, value)
+
+    def __setitem__(self, key, value):
+        raise TypeError("FrozenGrid is immutable; use copy() for a mutable grid")
+
+    def __eq__(self, other: object) -> bool:
+        if self is other:
+            return True
+        if isinstance(other, FrozenGrid) and other.data.dtype == self.data.dtype:
+            return self._content == other._content
+        return super().__eq__(other)
+
+    def __hash__(self) -> int:
+        return self.content_hash
+
+    def freeze(self) -> "FrozenGrid":
+        return self
+
 
 @dataclass(frozen=True)
 class GridObject:
@@ -260,6 +303,7 @@ class AuditTrace:
     refinement_applied: bool = False
     refinement_improved: bool = False
     refinement_edits: List[str] = field(default_factory=list)
+    phase_summary: Dict[str, Any] = field(default_factory=dict)  # PhaseScheduler.get_phase_summary()
 
     def to_dict(self) -> Dict[str, Any]:
         """Convert to dictionary for JSON serialization."""
@@ -286,6 +330,7 @@ class AuditTrace:
             "refinement_applied": self.refinement_applied,
             "refinement_improved": self.refinement_improved,
             "refinement_edits": self.refinement_edits,
+            "phase_summary": self.phase_summary,
         }
 
 
@@ -14,11 +14,13 @@ Falls back to heuristic-based StubNeuralCritic when PyTorch is unavailable.
 """
 
 from abc import ABC, abstractmethod
+from collections import OrderedDict
 from dataclasses import dataclass, field
 from typing import List, Dict, Any, Optional, Tuple
+import logging
 import math
 
-from ..core.types import Grid, ARCTask
+from ..core.types import Grid, ARCTask, FrozenGrid
 from ..dsl.ast import ASTNode, PrimitiveNode, ComposeNode, walk_ast
 from ..dsl.primitives import list_primitives, PRIMITIVES
 
@@ -35,6 +37,9 @@ except ImportError:
     F = None
 
 
+logger = logging.getLogger(__name__)
+
+
 # =============================================================================
 # Constants and Configuration
 # =============================================================================
@@ -218,6 +223,29 @@ if TORCH_AVAILABLE:
 
             return token_ids[:self.config.max_program_len]
 
+        def tokenize(self, programs: List[ASTNode]) -> Tuple[torch.Tensor, torch.Tensor]:
+            """
+            Convert programs to padded token IDs.
+
+            Returns:
+                (batch, seq) token IDs and (batch, seq) padding mask (True = pad)
+            """
+            sequences = [self._ast_to_token_ids(p) for p in programs]
+            lengths = [len(s) for s in sequences]
+            max_len = max(lengths)
+
+            # Pad in Python and build each tensor in one call
+            device = self.prim_embed.weight.device
+            padded = torch.tensor(
+                [s + [0] * (max_len - len(s)) for s in sequences],
+                dtype=torch.long, device=device,
+            )
+            mask = (
+                torch.arange(max_len, device=device)
+                >= torch.tensor(lengths, device=device).unsqueeze(1)
+            )
+            return padded, mask
+
         def forward(self, programs: List[ASTNode]) -> torch.Tensor:
             """
             Encode a batch of programs.
@@ -228,22 +256,11 @@ if TORCH_AVAILABLE:
             Returns:
                 (batch, embed_dim) program embeddings
             """
-            batch_size = len(programs)
-
-            # Convert to token sequences
-            sequences = [self._ast_to_token_ids(p) for p in programs]
-            max_len = max(len(s) for s in sequences)
-            max_len = min(max_len, self.config.max_program_len)
-
-            # Pad sequences
-            device = self.prim_embed.weight.device
-            padded = torch.zeros(batch_size, max_len, dtype=torch.long, device=device)
-            mask = torch.ones(batch_size, max_len, dtype=torch.bool, device=device)
+            return self.encode_tokens(*self.tokenize(programs))
 
-            for i, seq in enumerate(sequences):
-                seq_len = min(len(seq), max_len)
-                padded[i, :seq_len] = torch.tensor(seq[:seq_len], device=device)
-                mask[i, :seq_len] = False
+        def encode_tokens(self, padded: torch.Tensor, mask: torch.Tensor) -> torch.Tensor:
+            """Encode padded token IDs from tokenize()."""
+            max_len = padded.shape[1]
 
             # Embed tokens
             embedded = self.prim_embed(padded)  # (batch, seq, embed)
@@ -294,22 +311,17 @@ if TORCH_AVAILABLE:
 
         def _encode_grid_simple(self, grid: torch.Tensor) -> torch.Tensor:
             """Simple grid encoding - color histogram + dimensions."""
-            batch_size = grid.shape[0]
-            device = grid.device
+            flat = grid.reshape(grid.shape[0], -1)
 
-            # Color histogram
-            histograms = []
-            for i in range(batch_size):
-                hist = torch.histc(
-                    grid[i].float(), bins=NUM_COLORS, min=0, max=NUM_COLORS - 1
-                )
-                hist = hist / hist.sum().clamp(min=1)  # Normalize
-                histograms.append(hist)
-
-            hist_tensor = torch.stack(histograms)  # (batch, NUM_COLORS)
+            # Color histogram for the whole batch; values outside the
+            # palette are not counted
+            in_palette = (flat >= 0) & (flat < NUM_COLORS)
+            hist_tensor = torch.zeros(
+                flat.shape[0], NUM_COLORS, dtype=torch.float, device=grid.device
+            ).scatter_add_(1, flat.long().clamp(0, NUM_COLORS - 1), in_palette.float())
+            hist_tensor = hist_tensor / hist_tensor.sum(dim=1, keepdim=True).clamp(min=1)
 
             # Embed histogram
-            color_emb = self.color_embed.weight.mean(dim=0)  # Average embedding
             color_features = hist_tensor @ self.color_embed.weight  # (batch, embed/2)
 
             return color_features
@@ -402,11 +414,25 @@ if TORCH_AVAILABLE:
                 generalization: (batch,) generalization scores
                 confidence: (batch,) confidence scores
             """
-            # Encode programs
-            program_emb = self.program_encoder(programs)
-
-            # Encode task context
+            tokens, mask = self.program_encoder.tokenize(programs)
             context_emb = self.context_encoder(input_grids, output_grids)
+            scores = self.score_tokens(tokens, mask, context_emb)
+            return scores[:, 0], scores[:, 1], scores[:, 2]
+
+        def score_tokens(
+            self,
+            tokens: torch.Tensor,
+            mask: torch.Tensor,
+            context_emb: torch.Tensor,
+        ) -> torch.Tensor:
+            """
+            Score tokenized programs against an encoded task context.
+
+            Returns:
+                (batch, 3) plausibility, generalization and confidence
+            """
+            # Encode programs
+            program_emb = self.program_encoder.encode_tokens(tokens, mask)
 
             # Expand context for each program (assumes 1 task for batch of programs)
             if context_emb.shape[0] == 1 and program_emb.shape[0] > 1:
@@ -417,9 +443,7 @@ if TORCH_AVAILABLE:
             scores = self.scorer(combined)
 
             # Apply sigmoid to get [0, 1] range
-            scores = torch.sigmoid(scores)
-
-            return scores[:, 0], scores[:, 1], scores[:, 2]
+            return torch.sigmoid(scores)
 
 
     class NeuralCriticImpl(NeuralCritic):
@@ -428,24 +452,51 @@ if TORCH_AVAILABLE:
 
         Scores programs using a learned model that considers
         both program structure and task context.
+
+        The task-context embedding is cached per task (by grid content),
+        so scoring many candidates for one task encodes the task once.
+        For CPU inference, quantize=True converts Linear layers outside
+        the transformer encoder to dynamic int8 (the encoder layers'
+        fused CPU kernel needs float weights), and compile=True runs
+        program scoring through torch.compile, which pays a one-off
+        compilation on the first batch.
         """
 
         def __init__(
             self,
             config: Optional[CriticConfig] = None,
             model_path: Optional[str] = None,
+            device: Optional[str] = None,
+            quantize: bool = False,
+            compile: bool = False,
+            context_cache_size: int = 64,
         ):
             self.config = config or CriticConfig()
             self.model = GeneralizationCriticModel(self.config)
             self.model_path = model_path
+            self.context_cache_size = context_cache_size
+            self._context_cache: "OrderedDict[Tuple[FrozenGrid, ...], torch.Tensor]" = OrderedDict()
 
             # Load pretrained weights if provided
             if model_path is not None:
                 self._load_weights(model_path)
 
-            # Move to available device
-            self.device = torch.device("cuda" if torch.cuda.is_available() else "cpu")
+            # Move to requested or available device
+            if device is None:
+                device = "cuda" if torch.cuda.is_available() else "cpu"
+            self.device = torch.device(device)
             self.model.to(self.device)
+            self.model.eval()
+
+            if quantize:
+                if self.device.type == "cpu":
+                    self.model = _quantize_dynamic(self.model)
+                else:
+                    logger.warning("Dynamic quantization is CPU-only, keeping float weights")
+
+            self._score_tokens = self.model.score_tokens
+            if compile:
+                self._score_tokens = torch.compile(self.model.score_tokens, dynamic=True)
 
         def _load_weights(self, path: str) -> None:
             """Load model weights from file."""
@@ -454,6 +505,36 @@ if TORCH_AVAILABLE:
                 self.model.load_state_dict(state_dict)
             except Exception as e:
                 print(f"Warning: Failed to load critic weights: {e}")
+            self.clear_cache()
+
+        def clear_cache(self) -> None:
+            """Drop cached task-context embeddings (e.g. after changing weights)."""
+            self._context_cache.clear()
+
+        def _task_context(self, task: ARCTask) -> torch.Tensor:
+            """Encoded training pairs of a task, cached by grid content."""
+            key = tuple(
+                grid.freeze() for pair in task.train for grid in (pair.input, pair.output)
+            )
+            context = self._context_cache.get(key)
+            if context is not None:
+                self._context_cache.move_to_end(key)
+                return context
+
+            input_grids = [
+                self._grid_to_tensor(pair.input).unsqueeze(0)
+                for pair in task.train
+            ]
+            output_grids = [
+                self._grid_to_tensor(pair.output).unsqueeze(0)
+                for pair in task.train
+            ]
+            context = self.model.context_encoder(input_grids, output_grids)
+
+            self._context_cache[key] = context
+            while len(self._context_cache) > self.context_cache_size:
+                self._context_cache.popitem(last=False)
+            return context
 
         def _grid_to_tensor(self, grid: Grid) -> torch.Tensor:
             """Convert Grid to tensor."""
@@ -487,30 +568,20 @@ if TORCH_AVAILABLE:
             if not programs or not task.train:
                 return [self._neutral_score(p) for p in programs]
 
-            # Prepare input tensors
-            input_grids = [
-                self._grid_to_tensor(pair.input).unsqueeze(0)
-                for pair in task.train
-            ]
-            output_grids = [
-                self._grid_to_tensor(pair.output).unsqueeze(0)
-                for pair in task.train
-            ]
-
             # Run model
             self.model.eval()
             with torch.no_grad():
-                plausibility, generalization, confidence = self.model(
-                    programs, input_grids, output_grids
-                )
+                context = self._task_context(task)
+                tokens, mask = self.model.program_encoder.tokenize(programs)
+                batch_scores = self._score_tokens(tokens, mask, context).tolist()
 
             # Convert to scores
             scores = []
-            for i, program in enumerate(programs):
+            for program, (plausibility, generalization, confidence) in zip(programs, batch_scores):
                 scores.append(NeuralCriticScore(
-                    confidence=float(confidence[i]),
-                    plausibility=float(plausibility[i]),
-                    generalization=float(generalization[i]),
+                    confidence=confidence,
+                    plausibility=plausibility,
+                    generalization=generalization,
                     features=self._extract_features(program),
                 ))
 
@@ -526,6 +597,15 @@ if TORCH_AVAILABLE:
             )
 
 
+    def _quantize_dynamic(model: "nn.Module") -> "nn.Module":
+        """Dynamic int8 quantization of Linear layers outside encoder layers."""
+        targets = {
+            name for name, module in model.named_modules()
+            if type(module) is nn.Linear and ".transformer." not in f".{name}."
+        }
+        return torch.ao.quantization.quantize_dynamic(model, targets, dtype=torch.qint8)
+
+
 # =============================================================================
 # Heuristic Fallback (always available)
 # =============================================================================
@@ -639,6 +719,9 @@ def get_critic(
     use_neural: bool = True,
     config: Optional[CriticConfig] = None,
     model_path: Optional[str] = None,
+    device: Optional[str] = None,
+    quantize: bool = False,
+    compile: bool = False,
 ) -> NeuralCritic:
     """
     Get the best available critic model.
@@ -647,12 +730,18 @@ def get_critic(
         use_neural: Whether to use neural model (if available)
         config: Configuration for neural model
         model_path: Path to pretrained weights
+        device: Torch device (default: CUDA if available, else CPU)
+        quantize: Dynamic int8 quantization (CPU only)
+        compile: Score programs through torch.compile
 
     Returns:
         NeuralCritic instance (neural if available and requested, otherwise stub)
     """
     if use_neural and TORCH_AVAILABLE:
-        return NeuralCriticImpl(config=config, model_path=model_path)
+        return NeuralCriticImpl(
+            config=config, model_path=model_path, device=device,
+            quantize=quantize, compile=compile,
+        )
     return StubNeuralCritic()
 
 
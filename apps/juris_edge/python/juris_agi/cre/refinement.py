@@ -4,11 +4,17 @@ Refinement engine for near-miss solutions.
 Uses symbolic diffs to propose local edits when synthesis gets close.
 """
 
+import logging
+import pickle
+import time
 from abc import ABC, abstractmethod
+from collections import OrderedDict
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum, auto
-from typing import List, Dict, Any, Optional, Callable, Tuple
+from typing import List, Dict, Any, Optional, Callable, Iterator, Set, Tuple
 
+from ..core.metrics import compute_pixel_accuracy
 from ..core.types import Grid, ARCTask
 from ..dsl.ast import (
     ASTNode,
@@ -20,9 +26,13 @@ from ..dsl.ast import (
 )
 from ..dsl.primitives import PRIMITIVES
 from ..dsl.interpreter import make_program
+from ..dsl.compiler import program_key
+from ..dsl.memo import _Unkeyable
 from ..dsl.prettyprint import ast_to_source
 from .critic_symbolic import SymbolicCritic, SymbolicDiff, CriticResult
 
+logger = logging.getLogger(__name__)
+
 
 class EditType(Enum):
     """Types of edits to programs."""
@@ -75,6 +85,45 @@ class RefinementResult:
     refined_ast: Optional[ASTNode] = None
     edits_applied: List[EditOperation] = field(default_factory=list)
     iterations: int = 0
+    candidates_scored: int = 0
+
+
+def score_program(program: ASTNode, task: ARCTask) -> Tuple[bool, float]:
+    """
+    Certification flag and refinement score of a program.
+
+    Equal to (critique.is_certified, RefinementEngine._compute_score(critique))
+    for critique = SymbolicCritic().evaluate(program, task), but only runs
+    the program once per training pair: no diffs or invariant checks.
+    """
+    try:
+        program_fn = make_program(program)
+    except Exception:
+        return False, 0.0
+
+    all_exact = True
+    total_accuracy = 0.0
+    for pair in task.train:
+        try:
+            predicted = program_fn(pair.input)
+        except Exception:
+            all_exact = False
+            continue
+        if not predicted == pair.output:
+            all_exact = False
+        total_accuracy += compute_pixel_accuracy(predicted, pair.output)
+
+    if all_exact:
+        return True, 100.0
+    return False, total_accuracy / len(task.train) * 50.0
+
+
+def _score_chunk(
+    task: ARCTask,
+    programs: List[ASTNode],
+) -> List[Tuple[bool, float]]:
+    """Score a chunk of programs (runs inside worker processes)."""
+    return [score_program(p, task) for p in programs]
 
 
 class RefinementEngine:
@@ -88,10 +137,36 @@ class RefinementEngine:
         self,
         max_iterations: int = 20,
         max_edits_per_iteration: int = 10,
+        time_budget: Optional[float] = None,
+        max_workers: int = 1,
+        min_parallel_batch: int = 4,
+        score_cache_size: int = 10000,
     ):
+        """
+        Initialize the engine.
+
+        Args:
+            max_iterations: Maximum edit-and-score rounds per refine call
+            max_edits_per_iteration: Candidate edits scored per round
+            time_budget: Seconds a refine call may spend (None = no limit)
+            max_workers: Worker processes for scoring edits (1 = in-process)
+            min_parallel_batch: Smallest batch worth sending to workers
+            score_cache_size: Scored programs remembered for the current task
+        """
         self.max_iterations = max_iterations
         self.max_edits_per_iteration = max_edits_per_iteration
+        self.time_budget = time_budget
+        self.max_workers = max_workers
+        self.min_parallel_batch = min_parallel_batch
+        self.score_cache_size = score_cache_size
         self.critic = SymbolicCritic()
+        self._executor: Optional[Executor] = None
+
+        # Scores by program source, for the task they were computed on.
+        # Near-misses of one task share most of their edit neighbourhood.
+        self._score_task: Optional[ARCTask] = None
+        self._scores: "OrderedDict[Tuple[Any, ...], Tuple[bool, float]]" = OrderedDict()
+        self.cache_hits = 0
 
         # Edit generators
         self.edit_generators: List[Callable[[ASTNode, List[Dict]], List[Tuple[EditOperation, ASTNode]]]] = [
@@ -109,18 +184,29 @@ class RefinementEngine:
         program: ASTNode,
         task: ARCTask,
         initial_critique: Optional[CriticResult] = None,
+        time_budget: Optional[float] = None,
     ) -> RefinementResult:
         """
         Attempt to refine a near-miss program.
 
+        Edited programs are scored with score_program; only an accepted
+        edit gets a full critique, for the next round's hints. A program
+        already scored in this call cannot beat the current best, so
+        repeats are skipped; the search path is unchanged.
+
         Args:
             program: The program to refine
             task: The task to solve
             initial_critique: Pre-computed critique (optional)
+            time_budget: Seconds for this call, on top of the engine's
+                time_budget (the smaller one applies)
 
         Returns:
             RefinementResult with refined program if successful
         """
+        budgets = [b for b in (self.time_budget, time_budget) if b is not None]
+        deadline = time.perf_counter() + min(budgets) if budgets else None
+
         if initial_critique is None:
             initial_critique = self.critic.evaluate(program, task)
 
@@ -136,6 +222,10 @@ class RefinementEngine:
                 refined_program=ast_to_source(program),
             )
 
+        if task is not self._score_task:
+            self._score_task = task
+            self._scores.clear()
+
         original_score = self._compute_score(initial_critique)
         best_score = original_score
         best_ast = program
@@ -143,50 +233,66 @@ class RefinementEngine:
 
         current_ast = program
         iterations = 0
+        scored = 0
+        # Sources of programs scored in this call (including the original)
+        seen: Set[Tuple[Any, ...]] = set()
+        self._mark_seen(seen, program)
+
+        self._start_workers()
+        try:
+            while iterations < self.max_iterations:
+                if deadline is not None and time.perf_counter() > deadline:
+                    break
+                iterations += 1
 
-        while iterations < self.max_iterations:
-            iterations += 1
+                # Get refinement hints from critic
+                hints = self.critic.compute_refinement_hints(initial_critique.diffs)
 
-            # Get refinement hints from critic
-            hints = self.critic.compute_refinement_hints(initial_critique.diffs)
+                # Generate candidate edits
+                candidates = self._generate_edit_candidates(current_ast, hints)
 
-            # Generate candidate edits
-            candidates = self._generate_edit_candidates(current_ast, hints)
+                if not candidates:
+                    break
 
-            if not candidates:
-                break
-
-            # Evaluate candidates
-            improved = False
-            for edit, edited_ast in candidates[:self.max_edits_per_iteration]:
-                critique = self.critic.evaluate(edited_ast, task)
-                score = self._compute_score(critique)
-
-                if critique.is_certified:
-                    # Found exact solution!
-                    return RefinementResult(
-                        success=True,
-                        improved=True,
-                        original_score=original_score,
-                        new_score=100.0,
-                        original_program=ast_to_source(program),
-                        refined_program=ast_to_source(edited_ast),
-                        refined_ast=edited_ast,
-                        edits_applied=best_edits + [edit],
-                        iterations=iterations,
-                    )
+                # Evaluate candidates
+                improved = False
+                batch = self._select_unseen(candidates, seen)
+                for (edit, edited_ast), (certified, score) in zip(
+                    batch, self._iter_scores([edited for _, edited in batch], task)
+                ):
+                    scored += 1
+                    self._mark_seen(seen, edited_ast)
+                    if certified:
+                        # Found exact solution!
+                        return RefinementResult(
+                            success=True,
+                            improved=True,
+                            original_score=original_score,
+                            new_score=100.0,
+                            original_program=ast_to_source(program),
+                            refined_program=ast_to_source(edited_ast),
+                            refined_ast=edited_ast,
+                            edits_applied=best_edits + [edit],
+                            iterations=iterations,
+                            candidates_scored=scored,
+                        )
 
-                if score > best_score:
-                    best_score = score
-                    best_ast = edited_ast
-                    best_edits.append(edit)
-                    current_ast = edited_ast
-                    initial_critique = critique
-                    improved = True
-                    break
+                    if score > best_score:
+                        best_score = score
+                        best_ast = edited_ast
+                        best_edits.append(edit)
+                        current_ast = edited_ast
+                        initial_critique = self.critic.evaluate(edited_ast, task)
+                        improved = True
+                        break
 
-            if not improved:
-                break
+                    if deadline is not None and time.perf_counter() > deadline:
+                        break
+
+                if not improved:
+                    break
+        finally:
+            self._stop_workers()
 
         return RefinementResult(
             success=best_score >= 100.0,
@@ -198,8 +304,124 @@ class RefinementEngine:
             refined_ast=best_ast,
             edits_applied=best_edits,
             iterations=iterations,
+            candidates_scored=scored,
         )
 
+    def _mark_seen(self, seen: Set[Tuple[Any, ...]], program: ASTNode) -> None:
+        try:
+            seen.add(program_key(program))
+        except _Unkeyable:
+            pass
+
+    def _select_unseen(
+        self,
+        candidates: List[Tuple[EditOperation, ASTNode]],
+        seen: Set[Tuple[Any, ...]],
+    ) -> List[Tuple[EditOperation, ASTNode]]:
+        """The round's candidates, minus programs scored earlier in the call."""
+        batch = []
+        batch_keys: Set[Tuple[Any, ...]] = set()
+        for edit, edited in candidates[:self.max_edits_per_iteration]:
+            try:
+                key = program_key(edited)
+            except _Unkeyable:
+                batch.append((edit, edited))
+                continue
+            if key not in seen and key not in batch_keys:
+                batch_keys.add(key)
+                batch.append((edit, edited))
+        return batch
+
+    def _iter_scores(
+        self,
+        programs: List[ASTNode],
+        task: ARCTask,
+    ) -> Iterator[Tuple[bool, float]]:
+        """
+        Scores of programs, in order.
+
+        In-process, each program is scored only when the caller asks for
+        it, so a round stops paying once an edit is accepted. With
+        workers, uncached programs are scored up front in parallel.
+        """
+        keys: List[Optional[Tuple[Any, ...]]] = []
+        for p in programs:
+            try:
+                keys.append(program_key(p))
+            except _Unkeyable:
+                keys.append(None)
+
+        if self._executor is not None:
+            missing = [
+                i for i, key in enumerate(keys)
+                if key is None or key not in self._scores
+            ]
+            if len(missing) >= self.min_parallel_batch:
+                chunk_size = -(-len(missing) // self.max_workers)
+                chunks = [
+                    [programs[i] for i in missing[j:j + chunk_size]]
+                    for j in range(0, len(missing), chunk_size)
+                ]
+                results: List[Tuple[bool, float]] = []
+                for chunk_results in self._executor.map(
+                    _score_chunk, [task] * len(chunks), chunks
+                ):
+                    results.extend(chunk_results)
+                for i, result in zip(missing, results):
+                    self._remember(keys[i], result)
+                fresh = dict(zip(missing, results))
+                for i, key in enumerate(keys):
+                    if i in fresh:
+                        yield fresh[i]
+                    else:
+                        yield self._lookup(programs[i], key, task)
+                return
+
+        for program, key in zip(programs, keys):
+            yield self._lookup(program, key, task)
+
+    def _lookup(
+        self,
+        program: ASTNode,
+        key: Optional[Tuple[Any, ...]],
+        task: ARCTask,
+    ) -> Tuple[bool, float]:
+        """Score of one program, from the cache when possible."""
+        if key is not None:
+            cached = self._scores.get(key)
+            if cached is not None:
+                self._scores.move_to_end(key)
+                self.cache_hits += 1
+                return cached
+        result = score_program(program, task)
+        self._remember(key, result)
+        return result
+
+    def _remember(self, key: Optional[Tuple[Any, ...]], result: Tuple[bool, float]) -> None:
+        if key is None:
+            return
+        self._scores[key] = result
+        self._scores.move_to_end(key)
+        while len(self._scores) > self.score_cache_size:
+            self._scores.popitem(last=False)
+
+    def _start_workers(self) -> None:
+        """Start the worker pool for a refine call, if configured."""
+        if self.max_workers <= 1:
+            return
+        try:
+            pickle.dumps(self._score_task)
+        except Exception:
+            logger.warning("task is not picklable, scoring edits in-process")
+            return
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _stop_workers(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
+
     def _compute_score(self, critique: CriticResult) -> float:
         """Compute score from critique."""
         if critique.exact_match_all:
@@ -372,6 +372,53 @@ if TORCH_AVAILABLE:
 
             return logits
 
+        def _start_decoding(self, task_encoding: torch.Tensor) -> List[Dict[str, torch.Tensor]]:
+            """
+            Per-layer decoding caches for a (batch, 1, embed) task encoding.
+
+            Cross-attention keys/values of the task encoding are computed
+            once here; self-attention keys/values grow by one position per
+            _decode_step.
+            """
+            caches = []
+            for layer in self.transformer_decoder.layers:
+                attn = layer.multihead_attn
+                embed_dim = attn.embed_dim
+                memory_k, memory_v = F.linear(
+                    task_encoding,
+                    attn.in_proj_weight[embed_dim:],
+                    attn.in_proj_bias[embed_dim:],
+                ).chunk(2, dim=-1)
+                caches.append({
+                    "memory_k": _split_heads(memory_k, attn.num_heads),
+                    "memory_v": _split_heads(memory_v, attn.num_heads),
+                })
+            return caches
+
+        def _decode_step(
+            self,
+            tokens: torch.Tensor,
+            position: int,
+            caches: List[Dict[str, torch.Tensor]],
+        ) -> torch.Tensor:
+            """
+            Decode one position for each row, extending the caches.
+
+            Args:
+                tokens: (rows,) token IDs at `position`
+                position: Index of the tokens in their sequences
+                caches: From _start_decoding, one row per token
+
+            Returns:
+                (rows, vocab_size) logits for the next position
+            """
+            x = self.token_embed(tokens).unsqueeze(1) + self.pos_encoding[position]
+            for layer, cache in zip(self.transformer_decoder.layers, caches):
+                x = _decoder_layer_step(layer, x, cache)
+            if self.transformer_decoder.norm is not None:
+                x = self.transformer_decoder.norm(x)
+            return self.output_proj(x[:, 0])
+
         @torch.no_grad()
         def generate(
             self,
@@ -383,6 +430,10 @@ if TORCH_AVAILABLE:
             """
             Generate primitive sequences autoregressively.
 
+            The task is encoded once and shared by all samples, each step
+            decodes only the newest position against cached keys/values,
+            and rows stop being computed once they emit EOS.
+
             Args:
                 input_grids: List of input grid tensors
                 output_grids: List of output grid tensors
@@ -390,62 +441,200 @@ if TORCH_AVAILABLE:
                 temperature: Sampling temperature
 
             Returns:
-                sequences: (num_samples, max_seq_len) generated sequences
-                log_probs: (num_samples,) sequence log probabilities
+                sequences: (num_samples, steps) generated sequences, PAD_ID after EOS
+                log_probs: (num_samples,) sequence log probabilities up to EOS
             """
             self.eval()
             device = input_grids[0].device
-            batch_size = input_grids[0].shape[0]
-
-            # Replicate for sampling
-            input_grids_rep = [g.repeat(num_samples, 1, 1) for g in input_grids]
-            output_grids_rep = [g.repeat(num_samples, 1, 1) for g in output_grids]
 
-            # Encode task
-            task_encoding = self.task_encoder(input_grids_rep, output_grids_rep)
-            task_encoding = task_encoding.unsqueeze(1)
+            # Encode task once for all samples
+            task_encoding = self.task_encoder(input_grids, output_grids).unsqueeze(1)
+            caches = self._start_decoding(task_encoding)
 
-            # Initialize with SOS
             sequences = torch.full(
-                (num_samples, 1), SOS_ID, dtype=torch.long, device=device
+                (num_samples, self.config.max_seq_len), PAD_ID, dtype=torch.long, device=device
             )
             log_probs = torch.zeros(num_samples, device=device)
+            active = torch.arange(num_samples, device=device)
+            tokens = torch.full((num_samples,), SOS_ID, dtype=torch.long, device=device)
+            steps = 0
 
             for step in range(self.config.max_seq_len):
-                # Embed current sequence
-                token_emb = self.token_embed(sequences)
-                token_emb = token_emb + self.pos_encoding[:sequences.shape[1]]
-
-                # Decode
-                causal_mask = nn.Transformer.generate_square_subsequent_mask(
-                    sequences.shape[1], device=device
-                )
-                decoded = self.transformer_decoder(
-                    token_emb, task_encoding, tgt_mask=causal_mask
-                )
-
-                # Get logits for last position
-                logits = self.output_proj(decoded[:, -1])  # (num_samples, vocab)
-
                 # Apply temperature
-                logits = logits / temperature
+                logits = self._decode_step(tokens, step, caches) / temperature
 
                 # Sample
                 probs = F.softmax(logits, dim=-1)
-                next_token = torch.multinomial(probs, 1)  # (num_samples, 1)
+                next_token = torch.multinomial(probs, 1).squeeze(-1)  # (active,)
 
                 # Update log probs
-                token_probs = probs.gather(1, next_token).squeeze(-1)
-                log_probs = log_probs + torch.log(token_probs + 1e-10)
+                token_probs = probs.gather(1, next_token.unsqueeze(-1)).squeeze(-1)
+                log_probs[active] += torch.log(token_probs + 1e-10)
+                sequences[active, step] = next_token
+                steps = step + 1
+
+                # Drop rows that emitted EOS
+                running = next_token != EOS_ID
+                if not running.all():
+                    if not running.any():
+                        break
+                    keep = running.nonzero().squeeze(-1)
+                    active = active[keep]
+                    next_token = next_token[keep]
+                    _select_rows(caches, keep)
+                tokens = next_token
+
+            return sequences[:, :steps], log_probs
+
+        @torch.no_grad()
+        def beam_search(
+            self,
+            input_grids: List[torch.Tensor],
+            output_grids: List[torch.Tensor],
+            beam_width: int = 10,
+        ) -> Tuple[torch.Tensor, torch.Tensor]:
+            """
+            Decode the most likely distinct sequences with beam search.
+
+            SOS and PAD are never generated and EOS is not allowed as the
+            first token, so every result has at least one primitive and
+            different results are different primitive sequences.
 
-                # Append to sequence
-                sequences = torch.cat([sequences, next_token], dim=1)
+            Args:
+                input_grids: List of input grid tensors
+                output_grids: List of output grid tensors
+                beam_width: Beams kept per step, and results returned
 
-                # Check for EOS
-                if (next_token == EOS_ID).all():
+            Returns:
+                sequences: (k, steps) best-first sequences, PAD_ID after EOS
+                log_probs: (k,) sequence log probabilities
+            """
+            self.eval()
+            device = input_grids[0].device
+            max_len = self.config.max_seq_len
+
+            task_encoding = self.task_encoder(input_grids, output_grids).unsqueeze(1)
+            caches = self._start_decoding(task_encoding)
+
+            beams: List[List[int]] = [[]]
+            scores = torch.zeros(1, device=device)
+            tokens = torch.full((1,), SOS_ID, dtype=torch.long, device=device)
+            finished: List[Tuple[float, List[int]]] = []  # (log prob, tokens incl. EOS)
+
+            for step in range(max_len):
+                log_p = F.log_softmax(self._decode_step(tokens, step, caches), dim=-1)
+                log_p[:, [SOS_ID, PAD_ID]] = float("-inf")
+                if step == 0:
+                    log_p[:, EOS_ID] = float("-inf")
+
+                candidates = (scores.unsqueeze(1) + log_p).flatten()
+                top_scores, top_index = candidates.topk(min(2 * beam_width, candidates.numel()))
+
+                rows, next_tokens, next_scores = [], [], []
+                for score, index in zip(top_scores.tolist(), top_index.tolist()):
+                    if score == float("-inf") or len(rows) == beam_width:
+                        break
+                    row, token = divmod(index, VOCAB_SIZE)
+                    if token == EOS_ID:
+                        finished.append((score, beams[row] + [EOS_ID]))
+                    else:
+                        rows.append(row)
+                        next_tokens.append(token)
+                        next_scores.append(score)
+
+                if not rows:
                     break
+                beams = [beams[row] + [token] for row, token in zip(rows, next_tokens)]
+                scores = torch.tensor(next_scores, device=device)
+                tokens = torch.tensor(next_tokens, dtype=torch.long, device=device)
+                _select_rows(caches, torch.tensor(rows, device=device))
+
+                # Live beams only lose probability, so stop once none can
+                # displace the current top results
+                if len(finished) >= beam_width:
+                    kth_best = sorted(s for s, _ in finished)[-beam_width]
+                    if next_scores[0] <= kth_best:
+                        beams = []
+                        break
+
+            # Beams that reached the length limit end without EOS
+            finished.extend(zip(scores.tolist(), beams))
+            finished.sort(key=lambda item: item[0], reverse=True)
+            finished = finished[:beam_width]
+
+            steps = max((len(seq) for _, seq in finished), default=0)
+            sequences = torch.full((len(finished), steps), PAD_ID, dtype=torch.long, device=device)
+            for i, (_, seq) in enumerate(finished):
+                sequences[i, :len(seq)] = torch.tensor(seq, dtype=torch.long, device=device)
+            log_probs = torch.tensor([score for score, _ in finished], device=device)
+            return sequences, log_probs
+
+
+    def _split_heads(x: torch.Tensor, num_heads: int) -> torch.Tensor:
+        """(batch, len, embed) -> (batch, heads, len, head_dim)"""
+        batch, length, embed = x.shape
+        return x.view(batch, length, num_heads, embed // num_heads).transpose(1, 2)
+
+
+    def _merge_heads(x: torch.Tensor) -> torch.Tensor:
+        """(batch, heads, len, head_dim) -> (batch, len, embed)"""
+        batch, heads, length, head_dim = x.shape
+        return x.transpose(1, 2).reshape(batch, length, heads * head_dim)
+
+
+    def _decoder_layer_step(
+        layer: "nn.TransformerDecoderLayer",
+        x: torch.Tensor,
+        cache: Dict[str, torch.Tensor],
+    ) -> torch.Tensor:
+        """
+        One TransformerDecoderLayer (eval mode) for the newest position.
+
+        x is (rows, 1, embed). The position's self-attention keys/values
+        are appended to the cache, and it attends to every cached position,
+        which is what the causal mask allows in the full forward pass.
+        """
+        def self_attention(h: torch.Tensor) -> torch.Tensor:
+            attn = layer.self_attn
+            q, k, v = F.linear(h, attn.in_proj_weight, attn.in_proj_bias).chunk(3, dim=-1)
+            k = _split_heads(k, attn.num_heads)
+            v = _split_heads(v, attn.num_heads)
+            if "k" in cache:
+                k = torch.cat([cache["k"], k], dim=2)
+                v = torch.cat([cache["v"], v], dim=2)
+            cache["k"], cache["v"] = k, v
+            out = F.scaled_dot_product_attention(_split_heads(q, attn.num_heads), k, v)
+            return attn.out_proj(_merge_heads(out))
+
+        def cross_attention(h: torch.Tensor) -> torch.Tensor:
+            attn = layer.multihead_attn
+            embed_dim = attn.embed_dim
+            q = F.linear(h, attn.in_proj_weight[:embed_dim], attn.in_proj_bias[:embed_dim])
+            rows = h.shape[0]
+            out = F.scaled_dot_product_attention(
+                _split_heads(q, attn.num_heads),
+                cache["memory_k"].expand(rows, -1, -1, -1),
+                cache["memory_v"].expand(rows, -1, -1, -1),
+            )
+            return attn.out_proj(_merge_heads(out))
+
+        def feed_forward(h: torch.Tensor) -> torch.Tensor:
+            return layer.linear2(layer.activation(layer.linear1(h)))
+
+        if layer.norm_first:
+            x = x + self_attention(layer.norm1(x))
+            x = x + cross_attention(layer.norm2(x))
+            return x + feed_forward(layer.norm3(x))
+        x = layer.norm1(x + self_attention(x))
+        x = layer.norm2(x + cross_attention(x))
+        return layer.norm3(x + feed_forward(x))
 
-            return sequences[:, 1:], log_probs  # Remove SOS token
+
+    def _select_rows(caches: List[Dict[str, torch.Tensor]], index: torch.Tensor) -> None:
+        """Keep only the given rows of each layer's self-attention cache."""
+        for cache in caches:
+            cache["k"] = cache["k"][index]
+            cache["v"] = cache["v"][index]
 
 
     class NeuralSketcherImpl(SketcherModel):
@@ -512,8 +701,15 @@ if TORCH_AVAILABLE:
             self,
             task: ARCTask,
             num_sketches: int = 10,
+            beam_search: bool = False,
         ) -> List[ProgramSketch]:
-            """Generate sketches using neural model."""
+            """
+            Generate sketches using neural model.
+
+            By default 2x num_sketches sequences are sampled and duplicates
+            dropped; with beam_search=True the num_sketches most likely
+            distinct sequences are decoded instead.
+            """
             if not task.train:
                 return [self._identity_sketch()]
 
@@ -530,11 +726,16 @@ if TORCH_AVAILABLE:
             # Generate sequences
             self.model.eval()
             with torch.no_grad():
-                sequences, log_probs = self.model.generate(
-                    input_grids, output_grids,
-                    num_samples=num_sketches * 2,  # Generate extra, filter duplicates
-                    temperature=0.8,
-                )
+                if beam_search:
+                    sequences, log_probs = self.model.beam_search(
+                        input_grids, output_grids, beam_width=num_sketches,
+                    )
+                else:
+                    sequences, log_probs = self.model.generate(
+                        input_grids, output_grids,
+                        num_samples=num_sketches * 2,  # Generate extra, filter duplicates
+                        temperature=0.8,
+                    )
 
             # Convert to sketches
             sketches = []
@@ -26,6 +26,7 @@ from ..core.metrics import (
 if TYPE_CHECKING:
     from ..mal.retrieval import MacroStore
     from ..core.trace import JSONLTraceWriter, SolveTrace
+    from ..core.trace_spool import TracePolicy
 
 
 @dataclass
@@ -50,6 +51,7 @@ class SynthesisConfig:
     mal_top_k: int = 5  # Number of macros to retrieve
     write_traces: bool = False  # Enable trace writing
     trace_dir: str = "traces"  # Directory for trace files
+    trace_policy: Optional["TracePolicy"] = None  # Events to record (default: INFO, no per-candidate scores)
     # WME integration settings
     use_wme: bool = False  # Enable WME advisory scoring
     wme_robustness_weight: float = 0.1  # Weight for robustness in soft scoring
@@ -196,8 +198,11 @@ class BeamSearchSynthesizer(Synthesizer):
         # Create trace if enabled
         trace = None
         if cfg.write_traces:
-            from ..core.trace import create_trace_from_task
-            trace = create_trace_from_task(task, task.task_id)
+            from ..core.trace import TraceEntry, create_trace_from_task
+            writer = self._get_trace_writer(cfg)
+            trace = create_trace_from_task(
+                task, task.task_id, trace=writer.start_trace(task.task_id, cfg.trace_policy),
+            )
 
         # MAL: Retrieve relevant macros if enabled
         if cfg.use_mal and self.macro_store is not None:
@@ -222,6 +227,10 @@ class BeamSearchSynthesizer(Synthesizer):
 
         for ast in initial_candidates:
             score, train_results = self._evaluate_candidate(ast, task.train)
+            if trace and trace.should_log("candidate_scored"):
+                trace.add_entry(TraceEntry.now(
+                    "candidate_scored", "cre", program=ast_to_source(ast), score=score, depth=0,
+                ))
             if train_results and train_results.get("all_exact_match"):
                 # Found perfect solution immediately
                 result = SynthesisResult(
@@ -279,6 +288,11 @@ class BeamSearchSynthesizer(Synthesizer):
                     score, train_results = self._evaluate_candidate(
                         expanded_ast, task.train
                     )
+                    if trace and trace.should_log("candidate_scored"):
+                        trace.add_entry(TraceEntry.now(
+                            "candidate_scored", "cre",
+                            program=ast_to_source(expanded_ast), score=score, depth=candidate.depth + 1,
+                        ))
 
                     if train_results and train_results.get("all_exact_match"):
                         # Found perfect solution!
@@ -382,8 +396,12 @@ class BeamSearchSynthesizer(Synthesizer):
         """Try refining near-miss programs to find exact solution."""
         import time
         for ast, score in self.near_misses:
+            # Refinement gets whatever is left of the synthesis timeout
+            remaining = self.config.timeout_seconds - (time.time() - start_time)
+            if remaining <= 0:
+                break
             try:
-                result = self.refinement_engine.refine(ast, task)
+                result = self.refinement_engine.refine(ast, task, time_budget=remaining)
                 if result.success:
                     return SynthesisResult(
                         success=True,
@@ -449,16 +467,18 @@ class BeamSearchSynthesizer(Synthesizer):
                     used=result.macros_used,
                 )
 
-            # Write trace
-            if self.trace_writer is not None:
-                self.trace_writer.write_trace(trace)
-            else:
-                from ..core.trace import JSONLTraceWriter
-                writer = JSONLTraceWriter(cfg.trace_dir)
-                writer.write_trace(trace)
+            self._get_trace_writer(cfg).write_trace(trace)
 
         except Exception:
             pass  # Don't fail synthesis due to trace writing errors
+        finally:
+            trace.close()
+
+    def _get_trace_writer(self, cfg: SynthesisConfig) -> "JSONLTraceWriter":
+        if self.trace_writer is not None:
+            return self.trace_writer
+        from ..core.trace import JSONLTraceWriter
+        return JSONLTraceWriter(cfg.trace_dir)
 
     def _generate_initial_candidates(self) -> List[ASTNode]:
         """Generate initial candidate programs."""
@@ -28,6 +28,8 @@ from .primitives import (
     PrimitiveSpec,
 )
 from .interpreter import DSLInterpreter, interpret
+from .memo import PrimitiveMemo, get_primitive_memo
+from .compiler import CompiledProgram, ProgramCache, compile_program, get_program_cache
 from .prettyprint import pretty_print, ast_to_source
 
 __all__ = [
@@ -58,6 +60,13 @@ __all__ = [
     # Interpreter
     "DSLInterpreter",
     "interpret",
+    "PrimitiveMemo",
+    "get_primitive_memo",
+    # Compiler
+    "CompiledProgram",
+    "ProgramCache",
+    "compile_program",
+    "get_program_cache",
     # Pretty print
     "pretty_print",
     "ast_to_source",
@@ -0,0 +1,395 @@
+"""
+DSL Compiler - lowers AST programs to Python closures.
+
+The interpreter dispatches on node type and looks up primitives on
+every evaluation. Synthesis runs each candidate on every training pair,
+so the compiler does that work once: each node becomes a closure over
+its already-compiled children, with primitives resolved at compile
+time. Compiled programs behave exactly like DSLInterpreter, including
+error messages; ProgramCache reuses them across make_program calls.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, List, Optional, Tuple
+
+from ..core.types import FrozenGrid, Grid
+from .ast import (
+    ASTNode,
+    LiteralNode,
+    VariableNode,
+    PrimitiveNode,
+    ComposeNode,
+    LambdaNode,
+    ApplyNode,
+    LetNode,
+)
+from .interpreter import Closure, InterpreterError
+from .memo import PrimitiveMemo, _Unkeyable, _key_part, get_primitive_memo
+from .primitives import PRIMITIVES, PrimitiveSpec, get_primitive
+
+
+# A compiled node: evaluates the node in an environment
+Evaluator = Callable[[Dict[str, Any]], Any]
+
+
+def _raise(message: str) -> Evaluator:
+    """Evaluator that fails the way the interpreter would, when reached."""
+    def fail(env: Dict[str, Any]) -> Any:
+        raise InterpreterError(message)
+    return fail
+
+
+class _Compiler:
+    """Lowers one AST, recording the primitive specs it resolved."""
+
+    def __init__(self, memo: Optional[PrimitiveMemo]):
+        self.memo = memo
+        self.resolved: Dict[str, Optional[PrimitiveSpec]] = {}
+        # Lambda bodies by node id; closures stay plain Closure objects so
+        # they look the same as the interpreter's to primitives and errors
+        self.bodies: Dict[int, Evaluator] = {}
+
+    def resolve(self, name: str) -> Optional[PrimitiveSpec]:
+        spec = get_primitive(name)
+        self.resolved[name] = spec
+        return spec
+
+    def caller(self, spec: PrimitiveSpec) -> Callable[[List[Any]], Any]:
+        """Call a primitive with an argument list, through the memo."""
+        if self.memo is None:
+            implementation = spec.implementation
+            return lambda args: implementation(*args)
+        memo_call = self.memo.call
+        return lambda args: memo_call(spec, args)
+
+    def compile(self, node: ASTNode) -> Evaluator:
+        if isinstance(node, LiteralNode):
+            value = node.value
+            return lambda env: value
+
+        elif isinstance(node, VariableNode):
+            return self._variable(node.name)
+
+        elif isinstance(node, PrimitiveNode):
+            return self._primitive(node)
+
+        elif isinstance(node, ComposeNode):
+            return self._compose(node)
+
+        elif isinstance(node, LambdaNode):
+            return self._lambda(node)
+
+        elif isinstance(node, ApplyNode):
+            return self._apply(node)
+
+        elif isinstance(node, LetNode):
+            return self._let(node)
+
+        else:
+            return _raise(f"Unknown AST node type: {type(node)}")
+
+    def _variable(self, name: str) -> Evaluator:
+        def variable(env: Dict[str, Any]) -> Any:
+            if name not in env:
+                raise InterpreterError(f"Unbound variable: {name}")
+            return env[name]
+        return variable
+
+    def _primitive(self, node: PrimitiveNode) -> Evaluator:
+        name = node.name
+        spec = self.resolve(name)
+        if spec is None:
+            return _raise(f"Unknown primitive: {name}")
+
+        call = self.caller(spec)
+        arg_fns = [self.compile(arg) for arg in node.args]
+        # The interpreter prepends env["input"] when the signature wants
+        # more arguments than were given, or when none were given
+        arg_types = spec.signature.arg_types
+        prepend = not arg_fns or bool(arg_types) and len(arg_types) > len(arg_fns)
+
+        if not arg_fns:
+            def primitive(env: Dict[str, Any]) -> Any:
+                args = [env["input"]] if "input" in env else []
+                try:
+                    return call(args)
+                except Exception as e:
+                    raise InterpreterError(f"Error in primitive {name}: {e}") from e
+            return primitive
+
+        def primitive(env: Dict[str, Any]) -> Any:
+            args = [fn(env) for fn in arg_fns]
+            if prepend and "input" in env:
+                args = [env["input"]] + args
+            try:
+                return call(args)
+            except Exception as e:
+                raise InterpreterError(f"Error in primitive {name}: {e}") from e
+        return primitive
+
+    def _compose(self, node: ComposeNode) -> Evaluator:
+        if not node.operations:
+            return _raise("Empty composition")
+
+        # (kind, fn): "direct" calls a primitive on the running result,
+        # "env" evaluates with the result bound to input, and "value"
+        # applies whatever the operation evaluates to
+        steps: List[Tuple[str, Callable[..., Any]]] = []
+        for op in node.operations:
+            if isinstance(op, PrimitiveNode) and not op.args:
+                spec = self.resolve(op.name)
+                if spec is None:
+                    steps.append(("env", _raise(f"Unknown primitive: {op.name}")))
+                else:
+                    steps.append(("direct", self.caller(spec)))
+            elif isinstance(op, PrimitiveNode):
+                steps.append(("env", self._primitive(op)))
+            else:
+                steps.append(("value", self.compile(op)))
+
+        def compose(env: Dict[str, Any]) -> Any:
+            if "input" not in env:
+                raise InterpreterError("Composition requires 'input' in environment")
+            result = env["input"]
+            for kind, fn in steps:
+                if kind == "direct":
+                    result = fn([result])
+                    continue
+                op_env = env.copy()
+                op_env["input"] = result
+                if kind == "env":
+                    result = fn(op_env)
+                    continue
+                fn_result = fn(op_env)
+                if callable(fn_result):
+                    result = fn_result(result)
+                elif isinstance(fn_result, Closure):
+                    if len(fn_result.params) != 1:
+                        raise InterpreterError(
+                            "Closure in composition must have exactly 1 parameter"
+                        )
+                    closure_env = fn_result.env.copy()
+                    closure_env[fn_result.params[0]] = result
+                    result = self.run_closure(fn_result, closure_env)
+                else:
+                    result = fn_result
+            return result
+        return compose
+
+    def _lambda(self, node: LambdaNode) -> Evaluator:
+        param_names = [name for name, _ in node.params]
+        body = node.body
+        self.bodies[id(body)] = self.compile(body)
+
+        def make_closure(env: Dict[str, Any]) -> Closure:
+            return Closure(params=list(param_names), body=body, env=env.copy())
+        return make_closure
+
+    def _apply(self, node: ApplyNode) -> Evaluator:
+        function_fn = self.compile(node.function)
+        arg_fns = [self.compile(arg) for arg in node.args]
+
+        def apply(env: Dict[str, Any]) -> Any:
+            fn = function_fn(env)
+            args = [arg_fn(env) for arg_fn in arg_fns]
+            if isinstance(fn, Closure):
+                if len(args) != len(fn.params):
+                    raise InterpreterError(
+                        f"Arity mismatch: expected {len(fn.params)}, got {len(args)}"
+                    )
+                new_env = fn.env.copy()
+                for param, arg in zip(fn.params, args):
+                    new_env[param] = arg
+                return self.run_closure(fn, new_env)
+            elif callable(fn):
+                return fn(*args)
+            else:
+                raise InterpreterError(f"Cannot apply non-function: {type(fn)}")
+        return apply
+
+    def _let(self, node: LetNode) -> Evaluator:
+        name = node.name
+        value_fn = self.compile(node.value)
+        body_fn = self.compile(node.body)
+
+        def let(env: Dict[str, Any]) -> Any:
+            value = value_fn(env)
+            new_env = env.copy()
+            new_env[name] = value
+            return body_fn(new_env)
+        return let
+
+    def run_closure(self, closure: Closure, env: Dict[str, Any]) -> Any:
+        """Evaluate a closure body (compiling it if it came from elsewhere)."""
+        run = self.bodies.get(id(closure.body))
+        if run is None:
+            # Not one of ours (passed in through the environment)
+            run = _Compiler(self.memo).compile(closure.body)
+        return run(env)
+
+
+class CompiledProgram:
+    """
+    An AST lowered to closures.
+
+    Calling it runs the program on a grid, like the function from
+    DSLInterpreter.create_program_function; evaluate() mirrors
+    DSLInterpreter.interpret.
+    """
+
+    def __init__(self, ast: ASTNode, memo: Optional[PrimitiveMemo] = None):
+        self.ast = ast
+        self.memo = memo
+        compiler = _Compiler(memo)
+        self._run = compiler.compile(ast)
+        # Primitive names mapped to the specs the closures were bound to
+        self.resolved = dict(compiler.resolved)
+
+    def is_current(self) -> bool:
+        """True if no primitive used by the program has been re-registered."""
+        for name, spec in self.resolved.items():
+            if PRIMITIVES.get(name) is not spec:
+                return False
+        return True
+
+    def evaluate(self, env: Optional[Dict[str, Any]] = None) -> Any:
+        """Evaluate the program in an environment (default: empty)."""
+        return self._run({} if env is None else env)
+
+    def __call__(self, input_grid: Grid) -> Grid:
+        if self.memo is not None:
+            input_grid = input_grid.freeze()
+        result = self._run({"input": input_grid})
+        if not isinstance(result, Grid):
+            raise InterpreterError(f"Program did not return Grid, got {type(result)}")
+        if isinstance(result, FrozenGrid):
+            return result.copy()
+        return result
+
+
+def compile_program(
+    ast: ASTNode,
+    memoize: bool = True,
+    memo: Optional[PrimitiveMemo] = None,
+) -> CompiledProgram:
+    """
+    Compile an AST without caching.
+
+    Args:
+        ast: The program to compile
+        memoize: If True, primitive calls go through a PrimitiveMemo
+        memo: Cache to use (default: the shared process-wide memo)
+    """
+    if memoize and memo is None:
+        memo = get_primitive_memo()
+    return CompiledProgram(ast, memo if memoize else None)
+
+
+def program_key(node: ASTNode) -> Tuple[Any, ...]:
+    """
+    Canonical, hashable form of a program's source.
+
+    Unlike ast_to_source text it cannot conflate different programs (a
+    primitive and a variable that print the same, 1 and True, ...);
+    literals are keyed like primitive arguments in PrimitiveMemo. Raises
+    _Unkeyable for programs that cannot be keyed.
+    """
+    # Exact-type dispatch: isinstance against the ABC-derived node
+    # classes costs more than the rest of the key
+    keyer = _KEYERS.get(type(node))
+    if keyer is None:
+        raise _Unkeyable
+    return keyer(node)
+
+
+def _keys(nodes: List[ASTNode]) -> Tuple[Any, ...]:
+    return tuple([program_key(node) for node in nodes])
+
+
+_KEYERS: Dict[type, Callable[[Any], Tuple[Any, ...]]] = {
+    LiteralNode: lambda n: ("lit", _key_part(n.value)),
+    VariableNode: lambda n: ("var", n.name),
+    PrimitiveNode: lambda n: ("prim", n.name, _keys(n.args)),
+    ComposeNode: lambda n: ("compose", _keys(n.operations)),
+    LambdaNode: lambda n: ("lambda", tuple([p for p, _ in n.params]), program_key(n.body)),
+    ApplyNode: lambda n: ("apply", program_key(n.function), _keys(n.args)),
+    LetNode: lambda n: ("let", n.name, program_key(n.value), program_key(n.body)),
+}
+
+
+class ProgramCache:
+    """
+    Bounded LRU cache of compiled programs, keyed by program source.
+
+    The key is program_key(ast), recomputed on every lookup, so an AST
+    edited in place after compiling does not get the old program back.
+    Programs bound to a primitive that has since been re-registered are
+    recompiled; programs that cannot be keyed are compiled every time.
+    """
+
+    def __init__(self, maxsize: int = 1024, memo: Optional[PrimitiveMemo] = None):
+        self.maxsize = maxsize
+        self.memo = memo if memo is not None else get_primitive_memo()
+        self._entries: "OrderedDict[Tuple[Any, ...], CompiledProgram]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.uncacheable = 0
+
+    def get(self, ast: ASTNode) -> CompiledProgram:
+        """Return the compiled program for an AST, compiling on a miss."""
+        try:
+            key = program_key(ast)
+        except _Unkeyable:
+            with self._lock:
+                self.uncacheable += 1
+            return CompiledProgram(ast, self.memo)
+
+        with self._lock:
+            program = self._entries.get(key)
+            if program is not None and program.is_current():
+                self._entries.move_to_end(key)
+                self.hits += 1
+                return program
+            self.misses += 1
+
+        program = CompiledProgram(ast, self.memo)
+        with self._lock:
+            self._entries[key] = program
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+        return program
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of lookups served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters and occupancy."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+                "uncacheable": self.uncacheable,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+            }
+
+    def clear(self) -> None:
+        """Drop all compiled programs and counters."""
+        with self._lock:
+            self._entries.clear()
+            self.hits = self.misses = self.uncacheable = 0
+
+
+_default_cache = ProgramCache()
+
+
+def get_program_cache() -> ProgramCache:
+    """The process-wide cache used by make_program."""
+    return _default_cache
@@ -5,7 +5,7 @@ DSL Interpreter - executes AST programs.
 from dataclasses import dataclass
 from typing import Dict, Any, Optional, Callable, List
 
-from ..core.types import Grid
+from ..core.types import FrozenGrid, Grid
 from .ast import (
     ASTNode,
     LiteralNode,
@@ -16,7 +16,8 @@ from .ast import (
     ApplyNode,
     LetNode,
 )
-from .primitives import get_primitive, PRIMITIVES
+from .primitives import get_primitive, PrimitiveSpec, PRIMITIVES
+from .memo import PrimitiveMemo, get_primitive_memo
 
 
 class InterpreterError(Exception):
@@ -36,18 +37,36 @@ class DSLInterpreter:
     """
     Interpreter for the DSL.
 
-    Executes AST programs in a given environment.
+    Executes AST programs in a given environment. Primitive calls go
+    through a PrimitiveMemo (shared process-wide by default), so grids
+    computed by earlier programs are reused.
     """
 
-    def __init__(self, trace: bool = False):
+    def __init__(
+        self,
+        trace: bool = False,
+        memoize: bool = True,
+        memo: Optional[PrimitiveMemo] = None,
+    ):
         """
         Initialize interpreter.
 
         Args:
             trace: If True, record execution trace for debugging
+            memoize: If True, cache primitive results
+            memo: Cache to use (default: the shared process-wide memo)
         """
         self.trace = trace
         self.execution_trace: List[Dict[str, Any]] = []
+        self.memo: Optional[PrimitiveMemo] = None
+        if memoize:
+            self.memo = memo if memo is not None else get_primitive_memo()
+
+    def _call_primitive(self, spec: PrimitiveSpec, args: List[Any]) -> Any:
+        """Call a primitive, consulting the memo first."""
+        if self.memo is None:
+            return spec.implementation(*args)
+        return self.memo.call(spec, args)
 
     def interpret(
         self,
@@ -125,8 +144,7 @@ class DSLInterpreter:
 
         # Call the primitive implementation
         try:
-            result = spec.implementation(*args)
-            return result
+            return self._call_primitive(spec, args)
         except Exception as e:
             raise InterpreterError(
                 f"Error in primitive {node.name}: {e}"
@@ -158,7 +176,7 @@ class DSLInterpreter:
                 if not op.args:
                     spec = get_primitive(op.name)
                     if spec:
-                        result = spec.implementation(result)
+                        result = self._call_primitive(spec, [result])
                     else:
                         raise InterpreterError(f"Unknown primitive: {op.name}")
                 else:
@@ -219,12 +237,17 @@ class DSLInterpreter:
         Returns a function that takes a Grid and returns a Grid.
         """
         def program(input_grid: Grid) -> Grid:
+            if self.memo is not None:
+                # Freeze once so every primitive call keys on the same grid
+                input_grid = input_grid.freeze()
             env = {"input": input_grid}
             result = self.interpret(ast, env)
             if not isinstance(result, Grid):
                 raise InterpreterError(
                     f"Program did not return Grid, got {type(result)}"
                 )
+            if isinstance(result, FrozenGrid):
+                return result.copy()
             return result
         return program
 
@@ -232,13 +255,21 @@ class DSLInterpreter:
 def interpret(ast: ASTNode, env: Optional[Dict[str, Any]] = None) -> Any:
     """Convenience function to interpret an AST."""
     interpreter = DSLInterpreter()
-    return interpreter.interpret(ast, env)
+    result = interpreter.interpret(ast, env)
+    if isinstance(result, FrozenGrid):
+        return result.copy()
+    return result
 
 
 def make_program(ast: ASTNode) -> Callable[[Grid], Grid]:
-    """Create a Grid -> Grid function from an AST."""
-    interpreter = DSLInterpreter()
-    return interpreter.create_program_function(ast)
+    """
+    Create a Grid -> Grid function from an AST.
+
+    The program is compiled to closures once and cached by source (see
+    compiler.ProgramCache); it behaves like create_program_function.
+    """
+    from .compiler import get_program_cache
+    return get_program_cache().get(ast)
 
 
 def run_on_grid(ast: ASTNode, grid: Grid) -> Grid:
@@ -0,0 +1,168 @@
+"""
+Memoization of primitive results.
+
+Synthesis evaluates many candidate programs that share prefixes, so the
+same primitive is applied to the same grid over and over across beam
+branches. PrimitiveMemo is a bounded LRU cache keyed by (primitive,
+arguments), with grids keyed by content through FrozenGrid.
+"""
+
+import threading
+from collections import OrderedDict
+from typing import Any, Dict, List, Tuple
+
+from ..core.types import FrozenGrid, Grid
+from .primitives import PrimitiveSpec
+
+
+_MISSING = object()
+
+
+class _Unkeyable(Exception):
+    """An argument cannot be part of a cache key."""
+
+
+def _key_part(value: Any) -> Any:
+    """Hashable stand-in for a primitive argument."""
+    if type(value) is FrozenGrid:
+        return value
+    if isinstance(value, Grid):
+        return value.freeze()
+    if isinstance(value, (list, tuple)):
+        return (type(value), tuple(_key_part(v) for v in value))
+    if isinstance(value, dict):
+        try:
+            items = sorted(value.items())
+        except TypeError:
+            raise _Unkeyable from None
+        return (dict, tuple((_key_part(k), _key_part(v)) for k, v in items))
+    try:
+        hash(value)
+    except TypeError:
+        raise _Unkeyable from None
+    # Keep 1, 1.0 and True apart
+    return (type(value), value)
+
+
+def _freeze_result(value: Any) -> Any:
+    """Immutable copy of a primitive result for sharing from the cache."""
+    if isinstance(value, Grid):
+        return value.freeze()
+    if isinstance(value, list):
+        return [_freeze_result(v) for v in value]
+    return value
+
+
+def _share(value: Any) -> Any:
+    """Hand out a cached value (lists are copied, the rest is immutable)."""
+    if isinstance(value, list):
+        return list(value)
+    return value
+
+
+class PrimitiveMemo:
+    """
+    Bounded LRU cache of primitive results.
+
+    Grid arguments are keyed by content (shape plus bytes), so equal
+    grids produced by different programs share entries. Cached grids are
+    FrozenGrids; callers that need to write use copy(). Calls with an
+    argument that cannot be keyed (e.g. a closure) are passed through,
+    as are all calls while enabled is False.
+    """
+
+    def __init__(self, maxsize: int = 4096, enabled: bool = True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._entries: "OrderedDict[Tuple[Any, ...], Any]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+        self.uncacheable = 0
+        self._by_primitive: Dict[str, List[int]] = {}
+
+    def call(self, spec: PrimitiveSpec, args: List[Any]) -> Any:
+        """Return spec.implementation(*args), from the cache when possible."""
+        if not self.enabled:
+            return spec.implementation(*args)
+        try:
+            key = (spec.implementation, tuple([_key_part(arg) for arg in args]))
+        except _Unkeyable:
+            with self._lock:
+                self.uncacheable += 1
+            return spec.implementation(*args)
+
+        with self._lock:
+            counts = self._by_primitive.get(spec.name)
+            if counts is None:
+                counts = self._by_primitive[spec.name] = [0, 0]
+            cached = self._entries.get(key, _MISSING)
+            if cached is not _MISSING:
+                self._entries.move_to_end(key)
+                self.hits += 1
+                counts[0] += 1
+                return list(cached) if type(cached) is list else cached
+            self.misses += 1
+            counts[1] += 1
+
+        # Primitives get frozen grids from the key, so they cannot alias
+        # a caller's mutable array into the cached result
+        result = _freeze_result(spec.implementation(*[
+            part if isinstance(part, FrozenGrid) else arg
+            for arg, part in zip(args, key[1])
+        ]))
+        with self._lock:
+            self._entries[key] = result
+            self._entries.move_to_end(key)
+            while len(self._entries) > self.maxsize:
+                self._entries.popitem(last=False)
+                self.evictions += 1
+        return _share(result)
+
+    @property
+    def hit_rate(self) -> float:
+        """Fraction of cacheable calls served from the cache."""
+        total = self.hits + self.misses
+        return self.hits / total if total else 0.0
+
+    def stats(self) -> Dict[str, Any]:
+        """Hit/miss counters, overall and per primitive."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "hit_rate": self.hit_rate,
+                "evictions": self.evictions,
+                "uncacheable": self.uncacheable,
+                "size": len(self._entries),
+                "maxsize": self.maxsize,
+                "by_primitive": {
+                    name: {
+                        "hits": hits,
+                        "misses": misses,
+                        "hit_rate": hits / (hits + misses) if hits + misses else 0.0,
+                    }
+                    for name, (hits, misses) in sorted(self._by_primitive.items())
+                },
+            }
+
+    def reset_stats(self) -> None:
+        """Zero the counters, keeping cached entries."""
+        with self._lock:
+            self.hits = self.misses = self.evictions = self.uncacheable = 0
+            self._by_primitive.clear()
+
+    def clear(self) -> None:
+        """Drop all cached entries and counters."""
+        with self._lock:
+            self._entries.clear()
+        self.reset_stats()
+
+
+_default_memo = PrimitiveMemo()
+
+
+def get_primitive_memo() -> PrimitiveMemo:
+    """The process-wide memo shared by interpreters."""
+    return _default_memo
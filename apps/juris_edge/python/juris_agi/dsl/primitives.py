@@ -12,7 +12,11 @@ from typing import Callable, Dict, List, Any, Optional, Tuple
 import numpy as np
 
 from ..core.types import Grid, GridObject, BoundingBox, Color
-from ..representation.objects import extract_connected_objects, find_bounding_box
+from ..representation.objects import (
+    component_at,
+    extract_connected_objects,
+    find_bounding_box,
+)
 from .type_system import (
     DSLType,
     GridType,
@@ -295,13 +299,13 @@ def prim_transpose(grid: Grid) -> Grid:
 def prim_translate(grid: Grid, dr: int, dc: int, background: int = 0) -> Grid:
     """Translate grid content."""
     result = Grid.full(grid.height, grid.width, background)
+    height, width = grid.shape
+    if abs(dr) >= height or abs(dc) >= width:
+        return result
 
-    for r in range(grid.height):
-        for c in range(grid.width):
-            nr, nc = r + dr, c + dc
-            if 0 <= nr < grid.height and 0 <= nc < grid.width:
-                result[nr, nc] = grid[r, c]
-
+    result.data[max(0, dr):height + min(0, dr), max(0, dc):width + min(0, dc)] = grid.data[
+        max(0, -dr):height - max(0, dr), max(0, -dc):width - max(0, dc)
+    ]
     return result
 
 
@@ -318,13 +322,16 @@ def prim_paste(target: Grid, source: Grid, row: int, col: int) -> Grid:
     """Paste source onto target at position."""
     result = target.copy()
 
-    for r in range(source.height):
-        for c in range(source.width):
-            tr, tc = row + r, col + c
-            if 0 <= tr < result.height and 0 <= tc < result.width:
-                if source[r, c] != 0:  # Don't paste background
-                    result[tr, tc] = source[r, c]
+    # Overlap of the source window with the target, in target coordinates
+    r0, r1 = max(0, row), min(result.height, row + source.height)
+    c0, c1 = max(0, col), min(result.width, col + source.width)
+    if r0 >= r1 or c0 >= c1:
+        return result
 
+    window = source.data[r0 - row:r1 - row, c0 - col:c1 - col]
+    region = result.data[r0:r1, c0:c1]
+    mask = window != 0  # Don't paste background
+    region[mask] = window[mask]
     return result
 
 
@@ -584,10 +591,9 @@ def prim_flood_fill(grid: Grid, row: int, col: int, fill_color: Color) -> Grid:
     """
     Flood fill starting at (row, col).
 
-    Uses BFS to fill all connected cells with the same color as the starting cell.
+    Fills the 4-connected region of cells with the same color as the
+    starting cell, found by labelling the color mask.
     """
-    from collections import deque
-
     if not (0 <= row < grid.height and 0 <= col < grid.width):
         return grid.copy()
 
@@ -597,21 +603,7 @@ def prim_flood_fill(grid: Grid, row: int, col: int, fill_color: Color) -> Grid:
     if target_color == fill_color:
         return result  # Already the fill color
 
-    visited = set()
-    queue = deque([(row, col)])
-    visited.add((row, col))
-
-    while queue:
-        r, c = queue.popleft()
-        result[r, c] = fill_color
-
-        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
-            nr, nc = r + dr, c + dc
-            if (0 <= nr < grid.height and 0 <= nc < grid.width and
-                (nr, nc) not in visited and int(grid[nr, nc]) == target_color):
-                visited.add((nr, nc))
-                queue.append((nr, nc))
-
+    result.data[component_at(grid.data == target_color, row, col)] = fill_color
     return result
 
 
@@ -8,15 +8,32 @@ Usage:
 Examples:
     python -m juris_agi.eval.run_arc data/arc_public/training/task.json
     python -m juris_agi.eval.run_arc data/arc_public/training/ --output results/
+    python -m juris_agi.eval.run_arc data/arc_public/training/ --workers 8 \
+        --task-timeout 60 --stream-to results/run.jsonl
 """
 
 import argparse
 import json
+import logging
+import signal
 import sys
+import threading
+import time
+from collections import deque
+from concurrent.futures import FIRST_COMPLETED, Future, ProcessPoolExecutor, wait
+from concurrent.futures.process import BrokenProcessPool
+from contextlib import contextmanager
 from pathlib import Path
-from typing import List, Dict, Any, Optional
+from typing import List, Dict, Any, Iterator, Optional
 from datetime import datetime
 
+import numpy as np
+
+try:
+    import resource
+except ImportError:  # not available on Windows
+    resource = None
+
 from ..core.types import ARCTask, Grid
 from ..core.trace import TraceWriter
 from ..controller.router import MetaController, ControllerConfig, determine_regime
@@ -24,6 +41,9 @@ from ..controller.refusal import RefusalChecker
 from ..controller.scheduler import PhaseScheduler, SolvePhase
 
 
+logger = logging.getLogger(__name__)
+
+
 def load_task(filepath: Path) -> ARCTask:
     """Load an ARC task from JSON file."""
     with open(filepath) as f:
@@ -111,6 +131,10 @@ def run_single_task(
         "regime": regime_decision.regime.name,
         "regime_confidence": regime_decision.confidence,
         "runtime_seconds": result.audit_trace.runtime_seconds,
+        "phase_times": {
+            name: phase["time_used"]
+            for name, phase in result.audit_trace.phase_summary.get("phases", {}).items()
+        },
     }
 
     if not result.success:
@@ -119,31 +143,298 @@ def run_single_task(
     return result_dict
 
 
-def run_evaluation(
+class TaskTimeout(BaseException):
+    """
+    A task ran past its time limit.
+
+    Derives from BaseException so the solver's broad ``except Exception``
+    fallbacks cannot swallow it.
+    """
+
+
+@contextmanager
+def _deadline(seconds: Optional[float]) -> Iterator[None]:
+    """Raise TaskTimeout in the block after `seconds` (Unix main thread only)."""
+    if (
+        not seconds
+        or not hasattr(signal, "setitimer")
+        or threading.current_thread() is not threading.main_thread()
+    ):
+        yield
+        return
+
+    def _expire(signum, frame):
+        raise TaskTimeout(f"timed out after {seconds:g}s")
+
+    previous = signal.signal(signal.SIGALRM, _expire)
+    signal.setitimer(signal.ITIMER_REAL, seconds)
+    try:
+        yield
+    finally:
+        signal.setitimer(signal.ITIMER_REAL, 0)
+        signal.signal(signal.SIGALRM, previous)
+
+
+def _failure_record(task_id: str, error: str, **flags: Any) -> Dict[str, Any]:
+    """Result dict for a task that did not produce a solver result."""
+    return {"task_id": task_id, "success": False, "refused": False, "error": error, **flags}
+
+
+def _solve_with_limits(
+    task: ARCTask,
+    controller: MetaController,
+    task_timeout: Optional[float],
+    verbose: bool = False,
+) -> Dict[str, Any]:
+    """Run one task, recording timeouts and errors instead of raising."""
+    start = time.perf_counter()
+    try:
+        with _deadline(task_timeout):
+            record = run_single_task(task, controller, verbose)
+    except TaskTimeout as e:
+        record = _failure_record(task.task_id, str(e), timed_out=True)
+    except MemoryError:
+        record = _failure_record(task.task_id, "memory limit exceeded", out_of_memory=True)
+    except Exception as e:
+        record = _failure_record(task.task_id, f"{type(e).__name__}: {e}")
+    record["solve_seconds"] = time.perf_counter() - start
+    return record
+
+
+# Per-process state for evaluation workers
+_worker_state: Dict[str, Any] = {}
+
+
+def _init_eval_worker(
+    config: ControllerConfig,
+    task_timeout: Optional[float],
+    memory_limit_mb: Optional[int],
+) -> None:
+    """Apply the memory limit and build the worker's controller."""
+    if memory_limit_mb is not None and resource is not None:
+        limit = memory_limit_mb * 1024 * 1024
+        resource.setrlimit(resource.RLIMIT_AS, (limit, limit))
+    _worker_state["controller"] = MetaController(config)
+    _worker_state["task_timeout"] = task_timeout
+
+
+def _evaluate_in_worker(task: ARCTask) -> Dict[str, Any]:
+    """Solve one task with the worker's controller."""
+    return _solve_with_limits(task, _worker_state["controller"], _worker_state["task_timeout"])
+
+
+def _evaluate_serial(
     tasks: List[ARCTask],
     controller: MetaController,
-    output_dir: Optional[Path] = None,
+    task_timeout: Optional[float] = None,
     verbose: bool = True,
-) -> Dict[str, Any]:
-    """Run evaluation on multiple tasks."""
-    results = []
-    successes = 0
-    failures = 0
-    refusals = 0
-
+) -> Iterator[Dict[str, Any]]:
+    """Solve tasks one after another in this process."""
     for i, task in enumerate(tasks):
         if verbose:
             print(f"\n[{i+1}/{len(tasks)}] ", end="")
+        yield _solve_with_limits(task, controller, task_timeout, verbose)
+
+
+def _evaluate_parallel(
+    tasks: List[ARCTask],
+    config: ControllerConfig,
+    workers: int,
+    task_timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+    max_tasks_per_worker: Optional[int] = None,
+) -> Iterator[Dict[str, Any]]:
+    """
+    Solve tasks in a process pool, yielding result dicts as they finish.
+
+    At most `workers` tasks are in flight. A worker that dies (e.g. killed
+    for running out of memory) breaks the pool and fails every task in
+    flight; those tasks are rerun one at a time in a fresh worker, so only
+    the one that kills it again is recorded as crashed.
+
+    With max_tasks_per_worker set, workers are started with spawn rather
+    than fork, so each replacement re-imports the package.
+    """
+    pool_kwargs: Dict[str, Any] = {
+        "initializer": _init_eval_worker,
+        "initargs": (config, task_timeout, memory_limit_mb),
+    }
+    if max_tasks_per_worker:
+        if sys.version_info >= (3, 11):
+            pool_kwargs["max_tasks_per_child"] = max_tasks_per_worker
+        else:
+            logger.warning("Worker recycling needs Python 3.11+, workers will not be recycled")
+    if memory_limit_mb is not None and resource is None:
+        logger.warning("Memory limits are not supported on this platform")
+
+    queue = deque(tasks)
+    while queue:
+        executor = ProcessPoolExecutor(max_workers=workers, **pool_kwargs)
+        in_flight: Dict[Future, ARCTask] = {}
+        suspects: List[ARCTask] = []
+        try:
+            while (queue or in_flight) and not suspects:
+                while queue and len(in_flight) < workers:
+                    task = queue.popleft()
+                    in_flight[executor.submit(_evaluate_in_worker, task)] = task
+                done, _ = wait(in_flight, return_when=FIRST_COMPLETED)
+                for future in done:
+                    task = in_flight.pop(future)
+                    try:
+                        record = future.result()
+                    except BrokenProcessPool:
+                        suspects.append(task)
+                        continue
+                    except Exception as e:
+                        record = _failure_record(task.task_id, f"{type(e).__name__}: {e}")
+                    yield record
+        finally:
+            executor.shutdown(cancel_futures=True)
+
+        suspects.extend(in_flight.values())
+        for task in suspects:
+            yield _evaluate_isolated(task, pool_kwargs)
+
+
+def _evaluate_isolated(task: ARCTask, pool_kwargs: Dict[str, Any]) -> Dict[str, Any]:
+    """Solve one task alone in a fresh worker."""
+    start = time.perf_counter()
+    with ProcessPoolExecutor(max_workers=1, **pool_kwargs) as executor:
+        try:
+            return executor.submit(_evaluate_in_worker, task).result()
+        except BrokenProcessPool:
+            record = _failure_record(task.task_id, "worker process died", crashed=True)
+        except Exception as e:
+            record = _failure_record(task.task_id, f"{type(e).__name__}: {e}")
+    record["solve_seconds"] = time.perf_counter() - start
+    return record
+
+
+def load_streamed_results(path: Path) -> Dict[str, Dict[str, Any]]:
+    """Result dicts already written to a JSONL results stream, by task id."""
+    records: Dict[str, Dict[str, Any]] = {}
+    if not path.exists():
+        return records
+    with open(path) as f:
+        for line in f:
+            line = line.strip()
+            if not line:
+                continue
+            try:
+                record = json.loads(line)
+            except json.JSONDecodeError:
+                # Partial line from an interrupted write
+                continue
+            records[record["task_id"]] = record
+    return records
+
+
+def _latency_stats(latencies: List[float]) -> Dict[str, float]:
+    """Percentiles of per-task solve time in seconds."""
+    if not latencies:
+        return {"p50": 0.0, "p95": 0.0, "p99": 0.0, "mean": 0.0, "max": 0.0}
+    p50, p95, p99 = np.percentile(latencies, [50, 95, 99])
+    return {
+        "p50": float(p50),
+        "p95": float(p95),
+        "p99": float(p99),
+        "mean": float(np.mean(latencies)),
+        "max": float(np.max(latencies)),
+    }
+
+
+def _phase_breakdown(results: List[Dict[str, Any]]) -> Dict[str, Dict[str, float]]:
+    """Total and mean time per solve phase, over tasks that recorded phase times."""
+    timed = [r["phase_times"] for r in results if r.get("phase_times")]
+    breakdown = {}
+    for phase in SolvePhase:
+        total = sum(times.get(phase.name, 0.0) for times in timed)
+        breakdown[phase.name] = {
+            "total": total,
+            "mean": total / len(timed) if timed else 0.0,
+        }
+    return breakdown
 
-        result = run_single_task(task, controller, verbose)
-        results.append(result)
 
-        if result.get("refused"):
-            refusals += 1
-        elif result["success"]:
-            successes += 1
+def run_evaluation(
+    tasks: List[ARCTask],
+    controller: MetaController,
+    output_dir: Optional[Path] = None,
+    verbose: bool = True,
+    workers: int = 1,
+    task_timeout: Optional[float] = None,
+    memory_limit_mb: Optional[int] = None,
+    max_tasks_per_worker: Optional[int] = None,
+    stream_path: Optional[Path] = None,
+) -> Dict[str, Any]:
+    """
+    Run evaluation on multiple tasks.
+
+    Args:
+        tasks: Tasks to solve
+        controller: Controller to solve with; with workers > 1 each worker
+            builds its own controller from controller.config
+        output_dir: Directory for the summary JSON
+        verbose: Print progress
+        workers: Worker processes (1 = solve in this process)
+        task_timeout: Seconds before a task is abandoned and recorded as timed out
+        memory_limit_mb: Address-space limit per worker process (workers > 1 only)
+        max_tasks_per_worker: Replace each worker after this many tasks
+        stream_path: JSONL file each finished task is appended to; tasks
+            already recorded there are skipped, so interrupted runs resume
+
+    Returns:
+        Summary dict with per-task results, throughput, latency
+        percentiles and per-phase time breakdown
+    """
+    previous = load_streamed_results(stream_path) if stream_path else {}
+    pending = [task for task in tasks if task.task_id not in previous]
+    if verbose and previous:
+        print(f"Resuming: {len(tasks) - len(pending)} of {len(tasks)} tasks already done")
+    if memory_limit_mb is not None and workers <= 1:
+        logger.warning("memory_limit_mb only applies to worker processes (workers > 1)")
+
+    stream = None
+    if stream_path:
+        stream_path.parent.mkdir(parents=True, exist_ok=True)
+        stream = open(stream_path, "a+")
+        stream.seek(0, 2)
+        if stream.tell() > 0:
+            stream.seek(stream.tell() - 1)
+            if stream.read(1) != "\n":
+                stream.write("\n")
+
+    records: Dict[str, Dict[str, Any]] = dict(previous)
+    run_start = time.perf_counter()
+    try:
+        if workers > 1:
+            finished = _evaluate_parallel(
+                pending, controller.config, workers,
+                task_timeout=task_timeout,
+                memory_limit_mb=memory_limit_mb,
+                max_tasks_per_worker=max_tasks_per_worker,
+            )
         else:
-            failures += 1
+            finished = _evaluate_serial(pending, controller, task_timeout, verbose)
+        for i, result in enumerate(finished):
+            if verbose and workers > 1:
+                status = "SUCCESS" if result["success"] else "REFUSED" if result.get("refused") else "FAILED"
+                print(f"[{i+1}/{len(pending)}] {result['task_id']}: {status} "
+                      f"({result.get('solve_seconds', 0.0):.2f}s)")
+            records[result["task_id"]] = result
+            if stream is not None:
+                stream.write(json.dumps(result) + "\n")
+                stream.flush()
+    finally:
+        if stream is not None:
+            stream.close()
+    wall_time = time.perf_counter() - run_start
+
+    results = [records[task.task_id] for task in tasks if task.task_id in records]
+    successes = sum(1 for r in results if r["success"])
+    refusals = sum(1 for r in results if r.get("refused"))
+    failures = len(results) - successes - refusals
+    timeouts = sum(1 for r in results if r.get("timed_out"))
 
     # Compute summary statistics
     total = len(tasks)
@@ -155,6 +446,8 @@ def run_evaluation(
         "successes": successes,
         "failures": failures,
         "refusals": refusals,
+        "timeouts": timeouts,
+        "resumed": len(tasks) - len(pending),
         "success_rate": successes / attempted if attempted > 0 else 0.0,
         "timestamp": datetime.now().isoformat(),
         "results": results,
@@ -173,6 +466,15 @@ def run_evaluation(
     summary["regime_distribution"] = regime_counts
     summary["average_runtime_seconds"] = avg_runtime
 
+    # Throughput is for this run only; latency covers resumed tasks too
+    summary["workers"] = workers
+    summary["wall_time_seconds"] = wall_time
+    summary["tasks_per_second"] = len(pending) / wall_time if wall_time > 0 else 0.0
+    summary["latency_seconds"] = _latency_stats(
+        [r["solve_seconds"] for r in results if r.get("solve_seconds") is not None]
+    )
+    summary["phase_time_seconds"] = _phase_breakdown(results)
+
     if verbose:
         print(f"\n{'='*50}")
         print(f"SUMMARY")
@@ -182,6 +484,7 @@ def run_evaluation(
         print(f"Successes: {successes}")
         print(f"Failures: {failures}")
         print(f"Refusals: {refusals}")
+        print(f"Timeouts: {timeouts}")
         print(f"Success rate: {summary['success_rate']:.1%}")
 
         # Print regime and uncertainty stats
@@ -194,6 +497,17 @@ def run_evaluation(
             pct = count / total * 100 if total > 0 else 0
             print(f"  {regime}: {count} ({pct:.1f}%)")
 
+        latency = summary["latency_seconds"]
+        print(f"\n{'='*50}")
+        print("THROUGHPUT")
+        print(f"{'='*50}")
+        print(f"Workers: {workers}")
+        print(f"Tasks/sec: {summary['tasks_per_second']:.2f}")
+        print(f"Latency p50/p95/p99: {latency['p50']:.2f}s / {latency['p95']:.2f}s / {latency['p99']:.2f}s")
+        print("Phase time (mean per task):")
+        for phase, times in summary["phase_time_seconds"].items():
+            print(f"  {phase}: {times['mean']:.3f}s")
+
     # Save results
     if output_dir:
         output_dir.mkdir(parents=True, exist_ok=True)
@@ -257,6 +571,37 @@ def main():
         action="store_true",
         help="Skip robustness checking",
     )
+    parser.add_argument(
+        "--workers",
+        type=int,
+        default=1,
+        help="Worker processes for solving tasks in parallel (default: 1)",
+    )
+    parser.add_argument(
+        "--task-timeout",
+        type=float,
+        default=None,
+        help="Seconds before a task is abandoned as timed out",
+    )
+    parser.add_argument(
+        "--memory-limit-mb",
+        type=int,
+        default=None,
+        help="Address-space limit per worker process in MB",
+    )
+    parser.add_argument(
+        "--max-tasks-per-worker",
+        type=int,
+        default=None,
+        help="Replace each worker process after this many tasks",
+    )
+    parser.add_argument(
+        "--stream-to",
+        type=Path,
+        default=None,
+        help="JSONL file each finished task is appended to; "
+             "tasks already in it are skipped, so interrupted runs resume",
+    )
 
     args = parser.parse_args()
 
@@ -284,7 +629,14 @@ def main():
 
     # Run evaluation
     verbose = not args.quiet
-    summary = run_evaluation(tasks, controller, args.output, verbose)
+    summary = run_evaluation(
+        tasks, controller, args.output, verbose,
+        workers=args.workers,
+        task_timeout=args.task_timeout,
+        memory_limit_mb=args.memory_limit_mb,
+        max_tasks_per_worker=args.max_tasks_per_worker,
+        stream_path=args.stream_to,
+    )
 
     # Exit code based on success
     sys.exit(0 if summary["successes"] > 0 else 1)
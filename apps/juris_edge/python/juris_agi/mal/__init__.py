@@ -3,9 +3,13 @@
 from .retrieval import (
     MemoryStore,
     SolutionMemory,
+    InMemoryStore,
+    PersistentMemoryStore,
+    TaskFeatureIndex,
     retrieve_similar,
     # New JSON-based macro storage
     MacroStore,
+    SQLiteMacroStore,
     StoredMacro,
     retrieve_macros,
     extract_task_tags,
@@ -32,8 +36,12 @@ __all__ = [
     # Memory and retrieval
     "MemoryStore",
     "SolutionMemory",
+    "InMemoryStore",
+    "PersistentMemoryStore",
+    "TaskFeatureIndex",
     "retrieve_similar",
     "MacroStore",
+    "SQLiteMacroStore",
     "StoredMacro",
     "retrieve_macros",
     "extract_task_tags",
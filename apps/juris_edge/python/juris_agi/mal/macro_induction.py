@@ -4,9 +4,13 @@ Macro induction from successful solutions.
 Learns reusable patterns (macros) from solved tasks.
 """
 
+import json
+import os
+import re
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Set, Tuple
+from pathlib import Path
+from typing import TYPE_CHECKING, List, Dict, Any, Optional, Set, Tuple
 from collections import Counter
 
 from ..dsl.ast import (
@@ -17,6 +21,9 @@ from ..dsl.ast import (
 )
 from ..dsl.prettyprint import ast_to_source
 
+if TYPE_CHECKING:
+    from ..core.trace import JSONLTraceReader
+
 
 @dataclass
 class Macro:
@@ -244,6 +251,10 @@ def suggest_program_from_macros(
 # Trace-based Macro Induction
 # ============================================================================
 
+# A primitive call with arguments inside a program source
+_PRIMITIVE_CALL = re.compile(r'\b(\w+)\s*\([^)]*\)')
+
+
 @dataclass
 class CandidateMacro:
     """A candidate macro extracted from traces."""
@@ -269,14 +280,43 @@ class CandidateMacro:
         )
 
 
+# Interned step-token IDs of a subprogram; its code is the steps joined by " >> "
+PatternKey = Tuple[int, ...]
+
+
+@dataclass
+class PatternStats:
+    """Running statistics of one subprogram across processed traces."""
+    frequency: int = 0
+    task_ids: Dict[str, None] = field(default_factory=dict)  # Insertion-ordered set
+    tag_counts: Dict[str, int] = field(default_factory=dict)  # In first-seen order
+    mdl_cost: Optional[int] = None  # Estimated on first use
+
+
 class MacroInducer:
     """
     Induces candidate macros from solved traces.
 
     Extracts common subprograms and proposes them as macros.
+
+    Programs are split into step tokens, interned to integer IDs, and
+    subprograms are counted under tuples of those IDs, so each distinct
+    final_program is tokenized and windowed once however often it
+    recurs. Per-pattern statistics are aggregated as traces arrive and,
+    with a state_path, saved between runs together with a trace cursor,
+    so process_new_traces only reads traces written since the last run.
     """
 
-    def __init__(self, min_frequency: int = 2, min_length: int = 1, max_length: int = 4):
+    STATE_VERSION = 1
+
+    def __init__(
+        self,
+        min_frequency: int = 2,
+        min_length: int = 1,
+        max_length: int = 4,
+        state_path: Optional[str] = None,
+        program_cache_size: int = 100_000,
+    ):
         """
         Initialize macro inducer.
 
@@ -284,11 +324,21 @@ class MacroInducer:
             min_frequency: Minimum occurrences to become a macro
             min_length: Minimum subprogram length (in primitives)
             max_length: Maximum subprogram length
+            state_path: JSON file to load statistics from and save() to
+            program_cache_size: Distinct programs whose patterns are cached
         """
         self.min_frequency = min_frequency
         self.min_length = min_length
         self.max_length = max_length
-        self._pattern_counts: Dict[str, List[Dict[str, Any]]] = {}  # code -> [{task_id, tags}]
+        self.state_path = Path(state_path) if state_path else None
+        self.program_cache_size = program_cache_size
+        self.cursor: Dict[str, int] = {}  # Trace cursor for process_new_traces
+
+        self._token_ids: Dict[str, int] = {}
+        self._tokens: List[str] = []
+        self._patterns: Dict[PatternKey, PatternStats] = {}
+        self._program_patterns: Dict[str, List[PatternKey]] = {}
+        self._load()
 
     def process_trace(self, trace_dict: Dict[str, Any]) -> None:
         """
@@ -309,22 +359,35 @@ class MacroInducer:
         # Extract tags from trace features
         tags = self._extract_tags_from_trace(trace_dict)
 
-        # Extract subprograms
-        subprograms = self._extract_subprograms(program)
-
-        for code in subprograms:
-            if code not in self._pattern_counts:
-                self._pattern_counts[code] = []
-            self._pattern_counts[code].append({
-                "task_id": task_id,
-                "tags": tags,
-            })
+        for key in self._program_pattern_keys(program):
+            stats = self._patterns.get(key)
+            if stats is None:
+                stats = self._patterns[key] = PatternStats()
+            stats.frequency += 1
+            stats.task_ids[task_id] = None
+            tag_counts = stats.tag_counts
+            for tag in tags:
+                tag_counts[tag] = tag_counts.get(tag, 0) + 1
 
     def process_traces(self, traces: List[Dict[str, Any]]) -> None:
         """Process multiple traces."""
         for trace in traces:
             self.process_trace(trace)
 
+    def process_new_traces(self, reader: "JSONLTraceReader") -> int:
+        """
+        Process the successful traces written since the last call.
+
+        Args:
+            reader: Reader for the trace directory
+
+        Returns:
+            Number of traces processed
+        """
+        traces, self.cursor = reader.read_since(self.cursor, success_only=True)
+        self.process_traces(traces)
+        return len(traces)
+
     def extract_candidates(self) -> List[CandidateMacro]:
         """
         Extract candidate macros from processed traces.
@@ -335,37 +398,27 @@ class MacroInducer:
         candidates = []
         macro_id = 0
 
-        for code, occurrences in self._pattern_counts.items():
-            if len(occurrences) < self.min_frequency:
+        for key, stats in self._patterns.items():
+            if stats.frequency < self.min_frequency:
                 continue
 
-            # Aggregate tags and task IDs
-            all_tags: List[str] = []
-            task_ids: List[str] = []
-            for occ in occurrences:
-                all_tags.extend(occ["tags"])
-                if occ["task_id"] not in task_ids:
-                    task_ids.append(occ["task_id"])
-
-            # Deduplicate and sort tags by frequency
-            tag_counts = Counter(all_tags)
-            top_tags = [t for t, _ in tag_counts.most_common(5)]
-
-            # Compute MDL cost (rough estimate based on code length)
-            mdl_cost = self._estimate_mdl(code)
+            code = self._code(key)
+            if stats.mdl_cost is None:
+                # Compute MDL cost (rough estimate based on code length)
+                stats.mdl_cost = self._estimate_mdl(code)
 
             # Score: frequency * diversity / mdl_cost
-            frequency = len(occurrences)
-            diversity = len(task_ids)
-            score = (frequency * diversity) / max(mdl_cost, 1)
+            frequency = stats.frequency
+            diversity = len(stats.task_ids)
+            score = (frequency * diversity) / max(stats.mdl_cost, 1)
 
             candidates.append(CandidateMacro(
                 name=f"induced_macro_{macro_id}",
                 code=code,
-                tags=top_tags,
-                source_task_ids=task_ids,
+                tags=[t for t, _ in Counter(stats.tag_counts).most_common(5)],
+                source_task_ids=list(stats.task_ids),
                 frequency=frequency,
-                mdl_cost=mdl_cost,
+                mdl_cost=stats.mdl_cost,
                 score=score,
             ))
             macro_id += 1
@@ -407,31 +460,51 @@ class MacroInducer:
 
         return tags
 
-    def _extract_subprograms(self, program_source: str) -> List[str]:
+    def _tokenize(self, code: str) -> PatternKey:
+        """Intern the " >> "-separated steps of a code string."""
+        key = []
+        for step in code.split(" >> "):
+            token_id = self._token_ids.get(step)
+            if token_id is None:
+                token_id = self._token_ids[step] = len(self._tokens)
+                self._tokens.append(step)
+            key.append(token_id)
+        return tuple(key)
+
+    def _code(self, key: PatternKey) -> str:
+        return " >> ".join(self._tokens[t] for t in key)
+
+    def _program_pattern_keys(self, program_source: str) -> List[PatternKey]:
+        """Pattern keys of a program, cached per distinct program source."""
+        keys = self._program_patterns.get(program_source)
+        if keys is None:
+            if len(self._program_patterns) >= self.program_cache_size:
+                self._program_patterns.clear()
+            keys = self._extract_subprograms(program_source)
+            self._program_patterns[program_source] = keys
+        return keys
+
+    def _extract_subprograms(self, program_source: str) -> List[PatternKey]:
         """
         Extract subprogram patterns from a program source.
 
-        Returns list of subprogram code strings.
+        Returns a list of pattern keys, one per occurrence: the full
+        program, every window of min_length..max_length steps, and every
+        primitive call with arguments.
         """
-        subprograms = []
-
         # The full program
-        subprograms.append(program_source)
+        tokens = self._tokenize(program_source)
+        subprograms = [tokens]
 
-        # Try to parse and extract subsequences
-        # Simple heuristic: split on composition operator and extract windows
-        if " >> " in program_source:
-            parts = program_source.split(" >> ")
-            for window_size in range(self.min_length, min(self.max_length + 1, len(parts) + 1)):
-                for i in range(len(parts) - window_size + 1):
-                    subseq = " >> ".join(parts[i:i + window_size])
-                    subprograms.append(subseq)
+        # Windows over the composition steps
+        if len(tokens) > 1:
+            for window_size in range(self.min_length, min(self.max_length + 1, len(tokens) + 1)):
+                for i in range(len(tokens) - window_size + 1):
+                    subprograms.append(tokens[i:i + window_size])
 
         # Individual primitives with arguments
-        import re
-        prim_pattern = r'\b(\w+)\s*\([^)]*\)'
-        for match in re.finditer(prim_pattern, program_source):
-            subprograms.append(match.group(0))
+        for match in _PRIMITIVE_CALL.finditer(program_source):
+            subprograms.append(self._tokenize(match.group(0)))
 
         return subprograms
 
@@ -448,9 +521,66 @@ class MacroInducer:
 
         return cost
 
+    def save(self, path: Optional[str] = None) -> None:
+        """
+        Save statistics and the trace cursor.
+
+        Args:
+            path: Destination (default: state_path)
+        """
+        target = Path(path) if path else self.state_path
+        if target is None:
+            raise ValueError("No state path given")
+        target.parent.mkdir(parents=True, exist_ok=True)
+        state = {
+            "version": self.STATE_VERSION,
+            "min_length": self.min_length,
+            "max_length": self.max_length,
+            "cursor": self.cursor,
+            "tokens": self._tokens,
+            "patterns": [
+                [list(key), stats.frequency, list(stats.task_ids),
+                 list(stats.tag_counts.items()), stats.mdl_cost]
+                for key, stats in self._patterns.items()
+            ],
+        }
+        tmp_path = target.with_name(target.name + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(state, f, separators=(",", ":"))
+        os.replace(tmp_path, target)
+
+    def _load(self) -> None:
+        """Load saved statistics from state_path if it exists."""
+        if self.state_path is None or not self.state_path.exists():
+            return
+        with open(self.state_path) as f:
+            state = json.load(f)
+        if state.get("version") != self.STATE_VERSION:
+            raise ValueError(f"Unsupported macro induction state version: {state.get('version')}")
+        if (state["min_length"], state["max_length"]) != (self.min_length, self.max_length):
+            raise ValueError(
+                f"Macro induction state was built with subprogram lengths "
+                f"{state['min_length']}..{state['max_length']}, not "
+                f"{self.min_length}..{self.max_length}"
+            )
+        self.cursor = state["cursor"]
+        self._tokens = state["tokens"]
+        self._token_ids = {token: i for i, token in enumerate(self._tokens)}
+        for key, frequency, task_ids, tag_counts, mdl_cost in state["patterns"]:
+            self._patterns[tuple(key)] = PatternStats(
+                frequency=frequency,
+                task_ids=dict.fromkeys(task_ids),
+                tag_counts=dict(tag_counts),
+                mdl_cost=mdl_cost,
+            )
+
     def clear(self) -> None:
-        """Clear accumulated patterns."""
-        self._pattern_counts.clear()
+        """Clear accumulated patterns and the trace cursor."""
+        self._patterns.clear()
+        self._program_patterns.clear()
+        self._token_ids.clear()
+        self._tokens.clear()
+        self.cursor = {}
 
 
 def extract_candidate_macros(
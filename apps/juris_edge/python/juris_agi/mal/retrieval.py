@@ -6,13 +6,21 @@ Stores and retrieves solutions based on task similarity.
 
 from abc import ABC, abstractmethod
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Tuple
+from pathlib import Path
+from typing import List, Dict, Any, Optional, Set, Tuple
 import hashlib
 import json
+import os
+import pickle
+import sqlite3
+import struct
 
-from ..core.types import Grid, ARCTask
+import numpy as np
+
+from ..core.types import ARCTask
 from ..dsl.ast import ASTNode
 from ..dsl.prettyprint import ast_to_source
+from ..representation.task_context import TaskFeatureContext, get_task_context
 
 
 @dataclass
@@ -72,50 +80,287 @@ class MemoryStore(ABC):
         pass
 
 
+class TaskFeatureIndex:
+    """
+    Vectorized similarity search over task feature dicts.
+
+    Each feature key gets a column and each distinct value within a
+    column an integer code, so a feature dict becomes a fixed-length
+    uint16 vector. Codes are stored column-major, and the similarity of
+    a query against every row (fraction of shared keys with equal
+    values) is computed with whole-column comparisons.
+    """
+
+    MISSING = 0xFFFF  # Row does not have this key
+    UNSEEN = 0xFFFE  # Query value that no row has
+    _MAX_CODES = 0xFFFE
+
+    def __init__(self, initial_rows: int = 1024):
+        self.columns: Dict[str, int] = {}
+        self.vocab: List[Dict[Any, int]] = []
+        self.size = 0
+        self._codes = np.full((8, initial_rows), self.MISSING, dtype=np.uint16)
+        self._weights = np.zeros(initial_rows, dtype=np.float32)
+        # Presence bitmask per row over the first 64 columns
+        self._bits = np.zeros(initial_rows, dtype=np.uint64)
+
+    @staticmethod
+    def _value_key(value: Any) -> Any:
+        """Key used to look up a value's code."""
+        try:
+            hash(value)
+            return value
+        except TypeError:
+            return ("__unhashable__", repr(value))
+
+    def _ensure_writable(self) -> None:
+        """Copy memory-mapped arrays into memory before the first write."""
+        if not self._codes.flags.writeable:
+            self._codes = np.array(self._codes)
+            self._weights = np.array(self._weights)
+            self._bits = np.array(self._bits)
+
+    def _grow(self, num_columns: int, num_rows: int) -> None:
+        """Grow storage to hold at least the given columns and rows."""
+        cols, rows = self._codes.shape
+        if num_columns <= cols and num_rows <= rows:
+            return
+        new_cols = max(cols, num_columns)
+        new_rows = max(rows, num_rows)
+        if num_rows > rows:
+            new_rows = max(num_rows, rows * 2)
+        if num_columns > cols:
+            new_cols = max(num_columns, cols * 2)
+
+        codes = np.full((new_cols, new_rows), self.MISSING, dtype=np.uint16)
+        codes[:cols, :rows] = self._codes
+        weights = np.zeros(new_rows, dtype=np.float32)
+        weights[:rows] = self._weights
+        bits = np.zeros(new_rows, dtype=np.uint64)
+        bits[:rows] = self._bits
+        self._codes, self._weights, self._bits = codes, weights, bits
+
+    def encode(self, features: Dict[str, Any], add: bool = False) -> Dict[int, int]:
+        """
+        Encode a feature dict as {column: code}.
+
+        With add=False, unknown keys are dropped (no row can share them)
+        and unknown values map to UNSEEN (shared key, never equal).
+        """
+        encoded: Dict[int, int] = {}
+        for key, value in features.items():
+            col = self.columns.get(key)
+            if col is None:
+                if not add:
+                    continue
+                col = len(self.columns)
+                self.columns[key] = col
+                self.vocab.append({})
+            codes = self.vocab[col]
+            value_key = self._value_key(value)
+            code = codes.get(value_key)
+            if code is None:
+                if not add:
+                    code = self.UNSEEN
+                else:
+                    if len(codes) >= self._MAX_CODES:
+                        raise ValueError(f"Too many distinct values for feature {key!r}")
+                    code = len(codes)
+                    codes[value_key] = code
+            encoded[col] = code
+        return encoded
+
+    def set_row(self, row: int, features: Dict[str, Any], weight: float) -> None:
+        """Write a row (appending if row == size)."""
+        if row > self.size:
+            raise IndexError(f"Row {row} out of range for index of size {self.size}")
+        encoded = self.encode(features, add=True)
+        self._ensure_writable()
+        self._grow(len(self.columns), row + 1)
+
+        self._codes[:, row] = self.MISSING
+        bits = 0
+        for col, code in encoded.items():
+            self._codes[col, row] = code
+            if col < 64:
+                bits |= 1 << col
+        self._bits[row] = bits
+        self._weights[row] = weight
+        self.size = max(self.size, row + 1)
+
+    def _counts(self, query: Dict[int, int]) -> Tuple[np.ndarray, np.ndarray]:
+        """Shared-key and equal-value counts of the query against every row."""
+        n = self.size
+        cols = sorted(query)
+        match = np.zeros(n, dtype=np.uint8 if len(cols) < 256 else np.uint16)
+        for col in cols:
+            match += self._codes[col, :n] == query[col]
+
+        if hasattr(np, "bitwise_count") and (not cols or cols[-1] < 64):
+            mask = np.uint64(sum(1 << col for col in cols))
+            common = np.bitwise_count(self._bits[:n] & mask)
+        else:
+            common = np.zeros(n, dtype=np.uint16)
+            for col in cols:
+                common += self._codes[col, :n] != self.MISSING
+        return match, common
+
+    def search(
+        self,
+        features: Dict[str, Any],
+        top_k: int = 5,
+    ) -> List[Tuple[int, float, float]]:
+        """
+        Find the rows most relevant to a feature dict.
+
+        Relevance is similarity times the row weight. Ties keep row order.
+
+        Returns:
+            List of (row, similarity, relevance), best first
+        """
+        n = self.size
+        if n == 0 or top_k <= 0:
+            return []
+
+        match, common = self._counts(self.encode(features))
+        relevance = match.astype(np.float32)
+        relevance /= np.maximum(common, 1)
+        relevance *= self._weights[:n]
+
+        # float32 keeps the order of these small-denominator ratios, so
+        # selecting here and recomputing in float64 below is exact
+        rows = self._top_rows(relevance, top_k)
+
+        results = []
+        for row in rows[:top_k].tolist():
+            shared = int(common[row])
+            similarity = int(match[row]) / shared if shared else 0.0
+            results.append((row, similarity, similarity * float(self._weights[row])))
+        return results
+
+    @staticmethod
+    def _top_rows(relevance: np.ndarray, top_k: int) -> np.ndarray:
+        """Rows by descending relevance, ties in row order (at least top_k)."""
+        n = len(relevance)
+        if top_k >= n:
+            return np.argsort(-relevance, kind="stable")
+
+        if top_k <= 16:
+            # Scores take few distinct values: peel off the best level until
+            # enough rows are collected (relevance is never negative)
+            levels = []
+            found = 0
+            work = relevance
+            while found < top_k:
+                rows = np.flatnonzero(work == work.max())
+                levels.append(rows)
+                found += len(rows)
+                if work is relevance:
+                    work = relevance.copy()
+                work[rows] = -1.0
+            return np.concatenate(levels)
+
+        kth = np.partition(relevance, n - top_k)[n - top_k]
+        above = np.flatnonzero(relevance > kth)
+        ties = np.flatnonzero(relevance == kth)[: top_k - len(above)]
+        rows = np.concatenate([above, ties])
+        return rows[np.lexsort((rows, -relevance[rows]))]
+
+    def save(self, directory: Path) -> None:
+        """
+        Write the index to a directory (arrays as .npy for memory mapping).
+
+        Files are replaced atomically, so readers that have the previous
+        snapshot mapped keep a valid view.
+        """
+        n = self.size
+        arrays = {
+            "codes.npy": np.ascontiguousarray(self._codes[:, :n]),
+            "weights.npy": self._weights[:n],
+            "bits.npy": self._bits[:n],
+        }
+        for name, array in arrays.items():
+            with open(directory / (name + ".tmp"), "wb") as f:
+                np.save(f, array)
+            os.replace(directory / (name + ".tmp"), directory / name)
+        with open(directory / "vocab.pkl.tmp", "wb") as f:
+            pickle.dump({"columns": self.columns, "vocab": self.vocab}, f)
+        os.replace(directory / "vocab.pkl.tmp", directory / "vocab.pkl")
+
+    @classmethod
+    def load(cls, directory: Path) -> "TaskFeatureIndex":
+        """Load an index saved with save(), memory-mapping the arrays."""
+        index = cls(initial_rows=1)
+        with open(directory / "vocab.pkl", "rb") as f:
+            state = pickle.load(f)
+        index.columns = state["columns"]
+        index.vocab = state["vocab"]
+        index._codes = np.load(directory / "codes.npy", mmap_mode="r")
+        index._weights = np.load(directory / "weights.npy", mmap_mode="r")
+        index._bits = np.load(directory / "bits.npy", mmap_mode="r")
+        index.size = len(index._weights)
+        return index
+
+
 class InMemoryStore(MemoryStore):
     """
     Simple in-memory storage.
 
-    Uses feature-based similarity for retrieval.
+    Uses feature-based similarity for retrieval, searched through a
+    TaskFeatureIndex.
     """
 
     def __init__(self):
         self.memories: Dict[str, SolutionMemory] = {}
+        self._index = TaskFeatureIndex()
+        self._row_keys: List[str] = []
+        self._rows: Dict[str, int] = {}
 
     def store(self, memory: SolutionMemory) -> None:
         """Store a solution."""
         key = self._compute_key(memory)
+        self._index_memory(key, memory)
         self.memories[key] = memory
 
+    def _index_memory(self, key: str, memory: SolutionMemory) -> None:
+        """Add or replace a memory's row in the feature index."""
+        row = self._rows.get(key)
+        if row is None:
+            row = len(self._row_keys)
+            self._rows[key] = row
+            self._row_keys.append(key)
+        weight = 1.0 if memory.success else 0.5
+        self._index.set_row(row, memory.task_features, weight)
+
+    def _memory_at(self, row: int) -> SolutionMemory:
+        """Get the memory stored at an index row."""
+        return self.memories[self._row_keys[row]]
+
     def retrieve(
         self,
         task: ARCTask,
         top_k: int = 5,
     ) -> List[RetrievalResult]:
         """Retrieve similar solutions."""
-        if not self.memories:
+        if not self._row_keys:
             return []
 
         query_features = self._extract_features(task)
-        results: List[RetrievalResult] = []
-
-        for memory in self.memories.values():
-            similarity = self._compute_similarity(query_features, memory.task_features)
-            relevance = similarity * (1.0 if memory.success else 0.5)
-
-            results.append(RetrievalResult(
-                memory=memory,
+        return [
+            RetrievalResult(
+                memory=self._memory_at(row),
                 similarity=similarity,
                 relevance_score=relevance,
-            ))
-
-        # Sort by relevance
-        results.sort(key=lambda r: r.relevance_score, reverse=True)
-        return results[:top_k]
+            )
+            for row, similarity, relevance in self._index.search(query_features, top_k)
+        ]
 
     def clear(self) -> None:
         """Clear all memories."""
         self.memories.clear()
+        self._index = TaskFeatureIndex()
+        self._row_keys = []
+        self._rows = {}
 
     def _compute_key(self, memory: SolutionMemory) -> str:
         """Compute unique key for memory."""
@@ -124,10 +369,14 @@ class InMemoryStore(MemoryStore):
 
     def _extract_features(self, task: ARCTask) -> Dict[str, Any]:
         """Extract features from a task for similarity computation."""
-        features: Dict[str, Any] = {}
-
         if not task.train:
-            return features
+            return {}
+        context = get_task_context(task)
+        return dict(context.get("memory_features", lambda: self._compute_features(context)))
+
+    def _compute_features(self, context: TaskFeatureContext) -> Dict[str, Any]:
+        task = context.task
+        features: Dict[str, Any] = {}
 
         # Aggregate features from training pairs
         for i, pair in enumerate(task.train):
@@ -135,8 +384,8 @@ class InMemoryStore(MemoryStore):
             features[f"pair_{i}_input_shape"] = inp.shape
             features[f"pair_{i}_output_shape"] = out.shape
             features[f"pair_{i}_same_dims"] = inp.shape == out.shape
-            features[f"pair_{i}_input_palette_size"] = len(inp.palette)
-            features[f"pair_{i}_output_palette_size"] = len(out.palette)
+            features[f"pair_{i}_input_palette_size"] = len(context.palette("input", i))
+            features[f"pair_{i}_output_palette_size"] = len(context.palette("output", i))
 
         # Global features
         features["num_train_pairs"] = len(task.train)
@@ -173,33 +422,146 @@ class InMemoryStore(MemoryStore):
         return matches / len(common_keys)
 
 
-class PersistentMemoryStore(MemoryStore):
+class PersistentMemoryStore(InMemoryStore):
     """
     Persistent memory storage with disk backing.
 
-    Stub implementation - can be extended with actual persistence.
+    Layout of the storage directory:
+    - ``memories.log``: append-only log of pickled (key, memory) records
+    - ``codes.npy`` / ``weights.npy`` / ``bits.npy`` / ``vocab.pkl``:
+      a snapshot of the feature index, memory-mapped on open
+    - ``snapshot.json``: row keys and log offsets covered by the snapshot
+
+    Stores only append to the log; flush() (also called by close())
+    rewrites the snapshot. On open, records logged after the last
+    snapshot are replayed. Memories are unpickled lazily, when a
+    retrieval returns them.
     """
 
+    _LOG = "memories.log"
+    _SNAPSHOT = "snapshot.json"
+    _RECORD_HEADER = struct.Struct("<I")
+
     def __init__(self, storage_path: Optional[str] = None):
+        super().__init__()
         self.storage_path = storage_path
-        self._in_memory = InMemoryStore()
+        self._offsets: List[int] = []
+        self._dirty = False
+        if storage_path is not None:
+            self._directory = Path(storage_path)
+            self._directory.mkdir(parents=True, exist_ok=True)
+            self._open()
+
+    @property
+    def _log_path(self) -> Path:
+        return self._directory / self._LOG
+
+    def _open(self) -> None:
+        """Load the snapshot and replay any newer log records."""
+        log_start = 0
+        snapshot_path = self._directory / self._SNAPSHOT
+        if snapshot_path.exists():
+            with open(snapshot_path, "r") as f:
+                snapshot = json.load(f)
+            self._index = TaskFeatureIndex.load(self._directory)
+            self._row_keys = snapshot["keys"]
+            # Arrays may be ahead of snapshot.json if a flush was interrupted
+            self._index.size = len(self._row_keys)
+            self._offsets = snapshot["offsets"]
+            self._rows = {key: row for row, key in enumerate(self._row_keys)}
+            log_start = snapshot["log_size"]
+
+        if self._log_path.exists():
+            with open(self._log_path, "rb") as f:
+                f.seek(log_start)
+                offset = log_start
+                while True:
+                    record = self._read_record(f)
+                    if record is None:
+                        break
+                    key, memory = record
+                    self._index_memory(key, memory)
+                    self._set_offset(key, offset)
+                    self.memories[key] = memory
+                    offset = f.tell()
+            self._dirty = offset != log_start
+
+    def _read_record(self, f) -> Optional[Tuple[str, SolutionMemory]]:
+        """Read one length-prefixed record, or None at end of log."""
+        header = f.read(self._RECORD_HEADER.size)
+        if len(header) < self._RECORD_HEADER.size:
+            return None
+        (length,) = self._RECORD_HEADER.unpack(header)
+        payload = f.read(length)
+        if len(payload) < length:
+            return None  # Truncated final record
+        return pickle.loads(payload)
+
+    def _set_offset(self, key: str, offset: int) -> None:
+        """Record the log offset of a key's latest record."""
+        row = self._rows[key]
+        if row == len(self._offsets):
+            self._offsets.append(offset)
+        else:
+            self._offsets[row] = offset
 
     def store(self, memory: SolutionMemory) -> None:
-        """Store a solution."""
-        self._in_memory.store(memory)
-        # TODO: Persist to disk
+        """Store a solution, appending it to the log."""
+        key = self._compute_key(memory)
+        self._index_memory(key, memory)
+        self.memories[key] = memory
 
-    def retrieve(
-        self,
-        task: ARCTask,
-        top_k: int = 5,
-    ) -> List[RetrievalResult]:
-        """Retrieve similar solutions."""
-        return self._in_memory.retrieve(task, top_k)
+        if self.storage_path is None:
+            return
+        payload = pickle.dumps((key, memory), protocol=pickle.HIGHEST_PROTOCOL)
+        with open(self._log_path, "ab") as f:
+            offset = f.tell()
+            f.write(self._RECORD_HEADER.pack(len(payload)))
+            f.write(payload)
+        self._set_offset(key, offset)
+        self._dirty = True
+
+    def _memory_at(self, row: int) -> SolutionMemory:
+        """Get the memory at an index row, loading it from the log if needed."""
+        key = self._row_keys[row]
+        memory = self.memories.get(key)
+        if memory is None:
+            with open(self._log_path, "rb") as f:
+                f.seek(self._offsets[row])
+                _, memory = self._read_record(f)
+            self.memories[key] = memory
+        return memory
+
+    def flush(self) -> None:
+        """Write a snapshot of the index covering the whole log."""
+        if self.storage_path is None or not self._dirty:
+            return
+        log_size = self._log_path.stat().st_size if self._log_path.exists() else 0
+        self._index.save(self._directory)
+        tmp_path = self._directory / (self._SNAPSHOT + ".tmp")
+        with open(tmp_path, "w") as f:
+            json.dump(
+                {"keys": self._row_keys, "offsets": self._offsets, "log_size": log_size},
+                f,
+            )
+        os.replace(tmp_path, self._directory / self._SNAPSHOT)
+        self._dirty = False
+
+    def close(self) -> None:
+        """Flush the snapshot."""
+        self.flush()
 
     def clear(self) -> None:
-        """Clear all memories."""
-        self._in_memory.clear()
+        """Clear all memories, in memory and on disk."""
+        super().clear()
+        self._offsets = []
+        self._dirty = False
+        if self.storage_path is not None:
+            for name in (
+                self._LOG, self._SNAPSHOT,
+                "codes.npy", "weights.npy", "bits.npy", "vocab.pkl",
+            ):
+                (self._directory / name).unlink(missing_ok=True)
 
 
 def retrieve_similar(
@@ -282,7 +644,9 @@ class MacroStore:
     JSON-based macro storage with heuristic retrieval.
 
     Stores macros as simple JSON objects and retrieves
-    by tag-based similarity (no vectors).
+    by tag-based similarity (no vectors). Tags are kept in an
+    inverted index, so retrieval only scores macros sharing a tag
+    with the query.
     """
 
     def __init__(self, storage_path: Optional[str] = None):
@@ -296,6 +660,8 @@ class MacroStore:
 
         self.storage_path = Path(storage_path) if storage_path else None
         self.macros: Dict[str, StoredMacro] = {}
+        self._tag_index: Dict[str, Set[str]] = {}
+        self._order: Dict[str, int] = {}
         self._load()
 
     def _load(self) -> None:
@@ -305,8 +671,7 @@ class MacroStore:
                 with open(self.storage_path, "r") as f:
                     data = json.load(f)
                     for macro_data in data.get("macros", []):
-                        macro = StoredMacro.from_dict(macro_data)
-                        self.macros[macro.name] = macro
+                        self._cache_macro(StoredMacro.from_dict(macro_data))
             except (json.JSONDecodeError, KeyError):
                 pass  # Start fresh on error
 
@@ -321,9 +686,32 @@ class MacroStore:
                     indent=2,
                 )
 
+    def _cache_macro(self, macro: StoredMacro) -> None:
+        """Add or replace a macro in memory and in the tag index."""
+        old = self.macros.get(macro.name)
+        if old is not None:
+            for tag in set(old.tags):
+                names = self._tag_index.get(tag)
+                if names is not None:
+                    names.discard(macro.name)
+                    if not names:
+                        del self._tag_index[tag]
+        else:
+            self._order[macro.name] = len(self._order)
+
+        self.macros[macro.name] = macro
+        for tag in set(macro.tags):
+            self._tag_index.setdefault(tag, set()).add(macro.name)
+
+    def _clear_cache(self) -> None:
+        """Drop all in-memory macros and index entries."""
+        self.macros.clear()
+        self._tag_index.clear()
+        self._order.clear()
+
     def store_macro(self, macro: StoredMacro) -> None:
         """Store a macro."""
-        self.macros[macro.name] = macro
+        self._cache_macro(macro)
         self._save()
 
     def get_macro(self, name: str) -> Optional[StoredMacro]:
@@ -351,27 +739,28 @@ class MacroStore:
             return []
 
         query_set = set(query_tags)
-        results: List[Tuple[StoredMacro, float]] = []
-
-        for macro in self.macros.values():
-            macro_set = set(macro.tags)
-            if not macro_set:
-                continue
+        candidates: Set[str] = set()
+        for tag in query_set:
+            candidates.update(self._tag_index.get(tag, ()))
 
-            # Jaccard similarity
-            intersection = len(query_set & macro_set)
-            union = len(query_set | macro_set)
-            similarity = intersection / union if union > 0 else 0.0
+        results: List[Tuple[StoredMacro, float]] = []
+        for name in sorted(candidates, key=self._order.__getitem__):
+            macro = self.macros[name]
+            overlap = len(query_set & set(macro.tags))
+            results.append((macro, _macro_similarity(macro, len(query_set), overlap)))
 
-            # Boost by success rate
-            if macro.usage_count > 0:
-                success_rate = macro.success_count / macro.usage_count
-                similarity *= (0.5 + 0.5 * success_rate)
+        results.sort(key=lambda x: x[1], reverse=True)
+        results = results[:top_k]
 
-            results.append((macro, similarity))
+        # Macros without a shared tag score zero and fill the remaining slots
+        if len(results) < top_k:
+            for macro in self.macros.values():
+                if len(results) >= top_k:
+                    break
+                if macro.tags and macro.name not in candidates:
+                    results.append((macro, 0.0))
 
-        results.sort(key=lambda x: x[1], reverse=True)
-        return results[:top_k]
+        return results
 
     def retrieve_for_task(
         self,
@@ -400,20 +789,262 @@ class MacroStore:
 
     def clear(self) -> None:
         """Clear all macros."""
-        self.macros.clear()
+        self._clear_cache()
         self._save()
 
 
+class SQLiteMacroStore(MacroStore):
+    """
+    SQLite-backed macro storage.
+
+    Writes are incremental: storing a macro upserts a single row and
+    recording usage bumps its counters in place, so several workers can
+    share one library file. The database runs in WAL mode and keeps an
+    index on tags; reads go to the database so they see other workers'
+    writes, and ``self.macros`` acts as a cache of the rows last read.
+    """
+
+    _SCHEMA = (
+        """
+        CREATE TABLE IF NOT EXISTS macros (
+            name TEXT PRIMARY KEY,
+            code TEXT NOT NULL,
+            tags TEXT NOT NULL,
+            tag_count INTEGER NOT NULL,
+            mdl_cost INTEGER NOT NULL DEFAULT 1,
+            usage_count INTEGER NOT NULL DEFAULT 0,
+            success_count INTEGER NOT NULL DEFAULT 0,
+            created_from_task TEXT
+        )
+        """,
+        """
+        CREATE TABLE IF NOT EXISTS macro_tags (
+            tag TEXT NOT NULL,
+            name TEXT NOT NULL,
+            PRIMARY KEY (tag, name)
+        )
+        """,
+        "CREATE INDEX IF NOT EXISTS idx_macro_tags_name ON macro_tags (name)",
+    )
+    _COLUMNS = ", ".join(
+        f"macros.{column}"
+        for column in (
+            "rowid", "name", "code", "tags", "mdl_cost",
+            "usage_count", "success_count", "created_from_task",
+        )
+    )
+
+    def __init__(self, storage_path: str, timeout: float = 30.0):
+        """
+        Initialize SQLite macro store.
+
+        Args:
+            storage_path: Path to the SQLite database file
+            timeout: Seconds to wait for another writer's lock
+        """
+        self._timeout = timeout
+        self._conn: Optional[sqlite3.Connection] = None
+        super().__init__(storage_path)
+
+    def _load(self) -> None:
+        """Open the database, creating the schema, and cache all macros."""
+        self.storage_path.parent.mkdir(parents=True, exist_ok=True)
+        self._conn = sqlite3.connect(str(self.storage_path), timeout=self._timeout)
+        self._conn.execute("PRAGMA journal_mode=WAL")
+        self._conn.execute("PRAGMA synchronous=NORMAL")
+        with self._conn:
+            for statement in self._SCHEMA:
+                self._conn.execute(statement)
+        self.list_all()
+
+    def _save(self) -> None:
+        """No-op: every write is applied to the database incrementally."""
+
+    def _row_to_macro(self, row: Tuple[Any, ...]) -> StoredMacro:
+        """Convert a row to a macro, refreshing the cached copy."""
+        _, name, code, tags, mdl_cost, usage_count, success_count, created_from = row
+        macro = self.macros.get(name)
+        tag_list = json.loads(tags)
+        if macro is None or macro.code != code or macro.tags != tag_list:
+            macro = StoredMacro(
+                name=name,
+                code=code,
+                tags=tag_list,
+                mdl_cost=mdl_cost,
+                created_from_task=created_from,
+            )
+            self._cache_macro(macro)
+        macro.mdl_cost = mdl_cost
+        macro.usage_count = usage_count
+        macro.success_count = success_count
+        return macro
+
+    def store_macro(self, macro: StoredMacro) -> None:
+        """Store a macro, replacing any macro with the same name."""
+        tag_set = set(macro.tags)
+        with self._conn:
+            self._conn.execute(
+                """
+                INSERT INTO macros (
+                    name, code, tags, tag_count, mdl_cost,
+                    usage_count, success_count, created_from_task
+                )
+                VALUES (?, ?, ?, ?, ?, ?, ?, ?)
+                ON CONFLICT (name) DO UPDATE SET
+                    code = excluded.code,
+                    tags = excluded.tags,
+                    tag_count = excluded.tag_count,
+                    mdl_cost = excluded.mdl_cost,
+                    usage_count = excluded.usage_count,
+                    success_count = excluded.success_count,
+                    created_from_task = excluded.created_from_task
+                """,
+                (
+                    macro.name,
+                    macro.code,
+                    json.dumps(macro.tags),
+                    len(tag_set),
+                    macro.mdl_cost,
+                    macro.usage_count,
+                    macro.success_count,
+                    macro.created_from_task,
+                ),
+            )
+            self._conn.execute("DELETE FROM macro_tags WHERE name = ?", (macro.name,))
+            self._conn.executemany(
+                "INSERT INTO macro_tags (tag, name) VALUES (?, ?)",
+                [(tag, macro.name) for tag in tag_set],
+            )
+        self._cache_macro(macro)
+
+    def get_macro(self, name: str) -> Optional[StoredMacro]:
+        """Get a macro by name."""
+        row = self._conn.execute(
+            f"SELECT {self._COLUMNS} FROM macros WHERE name = ?", (name,)
+        ).fetchone()
+        return self._row_to_macro(row) if row else None
+
+    def retrieve_by_tags(
+        self,
+        query_tags: List[str],
+        top_k: int = 5,
+    ) -> List[Tuple[StoredMacro, float]]:
+        """Retrieve macros by tag similarity using the tag index."""
+        if not query_tags or top_k <= 0:
+            return []
+
+        query_set = set(query_tags)
+        placeholders = ", ".join("?" for _ in query_set)
+        rows = self._conn.execute(
+            f"""
+            SELECT {self._COLUMNS}, matches.overlap
+            FROM (
+                SELECT name, COUNT(*) AS overlap
+                FROM macro_tags
+                WHERE tag IN ({placeholders})
+                GROUP BY name
+            ) AS matches
+            JOIN macros USING (name)
+            ORDER BY macros.rowid
+            """,
+            list(query_set),
+        ).fetchall()
+
+        results: List[Tuple[StoredMacro, float]] = []
+        for row in rows:
+            macro = self._row_to_macro(row[:-1])
+            results.append((macro, _macro_similarity(macro, len(query_set), row[-1])))
+
+        results.sort(key=lambda x: x[1], reverse=True)
+        results = results[:top_k]
+
+        # Macros without a shared tag score zero and fill the remaining slots
+        if len(results) < top_k:
+            matched = {row[1] for row in rows}
+            fill_rows = self._conn.execute(
+                f"""
+                SELECT {self._COLUMNS} FROM macros
+                WHERE tag_count > 0
+                ORDER BY rowid
+                LIMIT ?
+                """,
+                (top_k - len(results) + len(matched),),
+            )
+            for row in fill_rows:
+                if len(results) >= top_k:
+                    break
+                if row[1] not in matched:
+                    results.append((self._row_to_macro(row), 0.0))
+
+        return results
+
+    def record_usage(self, macro_name: str, success: bool) -> None:
+        """Record usage of a macro by incrementing its counters in place."""
+        with self._conn:
+            self._conn.execute(
+                """
+                UPDATE macros
+                SET usage_count = usage_count + 1,
+                    success_count = success_count + ?
+                WHERE name = ?
+                """,
+                (int(success), macro_name),
+            )
+            row = self._conn.execute(
+                f"SELECT {self._COLUMNS} FROM macros WHERE name = ?", (macro_name,)
+            ).fetchone()
+        if row:
+            self._row_to_macro(row)
+
+    def list_all(self) -> List[StoredMacro]:
+        """List all stored macros."""
+        rows = self._conn.execute(
+            f"SELECT {self._COLUMNS} FROM macros ORDER BY rowid"
+        ).fetchall()
+        return [self._row_to_macro(row) for row in rows]
+
+    def clear(self) -> None:
+        """Clear all macros."""
+        with self._conn:
+            self._conn.execute("DELETE FROM macro_tags")
+            self._conn.execute("DELETE FROM macros")
+        self._clear_cache()
+
+    def close(self) -> None:
+        """Close the database connection."""
+        if self._conn is not None:
+            self._conn.close()
+            self._conn = None
+
+
+def _macro_similarity(macro: StoredMacro, query_size: int, overlap: int) -> float:
+    """Jaccard similarity of tag sets, boosted by the macro's success rate."""
+    union = query_size + len(set(macro.tags)) - overlap
+    similarity = overlap / union if union > 0 else 0.0
+
+    # Boost by success rate
+    if macro.usage_count > 0:
+        success_rate = macro.success_count / macro.usage_count
+        similarity *= (0.5 + 0.5 * success_rate)
+
+    return similarity
+
+
 def extract_task_tags(task: ARCTask) -> List[str]:
     """
     Extract heuristic tags from a task for macro retrieval.
 
     Tags capture task characteristics useful for matching.
     """
-    tags: List[str] = []
-
     if not task.train:
-        return tags
+        return []
+    context = get_task_context(task)
+    return list(context.get("task_tags", lambda: _compute_task_tags(context)))
+
+
+def _compute_task_tags(context: TaskFeatureContext) -> List[str]:
+    task = context.task
+    tags: List[str] = []
 
     # Dimension-based tags
     same_dims = all(
@@ -441,11 +1072,8 @@ def extract_task_tags(task: ARCTask) -> List[str]:
         tags.append("cropping")
 
     # Palette tags
-    all_input_colors = set()
-    all_output_colors = set()
-    for pair in task.train:
-        all_input_colors.update(pair.input.palette)
-        all_output_colors.update(pair.output.palette)
+    all_input_colors = set().union(*context.palettes("input"))
+    all_output_colors = set().union(*context.palettes("output"))
 
     if all_output_colors.issubset(all_input_colors):
         tags.append("palette_preserved")
@@ -455,16 +1083,15 @@ def extract_task_tags(task: ARCTask) -> List[str]:
         tags.append("color_addition")
 
     # Symmetry tags
-    if _is_symmetric_h(first_pair.output):
+    if context.symmetric_h("output", 0):
         tags.append("output_h_symmetric")
-    if _is_symmetric_v(first_pair.output):
+    if context.symmetric_v("output", 0):
         tags.append("output_v_symmetric")
 
     # Object count tags
-    from ..representation.objects import extract_connected_objects
     try:
-        input_objs = extract_connected_objects(first_pair.input)
-        output_objs = extract_connected_objects(first_pair.output)
+        input_objs = context.connected_objects("input", 0)
+        output_objs = context.connected_objects("output", 0)
         if len(output_objs) == len(input_objs):
             tags.append("object_count_preserved")
         elif len(output_objs) < len(input_objs):
@@ -481,18 +1108,6 @@ def extract_task_tags(task: ARCTask) -> List[str]:
     return tags
 
 
-def _is_symmetric_h(grid: Grid) -> bool:
-    """Check horizontal symmetry."""
-    import numpy as np
-    return np.array_equal(grid.data, np.fliplr(grid.data))
-
-
-def _is_symmetric_v(grid: Grid) -> bool:
-    """Check vertical symmetry."""
-    import numpy as np
-    return np.array_equal(grid.data, np.flipud(grid.data))
-
-
 def retrieve_macros(
     task: ARCTask,
     macro_store: MacroStore,
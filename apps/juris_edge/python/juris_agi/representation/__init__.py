@@ -4,6 +4,9 @@ from .objects import (
     extract_connected_objects,
     extract_objects_by_color,
     find_bounding_box,
+    label_components,
+    component_at,
+    ComponentLabels,
 )
 from .relations import build_relational_graph, RelationType
 from .features import compute_object_features, compute_grid_features
@@ -13,6 +16,9 @@ __all__ = [
     "extract_connected_objects",
     "extract_objects_by_color",
     "find_bounding_box",
+    "label_components",
+    "component_at",
+    "ComponentLabels",
     "build_relational_graph",
     "RelationType",
     "compute_object_features",
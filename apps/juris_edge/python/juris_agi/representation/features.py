@@ -8,11 +8,12 @@ Provides comprehensive feature extraction for:
 """
 
 from typing import List, Dict, Any, Set, Tuple, Optional
-from dataclasses import dataclass
+from dataclasses import dataclass, replace
 import numpy as np
 
 from ..core.types import Grid, GridObject, BoundingBox, ARCTask, ARCPair
 from .objects import extract_enhanced_objects, compute_object_statistics, EnhancedObject
+from .task_context import TaskFeatureContext, get_task_context
 
 
 def compute_grid_features(grid: Grid) -> Dict[str, Any]:
@@ -243,12 +244,44 @@ def compute_task_features(task: ARCTask) -> TaskFeatures:
     """
     Compute comprehensive features from an ARC task.
 
-    Analyzes all training pairs to extract patterns and invariants.
+    Analyzes all training pairs to extract patterns and invariants. The
+    features are memoized in the task's shared feature context; each call
+    returns a copy that the caller may modify.
     """
     if not task.train:
         # Return empty features for empty task
         return _empty_task_features()
 
+    context = get_task_context(task)
+    return _copy_task_features(
+        context.get("task_features", lambda: _compute_task_features(context))
+    )
+
+
+def _copy_task_features(features: TaskFeatures) -> TaskFeatures:
+    """TaskFeatures with its own copies of the set, list and dict fields."""
+    return replace(
+        features,
+        input_dims=list(features.input_dims),
+        output_dims=list(features.output_dims),
+        input_palette=set(features.input_palette),
+        output_palette=set(features.output_palette),
+        colors_added=set(features.colors_added),
+        colors_removed=set(features.colors_removed),
+        inputs_symmetric_h=list(features.inputs_symmetric_h),
+        inputs_symmetric_v=list(features.inputs_symmetric_v),
+        outputs_symmetric_h=list(features.outputs_symmetric_h),
+        outputs_symmetric_v=list(features.outputs_symmetric_v),
+        input_object_counts=list(features.input_object_counts),
+        output_object_counts=list(features.output_object_counts),
+        input_bbox_stats=dict(features.input_bbox_stats),
+        output_bbox_stats=dict(features.output_bbox_stats),
+    )
+
+
+def _compute_task_features(context: TaskFeatureContext) -> TaskFeatures:
+    task = context.task
+
     # Collect per-pair data
     input_dims = []
     output_dims = []
@@ -263,24 +296,24 @@ def compute_task_features(task: ARCTask) -> TaskFeatures:
     input_bbox_sizes = []
     output_bbox_sizes = []
 
-    for pair in task.train:
+    for i, pair in enumerate(task.train):
         # Dimensions
         input_dims.append(pair.input.shape)
         output_dims.append(pair.output.shape)
 
         # Palettes
-        input_palettes.append(pair.input.palette)
-        output_palettes.append(pair.output.palette)
+        input_palettes.append(context.palette("input", i))
+        output_palettes.append(context.palette("output", i))
 
         # Symmetry
-        inputs_h_sym.append(_check_horizontal_symmetry(pair.input))
-        inputs_v_sym.append(_check_vertical_symmetry(pair.input))
-        outputs_h_sym.append(_check_horizontal_symmetry(pair.output))
-        outputs_v_sym.append(_check_vertical_symmetry(pair.output))
+        inputs_h_sym.append(context.symmetric_h("input", i))
+        inputs_v_sym.append(context.symmetric_v("input", i))
+        outputs_h_sym.append(context.symmetric_h("output", i))
+        outputs_v_sym.append(context.symmetric_v("output", i))
 
         # Object counts
-        input_objs = extract_enhanced_objects(pair.input)
-        output_objs = extract_enhanced_objects(pair.output)
+        input_objs = context.enhanced_objects("input", i)
+        output_objs = context.enhanced_objects("output", i)
         input_obj_counts.append(len(input_objs))
         output_obj_counts.append(len(output_objs))
 
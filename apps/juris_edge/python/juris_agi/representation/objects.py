@@ -11,6 +11,16 @@ import numpy as np
 
 from ..core.types import Grid, GridObject, BoundingBox, Color
 
+try:
+    from scipy import ndimage
+    HAS_SCIPY = True
+except ImportError:
+    HAS_SCIPY = False
+
+# 4- and 8-connectivity neighborhoods for ndimage.label
+_CROSS = np.array([[0, 1, 0], [1, 1, 1], [0, 1, 0]], dtype=bool)
+_SQUARE = np.ones((3, 3), dtype=bool)
+
 
 @dataclass
 class EnhancedObject:
@@ -69,80 +79,236 @@ def find_bounding_box(pixels: Set[Tuple[int, int]]) -> BoundingBox:
     )
 
 
-def extract_connected_objects(
+@dataclass
+class ComponentLabels:
+    """
+    Connected-component labelling of a grid.
+
+    Components are numbered from 1 in the order a raster scan first
+    reaches them, which is the order extract_connected_objects returns
+    them in; background cells are labelled 0.
+    """
+    labels: np.ndarray  # (height, width) int32 label map
+    count: int
+    bboxes: List[BoundingBox]
+    sizes: np.ndarray  # Pixel count per component
+    colors: np.ndarray  # Color of each component's first pixel (raster order)
+    pixel_index: np.ndarray  # Flat pixel indices grouped by component
+    offsets: np.ndarray  # Component i owns pixel_index[offsets[i]:offsets[i + 1]]
+
+
+def _neighbor_offsets(connectivity: int) -> List[Tuple[int, int]]:
+    """Forward neighbor offsets (each adjacent pair appears once)."""
+    if connectivity == 4:
+        return [(0, 1), (1, 0)]
+    return [(0, 1), (1, 0), (1, 1), (1, -1)]
+
+
+def _raw_labels_union_find(
+    data: np.ndarray,
+    foreground: np.ndarray,
+    connectivity: int,
+    by_color: bool,
+) -> np.ndarray:
+    """
+    Label components with array union-find.
+
+    Each round hooks every root onto the smallest root it shares an edge
+    with, then compresses paths by pointer jumping, so the final root of
+    a component is its first pixel in raster order. Returns root + 1 for
+    foreground pixels and 0 for background.
+    """
+    height, width = data.shape
+    index = np.arange(height * width).reshape(height, width)
+
+    sources, targets = [], []
+    for dr, dc in _neighbor_offsets(connectivity):
+        c0, c1 = max(0, -dc), width - max(0, dc)
+        a = (slice(0, height - dr), slice(c0, c1))
+        b = (slice(dr, height), slice(c0 + dc, c1 + dc))
+        linked = foreground[a] & foreground[b]
+        if by_color:
+            linked &= data[a] == data[b]
+        sources.append(index[a][linked])
+        targets.append(index[b][linked])
+    a = np.concatenate(sources)
+    b = np.concatenate(targets)
+
+    parent = np.arange(height * width)
+    while a.size:
+        root_a, root_b = parent[a], parent[b]
+        pending = root_a != root_b
+        if not pending.any():
+            break
+        # Edges inside one component stay that way, so drop them
+        a, b = a[pending], b[pending]
+        root_a, root_b = root_a[pending], root_b[pending]
+        np.minimum.at(parent, np.maximum(root_a, root_b), np.minimum(root_a, root_b))
+        while True:
+            grandparent = parent[parent]
+            if np.array_equal(grandparent, parent):
+                break
+            parent = grandparent
+
+    return np.where(foreground.ravel(), parent + 1, 0).reshape(height, width)
+
+
+def _raw_labels_scipy(foreground: np.ndarray, connectivity: int) -> np.ndarray:
+    """Label foreground components with scipy.ndimage.label."""
+    structure = _CROSS if connectivity == 4 else _SQUARE
+    return ndimage.label(foreground, structure=structure)[0]
+
+
+def label_components(
     grid: Grid,
     background_color: int = 0,
     connectivity: int = 4,
-) -> List[GridObject]:
+    by_color: bool = False,
+) -> ComponentLabels:
     """
-    Extract connected components from a grid as GridObjects.
+    Label the connected components of a grid in one array pass.
+
+    Uses scipy.ndimage.label when scipy is installed and a NumPy
+    union-find otherwise (and always for by_color, which scipy cannot
+    express in a single call).
 
     Args:
         grid: The input grid
         background_color: Color to treat as background (not part of objects)
         connectivity: 4 for von Neumann neighborhood, 8 for Moore neighborhood
+        by_color: Only connect neighboring pixels of the same color
 
     Returns:
-        List of GridObject instances
+        ComponentLabels with the label map and per-component bbox, size
+        and color
     """
-    height, width = grid.shape
-    visited = np.zeros((height, width), dtype=bool)
-    objects: List[GridObject] = []
-    object_id = 0
-
-    # Define neighbor offsets
-    if connectivity == 4:
-        neighbors = [(-1, 0), (1, 0), (0, -1), (0, 1)]
-    else:  # 8-connectivity
-        neighbors = [
-            (-1, -1), (-1, 0), (-1, 1),
-            (0, -1),          (0, 1),
-            (1, -1),  (1, 0), (1, 1),
+    data = grid.data
+    height, width = data.shape
+    foreground = data != background_color
+    if HAS_SCIPY and not by_color:
+        raw = _raw_labels_scipy(foreground, connectivity)
+    else:
+        raw = _raw_labels_union_find(data, foreground, connectivity, by_color)
+
+    # Group pixels by raw label (raster order within each group), then
+    # number the groups by their first pixel in raster order
+    flat = raw.ravel()
+    pixels = np.flatnonzero(flat)
+    raw_labels = flat[pixels]
+    pixel_index = pixels[np.argsort(raw_labels, kind="stable")]
+    sizes = np.bincount(raw_labels)
+    sizes = sizes[sizes > 0]
+    count = len(sizes)
+    offsets = np.zeros(count + 1, dtype=np.intp)
+    np.cumsum(sizes, out=offsets[1:])
+
+    first = pixel_index[offsets[:-1]]
+    if count > 1 and not (first[1:] > first[:-1]).all():
+        order = np.argsort(first)
+        group_of_pixel = np.repeat(np.argsort(order), sizes)
+        pixel_index = pixel_index[np.argsort(group_of_pixel, kind="stable")]
+        sizes = sizes[order]
+        np.cumsum(sizes, out=offsets[1:])
+
+    labels = np.zeros(height * width, dtype=np.int32)
+    labels[pixel_index] = np.repeat(np.arange(1, count + 1, dtype=np.int32), sizes)
+
+    bboxes: List[BoundingBox] = []
+    colors = np.zeros(count, dtype=data.dtype)
+    if count:
+        starts = offsets[:-1]
+        rows, cols = np.divmod(pixel_index, width)
+        # Pixels are in raster order within a component
+        min_rows = rows[starts].tolist()
+        max_rows = rows[offsets[1:] - 1].tolist()
+        min_cols = np.minimum.reduceat(cols, starts).tolist()
+        max_cols = np.maximum.reduceat(cols, starts).tolist()
+        bboxes = [
+            BoundingBox(min_row=r0, min_col=c0, max_row=r1, max_col=c1)
+            for r0, c0, r1, c1 in zip(min_rows, min_cols, max_rows, max_cols)
         ]
+        colors = data.ravel()[pixel_index[starts]]
 
-    for start_r in range(height):
-        for start_c in range(width):
-            if visited[start_r, start_c]:
-                continue
-            if grid[start_r, start_c] == background_color:
-                visited[start_r, start_c] = True
-                continue
-
-            # BFS to find connected component
-            component_pixels: Set[Tuple[int, int]] = set()
-            queue = deque([(start_r, start_c)])
-            visited[start_r, start_c] = True
+    return ComponentLabels(
+        labels=labels.reshape(height, width),
+        count=count,
+        bboxes=bboxes,
+        sizes=sizes,
+        colors=colors,
+        pixel_index=pixel_index,
+        offsets=offsets,
+    )
 
-            while queue:
-                r, c = queue.popleft()
-                component_pixels.add((r, c))
 
-                for dr, dc in neighbors:
-                    nr, nc = r + dr, c + dc
-                    if 0 <= nr < height and 0 <= nc < width:
-                        if not visited[nr, nc] and grid[nr, nc] != background_color:
-                            visited[nr, nc] = True
-                            queue.append((nr, nc))
+def component_at(
+    mask: np.ndarray,
+    row: int,
+    col: int,
+    connectivity: int = 4,
+) -> np.ndarray:
+    """
+    Boolean mask of the connected region of a boolean mask containing (row, col).
 
-            if component_pixels:
-                bbox = find_bounding_box(component_pixels)
+    Returns an all-False mask if (row, col) is not set in the mask.
+    """
+    if not mask[row, col]:
+        return np.zeros(mask.shape, dtype=bool)
+    if HAS_SCIPY:
+        labels = _raw_labels_scipy(mask, connectivity)
+    else:
+        labels = _raw_labels_union_find(mask, mask, connectivity, by_color=False)
+    return labels == labels[row, col]
 
-                # Convert to local coordinates with colors
-                local_pixels = frozenset(
-                    (r - bbox.min_row, c - bbox.min_col, int(grid[r, c]))
-                    for r, c in component_pixels
-                )
 
-                objects.append(GridObject(
-                    pixels=local_pixels,
-                    bbox=bbox,
-                    object_id=object_id,
-                ))
-                object_id += 1
+def _components_to_objects(
+    grid: Grid,
+    components: ComponentLabels,
+    order: Optional[List[int]] = None,
+) -> List[GridObject]:
+    """Build GridObjects (ids numbered in output order) from a labelling."""
+    if components.count == 0:
+        return []
+    rows, cols = np.divmod(components.pixel_index, grid.width)
+    min_rows = np.array([bbox.min_row for bbox in components.bboxes])
+    min_cols = np.array([bbox.min_col for bbox in components.bboxes])
+    local_rows = (rows - np.repeat(min_rows, components.sizes)).tolist()
+    local_cols = (cols - np.repeat(min_cols, components.sizes)).tolist()
+    colors = grid.data.ravel()[components.pixel_index].tolist()
+    offsets = components.offsets.tolist()
 
+    objects: List[GridObject] = []
+    for object_id, i in enumerate(range(components.count) if order is None else order):
+        start, end = offsets[i], offsets[i + 1]
+        objects.append(GridObject(
+            pixels=frozenset(zip(
+                local_rows[start:end], local_cols[start:end], colors[start:end]
+            )),
+            bbox=components.bboxes[i],
+            object_id=object_id,
+        ))
     return objects
 
 
+def extract_connected_objects(
+    grid: Grid,
+    background_color: int = 0,
+    connectivity: int = 4,
+) -> List[GridObject]:
+    """
+    Extract connected components from a grid as GridObjects.
+
+    Args:
+        grid: The input grid
+        background_color: Color to treat as background (not part of objects)
+        connectivity: 4 for von Neumann neighborhood, 8 for Moore neighborhood
+
+    Returns:
+        List of GridObject instances
+    """
+    components = label_components(grid, background_color, connectivity)
+    return _components_to_objects(grid, components)
+
+
 def extract_objects_by_color(
     grid: Grid,
     target_color: Optional[Color] = None,
@@ -158,23 +324,17 @@ def extract_objects_by_color(
         mask = Grid(np.where(grid.data == target_color, target_color, 0))
         return extract_connected_objects(mask, background_color=0)
 
-    # Extract objects for each non-background color
-    all_objects: List[GridObject] = []
+    # Objects are grouped by color, in raster order within each color.
+    # Color 0 never forms objects (it is the mask fill of the per-color scan)
     unique_colors = set(np.unique(grid.data).tolist()) - {background_color}
-
-    object_id = 0
-    for color in unique_colors:
-        mask = Grid(np.where(grid.data == color, color, 0))
-        color_objects = extract_connected_objects(mask, background_color=0)
-        for obj in color_objects:
-            all_objects.append(GridObject(
-                pixels=obj.pixels,
-                bbox=obj.bbox,
-                object_id=object_id,
-            ))
-            object_id += 1
-
-    return all_objects
+    color_rank = {color: rank for rank, color in enumerate(unique_colors)}
+    components = label_components(grid, background_color, by_color=True)
+    component_colors = components.colors.tolist()
+    order = sorted(
+        (i for i in range(components.count) if component_colors[i] != 0),
+        key=lambda i: color_rank[component_colors[i]],
+    )
+    return _components_to_objects(grid, components, order)
 
 
 def extract_single_object(grid: Grid, background_color: int = 0) -> Optional[GridObject]:
@@ -0,0 +1,239 @@
+"""
+Shared, lazily computed task features.
+
+During one solve several components derive overlapping statistics from
+the same task: the WME's pair features, MAL's retrieval features and
+tags, the controller's regime and difficulty estimates, and the
+constraint extraction behind synthesis all look at the palettes,
+dimensions, symmetry and objects of the training grids.
+TaskFeatureContext computes each of these once, on first use, and
+TaskFeatureCache hands the same context to every consumer of a task,
+keyed by a hash of the task's grids so that equal tasks loaded twice
+share it too.
+
+Values from a context are shared between consumers and must not be
+modified; palettes are frozensets and object lists are tuples for that
+reason, and consumers copy mutable results before returning them.
+"""
+
+import hashlib
+import threading
+from collections import OrderedDict
+from typing import Any, Callable, Dict, FrozenSet, List, Tuple
+
+import numpy as np
+
+from ..core.types import ARCTask, Grid, GridObject
+from .objects import EnhancedObject, extract_connected_objects, extract_enhanced_objects
+
+
+_MISSING = object()
+
+
+def task_content_key(task: ARCTask) -> str:
+    """Hash of a task's train and test grids (shape, dtype and bytes)."""
+    digest = hashlib.blake2b(digest_size=16)
+    for pairs in (task.train, task.test):
+        digest.update(b"|")
+        for pair in pairs:
+            for grid in (pair.input, pair.output):
+                if grid is None:
+                    digest.update(b"-")
+                    continue
+                data = np.ascontiguousarray(grid.data)
+                digest.update(f"{data.shape}{data.dtype.str};".encode())
+                digest.update(data.tobytes())
+    return digest.hexdigest()
+
+
+class TaskFeatureContext:
+    """
+    Memoized features of one task.
+
+    get() computes a named feature on first use and returns the stored
+    value afterwards; the helpers below cover the per-grid statistics
+    consumers share. Grids are addressed by role ("input" or "output")
+    and training pair index.
+    """
+
+    def __init__(self, task: ARCTask, key: str):
+        self.task = task
+        self.key = key
+        self._values: Dict[Tuple[Any, ...], Any] = {}
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self._by_feature: Dict[str, List[int]] = {}
+
+    def get(self, feature: str, compute: Callable[[], Any], *args: Any) -> Any:
+        """The value of feature (for the given args), computing it once."""
+        key = (feature, *args)
+        with self._lock:
+            counts = self._by_feature.get(feature)
+            if counts is None:
+                counts = self._by_feature[feature] = [0, 0]
+            value = self._values.get(key, _MISSING)
+            if value is not _MISSING:
+                self.hits += 1
+                counts[0] += 1
+                return value
+            self.misses += 1
+            counts[1] += 1
+
+        value = compute()
+        with self._lock:
+            return self._values.setdefault(key, value)
+
+    def grid(self, role: str, index: int) -> Grid:
+        pair = self.task.train[index]
+        return pair.input if role == "input" else pair.output
+
+    def palette(self, role: str, index: int) -> FrozenSet[int]:
+        return self.get("palette", lambda: frozenset(self.grid(role, index).palette), role, index)
+
+    def palettes(self, role: str) -> Tuple[FrozenSet[int], ...]:
+        """Palette of each training grid with this role."""
+        return tuple(self.palette(role, i) for i in range(len(self.task.train)))
+
+    def symmetric_h(self, role: str, index: int) -> bool:
+        """Whether the grid is left-right symmetric."""
+        def compute() -> bool:
+            data = self.grid(role, index).data
+            return bool(np.array_equal(data, np.fliplr(data)))
+        return self.get("symmetric_h", compute, role, index)
+
+    def symmetric_v(self, role: str, index: int) -> bool:
+        """Whether the grid is top-bottom symmetric."""
+        def compute() -> bool:
+            data = self.grid(role, index).data
+            return bool(np.array_equal(data, np.flipud(data)))
+        return self.get("symmetric_v", compute, role, index)
+
+    def connected_objects(self, role: str, index: int) -> Tuple[GridObject, ...]:
+        return self.get(
+            "connected_objects",
+            lambda: tuple(extract_connected_objects(self.grid(role, index))),
+            role, index,
+        )
+
+    def enhanced_objects(self, role: str, index: int) -> Tuple[EnhancedObject, ...]:
+        return self.get(
+            "enhanced_objects",
+            lambda: tuple(extract_enhanced_objects(self.grid(role, index))),
+            role, index,
+        )
+
+    def stats(self) -> Dict[str, Any]:
+        """Lookups served from the context (hits) and computed (misses), per feature."""
+        with self._lock:
+            return {
+                "hits": self.hits,
+                "misses": self.misses,
+                "by_feature": {
+                    name: {"hits": hits, "misses": misses}
+                    for name, (hits, misses) in sorted(self._by_feature.items())
+                },
+            }
+
+    def stats_since(self, before: Dict[str, Any]) -> Dict[str, Any]:
+        """
+        Lookups made since an earlier stats() snapshot, in the same shape.
+
+        Lookups by other consumers of the context in that time (say, a
+        concurrent solve of the same task) are included.
+        """
+        after = self.stats()
+        by_feature = {}
+        for name, counts in after["by_feature"].items():
+            previous = before["by_feature"].get(name, {"hits": 0, "misses": 0})
+            delta = {key: counts[key] - previous[key] for key in ("hits", "misses")}
+            if any(delta.values()):
+                by_feature[name] = delta
+        return {
+            "hits": after["hits"] - before["hits"],
+            "misses": after["misses"] - before["misses"],
+            "by_feature": by_feature,
+        }
+
+    def reset_stats(self) -> None:
+        with self._lock:
+            self.hits = self.misses = 0
+            self._by_feature.clear()
+
+
+class TaskFeatureCache:
+    """
+    Bounded LRU of task contexts keyed by task content.
+
+    While enabled is False every call gets a fresh context, so features
+    are still shared within that call but not across consumers.
+    """
+
+    def __init__(self, maxsize: int = 256, enabled: bool = True):
+        self.maxsize = maxsize
+        self.enabled = enabled
+        self._contexts: "OrderedDict[str, TaskFeatureContext]" = OrderedDict()
+        self._lock = threading.Lock()
+        self.hits = 0
+        self.misses = 0
+        self.evictions = 0
+
+    def context(self, task: ARCTask) -> TaskFeatureContext:
+        """The shared context for a task, created on first use."""
+        key = task_content_key(task)
+        if not self.enabled:
+            return TaskFeatureContext(task, key)
+        with self._lock:
+            context = self._contexts.get(key)
+            if context is not None:
+                self._contexts.move_to_end(key)
+                self.hits += 1
+                return context
+            self.misses += 1
+            context = self._contexts[key] = TaskFeatureContext(task, key)
+            while len(self._contexts) > self.maxsize:
+                self._contexts.popitem(last=False)
+                self.evictions += 1
+            return context
+
+    def stats(self) -> Dict[str, Any]:
+        """Context lookups plus feature hits and misses summed over cached contexts."""
+        with self._lock:
+            contexts = list(self._contexts.values())
+            stats = {
+                "hits": self.hits,
+                "misses": self.misses,
+                "evictions": self.evictions,
+                "size": len(contexts),
+                "maxsize": self.maxsize,
+            }
+        stats["feature_hits"] = sum(c.hits for c in contexts)
+        stats["feature_misses"] = sum(c.misses for c in contexts)
+        return stats
+
+    def reset_stats(self) -> None:
+        """Zero the counters, keeping cached contexts."""
+        with self._lock:
+            self.hits = self.misses = self.evictions = 0
+            contexts = list(self._contexts.values())
+        for context in contexts:
+            context.reset_stats()
+
+    def clear(self) -> None:
+        """Drop all contexts and counters."""
+        with self._lock:
+            self._contexts.clear()
+        self.reset_stats()
+
+
+_default_cache = TaskFeatureCache()
+
+
+def get_task_feature_cache() -> TaskFeatureCache:
+    """The process-wide cache shared by WME, MAL and the controller."""
+    return _default_cache
+
+
+def get_task_context(task: ARCTask) -> TaskFeatureContext:
+    """The shared feature context for a task."""
+    return _default_cache.context(task)
@@ -0,0 +1,239 @@
+"""
+Sharded generation and on-disk caching of synthetic training data.
+
+Samples are generated in fixed-size shards, each with its own seed, so
+the data depends only on the generation parameters and seed, never on
+how many worker processes produced it. Shards are stored as compressed
+NumPy .npz files under a directory named by a hash of those parameters;
+a later run with the same parameters loads them instead of generating.
+
+A shard file holds:
+    cells       uint8   every grid, flattened and concatenated
+    shapes      int16   (num_grids, 2) grid shapes; pairs are (input, output)
+    num_pairs   int16   train pairs per sample
+    task_ids    str     task ID per sample
+    programs    str     encoded program per sample (see encode_program)
+    <field>     any     one entry per sample for each extra numeric field
+"""
+
+import hashlib
+import json
+import os
+import random
+from concurrent.futures import ProcessPoolExecutor
+from pathlib import Path
+from typing import Any, Callable, Dict, Iterator, List, Optional
+
+import numpy as np
+
+from ..core.types import ARCPair, ARCTask, Grid
+from ..dsl.ast import ASTNode, ComposeNode, LiteralNode, PrimitiveNode
+
+FORMAT_VERSION = 1
+# Bump when the sample generators change, so caches of older data are ignored
+GENERATOR_VERSION = 2
+
+# A sample generator returns {"task": ARCTask, "program": ASTNode, **numeric fields}
+SampleGenerator = Callable[[], Dict[str, Any]]
+
+
+def cache_key(kind: str, params: Dict[str, Any]) -> str:
+    """Stable hash of everything that determines the generated samples."""
+    payload = json.dumps(
+        {"kind": kind, "version": FORMAT_VERSION, "generator": GENERATOR_VERSION, **params},
+        sort_keys=True,
+    )
+    return hashlib.sha256(payload.encode()).hexdigest()[:16]
+
+
+def encode_program(program: ASTNode) -> str:
+    """
+    Encode a synthetic program as JSON.
+
+    Synthetic programs are a primitive with literal arguments or a flat
+    composition of those, stored as [[name, [args...]], ...].
+    """
+    steps = program.operations if isinstance(program, ComposeNode) else [program]
+    encoded = []
+    for step in steps:
+        if not isinstance(step, PrimitiveNode) or not all(isinstance(a, LiteralNode) for a in step.args):
+            raise ValueError(f"Cannot encode program step: {step}")
+        encoded.append([step.name, [a.value for a in step.args]])
+    return json.dumps(encoded, separators=(",", ":"))
+
+
+def decode_program(encoded: str) -> ASTNode:
+    """Inverse of encode_program."""
+    nodes: List[ASTNode] = [
+        PrimitiveNode(name, [LiteralNode(value) for value in args])
+        for name, args in json.loads(encoded)
+    ]
+    return nodes[0] if len(nodes) == 1 else ComposeNode(nodes)
+
+
+def pack_samples(samples: List[Dict[str, Any]]) -> Dict[str, np.ndarray]:
+    """Pack generated samples into the arrays stored in a shard."""
+    grids = [
+        grid.data
+        for sample in samples
+        for pair in sample["task"].train
+        for grid in (pair.input, pair.output)
+    ]
+    cells = [g.ravel() for g in grids] or [np.zeros(0)]
+    arrays = {
+        "cells": np.concatenate(cells).astype(np.uint8),
+        "shapes": np.array([g.shape for g in grids], dtype=np.int16).reshape(-1, 2),
+        "num_pairs": np.array([len(s["task"].train) for s in samples], dtype=np.int16),
+        "task_ids": np.array([s["task"].task_id for s in samples], dtype=str),
+        "programs": np.array([encode_program(s["program"]) for s in samples], dtype=str),
+    }
+    for name in samples[0].keys() - {"task", "program"} if samples else ():
+        arrays[name] = np.array([s[name] for s in samples])
+    return arrays
+
+
+class PackedSamples:
+    """
+    Samples held as packed arrays and decoded on access.
+
+    Keeping the data as a handful of NumPy arrays makes the dataset cheap
+    to hold and to hand to DataLoader worker processes; ARCTask and AST
+    objects are only built for the samples a batch asks for.
+    """
+
+    def __init__(self, arrays: Dict[str, np.ndarray]):
+        self.arrays = arrays
+        grid_sizes = arrays["shapes"].prod(axis=1)
+        self._cell_offsets = np.concatenate([[0], np.cumsum(grid_sizes)])
+        self._grid_offsets = np.concatenate([[0], np.cumsum(arrays["num_pairs"].astype(np.int64) * 2)])
+
+    def __len__(self) -> int:
+        return len(self.arrays["programs"])
+
+    def task(self, idx: int) -> ARCTask:
+        """Rebuild the task for sample idx."""
+        grids = []
+        for g in range(self._grid_offsets[idx], self._grid_offsets[idx + 1]):
+            cells = self.arrays["cells"][self._cell_offsets[g]:self._cell_offsets[g + 1]]
+            grids.append(Grid(cells.reshape(self.arrays["shapes"][g]).astype(np.int32)))
+        train = [ARCPair(input=grids[i], output=grids[i + 1]) for i in range(0, len(grids), 2)]
+        return ARCTask(task_id=str(self.arrays["task_ids"][idx]), train=train, test=[])
+
+    def program(self, idx: int) -> ASTNode:
+        """Rebuild the program for sample idx."""
+        return decode_program(str(self.arrays["programs"][idx]))
+
+    def field(self, name: str, idx: int) -> Any:
+        """Extra numeric field of sample idx, as a Python scalar."""
+        return self.arrays[name][idx].item()
+
+
+def shard_seed(seed: int, shard_index: int) -> str:
+    """Seed for one shard, independent of which process generates it."""
+    return f"{seed}:{shard_index}"
+
+
+def generate_shard(generator: SampleGenerator, count: int, seed: str) -> Dict[str, np.ndarray]:
+    """
+    Generate one shard of samples.
+
+    The global random state is seeded for the shard, because the
+    synthetic generators draw from it, and restored afterwards.
+    """
+    state = random.getstate()
+    random.seed(seed)
+    try:
+        return pack_samples([generator() for _ in range(count)])
+    finally:
+        random.setstate(state)
+
+
+def _shard_counts(num_samples: int, shard_size: int) -> List[int]:
+    full, rest = divmod(num_samples, shard_size)
+    return [shard_size] * full + ([rest] if rest else [])
+
+
+def _iter_shards(
+    generator: SampleGenerator,
+    counts: List[int],
+    seeds: List[str],
+    workers: int,
+) -> Iterator[Dict[str, np.ndarray]]:
+    """Generated shards in order, in worker processes when workers > 1."""
+    if workers <= 1 or len(counts) <= 1:
+        for count, s in zip(counts, seeds):
+            yield generate_shard(generator, count, s)
+        return
+    with ProcessPoolExecutor(max_workers=min(workers, len(counts))) as pool:
+        yield from pool.map(generate_shard, [generator] * len(counts), counts, seeds)
+
+
+def _concatenate(shards: List[Dict[str, np.ndarray]]) -> Dict[str, np.ndarray]:
+    shards = [s for s in shards if len(s["programs"])]
+    if not shards:
+        return pack_samples([])
+    return {name: np.concatenate([s[name] for s in shards]) for name in shards[0]}
+
+
+def load_or_generate(
+    kind: str,
+    generator: SampleGenerator,
+    num_samples: int,
+    params: Dict[str, Any],
+    seed: int,
+    shard_size: int = 1000,
+    workers: int = 1,
+    cache_dir: Optional[str] = None,
+) -> PackedSamples:
+    """
+    Synthetic samples for the given parameters, from cache when possible.
+
+    Args:
+        kind: Dataset kind, part of the cache key ("sketcher", "critic")
+        generator: Picklable callable producing one sample
+        num_samples: Number of samples
+        params: Generation parameters that affect the samples
+        seed: Base seed; shard i is generated from shard_seed(seed, i)
+        shard_size: Samples per shard
+        workers: Processes used to generate missing shards
+        cache_dir: Directory for the shard cache; None disables caching
+
+    Returns:
+        The samples, packed
+    """
+    counts = _shard_counts(num_samples, shard_size)
+    if cache_dir is None:
+        print(f"Generating {num_samples} {kind} samples in {len(counts)} shards...")
+        seeds = [shard_seed(seed, i) for i in range(len(counts))]
+        return PackedSamples(_concatenate(list(_iter_shards(generator, counts, seeds, workers))))
+
+    key = cache_key(kind, {**params, "num_samples": num_samples, "seed": seed, "shard_size": shard_size})
+    directory = Path(cache_dir) / f"{kind}-{key}"
+    paths = [directory / f"shard_{i:05d}.npz" for i in range(len(counts))]
+    missing = [i for i, path in enumerate(paths) if not path.exists()]
+
+    if missing:
+        # Shards already on disk (e.g. from an interrupted run) are kept
+        print(f"Generating {len(missing)}/{len(paths)} {kind} shards into {directory}...")
+        directory.mkdir(parents=True, exist_ok=True)
+        shards = _iter_shards(
+            generator,
+            [counts[i] for i in missing],
+            [shard_seed(seed, i) for i in missing],
+            workers,
+        )
+        for i, shard in zip(missing, shards):
+            tmp = paths[i].with_suffix(".tmp.npz")
+            np.savez_compressed(tmp, **shard)
+            os.replace(tmp, paths[i])
+        with open(directory / "meta.json", "w") as f:
+            json.dump({"kind": kind, "num_samples": num_samples, "seed": seed,
+                       "shard_size": shard_size, "params": params}, f, indent=2)
+    else:
+        print(f"Loading {num_samples} {kind} samples from {directory}")
+
+    shards = []
+    for path in paths:
+        with np.load(path) as data:
+            shards.append({name: data[name] for name in data.files})
+    return PackedSamples(_concatenate(shards))
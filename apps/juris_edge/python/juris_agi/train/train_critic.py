@@ -12,12 +12,16 @@ Training data is generated by:
 3. Generating negative examples (incorrect/partial programs)
 4. Training the critic to distinguish good from bad programs
 
+Samples are generated in seeded shards, optionally across processes, and
+can be cached on disk (--cache-dir) so repeated runs skip generation.
+
 Usage:
     python -m juris_agi.train.train_critic --epochs 100 --output models/critic.pt
 """
 
 import argparse
 import random
+from functools import partial
 from dataclasses import dataclass, field
 from pathlib import Path
 from typing import List, Optional, Dict, Any, Tuple
@@ -28,12 +32,13 @@ import numpy as np
 from ..core.types import Grid, ARCTask, ARCPair
 from ..dsl.ast import ASTNode, PrimitiveNode, ComposeNode, LiteralNode, walk_ast
 from ..dsl.primitives import list_primitives
-from ..dsl.interpreter import DSLInterpreter
+from ..dsl.interpreter import make_program
 from ..cre.critic_neural import (
     TORCH_AVAILABLE,
     CriticConfig,
     NeuralCriticScore,
 )
+from .data_cache import load_or_generate
 from .train_sketcher import (
     generate_random_grid,
     generate_random_program,
@@ -47,6 +52,7 @@ if TORCH_AVAILABLE:
     import torch.optim as optim
     from torch.utils.data import Dataset, DataLoader
     from ..cre.critic_neural import GeneralizationCriticModel
+    from .train_sketcher import make_data_loader
 
 
 # =============================================================================
@@ -75,6 +81,10 @@ class CriticTrainingConfig:
     min_grid_size: int = 3
     max_grid_size: int = 10
     num_train_pairs: int = 3
+    data_workers: int = 1  # Processes generating dataset shards
+    data_shard_size: int = 1000
+    data_cache_dir: Optional[str] = None  # Cache generated datasets here
+    loader_workers: int = 0  # DataLoader worker processes
 
     # Checkpointing
     checkpoint_every: int = 10
@@ -91,6 +101,16 @@ class CriticTrainingConfig:
             "num_train_samples": self.num_train_samples,
         }
 
+    def data_params(self) -> Dict[str, Any]:
+        """Parameters that determine the generated samples."""
+        return {
+            "negative_ratio": self.negative_ratio,
+            "max_program_length": self.max_program_length,
+            "min_grid_size": self.min_grid_size,
+            "max_grid_size": self.max_grid_size,
+            "num_train_pairs": self.num_train_pairs,
+        }
+
 
 # =============================================================================
 # Negative Example Generation
@@ -151,6 +171,65 @@ def generate_negative_program(task: ARCTask) -> ASTNode:
     return program
 
 
+def generate_critic_sample(config: CriticTrainingConfig) -> Dict[str, Any]:
+    """
+    One labelled (task, program) sample for the dataset cache.
+
+    Negative programs are run on the training pairs, and labels are raised
+    for the ones that happen to solve the task anyway.
+    """
+    # Create sketcher config for task generation
+    sketcher_config = SketcherTrainingConfig(
+        max_program_length=config.max_program_length,
+        min_grid_size=config.min_grid_size,
+        max_grid_size=config.max_grid_size,
+        num_train_pairs=config.num_train_pairs,
+    )
+
+    # Generate a task with its correct program
+    task, correct_program, primitives = generate_synthetic_task(sketcher_config)
+
+    # Decide if this is a positive or negative example
+    is_positive = random.random() > config.negative_ratio
+
+    if is_positive:
+        program = correct_program
+        # Labels: high plausibility, high generalization
+        labels = {
+            "plausibility": 0.9 + random.uniform(-0.05, 0.05),
+            "generalization": 0.9 + random.uniform(-0.05, 0.05),
+            "confidence": 0.9,
+        }
+    else:
+        # Generate negative program
+        if random.random() < 0.5:
+            program = mutate_program(correct_program)
+        else:
+            program = generate_negative_program(task)
+
+        # Labels: low plausibility/generalization
+        labels = {
+            "plausibility": 0.2 + random.uniform(-0.1, 0.1),
+            "generalization": 0.2 + random.uniform(-0.1, 0.1),
+            "confidence": 0.7,
+        }
+
+        # Verify it's actually wrong
+        run = make_program(program)
+        try:
+            for pair in task.train:
+                result = run(pair.input)
+                if isinstance(result, Grid) and result == pair.output:
+                    # Accidentally correct, boost labels
+                    labels["plausibility"] = 0.7
+                    labels["generalization"] = 0.6
+                    break
+        except Exception:
+            pass  # Errors mean it's definitely wrong
+
+    return {"task": task, "program": program, "is_positive": is_positive, **labels}
+
+
 # =============================================================================
 # PyTorch Dataset
 # =============================================================================
@@ -158,83 +237,45 @@ def generate_negative_program(task: ARCTask) -> ASTNode:
 if TORCH_AVAILABLE:
 
     class CriticDataset(Dataset):
-        """Dataset for critic training with positive and negative examples."""
+        """
+        Dataset for critic training with positive and negative examples.
+
+        Samples are generated in seeded shards (see data_cache) and kept
+        packed; each item is decoded when requested.
+        """
 
         def __init__(
             self,
             num_samples: int,
             config: CriticTrainingConfig,
+            seed: Optional[int] = None,
         ):
             self.config = config
-            self.samples = []
-
-            # Create sketcher config for task generation
-            sketcher_config = SketcherTrainingConfig(
-                max_program_length=config.max_program_length,
-                min_grid_size=config.min_grid_size,
-                max_grid_size=config.max_grid_size,
-                num_train_pairs=config.num_train_pairs,
+            self.seed = random.randrange(2**31) if seed is None else seed
+            self.data = load_or_generate(
+                "critic",
+                partial(generate_critic_sample, config),
+                num_samples,
+                config.data_params(),
+                self.seed,
+                shard_size=config.data_shard_size,
+                workers=config.data_workers,
+                cache_dir=config.data_cache_dir,
             )
 
-            print(f"Generating {num_samples} critic training samples...")
-            interpreter = DSLInterpreter()
-
-            for i in range(num_samples):
-                # Generate a task with its correct program
-                task, correct_program, primitives = generate_synthetic_task(sketcher_config)
-
-                # Decide if this is a positive or negative example
-                is_positive = random.random() > config.negative_ratio
-
-                if is_positive:
-                    program = correct_program
-                    # Labels: high plausibility, high generalization
-                    labels = {
-                        "plausibility": 0.9 + random.uniform(-0.05, 0.05),
-                        "generalization": 0.9 + random.uniform(-0.05, 0.05),
-                        "confidence": 0.9,
-                    }
-                else:
-                    # Generate negative program
-                    if random.random() < 0.5:
-                        program = mutate_program(correct_program)
-                    else:
-                        program = generate_negative_program(task)
-
-                    # Labels: low plausibility/generalization
-                    labels = {
-                        "plausibility": 0.2 + random.uniform(-0.1, 0.1),
-                        "generalization": 0.2 + random.uniform(-0.1, 0.1),
-                        "confidence": 0.7,
-                    }
-
-                    # Verify it's actually wrong
-                    try:
-                        for pair in task.train:
-                            result = interpreter.eval(program, {"grid": pair.input})
-                            if isinstance(result, Grid) and result == pair.output:
-                                # Accidentally correct, boost labels
-                                labels["plausibility"] = 0.7
-                                labels["generalization"] = 0.6
-                                break
-                    except Exception:
-                        pass  # Errors mean it's definitely wrong
-
-                self.samples.append({
-                    "task": task,
-                    "program": program,
-                    "labels": labels,
-                    "is_positive": is_positive,
-                })
-
-                if (i + 1) % 1000 == 0:
-                    print(f"  Generated {i + 1}/{num_samples} samples")
-
         def __len__(self) -> int:
-            return len(self.samples)
+            return len(self.data)
 
         def __getitem__(self, idx: int) -> Dict[str, Any]:
-            return self.samples[idx]
+            return {
+                "task": self.data.task(idx),
+                "program": self.data.program(idx),
+                "labels": {
+                    name: self.data.field(name, idx)
+                    for name in ("plausibility", "generalization", "confidence")
+                },
+                "is_positive": self.data.field("is_positive", idx),
+            }
 
 
     def critic_collate_fn(batch: List[Dict[str, Any]]) -> Dict[str, Any]:
@@ -425,17 +466,13 @@ class CriticTrainer:
         val_dataset: "CriticDataset",
     ) -> Dict[str, List[float]]:
         """Full training loop."""
-        train_loader = DataLoader(
-            train_dataset,
-            batch_size=self.config.batch_size,
-            shuffle=True,
-            collate_fn=critic_collate_fn,
+        train_loader = make_data_loader(
+            train_dataset, self.config.batch_size, shuffle=True,
+            collate_fn=critic_collate_fn, num_workers=self.config.loader_workers,
         )
-        val_loader = DataLoader(
-            val_dataset,
-            batch_size=self.config.batch_size,
-            shuffle=False,
-            collate_fn=critic_collate_fn,
+        val_loader = make_data_loader(
+            val_dataset, self.config.batch_size, shuffle=False,
+            collate_fn=critic_collate_fn, num_workers=self.config.loader_workers,
         )
 
         history = {
@@ -501,6 +538,12 @@ def main():
     parser.add_argument("--negative-ratio", type=float, default=0.5, help="Negative example ratio")
     parser.add_argument("--output", type=str, default="models", help="Output directory")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--data-workers", type=int, default=1,
+                        help="Processes for dataset generation")
+    parser.add_argument("--loader-workers", type=int, default=0,
+                        help="DataLoader worker processes")
+    parser.add_argument("--cache-dir", type=str, default=None,
+                        help="Cache generated datasets in this directory")
 
     args = parser.parse_args()
 
@@ -522,14 +565,17 @@ def main():
         num_val_samples=args.val_samples,
         negative_ratio=args.negative_ratio,
         output_dir=args.output,
+        data_workers=args.data_workers,
+        data_cache_dir=args.cache_dir,
+        loader_workers=args.loader_workers,
     )
 
     # Create datasets
     print("Creating training dataset...")
-    train_dataset = CriticDataset(config.num_train_samples, config)
+    train_dataset = CriticDataset(config.num_train_samples, config, seed=args.seed)
 
     print("Creating validation dataset...")
-    val_dataset = CriticDataset(config.num_val_samples, config)
+    val_dataset = CriticDataset(config.num_val_samples, config, seed=args.seed + 1)
 
     # Create trainer and train
     trainer = CriticTrainer(config)
@@ -9,15 +9,19 @@ Training data is generated synthetically by:
 3. Applying the programs to get output grids
 4. Using (input, output, program) as training examples
 
+Samples are generated in seeded shards, optionally across processes, and
+can be cached on disk (--cache-dir) so repeated runs skip generation.
+
 Usage:
     python -m juris_agi.train.train_sketcher --epochs 100 --output models/sketcher.pt
 """
 
 import argparse
 import random
+from functools import partial
 from dataclasses import dataclass, field
 from pathlib import Path
-from typing import List, Optional, Dict, Any, Tuple
+from typing import Callable, List, Optional, Dict, Any, Tuple
 import json
 
 import numpy as np
@@ -25,7 +29,7 @@ import numpy as np
 from ..core.types import Grid, ARCTask, ARCPair
 from ..dsl.ast import ASTNode, PrimitiveNode, ComposeNode, LiteralNode
 from ..dsl.primitives import PRIMITIVES, list_primitives
-from ..dsl.interpreter import DSLInterpreter
+from ..dsl.interpreter import make_program
 from ..cre.sketcher_model import (
     TORCH_AVAILABLE,
     SketcherConfig,
@@ -35,6 +39,7 @@ from ..cre.sketcher_model import (
     PAD_ID,
     NUM_PRIMITIVES,
 )
+from .data_cache import load_or_generate
 
 if TORCH_AVAILABLE:
     import torch
@@ -69,6 +74,10 @@ class SketcherTrainingConfig:
     min_grid_size: int = 3
     max_grid_size: int = 10
     num_train_pairs: int = 3
+    data_workers: int = 1  # Processes generating dataset shards
+    data_shard_size: int = 1000
+    data_cache_dir: Optional[str] = None  # Cache generated datasets here
+    loader_workers: int = 0  # DataLoader worker processes
 
     # Checkpointing
     checkpoint_every: int = 10
@@ -85,6 +94,15 @@ class SketcherTrainingConfig:
             "num_train_samples": self.num_train_samples,
         }
 
+    def data_params(self) -> Dict[str, Any]:
+        """Parameters that determine the generated samples."""
+        return {
+            "max_program_length": self.max_program_length,
+            "min_grid_size": self.min_grid_size,
+            "max_grid_size": self.max_grid_size,
+            "num_train_pairs": self.num_train_pairs,
+        }
+
 
 # =============================================================================
 # Synthetic Data Generation
@@ -209,8 +227,8 @@ def generate_synthetic_task(
     # Generate a random program
     program, primitives = generate_random_program(config.max_program_length)
 
-    # Create interpreter
-    interpreter = DSLInterpreter()
+    # Compile the program once for all inputs
+    run = make_program(program)
 
     # Generate training pairs
     train_pairs = []
@@ -223,7 +241,7 @@ def generate_synthetic_task(
 
         # Apply program to get output
         try:
-            output_grid = interpreter.eval(program, {"grid": input_grid})
+            output_grid = run(input_grid)
             if isinstance(output_grid, Grid):
                 train_pairs.append(ARCPair(input=input_grid, output=output_grid))
         except Exception:
@@ -246,6 +264,18 @@ def generate_synthetic_task(
     return task, program, primitives
 
 
+def generate_sketcher_sample(config: SketcherTrainingConfig) -> Dict[str, Any]:
+    """One (task, program) sample for the dataset cache."""
+    task, program, _ = generate_synthetic_task(config)
+    return {"task": task, "program": program}
+
+
+def program_primitives(program: ASTNode) -> List[str]:
+    """Primitive names of a synthetic program, in application order."""
+    steps = program.operations if isinstance(program, ComposeNode) else [program]
+    return [step.name for step in steps if isinstance(step, PrimitiveNode)]
+
+
 # =============================================================================
 # PyTorch Dataset
 # =============================================================================
@@ -253,42 +283,53 @@ def generate_synthetic_task(
 if TORCH_AVAILABLE:
 
     class SyntheticSketcherDataset(Dataset):
-        """Dataset of synthetic (task, program) pairs."""
+        """
+        Dataset of synthetic (task, program) pairs.
+
+        Samples are generated in seeded shards (see data_cache) and kept
+        packed; each item is decoded when requested, so decoding runs in
+        DataLoader workers when there are any.
+        """
 
         def __init__(
             self,
             num_samples: int,
             config: SketcherTrainingConfig,
+            seed: Optional[int] = None,
         ):
             self.config = config
-            self.samples = []
-
-            print(f"Generating {num_samples} synthetic training samples...")
-            for i in range(num_samples):
-                task, program, primitives = generate_synthetic_task(config)
-
-                # Convert primitives to token IDs
-                token_ids = [SOS_ID]
-                for prim in primitives:
-                    if prim in PRIMITIVE_TO_ID:
-                        token_ids.append(PRIMITIVE_TO_ID[prim])
-                token_ids.append(EOS_ID)
-
-                self.samples.append({
-                    "task": task,
-                    "program": program,
-                    "primitives": primitives,
-                    "token_ids": token_ids,
-                })
-
-                if (i + 1) % 1000 == 0:
-                    print(f"  Generated {i + 1}/{num_samples} samples")
+            self.seed = random.randrange(2**31) if seed is None else seed
+            self.data = load_or_generate(
+                "sketcher",
+                partial(generate_sketcher_sample, config),
+                num_samples,
+                config.data_params(),
+                self.seed,
+                shard_size=config.data_shard_size,
+                workers=config.data_workers,
+                cache_dir=config.data_cache_dir,
+            )
 
         def __len__(self) -> int:
-            return len(self.samples)
+            return len(self.data)
 
         def __getitem__(self, idx: int) -> Dict[str, Any]:
-            return self.samples[idx]
+            program = self.data.program(idx)
+            primitives = program_primitives(program)
+
+            # Convert primitives to token IDs
+            token_ids = [SOS_ID]
+            for prim in primitives:
+                if prim in PRIMITIVE_TO_ID:
+                    token_ids.append(PRIMITIVE_TO_ID[prim])
+            token_ids.append(EOS_ID)
+
+            return {
+                "task": self.data.task(idx),
+                "program": program,
+                "primitives": primitives,
+                "token_ids": token_ids,
+            }
 
 
     def collate_fn(
@@ -324,6 +365,26 @@ if TORCH_AVAILABLE:
         }
 
 
+    def make_data_loader(
+        dataset: "Dataset",
+        batch_size: int,
+        shuffle: bool,
+        collate_fn: Callable[[List[Dict[str, Any]]], Dict[str, Any]],
+        num_workers: int = 0,
+    ) -> "DataLoader":
+        """DataLoader that decodes and collates batches in worker processes when asked."""
+        extra = {"persistent_workers": True, "prefetch_factor": 4} if num_workers > 0 else {}
+        return DataLoader(
+            dataset,
+            batch_size=batch_size,
+            shuffle=shuffle,
+            collate_fn=collate_fn,
+            num_workers=num_workers,
+            pin_memory=False,
+            **extra,
+        )
+
+
 # =============================================================================
 # Trainer
 # =============================================================================
@@ -481,17 +542,14 @@ class SketcherTrainer:
         val_dataset: "SyntheticSketcherDataset",
     ) -> Dict[str, List[float]]:
         """Full training loop."""
-        train_loader = DataLoader(
-            train_dataset,
-            batch_size=self.config.batch_size,
-            shuffle=True,
-            collate_fn=lambda b: collate_fn(b, self.config.model_config.max_seq_len),
+        collate = partial(collate_fn, max_seq_len=self.config.model_config.max_seq_len)
+        train_loader = make_data_loader(
+            train_dataset, self.config.batch_size, shuffle=True,
+            collate_fn=collate, num_workers=self.config.loader_workers,
         )
-        val_loader = DataLoader(
-            val_dataset,
-            batch_size=self.config.batch_size,
-            shuffle=False,
-            collate_fn=lambda b: collate_fn(b, self.config.model_config.max_seq_len),
+        val_loader = make_data_loader(
+            val_dataset, self.config.batch_size, shuffle=False,
+            collate_fn=collate, num_workers=self.config.loader_workers,
         )
 
         history = {"train_loss": [], "val_loss": []}
@@ -544,6 +602,12 @@ def main():
     parser.add_argument("--val-samples", type=int, default=1000, help="Validation samples")
     parser.add_argument("--output", type=str, default="models", help="Output directory")
     parser.add_argument("--seed", type=int, default=42, help="Random seed")
+    parser.add_argument("--data-workers", type=int, default=1,
+                        help="Processes for dataset generation")
+    parser.add_argument("--loader-workers", type=int, default=0,
+                        help="DataLoader worker processes")
+    parser.add_argument("--cache-dir", type=str, default=None,
+                        help="Cache generated datasets in this directory")
 
     args = parser.parse_args()
 
@@ -564,14 +628,17 @@ def main():
         num_train_samples=args.train_samples,
         num_val_samples=args.val_samples,
         output_dir=args.output,
+        data_workers=args.data_workers,
+        data_cache_dir=args.cache_dir,
+        loader_workers=args.loader_workers,
     )
 
     # Create datasets
     print("Creating training dataset...")
-    train_dataset = SyntheticSketcherDataset(config.num_train_samples, config)
+    train_dataset = SyntheticSketcherDataset(config.num_train_samples, config, seed=args.seed)
 
     print("Creating validation dataset...")
-    val_dataset = SyntheticSketcherDataset(config.num_val_samples, config)
+    val_dataset = SyntheticSketcherDataset(config.num_val_samples, config, seed=args.seed + 1)
 
     # Create trainer and train
     trainer = SketcherTrainer(config)
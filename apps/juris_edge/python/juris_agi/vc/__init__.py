@@ -13,6 +13,7 @@ Key components:
 from .counterfactuals import (
     PerturbationType,
     ClaimPerturbation,
+    ClaimOverlay,
     CounterfactualEvidenceGraph,
     EvidenceCounterfactualGenerator,
     generate_counterfactuals,
@@ -51,6 +52,7 @@ __all__ = [
     # Counterfactuals
     "PerturbationType",
     "ClaimPerturbation",
+    "ClaimOverlay",
     "CounterfactualEvidenceGraph",
     "EvidenceCounterfactualGenerator",
     "generate_counterfactuals",
@@ -5,10 +5,12 @@ Generates minimal perturbations to claim values while respecting ontology.
 Used to identify decision-critical claims and compute robustness scores.
 """
 
+from collections.abc import Sequence
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import List, Dict, Any, Optional, Callable, Tuple, Set
+from typing import List, Dict, Any, Optional, Callable, Tuple, Set, Iterable, Iterator
 from copy import deepcopy
+import heapq
 import math
 
 from ..evidence.schema import EvidenceGraph, Claim, Polarity, Source
@@ -24,6 +26,94 @@ class PerturbationType(Enum):
     CLAIM_ADDITION = "claim_addition"   # Add a missing claim
 
 
+class ClaimOverlay(Sequence):
+    """
+    Copy-on-write view over a list of claims.
+
+    Shares the unchanged claims of a base list and only stores replaced
+    claims and removed indices, so building a counterfactual graph costs
+    O(changes) instead of a full copy. Views are read-only, so they are
+    only used for graphs that are evaluated internally; graphs handed to
+    callers carry a real list.
+    """
+
+    __slots__ = ("_base", "_replaced", "_removed")
+
+    def __init__(
+        self,
+        base: Sequence,
+        replaced: Optional[Dict[int, Claim]] = None,
+        removed: Iterable[int] = (),
+    ):
+        """
+        Initialize view.
+
+        Args:
+            base: Underlying claims (shared, never modified)
+            replaced: Index into base -> replacement claim
+            removed: Indices into base of removed claims
+        """
+        replaced = dict(replaced or {})
+        removed = tuple(sorted(set(removed)))
+
+        if isinstance(base, ClaimOverlay):
+            if base._removed:
+                # Index spaces differ, materialize the parent view
+                base = list(base)
+            else:
+                # Flatten chained views onto the shared base
+                merged = dict(base._replaced)
+                merged.update(replaced)
+                replaced = merged
+                base = base._base
+
+        self._base = base
+        self._replaced = replaced
+        self._removed = removed
+
+    def _base_index(self, index: int) -> int:
+        """Map a view index to an index into the base list."""
+        for r in self._removed:
+            if r <= index:
+                index += 1
+            else:
+                break
+        return index
+
+    def __len__(self) -> int:
+        return len(self._base) - len(self._removed)
+
+    def __getitem__(self, index):
+        if isinstance(index, slice):
+            return list(self)[index]
+        n = len(self)
+        if index < 0:
+            index += n
+        if not 0 <= index < n:
+            raise IndexError("claim index out of range")
+        base_idx = self._base_index(index)
+        return self._replaced.get(base_idx, self._base[base_idx])
+
+    def __iter__(self) -> Iterator[Claim]:
+        removed = set(self._removed)
+        replaced = self._replaced
+        for i, claim in enumerate(self._base):
+            if i in removed:
+                continue
+            yield replaced.get(i, claim)
+
+    def __eq__(self, other: object) -> bool:
+        if isinstance(other, (ClaimOverlay, list, tuple)):
+            return list(self) == list(other)
+        return NotImplemented
+
+    def __repr__(self) -> str:
+        return (
+            f"ClaimOverlay(len={len(self)}, replaced={len(self._replaced)}, "
+            f"removed={len(self._removed)})"
+        )
+
+
 @dataclass
 class ClaimPerturbation:
     """
@@ -163,6 +253,9 @@ class EvidenceCounterfactualGenerator:
         self.max_perturbations = max_perturbations
         self.prefer_minimal = prefer_minimal
 
+        # Statistics from the last rule-guided minimal flip search
+        self.flip_search_stats: Dict[str, int] = {}
+
     def generate(
         self,
         graph: EvidenceGraph,
@@ -205,21 +298,34 @@ class EvidenceCounterfactualGenerator:
         graph: EvidenceGraph,
         decision_fn: Callable[[EvidenceGraph], bool],
         max_attempts: int = 100,
+        rules: Optional[List[Any]] = None,
+        max_evaluations: int = 1000,
     ) -> Optional[CounterfactualEvidenceGraph]:
         """
         Generate the minimal counterfactual that flips the decision.
 
         Uses binary search style approach to find smallest perturbation
-        that changes the decision outcome.
+        that changes the decision outcome. When the decision rules are
+        given, delegates to the rule-guided search
+        (see _guided_minimal_flip).
 
         Args:
             graph: Original evidence graph
             decision_fn: Function that returns True/False for the decision
             max_attempts: Maximum perturbation attempts
+            rules: Optional vc_dsl Rules behind decision_fn
+            max_evaluations: Decision evaluation budget for guided search
 
         Returns:
             Minimal counterfactual that flips decision, or None if not found
         """
+        if rules is not None:
+            return self._guided_minimal_flip(
+                graph, decision_fn, rules,
+                max_claims=self.max_perturbations,
+                max_evaluations=max_evaluations,
+            )
+
         original_decision = decision_fn(graph)
 
         # Try single-claim perturbations first (minimal)
@@ -260,6 +366,218 @@ class EvidenceCounterfactualGenerator:
 
         return None
 
+    def _guided_minimal_flip(
+        self,
+        graph: EvidenceGraph,
+        decision_fn: Callable[[EvidenceGraph], Any],
+        rules: List[Any],
+        max_claims: int = 3,
+        max_evaluations: int = 1000,
+    ) -> Optional[CounterfactualEvidenceGraph]:
+        """
+        Rule-guided minimal flip search.
+
+        Only claims whose "claim_type.field" key is referenced by the rules
+        (Predicate.get_fields) are perturbed. Numeric values are moved just
+        across the rule thresholds and confidences just across conf_ge gates,
+        so candidates carry their true magnitude. Combinations of up to
+        max_claims perturbations are enumerated best-first in order of total
+        magnitude, so the first flip found is minimal and ends the search.
+        Each perturbation is generated once per claim and the enumeration
+        yields every combination once, so no decision is evaluated twice;
+        combinations touching a claim twice are skipped. There is no other
+        pruning: the search runs until a flip is found, the combinations
+        are exhausted or max_evaluations is reached.
+
+        Args:
+            graph: Original evidence graph
+            decision_fn: Function returning the decision for a graph
+            rules: vc_dsl Rules behind decision_fn
+            max_claims: Maximum claims perturbed together
+            max_evaluations: Decision evaluation budget
+
+        Returns:
+            Minimal counterfactual that flips decision, or None if not found
+        """
+        stats = {"candidates": 0, "evaluations": 0, "expanded": 0}
+        self.flip_search_stats = stats
+
+        value_thresholds, confidence_thresholds = _collect_rule_thresholds(rules)
+        relevant = set(value_thresholds) | set(confidence_thresholds)
+        for rule in rules:
+            relevant.update(rule.predicate.get_fields())
+
+        candidates: List[ClaimPerturbation] = []
+        for i, claim in enumerate(graph.claims):
+            key = f"{claim.claim_type.value}.{claim.field}"
+            if key in relevant:
+                candidates.extend(self._rule_guided_perturbations(
+                    claim, i,
+                    value_thresholds.get(key, []),
+                    confidence_thresholds.get(key, []),
+                ))
+
+        # Stable sort keeps claim order among equal magnitudes
+        candidates.sort(key=lambda p: p.magnitude)
+        stats["candidates"] = len(candidates)
+        if not candidates:
+            return None
+
+        original_decision = decision_fn(graph)
+
+        # Best-first enumeration of index subsets in nondecreasing total magnitude
+        counter = 0
+        heap: List[Tuple[float, int, Tuple[int, ...]]] = [
+            (candidates[0].magnitude, counter, (0,))
+        ]
+        while heap and stats["evaluations"] < max_evaluations:
+            total, _, combo = heapq.heappop(heap)
+            stats["expanded"] += 1
+
+            claim_indices = [candidates[k].claim_index for k in combo]
+            if len(set(claim_indices)) == len(claim_indices):
+                perturbations = [candidates[k] for k in combo]
+                modified = self._apply_perturbations(graph, perturbations)
+                stats["evaluations"] += 1
+                if decision_fn(modified) != original_decision:
+                    return CounterfactualEvidenceGraph(
+                        original_graph=graph,
+                        modified_graph=self._derived_graph(graph, modified.claims),
+                        perturbations=perturbations,
+                        total_perturbation_magnitude=total,
+                    )
+
+            nxt = combo[-1] + 1
+            if nxt < len(candidates):
+                if len(combo) < max_claims:
+                    counter += 1
+                    heapq.heappush(heap, (
+                        total + candidates[nxt].magnitude, counter, combo + (nxt,)
+                    ))
+                counter += 1
+                heapq.heappush(heap, (
+                    total - candidates[combo[-1]].magnitude + candidates[nxt].magnitude,
+                    counter,
+                    combo[:-1] + (nxt,),
+                ))
+
+        return None
+
+    def _rule_guided_perturbations(
+        self,
+        claim: Claim,
+        claim_idx: int,
+        value_thresholds: List[float],
+        confidence_thresholds: List[float],
+    ) -> List[ClaimPerturbation]:
+        """Generate threshold-crossing perturbations for one claim."""
+        perturbations: List[ClaimPerturbation] = []
+        value = claim.value
+
+        if isinstance(value, (int, float)) and not isinstance(value, bool):
+            new_values: List[Any] = []
+            for t in value_thresholds:
+                for new_value in _threshold_crossings(value, t):
+                    if new_value != value and new_value not in new_values:
+                        new_values.append(new_value)
+
+            for new_value in new_values:
+                if value != 0:
+                    magnitude = abs(new_value - value) / abs(value)
+                else:
+                    magnitude = 1.0
+                perturbations.append(ClaimPerturbation(
+                    perturbation_type=PerturbationType.VALUE_CHANGE,
+                    claim_index=claim_idx,
+                    original_claim=claim,
+                    modified_claim=self._replace_claim(claim, value=new_value),
+                    field_changed=claim.field,
+                    original_value=value,
+                    new_value=new_value,
+                    magnitude=magnitude,
+                ))
+        else:
+            # Non-numeric values: fall back to the generic magnitude ladder
+            seen: List[Any] = []
+            for magnitude in [0.1, 0.25, 0.5, 1.0]:
+                new_value, field_changed = self._generate_perturbed_value(
+                    value, claim.claim_type, claim.field, magnitude
+                )
+                if new_value == value or new_value in seen:
+                    continue
+                seen.append(new_value)
+                perturbations.append(ClaimPerturbation(
+                    perturbation_type=PerturbationType.VALUE_CHANGE,
+                    claim_index=claim_idx,
+                    original_claim=claim,
+                    modified_claim=self._replace_claim(claim, value=new_value),
+                    field_changed=field_changed or claim.field,
+                    original_value=value,
+                    new_value=new_value,
+                    magnitude=magnitude,
+                ))
+
+        new_confidences: List[float] = []
+        for c in confidence_thresholds:
+            if claim.confidence >= c:
+                new_confidence = max(0.0, round(c - 0.01, 4))
+            else:
+                new_confidence = c
+            if new_confidence == claim.confidence or new_confidence in new_confidences:
+                continue
+            new_confidences.append(new_confidence)
+            perturbations.append(ClaimPerturbation(
+                perturbation_type=PerturbationType.CONFIDENCE_CHANGE,
+                claim_index=claim_idx,
+                original_claim=claim,
+                modified_claim=self._replace_claim(claim, confidence=new_confidence),
+                original_value=claim.confidence,
+                new_value=new_confidence,
+                magnitude=abs(claim.confidence - new_confidence),
+            ))
+
+        perturbations.append(ClaimPerturbation(
+            perturbation_type=PerturbationType.CLAIM_REMOVAL,
+            claim_index=claim_idx,
+            original_claim=claim,
+            modified_claim=None,
+            magnitude=1.0,
+        ))
+
+        return perturbations
+
+    def _replace_claim(self, claim: Claim, **changes: Any) -> Claim:
+        """Copy a claim with some attributes changed."""
+        attrs = dict(
+            claim_type=claim.claim_type,
+            field=claim.field,
+            value=claim.value,
+            confidence=claim.confidence,
+            polarity=claim.polarity,
+            source=claim.source,
+            unit=claim.unit,
+            notes=claim.notes,
+            claim_id=claim.claim_id,
+        )
+        attrs.update(changes)
+        return Claim(**attrs)
+
+    def _apply_perturbations(
+        self,
+        graph: EvidenceGraph,
+        perturbations: List[ClaimPerturbation],
+    ) -> EvidenceGraph:
+        """Apply perturbations on distinct claims as one copy-on-write view."""
+        replaced = {
+            p.claim_index: p.modified_claim
+            for p in perturbations
+            if p.modified_claim is not None
+        }
+        removed = [p.claim_index for p in perturbations if p.modified_claim is None]
+        return self._derived_graph(
+            graph, ClaimOverlay(graph.claims, replaced=replaced, removed=removed), view=True,
+        )
+
     def _single_value_change(
         self,
         graph: EvidenceGraph,
@@ -284,8 +602,9 @@ class EvidenceCounterfactualGenerator:
         graph: EvidenceGraph,
         claim_idx: int,
         magnitude: float,
+        view: bool = False,
     ) -> Optional[CounterfactualEvidenceGraph]:
-        """Perturb a single claim's value."""
+        """Perturb a single claim's value (view: share claims read-only, see ClaimOverlay)."""
         if claim_idx >= len(graph.claims):
             return None
 
@@ -314,7 +633,7 @@ class EvidenceCounterfactualGenerator:
         )
 
         # Create modified graph
-        modified_graph = self._copy_graph_with_modified_claim(graph, claim_idx, modified_claim)
+        modified_graph = self._copy_graph_with_modified_claim(graph, claim_idx, modified_claim, view)
 
         perturbation = ClaimPerturbation(
             perturbation_type=PerturbationType.VALUE_CHANGE,
@@ -457,8 +776,9 @@ class EvidenceCounterfactualGenerator:
         self,
         graph: EvidenceGraph,
         claim_idx: int,
+        view: bool = False,
     ) -> Optional[CounterfactualEvidenceGraph]:
-        """Create a polarity flip counterfactual."""
+        """Create a polarity flip counterfactual (view: see ClaimOverlay)."""
         if claim_idx >= len(graph.claims):
             return None
 
@@ -485,7 +805,7 @@ class EvidenceCounterfactualGenerator:
             claim_id=original_claim.claim_id,
         )
 
-        modified_graph = self._copy_graph_with_modified_claim(graph, claim_idx, modified_claim)
+        modified_graph = self._copy_graph_with_modified_claim(graph, claim_idx, modified_claim, view)
 
         perturbation = ClaimPerturbation(
             perturbation_type=PerturbationType.POLARITY_FLIP,
@@ -530,8 +850,9 @@ class EvidenceCounterfactualGenerator:
         graph: EvidenceGraph,
         claim_idx: int,
         new_confidence: float,
+        view: bool = False,
     ) -> Optional[CounterfactualEvidenceGraph]:
-        """Create a confidence change counterfactual."""
+        """Create a confidence change counterfactual (view: see ClaimOverlay)."""
         if claim_idx >= len(graph.claims):
             return None
 
@@ -549,7 +870,7 @@ class EvidenceCounterfactualGenerator:
             claim_id=original_claim.claim_id,
         )
 
-        modified_graph = self._copy_graph_with_modified_claim(graph, claim_idx, modified_claim)
+        modified_graph = self._copy_graph_with_modified_claim(graph, claim_idx, modified_claim, view)
 
         magnitude = abs(original_claim.confidence - new_confidence)
 
@@ -590,22 +911,17 @@ class EvidenceCounterfactualGenerator:
         self,
         graph: EvidenceGraph,
         claim_idx: int,
+        view: bool = False,
     ) -> Optional[CounterfactualEvidenceGraph]:
-        """Create a claim removal counterfactual."""
+        """Create a claim removal counterfactual (view: see ClaimOverlay)."""
         if claim_idx >= len(graph.claims):
             return None
 
         original_claim = graph.claims[claim_idx]
 
         # Create modified graph without this claim
-        modified_claims = [
-            c for i, c in enumerate(graph.claims) if i != claim_idx
-        ]
-        modified_graph = EvidenceGraph(
-            company_id=graph.company_id,
-            claims=modified_claims,
-            analyst_id=graph.analyst_id,
-            version=graph.version,
+        modified_graph = self._derived_graph(
+            graph, ClaimOverlay(graph.claims, removed=(claim_idx,)), view,
         )
 
         perturbation = ClaimPerturbation(
@@ -682,20 +998,91 @@ class EvidenceCounterfactualGenerator:
         graph: EvidenceGraph,
         claim_idx: int,
         new_claim: Claim,
+        view: bool = False,
     ) -> EvidenceGraph:
         """Create a copy of graph with one claim modified."""
-        modified_claims = [
-            new_claim if i == claim_idx else c
-            for i, c in enumerate(graph.claims)
-        ]
+        return self._derived_graph(
+            graph, ClaimOverlay(graph.claims, replaced={claim_idx: new_claim}), view,
+        )
+
+    def _derived_graph(
+        self,
+        graph: EvidenceGraph,
+        claims: ClaimOverlay,
+        view: bool = False,
+    ) -> EvidenceGraph:
+        """
+        Graph with graph's metadata and the given claims.
+
+        With view the overlay is kept (read-only, for internal
+        evaluation); otherwise the claims are copied into a list.
+        """
         return EvidenceGraph(
             company_id=graph.company_id,
-            claims=modified_claims,
+            claims=claims if view else list(claims),
             analyst_id=graph.analyst_id,
             version=graph.version,
         )
 
 
+def _collect_rule_thresholds(
+    rules: List[Any],
+) -> Tuple[Dict[str, List[float]], Dict[str, List[float]]]:
+    """
+    Collect numeric and confidence thresholds referenced by rules.
+
+    Returns (field -> value thresholds, field -> confidence thresholds).
+    """
+    from ..vc_dsl.predicates_v2 import Between, ConfGe, Ge, Le
+
+    value_thresholds: Dict[str, List[float]] = {}
+    confidence_thresholds: Dict[str, List[float]] = {}
+
+    def visit(pred: Any) -> None:
+        if isinstance(pred, (Ge, Le)):
+            value_thresholds.setdefault(pred.field, []).append(pred.threshold)
+        elif isinstance(pred, Between):
+            value_thresholds.setdefault(pred.field, []).extend([pred.lo, pred.hi])
+        elif isinstance(pred, ConfGe):
+            confidence_thresholds.setdefault(pred.field, []).append(pred.min_confidence)
+
+        for child in getattr(pred, "predicates", []):
+            visit(child)
+        for attr in ("predicate", "antecedent", "consequent"):
+            child = getattr(pred, attr, None)
+            if child is not None:
+                visit(child)
+
+    for rule in rules:
+        visit(rule.predicate)
+
+    return value_thresholds, confidence_thresholds
+
+
+def _threshold_crossings(value: float, threshold: float) -> List[float]:
+    """
+    Values closest to value that land on or just across a threshold.
+
+    Covers both inclusive and exclusive comparisons; keeps int values int.
+    """
+    if isinstance(value, int):
+        at_or_above = math.ceil(threshold)
+        above = math.floor(threshold) + 1
+        at_or_below = math.floor(threshold)
+        below = math.ceil(threshold) - 1
+    else:
+        step = max(abs(threshold), 1.0) * 1e-6
+        at_or_above = at_or_below = threshold
+        above = threshold + step
+        below = threshold - step
+
+    if value < threshold:
+        return [at_or_above, above]
+    if value > threshold:
+        return [at_or_below, below]
+    return [below, above]
+
+
 def generate_counterfactuals(
     graph: EvidenceGraph,
     num_counterfactuals: int = 5,
@@ -4,6 +4,9 @@ VC Decision Analysis with Counterfactual Reasoning.
 Analyzes which claims are decision-critical and computes robustness scores.
 """
 
+import logging
+import pickle
+from concurrent.futures import Executor, ProcessPoolExecutor
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import List, Dict, Any, Optional, Callable, Tuple, Set
@@ -18,6 +21,8 @@ from .counterfactuals import (
     PerturbationType,
 )
 
+logger = logging.getLogger(__name__)
+
 
 class DecisionOutcome(Enum):
     """Possible investment decision outcomes."""
@@ -171,19 +176,38 @@ class DecisionAnalysisResult:
         }
 
 
+DecisionFn = Callable[[EvidenceGraph], Tuple[DecisionOutcome, float]]
+DecisionBatchFn = Callable[[List[EvidenceGraph]], List[Tuple[DecisionOutcome, float]]]
+
+
+def _evaluate_chunk(
+    decision_fn: DecisionFn,
+    graphs: List[EvidenceGraph],
+) -> List[Tuple[DecisionOutcome, float]]:
+    """Evaluate a chunk of graphs (runs inside worker processes)."""
+    return [decision_fn(g) for g in graphs]
+
+
 class DecisionAnalyzer:
     """
     Analyzes VC investment decisions using counterfactual reasoning.
 
     Identifies critical claims, computes robustness, and generates explanations.
+
+    All counterfactuals of an analysis phase are submitted as one batch, either
+    to ``decision_fn_batch`` or, with ``max_workers > 1``, fanned out across
+    worker processes.
     """
 
     def __init__(
         self,
-        decision_fn: Callable[[EvidenceGraph], Tuple[DecisionOutcome, float]],
+        decision_fn: DecisionFn,
         seed: Optional[int] = None,
         num_counterfactuals: int = 20,
         max_perturbations_per_claim: int = 5,
+        decision_fn_batch: Optional[DecisionBatchFn] = None,
+        max_workers: int = 1,
+        min_parallel_batch: int = 64,
     ):
         """
         Initialize analyzer.
@@ -194,11 +218,74 @@ class DecisionAnalyzer:
             seed: Random seed for reproducibility
             num_counterfactuals: Number of counterfactuals to generate
             max_perturbations_per_claim: Max perturbations to try per claim
+            decision_fn_batch: Optional function that evaluates a list of
+                        graphs at once, returning results in order
+            max_workers: Worker processes for batches (1 = in-process).
+                        decision_fn must be picklable to use workers.
+            min_parallel_batch: Smallest batch worth sending to workers
         """
         self.decision_fn = decision_fn
+        self.decision_fn_batch = decision_fn_batch
         self.generator = EvidenceCounterfactualGenerator(seed=seed)
         self.num_counterfactuals = num_counterfactuals
         self.max_perturbations_per_claim = max_perturbations_per_claim
+        self.max_workers = max_workers
+        self.min_parallel_batch = min_parallel_batch
+        self._executor: Optional[Executor] = None
+        self.decisions_evaluated = 0
+
+    def evaluate_batch(
+        self,
+        graphs: List[EvidenceGraph],
+    ) -> List[Tuple[DecisionOutcome, float]]:
+        """
+        Evaluate decisions for a batch of graphs.
+
+        Args:
+            graphs: Graphs to evaluate
+
+        Returns:
+            (DecisionOutcome, confidence) per graph, in input order
+        """
+        if not graphs:
+            return []
+
+        self.decisions_evaluated += len(graphs)
+
+        if self.decision_fn_batch is not None:
+            return list(self.decision_fn_batch(graphs))
+
+        if self._executor is not None and len(graphs) >= self.min_parallel_batch:
+            chunk_size = -(-len(graphs) // self.max_workers)
+            chunks = [
+                graphs[i:i + chunk_size]
+                for i in range(0, len(graphs), chunk_size)
+            ]
+            results: List[Tuple[DecisionOutcome, float]] = []
+            for chunk_results in self._executor.map(
+                _evaluate_chunk, [self.decision_fn] * len(chunks), chunks
+            ):
+                results.extend(chunk_results)
+            return results
+
+        return [self.decision_fn(g) for g in graphs]
+
+    def _start_workers(self) -> None:
+        """Start the worker pool for this analysis, if configured."""
+        if self.max_workers <= 1 or self.decision_fn_batch is not None:
+            return
+        try:
+            pickle.dumps(self.decision_fn)
+        except Exception:
+            logger.warning("decision_fn is not picklable, evaluating in-process")
+            return
+        self._executor = ProcessPoolExecutor(max_workers=self.max_workers)
+
+    def _stop_workers(self) -> None:
+        """Shut down the worker pool."""
+        if self._executor is not None:
+            self._executor.shutdown()
+            self._executor = None
 
     def analyze(self, graph: EvidenceGraph) -> DecisionAnalysisResult:
         """
@@ -213,14 +300,20 @@ class DecisionAnalyzer:
         # Get original decision
         original_decision, original_confidence = self.decision_fn(graph)
 
-        # Find critical claims
-        critical_claims = self._find_critical_claims(graph, original_decision)
+        self._start_workers()
+        try:
+            # Find critical claims
+            critical_claims = self._find_critical_claims(graph, original_decision)
 
-        # Compute robustness
-        robustness = self._compute_robustness(graph, original_decision, critical_claims)
+            # Compute robustness
+            robustness = self._compute_robustness(graph, original_decision, critical_claims)
 
-        # Generate counterfactual explanations
-        explanations = self._generate_explanations(graph, original_decision, critical_claims)
+            # Generate counterfactual explanations
+            explanations = self._generate_explanations(
+                graph, original_decision, critical_claims
+            )
+        finally:
+            self._stop_workers()
 
         return DecisionAnalysisResult(
             decision=original_decision,
@@ -243,9 +336,22 @@ class DecisionAnalyzer:
         """Identify which claims are decision-critical."""
         critical_claims = []
 
+        # Generate every single-claim perturbation, then evaluate in one batch
+        per_claim = [
+            self._claim_perturbations(graph, i) for i in range(len(graph.claims))
+        ]
+        outcomes = self.evaluate_batch([
+            cf.modified_graph for perturbations in per_claim for _, cf in perturbations
+        ])
+
+        offset = 0
         for i, claim in enumerate(graph.claims):
-            criticality, min_flip, sensitivity = self._analyze_claim_criticality(
-                graph, i, original_decision
+            perturbations = per_claim[i]
+            decisions = [d for d, _ in outcomes[offset:offset + len(perturbations)]]
+            offset += len(perturbations)
+
+            criticality, min_flip, sensitivity = self._score_claim_criticality(
+                perturbations, decisions, original_decision
             )
 
             if criticality > 0.0:
@@ -275,27 +381,50 @@ class DecisionAnalyzer:
 
         Returns (criticality_score, minimal_flip_perturbation, sensitivity_dict).
         """
-        min_flip_magnitude = float('inf')
-        min_flip_perturbation = None
-        sensitivity = {}
+        perturbations = self._claim_perturbations(graph, claim_idx)
+        decisions = [
+            d for d, _ in self.evaluate_batch([cf.modified_graph for _, cf in perturbations])
+        ]
+        return self._score_claim_criticality(perturbations, decisions, original_decision)
 
+    def _claim_perturbations(
+        self,
+        graph: EvidenceGraph,
+        claim_idx: int,
+    ) -> List[Tuple[str, CounterfactualEvidenceGraph]]:
+        """Generate the named single-claim perturbations for a claim."""
         # Try different perturbation types
         perturbation_types = [
-            ("value_small", lambda g, i: self.generator._perturb_claim_value(g, i, 0.1)),
-            ("value_medium", lambda g, i: self.generator._perturb_claim_value(g, i, 0.3)),
-            ("value_large", lambda g, i: self.generator._perturb_claim_value(g, i, 0.5)),
-            ("polarity", lambda g, i: self.generator._create_polarity_flip(g, i)),
-            ("confidence_low", lambda g, i: self.generator._create_confidence_change(g, i, 0.2)),
-            ("confidence_medium", lambda g, i: self.generator._create_confidence_change(g, i, 0.5)),
-            ("removal", lambda g, i: self.generator._create_claim_removal(g, i)),
+            # Graphs are only evaluated, so they share claims as read-only views
+            ("value_small", lambda g, i: self.generator._perturb_claim_value(g, i, 0.1, view=True)),
+            ("value_medium", lambda g, i: self.generator._perturb_claim_value(g, i, 0.3, view=True)),
+            ("value_large", lambda g, i: self.generator._perturb_claim_value(g, i, 0.5, view=True)),
+            ("polarity", lambda g, i: self.generator._create_polarity_flip(g, i, view=True)),
+            ("confidence_low", lambda g, i: self.generator._create_confidence_change(g, i, 0.2, view=True)),
+            ("confidence_medium", lambda g, i: self.generator._create_confidence_change(g, i, 0.5, view=True)),
+            ("removal", lambda g, i: self.generator._create_claim_removal(g, i, view=True)),
         ]
 
+        perturbations = []
         for ptype_name, perturb_fn in perturbation_types:
             cf = perturb_fn(graph, claim_idx)
-            if cf is None:
-                continue
+            if cf is not None:
+                perturbations.append((ptype_name, cf))
+
+        return perturbations
 
-            new_decision, _ = self.decision_fn(cf.modified_graph)
+    def _score_claim_criticality(
+        self,
+        perturbations: List[Tuple[str, CounterfactualEvidenceGraph]],
+        decisions: List[DecisionOutcome],
+        original_decision: DecisionOutcome,
+    ) -> Tuple[float, Optional[ClaimPerturbation], Dict[str, float]]:
+        """Score criticality from evaluated perturbations of one claim."""
+        min_flip_magnitude = float('inf')
+        min_flip_perturbation = None
+        sensitivity = {}
+
+        for (ptype_name, cf), new_decision in zip(perturbations, decisions):
             flipped = (new_decision != original_decision)
 
             # Record sensitivity
@@ -334,8 +463,9 @@ class DecisionAnalyzer:
         # Track robustness by claim type
         type_flips: Dict[str, List[bool]] = {}
 
-        for cf in counterfactuals:
-            new_decision, _ = self.decision_fn(cf.modified_graph)
+        outcomes = self.evaluate_batch([cf.modified_graph for cf in counterfactuals])
+
+        for cf, (new_decision, _) in zip(counterfactuals, outcomes):
             flipped = (new_decision != original_decision)
 
             if flipped:
@@ -395,7 +525,8 @@ class DecisionAnalyzer:
         """Generate natural language counterfactual explanations."""
         explanations = []
 
-        # Generate explanation for each critical claim
+        # Reconstruct the flipping counterfactual for each critical claim
+        candidates = []
         for cc in critical_claims[:5]:  # Top 5 most critical
             if cc.minimal_flip_perturbation is None:
                 continue
@@ -404,8 +535,11 @@ class DecisionAnalyzer:
             cf = self._reconstruct_counterfactual(graph, cc)
             if cf is None:
                 continue
+            candidates.append((cc, cf))
+
+        outcomes = self.evaluate_batch([cf.modified_graph for _, cf in candidates])
 
-            new_decision, _ = self.decision_fn(cf.modified_graph)
+        for (cc, cf), (new_decision, _) in zip(candidates, outcomes):
             if new_decision == original_decision:
                 continue  # Didn't actually flip
 
@@ -538,6 +672,8 @@ def analyze_decision(
     graph: EvidenceGraph,
     decision_fn: Callable[[EvidenceGraph], Tuple[DecisionOutcome, float]],
     seed: Optional[int] = None,
+    decision_fn_batch: Optional[DecisionBatchFn] = None,
+    max_workers: int = 1,
 ) -> DecisionAnalysisResult:
     """
     Convenience function to analyze a VC decision.
@@ -546,9 +682,16 @@ def analyze_decision(
         graph: Evidence graph to analyze
         decision_fn: Function that returns (decision, confidence)
         seed: Random seed
+        decision_fn_batch: Optional batched decision function
+        max_workers: Worker processes for batch evaluation
 
     Returns:
         Complete decision analysis
     """
-    analyzer = DecisionAnalyzer(decision_fn, seed=seed)
+    analyzer = DecisionAnalyzer(
+        decision_fn,
+        seed=seed,
+        decision_fn_batch=decision_fn_batch,
+        max_workers=max_workers,
+    )
     return analyzer.analyze(graph)
@@ -15,7 +15,7 @@ import time
 import uuid
 from dataclasses import dataclass, field
 from datetime import datetime
-from typing import Any, Optional
+from typing import Any, Callable, Optional
 
 from juris_agi.api.vc_models import (
     DecisionOutput,
@@ -117,6 +117,7 @@ class OrchestratorTrace:
     uncertainty_report: Optional[UncertaintyReport] = None
     start_time: float = field(default_factory=time.time)
     end_time: Optional[float] = None
+    on_event: Optional[Callable[[VCJobEvent], None]] = None  # Called as each event is added
 
     def add_event(
         self,
@@ -134,6 +135,8 @@ class OrchestratorTrace:
         )
         self.events.append(event)
         logger.info(f"[{event_type}] {message or ''} {data}")
+        if self.on_event is not None:
+            self.on_event(event)
         return event
 
     @property
@@ -173,6 +176,7 @@ class VCOrchestrator:
         claims: Optional[list[DirectClaim]] = None,
         constraints: Optional[VCConstraints] = None,
         historical_decisions: Optional[list[dict[str, Any]]] = None,
+        on_event: Optional[Callable[[VCJobEvent], None]] = None,
     ) -> VCJobResult:
         """
         Execute the full VC reasoning workflow.
@@ -183,12 +187,14 @@ class VCOrchestrator:
             claims: Direct claims (alternative to deal_id)
             constraints: Processing constraints
             historical_decisions: Historical decisions for policy learning
+            on_event: Called with each event as it happens, for streaming
+                progress to clients
 
         Returns:
             VCJobResult with decision, policies, uncertainty, and trace
         """
         job_id = f"vcjob_{uuid.uuid4().hex[:12]}"
-        trace = OrchestratorTrace()
+        trace = OrchestratorTrace(on_event=on_event)
         constraints = constraints or VCConstraints()
         created_at = datetime.utcnow()
 
@@ -199,6 +199,7 @@ from .hierarchy import (
     HierarchicalLearningConfig,
     HierarchicalLearningEngine,
     learn_hierarchical_policy,
+    update_hierarchical_policy,
     evaluate_with_hierarchy,
     summarize_policy,
 )
@@ -213,6 +214,8 @@ from .uncertainty import (
     UncertaintyReport,
     UncertaintyConfig,
     UncertaintyAnalyzer,
+    FieldSensitivity,
+    SensitivityEngine,
     analyze_uncertainty,
     should_request_more_info,
     get_top_information_requests,
@@ -341,6 +344,7 @@ __all__ = [
     "HierarchicalLearningConfig",
     "HierarchicalLearningEngine",
     "learn_hierarchical_policy",
+    "update_hierarchical_policy",
     "evaluate_with_hierarchy",
     "summarize_policy",
     # Uncertainty Quantification
@@ -352,6 +356,8 @@ __all__ = [
     "UncertaintyReport",
     "UncertaintyConfig",
     "UncertaintyAnalyzer",
+    "FieldSensitivity",
+    "SensitivityEngine",
     "analyze_uncertainty",
     "should_request_more_info",
     "get_top_information_requests",
@@ -13,7 +13,7 @@ requires different metrics than SaaS) and stage (seed vs growth).
 import logging
 from dataclasses import dataclass, field
 from enum import Enum
-from typing import Any, Optional
+from typing import Any, Optional, Sequence
 
 from .evaluation import Decision, Rule, RuleEngine, EvalContext
 from .hypothesis import (
@@ -97,10 +97,12 @@ class PolicyOverride:
     coverage_stats: CoverageStats = field(default_factory=CoverageStats)
     exceptions: list[ExceptionCase] = field(default_factory=list)
     mdl_score: float = 0.0
+    mdl_breakdown: MDLScoreBreakdown = field(default_factory=MDLScoreBreakdown)
 
     # Learning metadata
     sample_count: int = 0
     improvement_over_global: float = 0.0  # How much better than global policy
+    reference_accuracy: Optional[float] = None  # Accuracy when last learned
 
     def is_empty(self) -> bool:
         """Check if override is empty (no changes)."""
@@ -155,6 +157,9 @@ class HierarchicalPolicy:
     global_rules: list[Rule] = field(default_factory=list)
     global_coverage_stats: CoverageStats = field(default_factory=CoverageStats)
     global_mdl_score: float = 0.0
+    global_exceptions: list[ExceptionCase] = field(default_factory=list)
+    global_mdl_breakdown: MDLScoreBreakdown = field(default_factory=MDLScoreBreakdown)
+    global_reference_accuracy: Optional[float] = None  # Accuracy when last learned
 
     # Partition overrides
     overrides: dict[str, PolicyOverride] = field(default_factory=dict)  # partition_name -> override
@@ -355,6 +360,9 @@ class HierarchicalLearningConfig:
     mdl_predicate_cost: float = 0.5
     mdl_exception_cost: float = 2.0
 
+    # Incremental updates: accuracy drift that triggers a re-search
+    relearn_threshold: float = 0.05
+
     # Sector/stage field names
     sector_field: str = "deal.sector"
     stage_field: str = "deal.stage"
@@ -394,51 +402,11 @@ class HierarchicalLearningEngine:
         partitions: dict[str, Partition] = {}
 
         for hist in dataset.decisions:
-            # Extract sector and stage from context
-            sector_fv = hist.context.get_field(self.config.sector_field)
-            stage_fv = hist.context.get_field(self.config.stage_field)
-
-            sector = sector_fv.value if sector_fv.exists else None
-            stage = stage_fv.value if stage_fv.exists else None
-
-            # Normalize
-            if sector and isinstance(sector, str):
-                sector = sector.lower()
-            if stage and isinstance(stage, str):
-                stage = stage.lower()
-
-            # Add to sector partition
-            if sector and PartitionKey.SECTOR in self.config.partition_keys:
-                key = f"{PartitionKey.SECTOR.value}:{sector}"
-                if key not in partitions:
-                    partitions[key] = Partition(
-                        key=PartitionKey.SECTOR,
-                        value=sector,
-                    )
-                partitions[key].decisions.append(hist)
-
-            # Add to stage partition
-            if stage and PartitionKey.STAGE in self.config.partition_keys:
-                key = f"{PartitionKey.STAGE.value}:{stage}"
-                if key not in partitions:
-                    partitions[key] = Partition(
-                        key=PartitionKey.STAGE,
-                        value=stage,
-                    )
-                partitions[key].decisions.append(hist)
-
-            # Add to combined partition
-            if (
-                sector and stage
-                and PartitionKey.SECTOR_STAGE in self.config.partition_keys
-            ):
-                key = f"{PartitionKey.SECTOR_STAGE.value}:{sector}_{stage}"
-                if key not in partitions:
-                    partitions[key] = Partition(
-                        key=PartitionKey.SECTOR_STAGE,
-                        value=f"{sector}_{stage}",
-                    )
-                partitions[key].decisions.append(hist)
+            for key, value in self._partition_memberships(hist):
+                name = f"{key.value}:{value}"
+                if name not in partitions:
+                    partitions[name] = Partition(key=key, value=value)
+                partitions[name].decisions.append(hist)
 
         # Filter out small partitions
         partitions = {
@@ -454,6 +422,43 @@ class HierarchicalLearningEngine:
 
         return partitions
 
+    def _partition_memberships(
+        self,
+        hist: HistoricalDecision,
+    ) -> list[tuple[PartitionKey, str]]:
+        """Get the (key, value) partitions a decision belongs to."""
+        # Extract sector and stage from context
+        sector_fv = hist.context.get_field(self.config.sector_field)
+        stage_fv = hist.context.get_field(self.config.stage_field)
+
+        sector = sector_fv.value if sector_fv.exists else None
+        stage = stage_fv.value if stage_fv.exists else None
+
+        # Normalize
+        if sector and isinstance(sector, str):
+            sector = sector.lower()
+        if stage and isinstance(stage, str):
+            stage = stage.lower()
+
+        memberships: list[tuple[PartitionKey, str]] = []
+
+        # Sector partition
+        if sector and PartitionKey.SECTOR in self.config.partition_keys:
+            memberships.append((PartitionKey.SECTOR, sector))
+
+        # Stage partition
+        if stage and PartitionKey.STAGE in self.config.partition_keys:
+            memberships.append((PartitionKey.STAGE, stage))
+
+        # Combined partition
+        if (
+            sector and stage
+            and PartitionKey.SECTOR_STAGE in self.config.partition_keys
+        ):
+            memberships.append((PartitionKey.SECTOR_STAGE, f"{sector}_{stage}"))
+
+        return memberships
+
     def learn_global_policy(
         self,
         dataset: DecisionDataset,
@@ -464,8 +469,18 @@ class HierarchicalLearningEngine:
 
         Uses the best candidate rule set (lowest MDL score).
         """
+        rules, stats, _, breakdown = self._select_global_policy(dataset, candidate_rules)
+        return rules, stats, breakdown
+
+    def _select_global_policy(
+        self,
+        dataset: DecisionDataset,
+        candidate_rules: list[list[Rule]],
+    ) -> tuple[list[Rule], CoverageStats, list[ExceptionCase], MDLScoreBreakdown]:
+        """Select the best global candidate, keeping its exceptions."""
         best_rules: list[Rule] = []
         best_stats = CoverageStats()
+        best_exceptions: list[ExceptionCase] = []
         best_breakdown = MDLScoreBreakdown()
         best_score = float("inf")
 
@@ -482,6 +497,7 @@ class HierarchicalLearningEngine:
                 best_score = breakdown.total_score
                 best_rules = rules
                 best_stats = stats
+                best_exceptions = exceptions
                 best_breakdown = breakdown
 
         logger.info(
@@ -490,7 +506,7 @@ class HierarchicalLearningEngine:
             f"accuracy={best_stats.accuracy:.2%}"
         )
 
-        return best_rules, best_stats, best_breakdown
+        return best_rules, best_stats, best_exceptions, best_breakdown
 
     def learn_override(
         self,
@@ -533,8 +549,10 @@ class HierarchicalLearningEngine:
                     coverage_stats=stats,
                     exceptions=exceptions,
                     mdl_score=breakdown.total_score,
+                    mdl_breakdown=breakdown,
                     sample_count=len(partition),
                     improvement_over_global=improvement,
+                    reference_accuracy=stats.accuracy,
                 )
 
         # Strategy 2: Replace rules with different thresholds
@@ -564,8 +582,10 @@ class HierarchicalLearningEngine:
                         coverage_stats=stats,
                         exceptions=exceptions,
                         mdl_score=breakdown.total_score,
+                        mdl_breakdown=breakdown,
                         sample_count=len(partition),
                         improvement_over_global=improvement,
+                        reference_accuracy=stats.accuracy,
                     )
 
         # Strategy 3: Disable rules that hurt this partition
@@ -588,8 +608,10 @@ class HierarchicalLearningEngine:
                     coverage_stats=stats,
                     exceptions=exceptions,
                     mdl_score=breakdown.total_score,
+                    mdl_breakdown=breakdown,
                     sample_count=len(partition),
                     improvement_over_global=improvement,
+                    reference_accuracy=stats.accuracy,
                 )
 
         # Only keep override if improvement is significant
@@ -626,8 +648,8 @@ class HierarchicalLearningEngine:
         logger.info(f"Learning hierarchical policy from {len(dataset)} decisions")
 
         # Step 1: Learn global policy
-        global_rules, global_stats, global_breakdown = self.learn_global_policy(
-            dataset, global_candidate_rules
+        global_rules, global_stats, global_exceptions, global_breakdown = (
+            self._select_global_policy(dataset, global_candidate_rules)
         )
 
         if not global_rules:
@@ -659,6 +681,9 @@ class HierarchicalLearningEngine:
             global_rules=global_rules,
             global_coverage_stats=global_stats,
             global_mdl_score=global_breakdown.total_score,
+            global_exceptions=global_exceptions,
+            global_mdl_breakdown=global_breakdown,
+            global_reference_accuracy=global_stats.accuracy,
             overrides=overrides,
             sector_field=self.config.sector_field,
             stage_field=self.config.stage_field,
@@ -671,6 +696,129 @@ class HierarchicalLearningEngine:
 
         return policy
 
+    def update_hierarchical_policy(
+        self,
+        policy: HierarchicalPolicy,
+        dataset: DecisionDataset,
+        new_decisions: Sequence[HistoricalDecision],
+        global_candidate_rules: list[list[Rule]],
+        override_candidate_rules: list[Rule],
+    ) -> HierarchicalPolicy:
+        """
+        Incrementally update a learned hierarchical policy with new decisions.
+
+        Global and override coverage stats, exceptions and MDL breakdowns
+        are updated in place from the delta only. The global policy is
+        re-learned (from scratch) only if its accuracy drifts past
+        ``config.relearn_threshold``. Otherwise only partitions touched by
+        the delta are revisited: existing overrides are re-searched when
+        their accuracy drifts, and partitions without an override are
+        searched for one.
+
+        Args:
+            policy: Policy from learn_hierarchical_policy (updated in place)
+            dataset: Full decision history, including new_decisions
+            new_decisions: Decisions added since the policy was learned
+            global_candidate_rules: Candidate rule sets for global policy
+            override_candidate_rules: Individual rules for overrides
+
+        Returns:
+            The updated policy (a newly learned one if the global policy
+            had to be re-learned)
+        """
+        delta = DecisionDataset(decisions=list(new_decisions))
+        if not delta.decisions:
+            return policy
+
+        stale = (
+            not policy.global_rules
+            or policy.global_coverage_stats.total_decisions + len(delta) != len(dataset)
+        )
+        if stale:
+            logger.info("Policy does not match dataset, relearning from scratch")
+            return self.learn_hierarchical_policy(
+                dataset, global_candidate_rules, override_candidate_rules
+            )
+
+        # Step 1: Update global policy coverage
+        reference = policy.global_reference_accuracy
+        if reference is None:
+            reference = policy.global_coverage_stats.accuracy
+
+        self.scorer.update_coverage(
+            policy.global_rules,
+            delta,
+            policy.global_coverage_stats,
+            policy.global_exceptions,
+            policy.global_mdl_breakdown,
+        )
+        policy.global_mdl_score = policy.global_mdl_breakdown.total_score
+
+        global_stats = policy.global_coverage_stats
+        if (
+            abs(global_stats.accuracy - reference) > self.config.relearn_threshold
+            or global_stats.coverage_rate < self.config.global_min_coverage
+            or global_stats.accuracy < self.config.global_min_accuracy
+        ):
+            logger.info(
+                f"Global accuracy drifted {reference:.2%} -> "
+                f"{global_stats.accuracy:.2%}, relearning"
+            )
+            return self.learn_hierarchical_policy(
+                dataset, global_candidate_rules, override_candidate_rules
+            )
+
+        # Step 2: Find partitions touched by the delta
+        touched: dict[str, list[HistoricalDecision]] = {}
+        for hist in delta.decisions:
+            for key, value in self._partition_memberships(hist):
+                touched.setdefault(f"{key.value}:{value}", []).append(hist)
+
+        partitions = self.partition_dataset(dataset)
+
+        # Step 3: Update or re-search overrides for touched partitions
+        for name, members in touched.items():
+            partition = partitions.get(name)
+            if partition is None:
+                continue  # Still below min_partition_size
+
+            override = policy.overrides.get(name)
+            if override is not None:
+                override_reference = override.reference_accuracy
+                if override_reference is None:
+                    override_reference = override.coverage_stats.accuracy
+
+                self.scorer.update_coverage(
+                    policy.get_rules_for_partition(name),
+                    DecisionDataset(decisions=members),
+                    override.coverage_stats,
+                    override.exceptions,
+                    override.mdl_breakdown,
+                )
+                override.mdl_score = override.mdl_breakdown.total_score
+                override.sample_count = len(partition)
+
+                drift = abs(override.coverage_stats.accuracy - override_reference)
+                if drift <= self.config.relearn_threshold:
+                    continue
+
+            relearned = self.learn_override(
+                partition=partition,
+                global_rules=policy.global_rules,
+                candidate_rules=override_candidate_rules,
+            )
+            if relearned:
+                policy.overrides[name] = relearned
+            else:
+                policy.overrides.pop(name, None)
+
+        logger.info(
+            f"Updated hierarchical policy with {len(delta)} decisions, "
+            f"{len(touched)} partitions touched"
+        )
+
+        return policy
+
 
 # =============================================================================
 # Convenience Functions
@@ -703,6 +851,38 @@ def learn_hierarchical_policy(
     )
 
 
+def update_hierarchical_policy(
+    policy: HierarchicalPolicy,
+    dataset: DecisionDataset,
+    new_decisions: Sequence[HistoricalDecision],
+    global_candidate_rules: list[list[Rule]],
+    override_candidate_rules: list[Rule],
+    config: Optional[HierarchicalLearningConfig] = None,
+) -> HierarchicalPolicy:
+    """
+    Convenience function to incrementally update a hierarchical policy.
+
+    Args:
+        policy: Previously learned policy
+        dataset: Full decision history, including new_decisions
+        new_decisions: Decisions added since the policy was learned
+        global_candidate_rules: Candidate rule sets for global policy
+        override_candidate_rules: Individual rules for overrides
+        config: Learning configuration
+
+    Returns:
+        Updated HierarchicalPolicy
+    """
+    engine = HierarchicalLearningEngine(config=config)
+    return engine.update_hierarchical_policy(
+        policy=policy,
+        dataset=dataset,
+        new_decisions=new_decisions,
+        global_candidate_rules=global_candidate_rules,
+        override_candidate_rules=override_candidate_rules,
+    )
+
+
 def evaluate_with_hierarchy(
     policy: HierarchicalPolicy,
     context: EvalContext,
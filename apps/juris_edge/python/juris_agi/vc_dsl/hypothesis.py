@@ -162,6 +162,10 @@ class MDLScoreBreakdown:
     # Total MDL score (lower is better)
     total_score: float = 0.0
 
+    # Running confidence sums (allow incremental updates of confidence_bonus)
+    confidence_total: float = 0.0
+    confidence_count: int = 0
+
     def compute_total(self) -> float:
         """Compute total MDL score."""
         self.total_score = (
@@ -239,18 +243,52 @@ class MDLScorer:
         Returns:
             Tuple of (coverage_stats, exceptions, mdl_breakdown)
         """
-        from .evaluation import RuleEngine
-
-        stats = CoverageStats(total_decisions=len(dataset))
+        stats = CoverageStats()
         exceptions: list[ExceptionCase] = []
+        breakdown = MDLScoreBreakdown(
+            rule_complexity=self.score_rules(rules),
+            num_rules=len(rules),
+            avg_rule_length=sum(len(r.predicate.to_dsl()) for r in rules) / max(1, len(rules)),
+        )
+
+        self.update_coverage(
+            rules, dataset, stats, exceptions, breakdown,
+            default_decision=default_decision,
+        )
 
-        # Total confidence of claims used
-        total_confidence = 0.0
-        confidence_count = 0
+        return stats, exceptions, breakdown
+
+    def update_coverage(
+        self,
+        rules: list[Rule],
+        delta: DecisionDataset,
+        stats: CoverageStats,
+        exceptions: list[ExceptionCase],
+        breakdown: MDLScoreBreakdown,
+        default_decision: Decision = Decision.DEFER,
+    ) -> None:
+        """
+        Fold additional decisions into existing coverage results in place.
+
+        Only the decisions in ``delta`` are evaluated; the stats, exception
+        list and MDL breakdown previously produced by ``score_coverage`` for
+        the same rules are extended so that they equal a full re-score over
+        the combined data.
+
+        Args:
+            rules: Rules the existing results were computed for
+            delta: Newly added decisions
+            stats: Coverage stats to update
+            exceptions: Exception list to extend
+            breakdown: MDL breakdown to update
+            default_decision: Decision when no rule fires
+        """
+        from .evaluation import RuleEngine
 
         engine = RuleEngine(rules, default_decision=default_decision)
+        stats.total_decisions += len(delta)
 
-        for hist in dataset.decisions:
+        for hist in delta.decisions:
             trace = engine.evaluate(hist.context)
             predicted = trace.final_decision
 
@@ -260,8 +298,8 @@ class MDLScorer:
                     for f in outcome.fields_used:
                         fv = hist.context.get_field(f)
                         if fv.exists:
-                            total_confidence += fv.confidence
-                            confidence_count += 1
+                            breakdown.confidence_total += fv.confidence
+                            breakdown.confidence_count += 1
 
             # Track coverage
             is_covered = predicted != Decision.DEFER
@@ -293,23 +331,16 @@ class MDLScorer:
             else:
                 stats.uncovered += 1
 
-        # Compute MDL breakdown
-        breakdown = MDLScoreBreakdown(
-            rule_complexity=self.score_rules(rules),
-            num_rules=len(rules),
-            avg_rule_length=sum(len(r.predicate.to_dsl()) for r in rules) / max(1, len(rules)),
-            exception_cost=self.exception_cost * len(exceptions),
-            num_exceptions=len(exceptions),
-            coverage_penalty=self.uncovered_cost * stats.uncovered,
-            num_uncovered=stats.uncovered,
-            confidence_bonus=self.confidence_weight * (
-                total_confidence / max(1, confidence_count)
-            ) if confidence_count > 0 else 0.0,
-        )
+        # Refresh data-dependent MDL components
+        breakdown.exception_cost = self.exception_cost * len(exceptions)
+        breakdown.num_exceptions = len(exceptions)
+        breakdown.coverage_penalty = self.uncovered_cost * stats.uncovered
+        breakdown.num_uncovered = stats.uncovered
+        breakdown.confidence_bonus = self.confidence_weight * (
+            breakdown.confidence_total / max(1, breakdown.confidence_count)
+        ) if breakdown.confidence_count > 0 else 0.0
         breakdown.compute_total()
 
-        return stats, exceptions, breakdown
-
 
 # =============================================================================
 # Policy Hypothesis
@@ -336,6 +367,9 @@ class PolicyHypothesis:
     mdl_breakdown: MDLScoreBreakdown = field(default_factory=MDLScoreBreakdown)
     robustness_score: float = 0.0  # How stable under perturbation
 
+    # Accuracy at the last full search (drift reference for incremental updates)
+    reference_accuracy: Optional[float] = None
+
     # Metadata
     created_at: datetime = field(default_factory=datetime.utcnow)
     description: str = ""
@@ -424,6 +458,9 @@ class HypothesisSetConfig:
     robustness_samples: int = 10
     robustness_noise: float = 0.1
 
+    # Incremental updates: accuracy drift that triggers a re-search
+    relearn_threshold: float = 0.05
+
 
 class HypothesisSet:
     """
@@ -500,6 +537,7 @@ class HypothesisSet:
             coverage_stats=stats,
             exceptions=exceptions,
             mdl_breakdown=breakdown,
+            reference_accuracy=stats.accuracy,
             description=description,
         )
         self._next_id += 1
@@ -515,6 +553,71 @@ class HypothesisSet:
 
         return hypothesis
 
+    def update_with_decisions(
+        self,
+        delta: DecisionDataset,
+        dataset: DecisionDataset,
+    ) -> list[PolicyHypothesis]:
+        """
+        Update existing hypotheses in place with newly added decisions.
+
+        Coverage stats, exceptions and MDL breakdowns are extended from the
+        delta only. Hypotheses that no longer meet the coverage/accuracy
+        minimums are dropped; robustness is only recomputed for hypotheses
+        whose accuracy drifted past ``config.relearn_threshold``.
+
+        Args:
+            delta: Newly added decisions
+            dataset: Full decision history (including delta)
+
+        Returns:
+            Hypotheses whose accuracy drifted past the threshold
+            (including dropped ones)
+        """
+        drifted: list[PolicyHypothesis] = []
+        kept: list[PolicyHypothesis] = []
+
+        for hyp in self.hypotheses:
+            reference = (
+                hyp.reference_accuracy
+                if hyp.reference_accuracy is not None
+                else hyp.accuracy
+            )
+            self.scorer.update_coverage(
+                hyp.rules, delta, hyp.coverage_stats, hyp.exceptions, hyp.mdl_breakdown
+            )
+
+            is_drifted = abs(hyp.accuracy - reference) > self.config.relearn_threshold
+            if is_drifted:
+                drifted.append(hyp)
+
+            if (
+                hyp.coverage_rate < self.config.min_coverage
+                or hyp.accuracy < self.config.min_accuracy
+            ):
+                logger.debug(
+                    f"Hypothesis {hyp.hypothesis_id} dropped after update: "
+                    f"coverage {hyp.coverage_rate:.2%}, accuracy {hyp.accuracy:.2%}"
+                )
+                continue
+
+            if is_drifted:
+                hyp.robustness_score = self._compute_robustness(hyp, dataset)
+                hyp.reference_accuracy = hyp.accuracy
+
+            kept.append(hyp)
+
+        self.hypotheses = kept
+        return drifted
+
+    def contains_rules(self, rules: list[Rule]) -> bool:
+        """Check if a hypothesis with exactly these rule predicates exists."""
+        dsls = {r.predicate.to_dsl() for r in rules}
+        return any(
+            {r.predicate.to_dsl() for r in hyp.rules} == dsls
+            for hyp in self.hypotheses
+        )
+
     def _is_diverse_enough(self, new_rules: list[Rule]) -> bool:
         """Check if new rules are diverse enough from existing."""
         if not self.hypotheses:
@@ -681,6 +784,10 @@ class MultiHypothesisEngine:
         self.scorer = scorer or MDLScorer()
         self.hypothesis_set = HypothesisSet(config=self.config, scorer=self.scorer)
 
+        # Retained for incremental updates
+        self._dataset = DecisionDataset()
+        self._candidate_rules: list[list[Rule]] = []
+
     def learn_from_dataset(
         self,
         dataset: DecisionDataset,
@@ -701,6 +808,13 @@ class MultiHypothesisEngine:
             f"{len(candidate_rules)} candidate rule sets"
         )
 
+        self._dataset = DecisionDataset(
+            decisions=list(dataset.decisions),
+            name=dataset.name,
+            description=dataset.description,
+        )
+        self._candidate_rules = list(candidate_rules)
+
         for i, rules in enumerate(candidate_rules):
             self.hypothesis_set.add_hypothesis(
                 rules=rules,
@@ -712,6 +826,64 @@ class MultiHypothesisEngine:
 
         return self.hypothesis_set
 
+    def update_from_decisions(
+        self,
+        new_decisions: Sequence[HistoricalDecision],
+        dataset: Optional[DecisionDataset] = None,
+        candidate_rules: Optional[list[list[Rule]]] = None,
+    ) -> HypothesisSet:
+        """
+        Incrementally update learned hypotheses with new decisions.
+
+        Existing hypotheses are updated in place from the delta. Candidate
+        rule sets are only re-searched over the full history when at least
+        one hypothesis drifted past ``config.relearn_threshold``; otherwise
+        only newly supplied candidates are scored.
+
+        Args:
+            new_decisions: Decisions not yet seen by the hypothesis set
+            dataset: Full history including new_decisions. Defaults to the
+                dataset from the last learn_from_dataset call, extended
+                with new_decisions.
+            candidate_rules: Additional candidate rule sets to consider
+
+        Returns:
+            The updated HypothesisSet
+        """
+        delta = DecisionDataset(decisions=list(new_decisions))
+
+        if dataset is None:
+            self._dataset.decisions.extend(delta.decisions)
+        else:
+            self._dataset = dataset
+
+        new_candidates = list(candidate_rules or [])
+        offset = len(self._candidate_rules)
+        self._candidate_rules.extend(new_candidates)
+
+        drifted = self.hypothesis_set.update_with_decisions(delta, self._dataset)
+
+        logger.info(
+            f"Updated {len(self.hypothesis_set.hypotheses)} hypotheses with "
+            f"{len(delta)} new decisions ({len(drifted)} drifted)"
+        )
+
+        if drifted:
+            to_search = list(enumerate(self._candidate_rules))
+        else:
+            to_search = list(enumerate(new_candidates, start=offset))
+
+        for i, rules in to_search:
+            if self.hypothesis_set.contains_rules(rules):
+                continue
+            self.hypothesis_set.add_hypothesis(
+                rules=rules,
+                dataset=self._dataset,
+                name=f"Candidate_{i+1}",
+            )
+
+        return self.hypothesis_set
+
     def detect_regime_inconsistency(
         self,
         dataset: DecisionDataset,
@@ -19,11 +19,12 @@ identifying which missing claims would help most.
 
 import logging
 import math
+import random
 from dataclasses import dataclass, field
 from enum import Enum
 from typing import Any, Optional, Sequence
 
-from .evaluation import Decision, Rule, RuleEngine, EvalContext
+from .evaluation import Decision, Rule, RuleEngine, RuleOutcome, EvalContext
 from .hypothesis import (
     DecisionDataset,
     HypothesisSet,
@@ -87,6 +88,7 @@ class EpistemicUncertainty:
     # Sensitivity to claim removal
     most_sensitive_claims: list[str] = field(default_factory=list)
     max_sensitivity: float = 0.0  # Decision flip probability
+    policy_sensitivity: dict[str, float] = field(default_factory=dict)  # hypothesis_id -> max
 
     # Overall epistemic score (0=certain, 1=uncertain)
     score: float = 0.0
@@ -133,6 +135,7 @@ class EpistemicUncertainty:
             "minority_decision": self.minority_decision.value if self.minority_decision else None,
             "most_sensitive_claims": self.most_sensitive_claims,
             "max_sensitivity": self.max_sensitivity,
+            "policy_sensitivity": self.policy_sensitivity,
         }
 
 
@@ -328,6 +331,197 @@ class UncertaintyReport:
         }
 
 
+# =============================================================================
+# Sensitivity Engine (Memoized Field Removal)
+# =============================================================================
+
+
+class _MaskedContext(EvalContext):
+    """View of an EvalContext with one field treated as missing.
+
+    Shares the base field dict instead of copying it.
+    """
+
+    def __init__(self, base: EvalContext, masked_field: str):
+        super().__init__(
+            fields=base.fields,
+            default_confidence_threshold=base.default_confidence_threshold,
+        )
+        self.masked_field = masked_field
+
+    def get_field(self, field_name: str) -> FieldValue:
+        if field_name == self.masked_field:
+            return FieldValue.missing()
+        return super().get_field(field_name)
+
+    def has_field(self, field_name: str) -> bool:
+        if field_name == self.masked_field:
+            return False
+        return super().has_field(field_name)
+
+
+@dataclass
+class FieldSensitivity:
+    """Removal sensitivity of a single policy on one deal."""
+
+    hypothesis_id: str
+    decision: Optional[Decision] = None
+    decision_confidence: float = 0.0
+    fields_tested: list[str] = field(default_factory=list)
+    sensitive_fields: list[str] = field(default_factory=list)
+    max_sensitivity: float = 0.0
+
+
+class SensitivityEngine:
+    """
+    Computes claim-removal sensitivity for many policies on one context.
+
+    Each predicate is evaluated at most once per masked field: results are
+    cached by (predicate DSL, masked field), and a mask on a field the
+    predicate does not reference reuses the unmasked result. Policies that
+    share rules therefore share work.
+    """
+
+    def __init__(
+        self,
+        context: EvalContext,
+        sample_count: int = 5,
+        sampling: str = "ranked",  # "ranked" or "random"
+        seed: int = 0,
+    ):
+        """
+        Initialize the engine.
+
+        Args:
+            context: Deal context
+            sample_count: Maximum fields to mask per policy
+            sampling: How to choose fields when there are more than
+                sample_count - "ranked" keeps the fields referenced by the
+                most fired rules, "random" draws a seeded sample
+            seed: Seed for random sampling
+        """
+        if sampling not in ("ranked", "random"):
+            raise ValueError(f"Unknown sensitivity sampling: {sampling}")
+        self.context = context
+        self.sample_count = sample_count
+        self.sampling = sampling
+        self._rng = random.Random(seed)
+        self._predicates: dict[int, tuple[Any, str, frozenset[str]]] = {}
+        self._results: dict[tuple[str, Optional[str]], EvalResult] = {}
+        self.evaluations = 0
+        self.cache_hits = 0
+
+    def predicate_result(self, predicate: Any, masked_field: Optional[str] = None) -> EvalResult:
+        """Evaluate a predicate with an optional field masked, using the cache."""
+        entry = self._predicates.get(id(predicate))
+        if entry is None:
+            # Keep a reference so the id cannot be reused by another object
+            entry = (predicate, predicate.to_dsl(), frozenset(predicate.get_fields()))
+            self._predicates[id(predicate)] = entry
+        _, dsl, fields = entry
+
+        if masked_field not in fields:
+            masked_field = None
+        key = (dsl, masked_field)
+        result = self._results.get(key)
+        if result is not None:
+            self.cache_hits += 1
+            return result
+
+        ctx = self.context if masked_field is None else _MaskedContext(self.context, masked_field)
+        result = predicate.evaluate(ctx)
+        self._results[key] = result
+        self.evaluations += 1
+        return result
+
+    def decide(
+        self,
+        engine: RuleEngine,
+        masked_field: Optional[str] = None,
+    ) -> tuple[Decision, float, list[Rule]]:
+        """
+        Resolve a policy's decision with an optional field masked.
+
+        Returns:
+            Tuple of (decision, confidence, rules that fired)
+        """
+        invest_outcomes: list[RuleOutcome] = []
+        pass_outcomes: list[RuleOutcome] = []
+        unknown_outcomes: list[RuleOutcome] = []
+        fired: list[Rule] = []
+
+        for rule in engine.rules:
+            result = self.predicate_result(rule.predicate, masked_field)
+            if rule.requires_all_fields and result == EvalResult.UNKNOWN:
+                result = EvalResult.FALSE
+
+            if result == EvalResult.TRUE:
+                fired.append(rule)
+                outcome = RuleOutcome(
+                    rule_id=rule.rule_id,
+                    rule_name=rule.name,
+                    result=result,
+                    decision=rule.decision,
+                    priority=rule.priority,
+                )
+                if rule.decision == Decision.INVEST:
+                    invest_outcomes.append(outcome)
+                elif rule.decision == Decision.PASS:
+                    pass_outcomes.append(outcome)
+            elif result == EvalResult.UNKNOWN:
+                unknown_outcomes.append(RuleOutcome(
+                    rule_id=rule.rule_id,
+                    rule_name=rule.name,
+                    result=result,
+                    priority=rule.priority,
+                ))
+
+        decision, confidence = engine._resolve_decision(
+            invest_outcomes, pass_outcomes, unknown_outcomes
+        )
+        return decision, confidence, fired
+
+    def analyze_hypothesis(self, hypothesis: PolicyHypothesis) -> FieldSensitivity:
+        """Compute removal sensitivity for a single policy."""
+        engine = RuleEngine(hypothesis.rules)
+        decision, confidence, fired = self.decide(engine)
+        result = FieldSensitivity(
+            hypothesis_id=hypothesis.hypothesis_id,
+            decision=decision,
+            decision_confidence=confidence,
+        )
+
+        # Fields referenced by fired rules, with how many rules use each
+        usage: dict[str, int] = {}
+        for rule in fired:
+            for field_name in rule.predicate.get_fields():
+                usage[field_name] = usage.get(field_name, 0) + 1
+        result.fields_tested = self._sample_fields(usage)
+
+        for field_name in result.fields_tested:
+            masked_decision, masked_confidence, _ = self.decide(engine, field_name)
+            if masked_decision != decision:
+                result.sensitive_fields.append(field_name)
+                result.max_sensitivity = 1.0
+            elif masked_confidence < confidence - 0.1:
+                result.max_sensitivity = max(result.max_sensitivity, 0.5)
+
+        return result
+
+    def analyze(self, hypotheses: Sequence[PolicyHypothesis]) -> list[FieldSensitivity]:
+        """Compute removal sensitivity for all policies in one pass."""
+        return [self.analyze_hypothesis(hyp) for hyp in hypotheses]
+
+    def _sample_fields(self, usage: dict[str, int]) -> list[str]:
+        """Choose which used fields to mask."""
+        ranked = sorted(usage, key=lambda f: (-usage[f], f))
+        if len(ranked) <= self.sample_count:
+            return ranked
+        if self.sampling == "random":
+            return sorted(self._rng.sample(ranked, self.sample_count))
+        return ranked[:self.sample_count]
+
+
 # =============================================================================
 # Uncertainty Analyzer
 # =============================================================================
@@ -340,7 +534,11 @@ class UncertaintyConfig:
     # Thresholds
     low_confidence_threshold: float = 0.7
     high_variance_threshold: float = 0.3  # Coefficient of variation
+
+    # Claim-removal sensitivity (fields masked per policy)
     sensitivity_sample_count: int = 5
+    sensitivity_sampling: str = "ranked"  # "ranked" or "random"
+    sensitivity_seed: int = 0
 
     # Defer thresholds
     defer_epistemic_threshold: float = 0.6
@@ -408,12 +606,9 @@ class UncertaintyAnalyzer:
             result.num_equivalent_policies = len(equivalent)
             result.policy_score_variance = _variance([h.score for h in hypotheses])
 
-        # Evaluate under each policy
-        decisions = []
-        for hyp in hypotheses:
-            engine = RuleEngine(hyp.rules)
-            trace = engine.evaluate(context)
-            decisions.append((hyp.hypothesis_id, trace.final_decision))
+        # Evaluate and probe every policy in one pass over a shared cache
+        sensitivities = self._sensitivity_engine(context).analyze(hypotheses)
+        decisions = [(sens.hypothesis_id, sens.decision) for sens in sensitivities]
 
         # Calculate agreement rate
         if decisions:
@@ -438,14 +633,25 @@ class UncertaintyAnalyzer:
                         result.minority_decision = dec
                         break
 
-        # Sensitivity analysis (sample claim removal)
-        result.most_sensitive_claims, result.max_sensitivity = self._analyze_sensitivity(
-            context, hypotheses[0] if hypotheses else None
-        )
+        # Sensitivity to claim removal (reported for the best policy)
+        result.most_sensitive_claims = sensitivities[0].sensitive_fields
+        result.max_sensitivity = sensitivities[0].max_sensitivity
+        result.policy_sensitivity = {
+            sens.hypothesis_id: sens.max_sensitivity for sens in sensitivities
+        }
 
         result.compute_score()
         return result
 
+    def _sensitivity_engine(self, context: EvalContext) -> SensitivityEngine:
+        """Create a sensitivity engine for a context from the config."""
+        return SensitivityEngine(
+            context,
+            sample_count=self.config.sensitivity_sample_count,
+            sampling=self.config.sensitivity_sampling,
+            seed=self.config.sensitivity_seed,
+        )
+
     def _analyze_sensitivity(
         self,
         context: EvalContext,
@@ -455,39 +661,8 @@ class UncertaintyAnalyzer:
         if not hypothesis:
             return [], 0.0
 
-        engine = RuleEngine(hypothesis.rules)
-        original_trace = engine.evaluate(context)
-        original_decision = original_trace.final_decision
-
-        sensitive_claims = []
-        max_sensitivity = 0.0
-
-        # Get fields that were used in the decision
-        used_fields = set()
-        for outcome in original_trace.rule_outcomes:
-            if outcome.result == EvalResult.TRUE:
-                used_fields.update(outcome.fields_used)
-
-        # Test removing each field
-        for field_name in list(used_fields)[:self.config.sensitivity_sample_count]:
-            # Create modified context without this field
-            modified_fields = {
-                k: v for k, v in context.fields.items()
-                if k != field_name
-            }
-            modified_context = EvalContext(fields=modified_fields)
-
-            # Evaluate
-            modified_trace = engine.evaluate(modified_context)
-
-            # Check if decision changed
-            if modified_trace.final_decision != original_decision:
-                sensitive_claims.append(field_name)
-                max_sensitivity = max(max_sensitivity, 1.0)
-            elif modified_trace.decision_confidence < original_trace.decision_confidence - 0.1:
-                max_sensitivity = max(max_sensitivity, 0.5)
-
-        return sensitive_claims, max_sensitivity
+        sens = self._sensitivity_engine(context).analyze_hypothesis(hypothesis)
+        return sens.sensitive_fields, sens.max_sensitivity
 
     def analyze_aleatoric(
         self,
@@ -26,6 +26,7 @@ from .counterfactuals import (
 from .robustness import (
     RobustnessChecker,
     RobustnessResult,
+    CounterfactualSuite,
     # New robustness_check API
     CounterfactualRobustnessResult,
     robustness_check,
@@ -54,6 +55,7 @@ __all__ = [
     # Robustness
     "RobustnessChecker",
     "RobustnessResult",
+    "CounterfactualSuite",
     "CounterfactualRobustnessResult",
     "robustness_check",
     "quick_robustness_check",
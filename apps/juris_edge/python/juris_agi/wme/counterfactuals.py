@@ -138,11 +138,11 @@ class GridPerturbationGenerator(CounterfactualGenerator):
         dc = self.rng.integers(-1, 2)
 
         modified = Grid.zeros(grid.height, grid.width)
-        for r in range(grid.height):
-            for c in range(grid.width):
-                nr, nc = r + dr, c + dc
-                if 0 <= nr < grid.height and 0 <= nc < grid.width:
-                    modified[nr, nc] = grid[r, c]
+        h, w = grid.height, grid.width
+        if abs(dr) < h and abs(dc) < w:
+            modified.data[max(dr, 0):h + min(dr, 0), max(dc, 0):w + min(dc, 0)] = (
+                grid.data[max(-dr, 0):h - max(dr, 0), max(-dc, 0):w - max(dc, 0)]
+            )
 
         return Counterfactual(
             original=grid,
@@ -219,11 +219,9 @@ class StructuralCounterfactualGenerator(CounterfactualGenerator):
 
         # Simple nearest-neighbor resize
         modified = Grid.zeros(new_h, new_w)
-        for r in range(new_h):
-            for c in range(new_w):
-                src_r = min(int(r / scale), grid.height - 1)
-                src_c = min(int(c / scale), grid.width - 1)
-                modified[r, c] = grid[src_r, src_c]
+        src_rows = [min(int(r / scale), grid.height - 1) for r in range(new_h)]
+        src_cols = [min(int(c / scale), grid.width - 1) for c in range(new_w)]
+        modified.data[:, :] = grid.data[np.ix_(src_rows, src_cols)]
 
         return Counterfactual(
             original=grid,
@@ -239,9 +237,7 @@ class StructuralCounterfactualGenerator(CounterfactualGenerator):
         new_w = grid.width + 2 * padding
 
         modified = Grid.zeros(new_h, new_w)
-        for r in range(grid.height):
-            for c in range(grid.width):
-                modified[r + padding, c + padding] = grid[r, c]
+        modified.data[padding:padding + grid.height, padding:padding + grid.width] = grid.data
 
         return Counterfactual(
             original=grid,
@@ -533,9 +529,7 @@ class InvariantPreservingGenerator(CounterfactualGenerator):
             return None
 
         modified = Grid.zeros(new_h, new_w)
-        for r in range(grid.height):
-            for c in range(grid.width):
-                modified[r + padding, c + padding] = grid[r, c]
+        modified.data[padding:padding + grid.height, padding:padding + grid.width] = grid.data
 
         return Counterfactual(
             original=grid,
@@ -4,10 +4,12 @@ Robustness checking for programs.
 Tests programs against counterfactual inputs to assess generalization.
 """
 
+import math
+import time
 from dataclasses import dataclass, field
-from typing import List, Dict, Any, Optional, Callable
+from typing import List, Dict, Any, Optional, Callable, Tuple
 
-from ..core.types import Grid, ARCTask
+from ..core.types import FrozenGrid, Grid, ARCTask
 from ..dsl.ast import ASTNode
 from ..dsl.interpreter import make_program
 from .counterfactuals import (
@@ -38,6 +40,32 @@ class RobustnessResult:
     num_errors: int
     test_results: List[RobustnessTestResult] = field(default_factory=list)
     analysis: Dict[str, Any] = field(default_factory=dict)
+    # Per generator: generate_ms, test_ms and number of tests run
+    generator_timing: Dict[str, Dict[str, float]] = field(default_factory=dict)
+
+
+@dataclass
+class CounterfactualSuite:
+    """
+    Counterfactuals generated for one task.
+
+    Built once by RobustnessChecker.generate_suite and shareable between
+    all candidate programs checked against the task.
+    """
+    task: ARCTask
+    # (pair index, generator name, counterfactual), in generation order
+    entries: List[Tuple[int, str, Counterfactual]]
+    generate_ms: Dict[str, float]
+    # Content key of each entry's modified grid (equal grids, equal key)
+    inputs: List[FrozenGrid] = field(default_factory=list)
+
+    def __post_init__(self):
+        if not self.inputs:
+            self.inputs = [cf.modified.freeze() for _, _, cf in self.entries]
+
+    @property
+    def num_unique_inputs(self) -> int:
+        return len(set(self.inputs))
 
 
 class RobustnessChecker:
@@ -51,7 +79,24 @@ class RobustnessChecker:
         self,
         generators: Optional[List[CounterfactualGenerator]] = None,
         num_tests_per_generator: int = 5,
+        pass_threshold: Optional[float] = None,
+        confidence: float = 1.0,
+        min_tests: int = 5,
     ):
+        """
+        Initialize checker.
+
+        Args:
+            generators: Counterfactual generators (default: perturbation
+                and structural)
+            num_tests_per_generator: Counterfactuals per generator and pair
+            pass_threshold: Overall score a robust program reaches. When
+                set, testing stops as soon as the verdict is settled.
+            confidence: 1.0 stops only when the remaining tests cannot
+                change the verdict; below 1.0 also stops once a sequential
+                Hoeffding bound settles it at this confidence
+            min_tests: Tests run before a statistical stop is considered
+        """
         if generators is None:
             generators = [
                 GridPerturbationGenerator(),
@@ -59,16 +104,69 @@ class RobustnessChecker:
             ]
         self.generators = generators
         self.num_tests_per_generator = num_tests_per_generator
+        self.pass_threshold = pass_threshold
+        self.confidence = confidence
+        self.min_tests = min_tests
+
+    def _generator_names(self) -> List[str]:
+        names: List[str] = []
+        for generator in self.generators:
+            name = type(generator).__name__
+            if name in names:
+                name = f"{name}_{len(names)}"
+            names.append(name)
+        return names
+
+    def generate_suite(self, task: ARCTask) -> CounterfactualSuite:
+        """Generate the counterfactuals for every training input of a task."""
+        names = self._generator_names()
+        entries: List[Tuple[int, str, Counterfactual]] = []
+        generate_ms = {name: 0.0 for name in names}
+
+        for i, pair in enumerate(task.train):
+            for name, generator in zip(names, self.generators):
+                start = time.perf_counter()
+                counterfactuals = generator.generate(
+                    pair.input,
+                    num_counterfactuals=self.num_tests_per_generator,
+                )
+                generate_ms[name] += (time.perf_counter() - start) * 1000
+                entries.extend((i, name, cf) for cf in counterfactuals)
+
+        return CounterfactualSuite(task=task, entries=entries, generate_ms=generate_ms)
+
+    def check_programs(
+        self,
+        programs: List[ASTNode],
+        task: ARCTask,
+    ) -> List[RobustnessResult]:
+        """Check several candidate programs against one shared suite."""
+        suite: Optional[CounterfactualSuite] = None
+        results = []
+        for program in programs:
+            if suite is None:
+                try:
+                    make_program(program)
+                except Exception:
+                    # Reported by check_robustness; no suite needed yet
+                    results.append(self.check_robustness(program, task))
+                    continue
+                suite = self.generate_suite(task)
+            results.append(self.check_robustness(program, task, suite))
+        return results
 
     def check_robustness(
         self,
         program: ASTNode,
         task: ARCTask,
+        suite: Optional[CounterfactualSuite] = None,
     ) -> RobustnessResult:
         """
         Check program robustness on a task.
 
         Tests program on counterfactual inputs derived from training data.
+        The program runs once per distinct counterfactual grid. Pass a
+        suite from generate_suite to reuse counterfactuals across programs.
         """
         try:
             program_fn = make_program(program)
@@ -82,33 +180,64 @@ class RobustnessChecker:
                 analysis={"error": f"Program compilation failed: {e}"},
             )
 
-        all_results: List[RobustnessTestResult] = []
-
-        # Generate and test counterfactuals for each training input
-        for pair in task.train:
-            for generator in self.generators:
-                counterfactuals = generator.generate(
-                    pair.input,
-                    num_counterfactuals=self.num_tests_per_generator,
-                )
-
-                for cf in counterfactuals:
-                    result = self._test_counterfactual(program_fn, cf, pair.output)
-                    all_results.append(result)
+        if suite is None:
+            suite = self.generate_suite(task)
+
+        order = list(range(len(suite.entries)))
+        if self.pass_threshold is not None:
+            order = self._interleaved_order(suite)
+
+        all_results: List[Tuple[int, RobustnessTestResult]] = []
+        outputs: Dict[FrozenGrid, Tuple[Optional[Grid], Optional[str]]] = {}
+        test_ms = {name: 0.0 for name in suite.generate_ms}
+        tests_run = {name: 0 for name in suite.generate_ms}
+        total_score = 0.0
+        verdict: Optional[str] = None
+
+        for n, index in enumerate(order, start=1):
+            pair_index, name, cf = suite.entries[index]
+            start = time.perf_counter()
+            key = suite.inputs[index]
+            if key not in outputs:
+                outputs[key] = self._run(program_fn, key)
+            output, error = outputs[key]
+            result = self._score_output(
+                cf, output, error, suite.task.train[pair_index].output
+            )
+            test_ms[name] += (time.perf_counter() - start) * 1000
+            tests_run[name] += 1
+            all_results.append((index, result))
+            total_score += result.consistency_score
+
+            if self.pass_threshold is not None:
+                verdict = self._settled_verdict(total_score, n, len(order))
+                if verdict is not None:
+                    break
+
+        if self.pass_threshold is None:
+            test_results = [r for _, r in all_results]
+        else:
+            # Report in generation order, whatever order they ran in
+            test_results = [r for _, r in sorted(all_results, key=lambda x: x[0])]
 
         # Compute aggregate statistics
-        num_tests = len(all_results)
-        num_passed = sum(1 for r in all_results if r.success and r.consistency_score > 0.5)
-        num_failed = sum(1 for r in all_results if r.success and r.consistency_score <= 0.5)
-        num_errors = sum(1 for r in all_results if not r.success)
+        num_tests = len(test_results)
+        num_passed = sum(1 for r in test_results if r.success and r.consistency_score > 0.5)
+        num_failed = sum(1 for r in test_results if r.success and r.consistency_score <= 0.5)
+        num_errors = sum(1 for r in test_results if not r.success)
 
         if num_tests > 0:
-            overall_score = sum(r.consistency_score for r in all_results) / num_tests
+            overall_score = sum(r.consistency_score for r in test_results) / num_tests
         else:
             overall_score = 0.0
 
         # Analyze failure patterns
-        analysis = self._analyze_failures(all_results)
+        analysis = self._analyze_failures(test_results)
+        if self.pass_threshold is not None:
+            if verdict is None:
+                verdict = "pass" if overall_score >= self.pass_threshold else "fail"
+            analysis["verdict"] = verdict
+            analysis["tests_skipped"] = len(order) - num_tests
 
         return RobustnessResult(
             overall_score=overall_score,
@@ -116,38 +245,96 @@ class RobustnessChecker:
             num_passed=num_passed,
             num_failed=num_failed,
             num_errors=num_errors,
-            test_results=all_results,
+            test_results=test_results,
             analysis=analysis,
+            generator_timing={
+                name: {
+                    "generate_ms": suite.generate_ms[name],
+                    "test_ms": test_ms[name],
+                    "tests": tests_run[name],
+                }
+                for name in suite.generate_ms
+            },
         )
 
-    def _test_counterfactual(
+    def _interleaved_order(self, suite: CounterfactualSuite) -> List[int]:
+        """
+        Round-robin over (pair, generator) groups.
+
+        Early exit judges the program on the tests run so far, so these
+        should cover every pair and generator rather than the first pair.
+        """
+        groups: Dict[Tuple[int, str], List[int]] = {}
+        for index, (pair_index, name, _) in enumerate(suite.entries):
+            groups.setdefault((pair_index, name), []).append(index)
+        order: List[int] = []
+        queues = list(groups.values())
+        depth = 0
+        while len(order) < len(suite.entries):
+            for queue in queues:
+                if depth < len(queue):
+                    order.append(queue[depth])
+            depth += 1
+        return order
+
+    def _settled_verdict(self, total: float, n: int, planned: int) -> Optional[str]:
+        """
+        "pass"/"fail" once the mean score's side of pass_threshold is known.
+
+        Scores lie in [0, 1], so the final mean is bounded by the scores
+        so far; with confidence < 1, a Hoeffding bound union-bounded over
+        every look (failure probability 1 - confidence overall) also
+        decides.
+        """
+        threshold = self.pass_threshold
+        remaining = planned - n
+        if total / planned >= threshold:
+            return "pass"
+        if (total + remaining) / planned < threshold:
+            return "fail"
+        if self.confidence < 1.0 and n >= self.min_tests:
+            delta = 1.0 - self.confidence
+            radius = math.sqrt(math.log(2 * n * (n + 1) / delta) / (2 * n))
+            mean = total / n
+            if mean - radius >= threshold:
+                return "pass"
+            if mean + radius < threshold:
+                return "fail"
+        return None
+
+    def _run(
         self,
         program_fn: Callable[[Grid], Grid],
+        grid: FrozenGrid,
+    ) -> Tuple[Optional[Grid], Optional[str]]:
+        """Program output on a counterfactual input, or the error message."""
+        try:
+            return program_fn(grid), None
+        except Exception as e:
+            return None, str(e)
+
+    def _score_output(
+        self,
         cf: Counterfactual,
+        output: Optional[Grid],
+        error: Optional[str],
         original_output: Grid,
     ) -> RobustnessTestResult:
-        """Test program on a single counterfactual."""
+        """Score a (possibly shared) program output for one counterfactual."""
+        if output is None:
+            return RobustnessTestResult(
+                counterfactual=cf,
+                success=False,
+                error=error,
+                consistency_score=0.0,
+            )
         try:
-            output = program_fn(cf.modified)
-
-            # Compute consistency score based on expected behavior
-            if cf.expected_behavior == "same_transformation":
-                # For same_transformation, we expect similar output structure
-                consistency = self._compute_structural_similarity(output, original_output)
-            elif cf.expected_behavior == "same_structure":
-                # Output structure should be preserved even if colors differ
-                consistency = self._compute_shape_similarity(output, original_output)
-            else:
-                # May differ - just check that output is valid
-                consistency = 1.0 if output.height > 0 and output.width > 0 else 0.0
-
             return RobustnessTestResult(
                 counterfactual=cf,
                 success=True,
-                output=output,
-                consistency_score=consistency,
+                output=output.copy(),
+                consistency_score=self._consistency(cf, output, original_output),
             )
-
         except Exception as e:
             return RobustnessTestResult(
                 counterfactual=cf,
@@ -156,6 +343,33 @@ class RobustnessChecker:
                 consistency_score=0.0,
             )
 
+    def _consistency(
+        self,
+        cf: Counterfactual,
+        output: Grid,
+        original_output: Grid,
+    ) -> float:
+        """Consistency of an output with the counterfactual's expected behavior."""
+        if cf.expected_behavior == "same_transformation":
+            # For same_transformation, we expect similar output structure
+            return self._compute_structural_similarity(output, original_output)
+        elif cf.expected_behavior == "same_structure":
+            # Output structure should be preserved even if colors differ
+            return self._compute_shape_similarity(output, original_output)
+        else:
+            # May differ - just check that output is valid
+            return 1.0 if output.height > 0 and output.width > 0 else 0.0
+
+    def _test_counterfactual(
+        self,
+        program_fn: Callable[[Grid], Grid],
+        cf: Counterfactual,
+        original_output: Grid,
+    ) -> RobustnessTestResult:
+        """Test program on a single counterfactual."""
+        output, error = self._run(program_fn, cf.modified)
+        return self._score_output(cf, output, error, original_output)
+
     def _compute_structural_similarity(
         self,
         output: Grid,
@@ -11,6 +11,7 @@ from typing import List, Dict, Any, Optional
 
 from ..core.types import Grid, ARCTask, ARCPair
 from ..dsl.ast import ASTNode
+from ..representation.task_context import get_task_context
 
 
 @dataclass
@@ -95,14 +96,16 @@ class HeuristicWorldModel(WorldModel):
         if not task.train:
             return state
 
-        # Extract features from all training pairs
-        all_features: List[Dict[str, Any]] = []
-        for pair in task.train:
-            features = self._extract_pair_features(pair)
-            all_features.append(features)
+        # Find features consistent across all training pairs (shared
+        # per task content, keyed by model class as subclasses may differ)
+        def consistent_features() -> Dict[str, Any]:
+            return self._find_consistent_features([
+                self._extract_pair_features(pair) for pair in task.train
+            ])
 
-        # Find consistent features
-        state.task_features = self._find_consistent_features(all_features)
+        state.task_features = dict(get_task_context(task).get(
+            "wme_task_features", consistent_features, type(self),
+        ))
 
         # Generate initial hypotheses
         state.hypotheses = [
@@ -193,7 +196,8 @@ class HeuristicWorldModel(WorldModel):
                 ))
 
         # Color transformation hypothesis
-        if inp.shape == out.shape and inp.palette != out.palette:
+        context = get_task_context(task)
+        if inp.shape == out.shape and context.palette("input", 0) != context.palette("output", 0):
             hypotheses.append(TransformationHypothesis(
                 name="recoloring",
                 confidence=0.5,
@@ -4,6 +4,7 @@ Integration tests for VC decision endpoints.
 Tests the end-to-end flow with mocked Evidence API.
 """
 
+import json
 import pytest
 from datetime import datetime
 from unittest.mock import AsyncMock, MagicMock, patch
@@ -266,6 +267,22 @@ class TestVCJobEventsEndpoint:
         assert "events" in data
         assert isinstance(data["events"], list)
 
+    def test_stream_job_events(self, client, sample_claims):
+        """The SSE stream should carry the same events and end when the job does."""
+        job_id = client.post("/vc/solve", json={"claims": sample_claims}).json()["job_id"]
+
+        response = client.get(f"/vc/jobs/{job_id}/events/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        streamed = [
+            json.loads(line[len("data: "):])
+            for line in response.text.splitlines() if line.startswith("data: ")
+        ]
+        polled = client.get(f"/vc/jobs/{job_id}/events").json()["events"]
+        assert [e["event_id"] for e in streamed] == [e["event_id"] for e in polled]
+        assert streamed[-1]["data"]["status"] in ("completed", "failed")
+
 
 class TestVCJobTraceEndpoint:
     """Tests for GET /vc/jobs/{job_id}/trace endpoint."""
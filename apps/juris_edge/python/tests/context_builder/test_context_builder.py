@@ -260,6 +260,58 @@ class TestConflictRetention:
         assert len(clusters) == 1
         assert len(clusters[0].conflicts) >= 1
 
+    def test_sweep_matches_all_pairs(self):
+        """Sorted sweep should find exactly the all-pairs conflicts, in order."""
+        from juris_agi.context_builder.conflicts import _are_values_conflicting
+
+        values = [
+            1000, 1040, 1100, 1160, 2000, -1000, -1100, 0, 0, 3.5,
+            "growing", "declining", "growing", [1, 2], None, float("inf"),
+        ]
+        claims = [
+            make_claim(f"c{i:02d}", "traction", "arr", v)
+            for i, v in enumerate(values)
+        ]
+
+        expected = [
+            (claims[i].claim_id, claims[j].claim_id)
+            for i in range(len(claims))
+            for j in range(i + 1, len(claims))
+            if _are_values_conflicting(claims[i].value, claims[j].value, 0.15)[0]
+        ]
+        conflicts = detect_conflicts(claims)
+
+        assert [(c.claims[0].claim_id, c.claims[1].claim_id) for c in conflicts] == expected
+        assert [c.conflict_id for c in conflicts] == [
+            f"conflict_{n:04d}" for n in range(1, len(expected) + 1)
+        ]
+
+    def test_clustering_long_chain(self):
+        """Long chains of shared claims should form one cluster."""
+        from juris_agi.context_builder.conflicts import DetectedConflict
+        from juris_agi.evidence_client.types import ConflictType
+
+        claims = [
+            make_claim(f"c{i:04d}", "traction", "arr", 100 * (i % 2 + 1))
+            for i in range(3001)
+        ]
+        # c0-c1, c1-c2, ... deeper than the default recursion limit
+        conflicts = [
+            DetectedConflict(
+                conflict_id=f"conflict_{i:04d}",
+                conflict_type=ConflictType.INCONSISTENCY,
+                claims=[claims[i], claims[i + 1]],
+                severity=ConflictSeverity.MEDIUM,
+                description="",
+            )
+            for i in range(3000)
+        ]
+
+        clusters = cluster_conflicts(conflicts)
+
+        assert len(clusters) == 1
+        assert clusters[0].conflicts == conflicts
+
 
 # =============================================================================
 # Deduplication Tests
@@ -325,6 +377,42 @@ class TestDeduplication:
         founder_claims = [c for c in result.claims_selected if c.field == "founder"]
         assert len(founder_claims) == 1
 
+    def test_indexed_dedup_matches_pairwise(self):
+        """Indexed deduplication should keep exactly what a full scan keeps."""
+        from juris_agi.context_builder.select_claims import _are_claims_duplicate
+
+        values = [
+            1000, 1040, 1100, 960, -1000, -1030, 0, 0.0, 2000, 1950,
+            "SaaS", "saas ", ["a", "B"], ["b", "A"], None, None, float("nan"),
+        ]
+        claims = [
+            make_claim(f"c{i:02d}", "traction", "arr", v, 0.9 - i * 0.01)
+            for i, v in enumerate(values)
+        ] + [make_claim("other", "traction", "mrr", 1000, 0.5)]
+        ranked = [(c, calculate_quality_score(c)) for c in claims]
+
+        kept, removed = deduplicate_claims(ranked)
+
+        expected: list[Claim] = []
+        for claim in claims:
+            if not any(_are_claims_duplicate(claim, seen) for seen in expected):
+                expected.append(claim)
+        assert [c.claim_id for c, _ in kept] == [c.claim_id for c in expected]
+        assert removed == len(claims) - len(expected)
+
+    def test_numeric_tolerance_configurable(self):
+        """A wider tolerance should merge values further apart."""
+        claims = [
+            make_claim("c1", "traction", "arr", 1000000, 0.9),
+            make_claim("c2", "traction", "arr", 1080000, 0.85),  # ~8% different
+        ]
+        ranked = [(c, calculate_quality_score(c)) for c in claims]
+
+        assert deduplicate_claims(ranked)[1] == 0
+        kept, removed = deduplicate_claims(ranked, numeric_tolerance=0.1)
+        assert removed == 1
+        assert kept[0][0].claim_id == "c1"
+
 
 # =============================================================================
 # Quality Scoring Tests
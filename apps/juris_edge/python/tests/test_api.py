@@ -241,6 +241,41 @@ class TestJobStatusEndpoint:
         response = client.get(f"/jobs/{job_id}?include_trace=true")
         assert response.status_code == 200
 
+    def test_result_artifact_loaded_off_event_loop(self, client, sample_solve_request, monkeypatch):
+        """Storage reads for completed jobs should run in the threadpool."""
+        import threading
+        import juris_agi.api.server as server_module
+
+        job_id = client.post("/solve", json=sample_solve_request).json()["job_id"]
+        server_module._memory_job_stores[server_module.JOB_PREFIX].store.update(job_id, {
+            "status": "completed", "predictions": None,
+            "result_key": "results/x.json", "trace_key": "traces/x.json",
+        })
+
+        loop_thread = []
+        read_threads = []
+
+        class FakeBackend:
+            def get_json(self, key):
+                read_threads.append(threading.current_thread())
+                return {"predictions": [{"data": [[1]], "confidence": 1.0}]}
+
+        original_get = server_module.AsyncMemoryJobStore.get
+
+        async def get(self, *args, **kwargs):
+            loop_thread.append(threading.current_thread())
+            return await original_get(self, *args, **kwargs)
+
+        monkeypatch.setattr(server_module.AsyncMemoryJobStore, "get", get)
+        monkeypatch.setattr(server_module, "_storage_client", MagicMock(backend=FakeBackend()))
+
+        response = client.get(f"/jobs/{job_id}?include_trace=true")
+
+        assert response.status_code == 200
+        assert response.json()["predictions"][0]["prediction"]["data"] == [[1]]
+        assert len(read_threads) == 2
+        assert all(t is not loop_thread[0] for t in read_threads)
+
 
 # =============================================================================
 # Test Request/Response Models
@@ -370,6 +405,246 @@ class TestConfig:
 
         assert config.max_concurrent_jobs == 1
         assert "juris_default" in config.queue_names
+        assert config.warm_start
+        assert config.fork_jobs
+
+    def test_worker_config_warm_start_from_env(self, monkeypatch):
+        """Warm start can be turned off from the environment."""
+        from juris_agi.api.config import WorkerConfig
+        monkeypatch.setenv("WORKER_WARM_START", "false")
+
+        assert not WorkerConfig.from_env().warm_start
+
+
+# =============================================================================
+# Worker Tests
+# =============================================================================
+
+class TestWarmWorker:
+    """Tests for reusing worker state across RQ jobs."""
+
+    @pytest.fixture
+    def fake_setup(self, monkeypatch):
+        """Replace JurisWorker.setup with an in-memory job store."""
+        from juris_agi.api import worker as worker_module
+        from juris_agi.api.job_store import MemoryJobStore
+
+        store = MemoryJobStore()
+        calls = []
+
+        def setup(self):
+            calls.append(self)
+            self.jobs = store
+            self.vc_jobs = MemoryJobStore()
+            self.setup_seconds = 0.5
+
+        monkeypatch.setattr(worker_module.JurisWorker, "setup", setup)
+        monkeypatch.setattr(worker_module, "_warm_worker", None)
+        return store, calls
+
+    def _submit(self, store, job_id, sample_solve_request):
+        store.create(job_id, {
+            **sample_solve_request,
+            "job_id": job_id,
+            "return_trace": False,
+            "created_at": datetime.utcnow().isoformat(),
+        })
+
+    def test_setup_runs_once_per_process(self, fake_setup, sample_solve_request, monkeypatch):
+        """Warm jobs should share one setup and report its cost once."""
+        from juris_agi.api.worker import process_job
+        store, calls = fake_setup
+        monkeypatch.delenv("WORKER_WARM_START", raising=False)
+
+        results = []
+        for job_id in ("job_a", "job_b"):
+            self._submit(store, job_id, sample_solve_request)
+            results.append(process_job(job_id))
+
+        assert len(calls) == 1
+        assert [r["setup_seconds"] for r in results] == [0.5, 0.0]
+        assert all(r["status"] == "completed" for r in results)
+        assert calls[0].jobs_processed == 2
+
+    def test_cold_start_sets_up_every_job(self, fake_setup, sample_solve_request, monkeypatch):
+        """With warm start off each job pays for its own setup."""
+        from juris_agi.api.worker import process_job
+        store, calls = fake_setup
+        monkeypatch.setenv("WORKER_WARM_START", "false")
+
+        results = []
+        for job_id in ("job_a", "job_b"):
+            self._submit(store, job_id, sample_solve_request)
+            results.append(process_job(job_id))
+
+        assert len(calls) == 2
+        assert [r["setup_seconds"] for r in results] == [0.5, 0.5]
+
+    def test_job_updates_write_fields_and_events(self, fake_setup, sample_solve_request, monkeypatch):
+        """Status updates should write changed fields only and append events."""
+        from juris_agi.api.worker import process_job
+        store, _ = fake_setup
+        monkeypatch.delenv("WORKER_WARM_START", raising=False)
+        self._submit(store, "job_a", sample_solve_request)
+
+        written = []
+        update = store.update
+
+        def recording_update(job_id, fields):
+            written.append(set(fields))
+            update(job_id, fields)
+
+        monkeypatch.setattr(store, "update", recording_update)
+        process_job("job_a")
+
+        assert written[0] == {"status", "started_at", "setup_seconds"}
+        assert not any("task" in fields for fields in written)
+        assert store.get("job_a")["task"] == sample_solve_request["task"]
+
+        events = [event for _, event in store.read_events("job_a")]
+        assert events[0]["event_type"] == "job_started"
+        assert events[-1]["data"]["status"] == store.get("job_a", ["status"])["status"]
+
+    def test_vc_job_streams_orchestrator_events(self, fake_setup, monkeypatch):
+        """VC jobs should append orchestrator events as they happen."""
+        from juris_agi.api.worker import preload_worker, process_vc_job
+        _, calls = fake_setup
+        monkeypatch.delenv("WORKER_WARM_START", raising=False)
+        preload_worker().vc_jobs.create("vcjob_a", {
+            "claims": [{"claim_type": "traction", "field": "arr", "value": 2500000}],
+            "constraints": {},
+            "include_trace": False,
+        })
+
+        result = process_vc_job("vcjob_a")
+
+        vc_jobs = calls[0].vc_jobs
+        events = [event for _, event in vc_jobs.read_events("vcjob_a")]
+        assert len(events) > 1
+        assert events[-1]["data"]["status"] == result["status"]
+        assert vc_jobs.get("vcjob_a", ["status"])["status"] == result["status"]
+
+
+# =============================================================================
+# Event Stream Tests
+# =============================================================================
+
+def _read_sse(response):
+    """Parse a server-sent event response into (id, event, data) tuples."""
+    events = []
+    for block in response.text.strip().split("\n\n"):
+        fields = dict(line.split(": ", 1) for line in block.splitlines() if not line.startswith(":"))
+        if fields:
+            events.append((fields["id"], fields["event"], json.loads(fields["data"])))
+    return events
+
+
+class TestJobEventStream:
+    """Tests for GET /jobs/{job_id}/events/stream."""
+
+    def test_stream_ends_with_terminal_event(self, client, sample_solve_request):
+        """The stream should push every event and close once the job finishes."""
+        job_id = client.post("/solve", json=sample_solve_request).json()["job_id"]
+
+        response = client.get(f"/jobs/{job_id}/events/stream")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/event-stream")
+
+        events = _read_sse(response)
+        assert [e[1] for e in events[:2]] == ["job_queued", "job_started"]
+        assert events[-1][2]["data"]["status"] in ("completed", "failed")
+
+    def test_last_event_id_resumes(self, client, sample_solve_request):
+        """Reconnecting with Last-Event-ID should skip events already seen."""
+        job_id = client.post("/solve", json=sample_solve_request).json()["job_id"]
+        events = _read_sse(client.get(f"/jobs/{job_id}/events/stream"))
+
+        resumed = _read_sse(client.get(
+            f"/jobs/{job_id}/events/stream", headers={"Last-Event-ID": events[0][0]},
+        ))
+        assert resumed == events[1:]
+
+    def test_stream_unknown_job_404(self, client):
+        response = client.get("/jobs/job_nonexistent/events/stream")
+        assert response.status_code == 404
+
+
+# =============================================================================
+# Redis Metrics Tests
+# =============================================================================
+
+class TestRedisMetrics:
+    """Tests for Redis call timeouts and latency histograms."""
+
+    def test_histogram_render(self):
+        """Rendered buckets should be cumulative, ending with +Inf."""
+        from juris_agi.api.metrics import LatencyMetrics
+
+        metrics = LatencyMetrics("test_seconds", "Test latency", buckets=(0.01, 0.1))
+        for seconds in (0.005, 0.05, 0.05, 3.0):
+            metrics.observe("job_get", seconds)
+
+        text = metrics.render()
+        assert "# TYPE test_seconds histogram" in text
+        assert 'test_seconds_bucket{operation="job_get",outcome="ok",le="0.01"} 1' in text
+        assert 'test_seconds_bucket{operation="job_get",outcome="ok",le="0.1"} 3' in text
+        assert 'test_seconds_bucket{operation="job_get",outcome="ok",le="+Inf"} 4' in text
+        assert 'test_seconds_count{operation="job_get",outcome="ok"} 4' in text
+
+    def test_store_call_timeout(self):
+        """A slow Redis call should time out and be recorded as an error."""
+        import asyncio
+        from juris_agi.api.job_store import AsyncRedisJobStore
+        from juris_agi.api.metrics import LatencyMetrics
+
+        class SlowRedis:
+            async def hgetall(self, key):
+                await asyncio.sleep(1.0)
+
+        metrics = LatencyMetrics("test_seconds", "Test latency")
+        store = AsyncRedisJobStore(SlowRedis(), timeout=0.01, metrics=metrics)
+
+        with pytest.raises(asyncio.TimeoutError):
+            asyncio.run(store.get("job_a"))
+        assert metrics.histogram("job_get", error=True).count == 1
+        assert metrics.histogram("job_get") is None
+
+    def test_concurrent_first_calls_share_pool(self, monkeypatch):
+        """Requests racing to create the Redis pool should get the same client."""
+        import asyncio
+        import juris_agi.api.server as server_module
+
+        created = []
+
+        async def connect(max_connections):
+            await asyncio.sleep(0.01)
+            created.append(max_connections)
+            return MagicMock(name=f"client_{len(created)}")
+
+        async def first_calls():
+            await server_module.close_redis()
+            return await asyncio.gather(
+                server_module.get_redis_stream(), server_module.get_redis_stream(),
+                server_module.get_redis(), server_module.get_redis(),
+            )
+
+        monkeypatch.setattr(server_module, "REDIS_AVAILABLE", True)
+        monkeypatch.setattr(server_module, "_connect", connect)
+        monkeypatch.setattr(server_module, "_redis_client", None)
+        monkeypatch.setattr(server_module, "_redis_stream_client", None)
+        monkeypatch.setattr(server_module, "_rq_connection", None)
+        stream_a, stream_b, client_a, client_b = asyncio.run(first_calls())
+
+        assert len(created) == 2
+        assert client_a is client_b
+        assert stream_a is stream_b
+        assert stream_a is not client_a
+
+    def test_metrics_endpoint(self, client):
+        response = client.get("/metrics")
+        assert response.status_code == 200
+        assert response.headers["content-type"].startswith("text/plain")
+        assert "# TYPE juris_redis_call_seconds histogram" in response.text
 
 
 # =============================================================================
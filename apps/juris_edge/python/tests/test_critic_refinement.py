@@ -17,6 +17,7 @@ from juris_agi.cre.refinement import (
     RefinementResult,
     EditType,
     EditOperation,
+    score_program,
 )
 
 
@@ -390,6 +391,85 @@ class TestRefinementEngine:
         assert result.original_program is not None
 
 
+class TestRefinementScoring:
+    """Tests for cheap edit scoring, caching and parallel refinement."""
+
+    PROGRAMS = [
+        PrimitiveNode("identity"),
+        PrimitiveNode("rotate90", [LiteralNode(1)]),
+        PrimitiveNode("rotate90", [LiteralNode(3)]),
+        ComposeNode([PrimitiveNode("reflect_h"), PrimitiveNode("transpose")]),
+        PrimitiveNode("scale", [LiteralNode(2)]),
+        PrimitiveNode("no_such_primitive"),
+    ]
+
+    @pytest.mark.parametrize("program", PROGRAMS)
+    def test_score_matches_critic(self, program):
+        """score_program agrees with a full critique."""
+        engine = RefinementEngine()
+        for task in (create_identity_task(), create_rotate_task()):
+            critique = SymbolicCritic().evaluate(program, task)
+            assert score_program(program, task) == (
+                critique.is_certified, engine._compute_score(critique)
+            )
+
+    def test_repeated_programs_scored_once(self):
+        """Programs scored in one refine call are not scored again."""
+        task = create_rotate_task()
+        engine = RefinementEngine(max_iterations=30)
+
+        result = engine.refine(PrimitiveNode("reflect_v"), task)
+
+        assert result.candidates_scored == len(engine._scores)
+
+    def test_scores_cached_across_calls(self):
+        """Refining near-misses of the same task reuses earlier scores."""
+        task = create_rotate_task()
+        engine = RefinementEngine()
+
+        first = engine.refine(PrimitiveNode("reflect_v"), task)
+        second = engine.refine(PrimitiveNode("reflect_v"), task)
+
+        assert second.refined_program == first.refined_program
+        assert engine.cache_hits >= second.candidates_scored
+
+        engine.refine(PrimitiveNode("reflect_v"), create_identity_task())
+        assert engine._score_task is not task
+
+    def test_time_budget(self):
+        """An exhausted budget stops refinement before any edits are scored."""
+        engine = RefinementEngine(time_budget=0.0)
+
+        result = engine.refine(PrimitiveNode("reflect_v"), create_rotate_task())
+
+        assert result.iterations == 0
+        assert result.candidates_scored == 0
+        assert not result.success
+
+    def test_time_budget_per_call(self):
+        """A per-call budget applies to that call only."""
+        engine = RefinementEngine()
+
+        limited = engine.refine(PrimitiveNode("reflect_v"), create_rotate_task(), time_budget=0.0)
+        unlimited = engine.refine(PrimitiveNode("reflect_v"), create_rotate_task())
+
+        assert limited.iterations == 0
+        assert engine.time_budget is None
+        assert unlimited.success
+
+    def test_workers_match_in_process(self):
+        """Scoring edits on a worker pool finds the same refinement."""
+        task = create_rotate_task()
+        program = ComposeNode([PrimitiveNode("reflect_h"), PrimitiveNode("reflect_v")])
+
+        serial = RefinementEngine().refine(program, task)
+        parallel = RefinementEngine(max_workers=2, min_parallel_batch=1).refine(program, task)
+
+        assert parallel.refined_program == serial.refined_program
+        assert parallel.new_score == serial.new_score
+        assert parallel.iterations == serial.iterations
+
+
 class TestEditOperation:
     """Tests for edit operations."""
 
@@ -9,9 +9,19 @@ from juris_agi.dsl.ast import (
     ComposeNode,
     LiteralNode,
     LambdaNode,
+    ApplyNode,
+    LetNode,
     VariableNode,
 )
-from juris_agi.dsl.interpreter import DSLInterpreter, make_program, run_on_grid
+from juris_agi.dsl.compiler import ProgramCache, compile_program
+from juris_agi.dsl.interpreter import (
+    DSLInterpreter,
+    InterpreterError,
+    interpret,
+    make_program,
+    run_on_grid,
+)
+from juris_agi.dsl.memo import PrimitiveMemo
 from juris_agi.dsl.primitives import (
     prim_identity,
     prim_rotate90,
@@ -312,6 +322,226 @@ class TestInterpreter:
         assert result1 == result2
 
 
+class TestFrozenGrid:
+    """Test the immutable hashed grid."""
+
+    def test_immutable(self):
+        """Writes to a frozen grid should fail."""
+        frozen = Grid.from_list([[1, 2], [3, 4]]).freeze()
+
+        with pytest.raises(TypeError):
+            frozen[0, 0] = 5
+        with pytest.raises(ValueError):
+            frozen.data[0, 0] = 5
+        with pytest.raises(AttributeError):
+            frozen.data = np.zeros((2, 2), dtype=np.int32)
+
+    def test_freeze_copies(self):
+        """Freezing should not affect the original grid."""
+        grid = Grid.from_list([[1, 2], [3, 4]])
+        frozen = grid.freeze()
+        grid[0, 0] = 9
+
+        assert frozen.data[0, 0] == 1
+        assert frozen.freeze() is frozen
+
+    def test_content_hash(self):
+        """Equal content hashes equal; shape is part of the hash."""
+        a = Grid.from_list([[1, 2, 3, 4]]).freeze()
+        b = Grid.from_list([[1, 2, 3, 4]]).freeze()
+        c = Grid.from_list([[1, 2], [3, 4]]).freeze()
+
+        assert a == b and hash(a) == hash(b)
+        assert a != c
+        assert a == Grid.from_list([[1, 2, 3, 4]])
+
+    def test_copy_is_mutable(self):
+        """copy() of a frozen grid is a regular grid."""
+        copy = Grid.from_list([[1]]).freeze().copy()
+        copy[0, 0] = 2
+
+        assert type(copy) is Grid
+        assert copy.data[0, 0] == 2
+
+
+class TestPrimitiveMemo:
+    """Test primitive result memoization."""
+
+    def test_repeated_calls_hit(self):
+        """The same primitive on an equal grid should be served from the cache."""
+        memo = PrimitiveMemo()
+        interpreter = DSLInterpreter(memo=memo)
+        ast = ComposeNode([PrimitiveNode("reflect_h"), PrimitiveNode("rotate90", [LiteralNode(1)])])
+        program = interpreter.create_program_function(ast)
+
+        first = program(Grid.from_list([[1, 2], [3, 4]]))
+        second = program(Grid.from_list([[1, 2], [3, 4]]))
+
+        assert first == second
+        assert memo.hits == 2
+        assert memo.misses == 2
+        assert memo.hit_rate == 0.5
+        assert memo.stats()["by_primitive"]["reflect_h"] == {
+            "hits": 1, "misses": 1, "hit_rate": 0.5,
+        }
+
+    def test_results_are_isolated(self):
+        """Mutating a program result or input must not corrupt the cache."""
+        memo = PrimitiveMemo()
+        program = DSLInterpreter(memo=memo).create_program_function(PrimitiveNode("transpose"))
+        grid = Grid.from_list([[1, 2], [3, 4]])
+
+        result = program(grid)
+        result[0, 0] = 9
+        grid[0, 1] = 7
+
+        assert program(Grid.from_list([[1, 2], [3, 4]])) == Grid.from_list([[1, 3], [2, 4]])
+        assert memo.hits == 1
+
+    def test_interpret_returns_writable_grid(self):
+        """interpret() should not hand out memoized grids."""
+        env = {"input": Grid.from_list([[1, 2], [3, 4]]).freeze()}
+        interpret(PrimitiveNode("transpose"), env)
+
+        result = interpret(PrimitiveNode("transpose"), env)
+        result[0, 0] = 9
+
+        assert interpret(PrimitiveNode("transpose"), env) == Grid.from_list([[1, 3], [2, 4]])
+
+    def test_argument_types_distinguished(self):
+        """Literal arguments are keyed by type as well as value."""
+        memo = PrimitiveMemo()
+        spec = PRIMITIVES["rotate90"]
+        grid = Grid.from_list([[1, 2]])
+
+        memo.call(spec, [grid, 1])
+        memo.call(spec, [grid, True])
+
+        assert memo.misses == 2
+
+    def test_lru_eviction(self):
+        """The cache should stay within maxsize, evicting least recent entries."""
+        memo = PrimitiveMemo(maxsize=2)
+        spec = PRIMITIVES["rotate90"]
+        grid = Grid.from_list([[1, 2]])
+
+        for n in (1, 2, 1, 3):
+            memo.call(spec, [grid, n])
+        memo.call(spec, [grid, 1])
+
+        assert memo.stats()["size"] == 2
+        assert memo.evictions == 1
+        assert memo.hits == 2
+
+    def test_disabled(self):
+        """A disabled memo or interpreter bypasses the cache."""
+        memo = PrimitiveMemo(enabled=False)
+        program = DSLInterpreter(memo=memo).create_program_function(PrimitiveNode("identity"))
+        program(Grid.from_list([[1]]))
+        program(Grid.from_list([[1]]))
+        assert memo.hits == memo.misses == 0
+
+        assert DSLInterpreter(memoize=False).memo is None
+
+
+def _outcome(fn, *args):
+    """Result or (error type, message) of a call, for parity checks."""
+    try:
+        return fn(*args)
+    except Exception as e:
+        return (type(e).__name__, str(e))
+
+
+class TestCompiler:
+    """Test that compiled programs match the interpreter."""
+
+    PROGRAMS = [
+        ComposeNode([PrimitiveNode("reflect_h"), PrimitiveNode("rotate90", [LiteralNode(3)])]),
+        ComposeNode([PrimitiveNode("crop_to_content"), PrimitiveNode("scale", [LiteralNode(2)])]),
+        PrimitiveNode("recolor", [LiteralNode(1), LiteralNode(5)]),
+        LetNode("k", LiteralNode(2), PrimitiveNode("rotate90", [VariableNode("k")])),
+        ApplyNode(
+            LambdaNode([("g", None)], PrimitiveNode("transpose", [VariableNode("g")])),
+            [VariableNode("input")],
+        ),
+        ComposeNode([LambdaNode([("g", None)], PrimitiveNode("reflect_v", [VariableNode("g")]))]),
+        # Error cases
+        PrimitiveNode("no_such_primitive"),
+        ComposeNode([PrimitiveNode("identity"), PrimitiveNode("no_such_primitive")]),
+        ComposeNode([]),
+        VariableNode("unbound"),
+        PrimitiveNode("count_colors"),
+        PrimitiveNode("rotate90", [LiteralNode("x")]),
+        ApplyNode(LambdaNode([("a", None), ("b", None)], VariableNode("a")), [LiteralNode(1)]),
+        ApplyNode(LiteralNode(1), []),
+        ComposeNode([LambdaNode([("a", None), ("b", None)], VariableNode("a"))]),
+    ]
+
+    @pytest.mark.parametrize("ast", PROGRAMS, ids=ast_to_source)
+    def test_matches_interpreter(self, ast):
+        """Compiled programs return the same grids and raise the same errors."""
+        grid = Grid.from_list([[0, 1, 2], [3, 0, 1]])
+        expected = _outcome(DSLInterpreter().create_program_function(ast), grid)
+        assert _outcome(compile_program(ast), grid) == expected
+        assert _outcome(make_program(ast), grid) == expected
+
+        env = {"input": grid}
+        assert (_outcome(compile_program(ast).evaluate, dict(env))
+                == _outcome(DSLInterpreter().interpret, ast, dict(env)))
+
+    def test_error_chaining(self):
+        """Primitive failures are wrapped with the original as the cause."""
+        program = compile_program(PrimitiveNode("rotate90", [LiteralNode("x")]))
+        with pytest.raises(InterpreterError) as excinfo:
+            program(Grid.from_list([[1]]))
+        assert isinstance(excinfo.value.__cause__, TypeError)
+
+    def test_cache_hits_by_source(self):
+        """Equal programs share one compiled program."""
+        cache = ProgramCache()
+        first = cache.get(ComposeNode([PrimitiveNode("reflect_h"), PrimitiveNode("transpose")]))
+        second = cache.get(ComposeNode([PrimitiveNode("reflect_h"), PrimitiveNode("transpose")]))
+
+        assert first is second
+        assert cache.hits == 1
+        assert cache.misses == 1
+
+    def test_cache_checks_structure(self):
+        """ASTs that print the same but differ structurally are not conflated."""
+        cache = ProgramCache()
+        primitive = PrimitiveNode("identity")
+        variable = VariableNode("identity")
+        assert ast_to_source(primitive) == ast_to_source(variable)
+
+        cache.get(primitive)
+        program = cache.get(variable)
+
+        assert cache.hits == 0
+        with pytest.raises(InterpreterError, match="Unbound variable"):
+            program(Grid.from_list([[1]]))
+
+    def test_cache_ignores_later_mutation(self):
+        """Editing an AST in place after compiling does not reuse the old program."""
+        cache = ProgramCache()
+        ast = PrimitiveNode("rotate90", [LiteralNode(1)])
+        cache.get(ast)
+        ast.args[0] = LiteralNode(2)
+
+        program = cache.get(ast)
+
+        grid = Grid.from_list([[1, 2]])
+        assert program(grid) == prim_rotate90(grid, 2)
+
+    def test_cache_lru_eviction(self):
+        """The cache stays within maxsize."""
+        cache = ProgramCache(maxsize=2)
+        for k in (1, 2, 3, 1):
+            cache.get(PrimitiveNode("rotate90", [LiteralNode(k)]))
+
+        assert cache.stats()["size"] == 2
+        assert cache.hits == 0
+
+
 class TestPrettyPrint:
     """Test AST pretty printing."""
 
@@ -1,9 +1,12 @@
 """End-to-end tests for the JURIS-AGI system."""
 
+import json
+
 import pytest
 
 from juris_agi.core.types import Grid, ARCTask, ARCPair
 from juris_agi.controller.router import MetaController, ControllerConfig
+from juris_agi.eval.run_arc import load_streamed_results, run_evaluation
 from juris_agi.controller.refusal import RefusalChecker
 from juris_agi.cre.critic_symbolic import SymbolicCritic
 from juris_agi.dsl.ast import PrimitiveNode, LiteralNode
@@ -159,6 +162,87 @@ class TestMetaController:
         assert result.audit_trace.program_source
         assert len(result.audit_trace.constraints_satisfied) > 0
 
+    def test_phase_summary_recorded(self, controller):
+        """Audit trace should carry the phase scheduler's summary."""
+        result = controller.solve(create_rotate90_task())
+
+        phases = result.audit_trace.phase_summary["phases"]
+        assert set(phases) == {"PRIORS", "SYNTHESIS", "REFINEMENT", "ROBUSTNESS"}
+        assert phases["SYNTHESIS"]["time_used"] > 0
+        assert result.audit_trace.phase_summary["current_phase"] is None
+
+    def test_solve_batch_parallel_matches_serial(self, controller):
+        """Parallel batch solving should give the same programs, in order."""
+        tasks = [create_identity_task(), create_rotate90_task(), create_crop_task()]
+        serial = MetaController(controller.config).solve_batch(tasks)
+        parallel = controller.solve_batch(tasks, max_workers=2)
+
+        assert [r.task_id for r in parallel] == [t.task_id for t in tasks]
+        assert [r.audit_trace.program_source for r in parallel] == \
+            [r.audit_trace.program_source for r in serial]
+        assert len(controller.memory_store.memories) == sum(r.success for r in parallel)
+
+
+class TestEvaluationRunner:
+    """Test the ARC evaluation runner."""
+
+    @pytest.fixture
+    def controller(self):
+        return MetaController(ControllerConfig(
+            max_synthesis_depth=3,
+            beam_width=30,
+            max_synthesis_iterations=200,
+            compute_robustness=False,
+        ))
+
+    @pytest.fixture
+    def tasks(self):
+        return [create_identity_task(), create_rotate90_task(), create_crop_task()]
+
+    def test_summary_reports_throughput(self, controller, tasks):
+        """Summary should include throughput, latency percentiles and phase times."""
+        summary = run_evaluation(tasks, controller, verbose=False)
+
+        assert summary["successes"] == 3
+        assert summary["tasks_per_second"] > 0
+        latency = summary["latency_seconds"]
+        assert 0 < latency["p50"] <= latency["p95"] <= latency["p99"] <= latency["max"]
+        assert summary["phase_time_seconds"]["SYNTHESIS"]["total"] > 0
+
+    def test_stream_resumes(self, controller, tasks, tmp_path):
+        """Tasks already in the results stream should be skipped."""
+        stream = tmp_path / "run.jsonl"
+        run_evaluation(tasks[:2], controller, verbose=False, stream_path=stream)
+        # Simulate a run killed mid-write
+        with open(stream, "a") as f:
+            f.write('{"task_id": "e2e_cr')
+
+        summary = run_evaluation(tasks, controller, verbose=False, stream_path=stream)
+
+        assert summary["resumed"] == 2
+        assert [r["task_id"] for r in summary["results"]] == [t.task_id for t in tasks]
+        assert set(load_streamed_results(stream)) == {t.task_id for t in tasks}
+
+    def test_timeout_recorded(self, controller, tasks):
+        """A task past its timeout should be recorded, not abort the run."""
+        summary = run_evaluation(tasks, controller, verbose=False, task_timeout=1e-6)
+
+        assert summary["timeouts"] == 3
+        assert all(r["timed_out"] and not r["success"] for r in summary["results"])
+
+    def test_parallel_matches_serial(self, controller, tasks, tmp_path):
+        """Worker processes should produce the same results as the serial run."""
+        stream = tmp_path / "run.jsonl"
+        serial = run_evaluation(tasks, controller, verbose=False)
+        parallel = run_evaluation(
+            tasks, controller, verbose=False, workers=2, task_timeout=30, stream_path=stream,
+        )
+
+        assert [r["program"] for r in parallel["results"]] == \
+            [r["program"] for r in serial["results"]]
+        assert len(stream.read_text().splitlines()) == 3
+        assert all(json.loads(line)["phase_times"] for line in stream.read_text().splitlines())
+
 
 class TestSymbolicCritic:
     """Test the symbolic critic (jurisdiction)."""
@@ -1,5 +1,6 @@
 """Tests for local PoC configuration and server."""
 
+import json
 import os
 import pytest
 from unittest.mock import patch
@@ -134,3 +135,108 @@ class TestIsLocalPoCMode:
         """Test explicit LOCAL_POC=false."""
         with patch.dict(os.environ, {"LOCAL_POC": "false"}, clear=False):
             assert is_local_poc_mode() is False
+
+
+class FakeRedis:
+    """Just enough of a Redis client for RedisJobStore: hashes, streams, pipelines."""
+
+    def __init__(self):
+        self.hashes = {}
+        self.streams = {}
+
+    def pipeline(self):
+        return FakePipeline(self)
+
+    def delete(self, *keys):
+        for key in keys:
+            self.hashes.pop(key, None)
+            self.streams.pop(key, None)
+
+    def hset(self, key, mapping):
+        self.hashes.setdefault(key, {}).update(mapping)
+
+    def hgetall(self, key):
+        return dict(self.hashes.get(key, {}))
+
+    def hmget(self, key, fields):
+        values = self.hashes.get(key, {})
+        return [values.get(name) for name in fields]
+
+    def exists(self, key):
+        return int(key in self.hashes)
+
+    def expire(self, key, seconds):
+        return True
+
+    def xadd(self, key, values, maxlen=None, approximate=True):
+        stream = self.streams.setdefault(key, [])
+        stream.append((f"{len(stream) + 1}-0", values))
+        return stream[-1][0]
+
+
+class FakePipeline:
+    def __init__(self, client):
+        self.client = client
+        self.calls = []
+
+    def __getattr__(self, name):
+        method = getattr(self.client, name)
+        return lambda *args, **kwargs: self.calls.append((method, args, kwargs))
+
+    def execute(self):
+        return [method(*args, **kwargs) for method, args, kwargs in self.calls]
+
+
+class TestLocalServerAsyncMode:
+    """Queued jobs go through the same job hashes the worker reads."""
+
+    def test_queued_job_runs_on_worker(self, tmp_path, monkeypatch):
+        from fastapi.testclient import TestClient
+
+        import juris_agi.api.local_server as local_server
+        from juris_agi.api.config import WorkerConfig
+        from juris_agi.api.job_store import JOB_PREFIX, RedisJobStore
+        from juris_agi.api.worker import JurisWorker
+        from juris_agi.core.storage import StorageClient, StorageConfig
+
+        redis_client = FakeRedis()
+        enqueued = []
+
+        class FakeQueue:
+            def enqueue(self, func, job_id, **kwargs):
+                enqueued.append((func, job_id))
+
+        storage = StorageClient(StorageConfig(local_path=str(tmp_path / "storage")))
+        config = LocalPoCConfig(sync_mode=False, redis_enabled=True, runs_dir=str(tmp_path / "runs"))
+        monkeypatch.setattr(local_server, "get_local_config", lambda: config)
+        monkeypatch.setattr(local_server, "_redis_client", redis_client)
+        monkeypatch.setattr(local_server, "_job_queue", FakeQueue())
+        monkeypatch.setattr(local_server, "_storage_client", storage)
+
+        client = TestClient(local_server.app)
+        response = client.post("/solve", json={
+            "task": {
+                "train": [
+                    {"input": {"data": [[1, 2], [3, 4]]}, "output": {"data": [[3, 1], [4, 2]]}},
+                    {"input": {"data": [[5, 6], [7, 8]]}, "output": {"data": [[7, 5], [8, 6]]}},
+                ],
+                "test": [{"input": {"data": [[1, 0], [0, 2]]}}],
+            },
+        })
+        assert response.status_code == 200
+        job_id = response.json()["job_id"]
+        assert enqueued == [("juris_agi.api.worker.process_job", job_id)]
+        assert client.get(f"/jobs/{job_id}").json()["status"] == "pending"
+
+        worker = JurisWorker(WorkerConfig())
+        worker.jobs = RedisJobStore(redis_client, JOB_PREFIX)
+        worker.storage_client = storage
+        worker.process_job(job_id)
+
+        result = client.get(f"/jobs/{job_id}").json()
+        assert result["status"] == "completed"
+        assert result["success"] is True
+        assert result["predictions"][0]["prediction"]["data"] == [[0, 1], [2, 0]]
+        events = [json.loads(v["event"])["event_type"] for _, v in redis_client.streams[f"{JOB_PREFIX}{job_id}:events"]]
+        assert events[0] == "job_queued"
+        assert events[-1] == "job_completed"
@@ -9,12 +9,25 @@ from juris_agi.core.types import Grid, ARCTask, ARCPair
 from juris_agi.core.trace import (
     SolveTrace,
     TraceEntry,
+    TraceWriter,
     JSONLTraceWriter,
     JSONLTraceReader,
     create_trace_from_task,
 )
+from juris_agi.core.trace_index import (
+    ZSTD_AVAILABLE,
+    TraceIndexEntry,
+    encode_trace,
+    iter_entries,
+    load_index,
+)
+from juris_agi.core.trace_spool import TraceLevel, TracePolicy
 from juris_agi.mal.retrieval import (
+    InMemoryStore,
+    PersistentMemoryStore,
+    SolutionMemory,
     MacroStore,
+    SQLiteMacroStore,
     StoredMacro,
     extract_task_tags,
     retrieve_macros,
@@ -70,6 +83,13 @@ def temp_macro_file():
     Path(f.name).unlink(missing_ok=True)
 
 
+@pytest.fixture
+def temp_macro_db():
+    """Create a temporary path for SQLite macro storage."""
+    with tempfile.TemporaryDirectory() as tmpdir:
+        yield str(Path(tmpdir) / "macros.db")
+
+
 # ============================================================================
 # Trace Tests
 # ============================================================================
@@ -114,6 +134,49 @@ class TestSolveTrace:
         assert d["success"] is True
         assert len(d["entries"]) == 1
 
+    def test_policy_filters_and_samples(self):
+        """Debug events should be dropped at INFO and sampled at DEBUG."""
+        trace = SolveTrace.start("policy_task", policy=TracePolicy())
+        for i in range(5):
+            trace.log("candidate_scored", "cre", score=i)
+        trace.log("synthesis", "cre")
+        assert [e.event_type for e in trace.entries] == ["synthesis"]
+        assert trace.to_dict()["dropped_events"] == {"candidate_scored": 5}
+
+        policy = TracePolicy(verbosity=TraceLevel.DEBUG, sample_every={"candidate_scored": 2})
+        trace = SolveTrace.start("policy_task", policy=policy)
+        for i in range(5):
+            trace.log("candidate_scored", "cre", score=i)
+        assert [e.details["score"] for e in trace.entries] == [0, 2, 4]
+        assert trace.dropped_events == {"candidate_scored": 2}
+
+    def test_spooled_entries(self, temp_trace_dir):
+        """Spooled traces should keep entries on disk and serialize identically."""
+        writer = JSONLTraceWriter(temp_trace_dir)
+        spooled = writer.start_trace("spool_task", buffer_entries=4)
+        in_memory = SolveTrace.start("spool_task", policy=TracePolicy())
+        for trace in (spooled, in_memory):
+            trace.start_time = "2024-01-01T00:00:00"
+            for i in range(10):
+                trace.add_entry(TraceEntry("t", "evaluation", "cre", {"score": i, "data": [i]}))
+            trace.finalize(success=True, program="identity")
+        in_memory.end_time = spooled.end_time
+        spool_path = spooled.spool.path
+
+        assert spooled.entries == []
+        assert spooled.entry_count == 10
+        assert len(spool_path.read_bytes().splitlines()) == 8  # Two still buffered
+        assert spooled.to_dict() == in_memory.to_dict()
+        assert b"".join(spooled.iter_encoded()) == encode_trace(in_memory.to_dict())
+
+        path = writer.write_trace(spooled, session_id="spool")
+        reader = JSONLTraceReader(temp_trace_dir)
+        assert reader.read_traces(path) == [in_memory.to_dict()]
+        assert [e.task_id for e in reader.index(path)] == ["spool_task"]
+
+        spooled.close()
+        assert not spool_path.exists()
+
 
 class TestJSONLTraceWriter:
     """Tests for JSONL trace writer."""
@@ -159,6 +222,38 @@ class TestJSONLTraceWriter:
                 assert "task_id" in data
 
 
+class TestTraceWriter:
+    """Tests for the per-trace JSON writer."""
+
+    @pytest.mark.parametrize("compress", [False, True])
+    def test_write_and_read(self, temp_trace_dir, compress):
+        """Written traces should load back, compact or gzip-compressed."""
+        writer = TraceWriter(temp_trace_dir, compress=compress)
+        trace = writer.start_trace("writer_task")
+        trace.log("synthesis", "cre", program="identity")
+        trace.finalize(success=True, program="identity")
+
+        path = writer.write(trace)
+        trace.close()
+
+        assert path.name.endswith(".json.gz" if compress else ".json")
+        loaded = TraceWriter.read(path)
+        assert loaded["task_id"] == "writer_task"
+        assert [e["event_type"] for e in loaded["entries"]] == ["synthesis"]
+
+    def test_indented_by_default(self, temp_trace_dir):
+        """Traces should be pretty-printed unless indent=None asks for compact JSON."""
+        trace = SolveTrace.start("layout_task")
+        trace.log("synthesis", "cre", program="identity")
+        trace.finalize(success=True, program="identity")
+
+        indented = TraceWriter(Path(temp_trace_dir) / "indented").write(trace)
+        compact = TraceWriter(Path(temp_trace_dir) / "compact", indent=None).write(trace)
+
+        assert indented.read_text() == json.dumps(trace.to_dict(), indent=2)
+        assert compact.read_bytes() == encode_trace(trace.to_dict())
+
+
 class TestJSONLTraceReader:
     """Tests for JSONL trace reader."""
 
@@ -222,6 +317,116 @@ class TestJSONLTraceReader:
         assert len(programs) == 1
         assert programs[0]["program"] == "rotate90(1)"
 
+    def test_query_filters(self, temp_trace_dir):
+        """query should filter on indexed fields."""
+        writer = JSONLTraceWriter(temp_trace_dir)
+        for i in range(9):
+            trace = SolveTrace.start(f"query_task_{i % 3}")
+            trace.finalize(success=(i % 2 == 0), program=f"p{i}")
+            writer.write_trace(trace, session_id="query_test")
+
+        reader = JSONLTraceReader(temp_trace_dir)
+        by_task = list(reader.query(task_id="query_task_1"))
+        successful = list(reader.query(task_id="query_task_1", success=True))
+
+        assert [t["final_program"] for t in by_task] == ["p1", "p4", "p7"]
+        assert [t["final_program"] for t in successful] == ["p4"]
+        assert len(list(reader.query(success=False, limit=2))) == 2
+
+    def test_index_catches_up_with_unindexed_lines(self, temp_trace_dir):
+        """Lines written without an index row should be indexed on read."""
+        writer = JSONLTraceWriter(temp_trace_dir)
+        trace = SolveTrace.start("indexed")
+        trace.finalize(success=True, program="identity")
+        path = writer.write_trace(trace, session_id="legacy")
+
+        legacy = SolveTrace.start("unindexed")
+        legacy.finalize(success=True, program="transpose")
+        with open(path, "a") as f:
+            f.write(json.dumps(legacy.to_dict()) + "\n")
+            f.write('{"task_id": "torn')  # Still being written
+
+        reader = JSONLTraceReader(temp_trace_dir)
+        programs = [p["program"] for p in reader.get_successful_programs()]
+
+        assert programs == ["identity", "transpose"]
+        assert len(reader.index(path)) == 2
+        assert len(Path(str(path) + ".idx").read_text().splitlines()) == 2
+
+    def test_index_gap_and_duplicates_rebuilt(self, temp_trace_dir):
+        """Rows that do not chain should trigger a full rescan."""
+        writer = JSONLTraceWriter(temp_trace_dir)
+        path = None
+        for name in ("first", "second", "third"):
+            trace = SolveTrace.start(name)
+            trace.finalize(success=True, program=name)
+            path = writer.write_trace(trace, session_id="gap")
+        idx = Path(str(path) + ".idx")
+        first, second, third = idx.read_text().splitlines()
+
+        # Crash between the trace and index appends, then more writes
+        idx.write_text(f"{first}\n{third}\n")
+        reader = JSONLTraceReader(temp_trace_dir)
+        assert [t["task_id"] for t in reader.read_all_traces()] == ["first", "second", "third"]
+        assert idx.read_text().splitlines() == [first, second, third]
+
+        # Racing writers appending the same row twice, out of order
+        idx.write_text(f"{first}\n{third}\n{second}\n{third}\n")
+        assert [e.task_id for e in reader.index(path)] == ["first", "second", "third"]
+        assert idx.read_text().splitlines() == [first, second, third]
+
+    @pytest.mark.skipif(ZSTD_AVAILABLE, reason="zstandard is installed")
+    def test_compressed_segment_requires_zstandard(self, temp_trace_dir):
+        """Reading a compressed segment without zstandard should say so."""
+        segment = Path(temp_trace_dir) / "traces_zst.jsonl.zst"
+        segment.write_bytes(b"\x28\xb5\x2f\xfd")
+
+        with pytest.raises(RuntimeError, match="zstandard is required"):
+            load_index(segment)
+        entry = TraceIndexEntry(0, 1, "t", True, None, None, frame_offset=0, frame_length=4)
+        with pytest.raises(RuntimeError, match="zstandard is required"):
+            list(iter_entries(segment, [entry]))
+
+    def test_read_since_cursor(self, temp_trace_dir):
+        """read_since should return only traces written after the cursor."""
+        writer = JSONLTraceWriter(temp_trace_dir)
+        reader = JSONLTraceReader(temp_trace_dir)
+        for i in range(3):
+            trace = SolveTrace.start(f"cursor_task_{i}")
+            trace.finalize(success=True)
+            writer.write_trace(trace, session_id="s1")
+
+        first, cursor = reader.read_since()
+        trace = SolveTrace.start("cursor_task_3")
+        trace.finalize(success=True)
+        writer.write_trace(trace, session_id="s1")
+        writer.write_trace(SolveTrace.start("cursor_task_4"), session_id="s2")
+
+        second, cursor = reader.read_since(cursor)
+        third, _ = reader.read_since(cursor)
+
+        assert len(first) == 3
+        assert [t["task_id"] for t in second] == ["cursor_task_3", "cursor_task_4"]
+        assert third == []
+
+    @pytest.mark.skipif(not ZSTD_AVAILABLE, reason="zstandard not available")
+    def test_compressed_segment(self, temp_trace_dir):
+        """Compressed segments should read like plain files and keep cursors valid."""
+        writer = JSONLTraceWriter(temp_trace_dir)
+        reader = JSONLTraceReader(temp_trace_dir)
+        for i in range(10):
+            trace = SolveTrace.start(f"zst_task_{i % 3}")
+            trace.finalize(success=(i % 2 == 0), program=f"p{i}")
+            writer.write_trace(trace, session_id="zst")
+        expected, cursor = reader.read_since()
+
+        segment = writer.compress_session("zst", frame_traces=4)
+
+        assert segment.name == "traces_zst.jsonl.zst"
+        assert reader.read_all_traces() == expected
+        assert [t["final_program"] for t in reader.query(task_id="zst_task_1")] == ["p1", "p4", "p7"]
+        assert reader.read_since(cursor)[0] == []
+
 
 class TestCreateTraceFromTask:
     """Tests for trace creation from task."""
@@ -236,6 +441,138 @@ class TestCreateTraceFromTask:
         assert trace.entries[0].details["num_train_pairs"] == 2
 
 
+# ============================================================================
+# Solution Memory Tests
+# ============================================================================
+
+def _make_memory(task_id, features, success=True, program_source="identity"):
+    return SolutionMemory(
+        task_id=task_id,
+        program=None,
+        program_source=program_source,
+        task_features=features,
+        success=success,
+    )
+
+
+def _linear_retrieve(store, task, top_k):
+    """Reference ranking: score every memory with _compute_similarity."""
+    query = store._extract_features(task)
+    scored = []
+    for memory in store.memories.values():
+        similarity = store._compute_similarity(query, memory.task_features)
+        relevance = similarity * (1.0 if memory.success else 0.5)
+        scored.append((memory.task_id, memory.program_source, similarity, relevance))
+    scored.sort(key=lambda r: r[3], reverse=True)
+    return scored[:top_k]
+
+
+def _ranking(results):
+    return [
+        (r.memory.task_id, r.memory.program_source, r.similarity, r.relevance_score)
+        for r in results
+    ]
+
+
+class TestSolutionMemoryStore:
+    """Tests for indexed solution-memory retrieval."""
+
+    def _populate(self, store):
+        import random
+
+        rng = random.Random(0)
+        for i in range(200):
+            def grid():
+                width = rng.randint(1, 3)
+                return Grid.from_list([
+                    [rng.randint(0, 2) for _ in range(width)]
+                    for _ in range(rng.randint(1, 3))
+                ])
+
+            task = ARCTask(
+                task_id=f"task_{i % 150}",
+                train=[ARCPair(input=grid(), output=grid()) for _ in range(rng.randint(1, 3))],
+                test=[],
+            )
+            features = store._extract_features(task)
+            if i % 20 == 0:
+                features["palette"] = [1, 2]  # Unhashable value
+            store.store(_make_memory(
+                task.task_id, features,
+                success=rng.random() < 0.7,
+                program_source=f"program_{i % 4}",
+            ))
+
+    def test_index_matches_linear_scan(self, sample_task):
+        """Indexed retrieval should rank exactly like scoring every memory."""
+        store = InMemoryStore()
+        self._populate(store)
+
+        for top_k in (1, 5, 40, 500):
+            assert _ranking(store.retrieve(sample_task, top_k)) == _linear_retrieve(
+                store, sample_task, top_k
+            )
+
+    def test_restore_replaces_memory(self, sample_task):
+        """Storing the same task and program again should replace the memory."""
+        store = InMemoryStore()
+        features = store._extract_features(sample_task)
+        store.store(_make_memory("t1", features, success=False))
+        store.store(_make_memory("t1", features, success=True))
+
+        results = store.retrieve(sample_task, top_k=5)
+        assert len(results) == 1
+        assert results[0].similarity == 1.0
+        assert results[0].relevance_score == 1.0
+
+    def test_empty_store(self, sample_task):
+        """Empty stores should return no results."""
+        assert InMemoryStore().retrieve(sample_task) == []
+
+    def test_persistence(self, sample_task, temp_trace_dir):
+        """Memories should survive reopening, loaded lazily from the log."""
+        store1 = PersistentMemoryStore(temp_trace_dir)
+        self._populate(store1)
+        expected = _ranking(store1.retrieve(sample_task, top_k=10))
+        store1.close()
+
+        store2 = PersistentMemoryStore(temp_trace_dir)
+        assert store2.memories == {}
+        assert _ranking(store2.retrieve(sample_task, top_k=10)) == expected
+        assert len(store2.memories) == 10
+
+    def test_replays_unflushed_log(self, sample_task, temp_trace_dir):
+        """Stores after the last snapshot should be replayed from the log."""
+        store1 = PersistentMemoryStore(temp_trace_dir)
+        self._populate(store1)
+        store1.close()
+
+        features = store1._extract_features(sample_task)
+        store1.store(_make_memory("late", features))
+        expected = _ranking(store1.retrieve(sample_task, top_k=5))
+
+        store2 = PersistentMemoryStore(temp_trace_dir)
+        assert _ranking(store2.retrieve(sample_task, top_k=5)) == expected
+        assert expected[0][0] == "late"
+
+        store2.store(_make_memory("after_reopen", features, program_source="other"))
+        store2.close()
+        store3 = PersistentMemoryStore(temp_trace_dir)
+        assert {r.memory.task_id for r in store3.retrieve(sample_task, top_k=2)} == {
+            "late", "after_reopen",
+        }
+
+    def test_clear(self, sample_task, temp_trace_dir):
+        """Clearing should remove memories from disk too."""
+        store = PersistentMemoryStore(temp_trace_dir)
+        self._populate(store)
+        store.close()
+        store.clear()
+
+        assert store.retrieve(sample_task) == []
+        assert PersistentMemoryStore(temp_trace_dir).retrieve(sample_task) == []
+
+
 # ============================================================================
 # MacroStore Tests
 # ============================================================================
@@ -322,6 +659,108 @@ class TestMacroStore:
         assert macro.usage_count == 3
         assert macro.success_count == 2
 
+    def test_zero_similarity_macros_fill_results(self, temp_macro_file):
+        """Macros without shared tags should follow matching ones, in order."""
+        store = MacroStore(temp_macro_file)
+        store.store_macro(StoredMacro(name="a", code="identity", tags=["x"]))
+        store.store_macro(StoredMacro(name="b", code="identity", tags=["rotation"]))
+        store.store_macro(StoredMacro(name="c", code="identity", tags=[]))
+        store.store_macro(StoredMacro(name="d", code="identity", tags=["y"]))
+
+        results = store.retrieve_by_tags(["rotation"], top_k=5)
+
+        assert [(m.name, score) for m, score in results] == [
+            ("b", 1.0), ("a", 0.0), ("d", 0.0),
+        ]
+
+    def test_replaced_macro_reindexed(self, temp_macro_file):
+        """Re-storing a macro should update its tags in the index."""
+        store = MacroStore(temp_macro_file)
+        store.store_macro(StoredMacro(name="m", code="identity", tags=["old"]))
+        store.store_macro(StoredMacro(name="m", code="identity", tags=["new"]))
+
+        assert store.retrieve_by_tags(["old"], top_k=1)[0][1] == 0.0
+        assert store.retrieve_by_tags(["new"], top_k=1)[0][1] == 1.0
+
+
+class TestSQLiteMacroStore:
+    """Tests for SQLite-backed macro storage."""
+
+    def _populate(self, store):
+        store.store_macro(StoredMacro(
+            name="macro1", code="rotate90(1)", tags=["rotation", "same_dims"],
+        ))
+        store.store_macro(StoredMacro(
+            name="macro2", code="scale(2)", tags=["scaling", "enlarging"],
+        ))
+        store.store_macro(StoredMacro(
+            name="macro3", code="reflect_h >> rotate90(1)",
+            tags=["rotation", "reflection", "same_dims"],
+        ))
+        store.store_macro(StoredMacro(name="macro4", code="identity", tags=[]))
+
+    def test_matches_json_store(self, temp_macro_file, temp_macro_db):
+        """Retrieval should rank exactly like the JSON store."""
+        json_store = MacroStore(temp_macro_file)
+        sqlite_store = SQLiteMacroStore(temp_macro_db)
+        for store in (json_store, sqlite_store):
+            self._populate(store)
+            store.record_usage("macro3", success=False)
+
+        for query in (["rotation", "same_dims"], ["enlarging"], ["unknown"]):
+            expected = [(m.name, s) for m, s in json_store.retrieve_by_tags(query, top_k=3)]
+            actual = [(m.name, s) for m, s in sqlite_store.retrieve_by_tags(query, top_k=3)]
+            assert actual == expected
+
+        sqlite_store.close()
+
+    def test_persistence(self, temp_macro_db):
+        """Macros and counters should persist across store instances."""
+        store1 = SQLiteMacroStore(temp_macro_db)
+        self._populate(store1)
+        store1.record_usage("macro1", success=True)
+        store1.close()
+
+        store2 = SQLiteMacroStore(temp_macro_db)
+        macro = store2.get_macro("macro1")
+
+        assert macro.code == "rotate90(1)"
+        assert macro.tags == ["rotation", "same_dims"]
+        assert macro.usage_count == 1
+        assert [m.name for m in store2.list_all()] == [
+            "macro1", "macro2", "macro3", "macro4",
+        ]
+        store2.close()
+
+    def test_concurrent_usage_updates(self, temp_macro_db):
+        """Usage recorded by separate stores should not overwrite each other."""
+        store1 = SQLiteMacroStore(temp_macro_db)
+        store2 = SQLiteMacroStore(temp_macro_db)
+        store1.store_macro(StoredMacro(name="shared", code="identity", tags=["t"]))
+
+        store1.record_usage("shared", success=True)
+        store2.record_usage("shared", success=False)
+        store1.record_usage("shared", success=True)
+
+        for store in (store1, store2):
+            macro = store.get_macro("shared")
+            assert macro.usage_count == 3
+            assert macro.success_count == 2
+        assert store2.retrieve_by_tags(["t"])[0][0].name == "shared"
+
+        store1.close()
+        store2.close()
+
+    def test_clear(self, temp_macro_db):
+        """Clearing should remove all macros and tags."""
+        store = SQLiteMacroStore(temp_macro_db)
+        self._populate(store)
+        store.clear()
+
+        assert store.list_all() == []
+        assert store.retrieve_by_tags(["rotation"]) == []
+        store.close()
+
 
 class TestExtractTaskTags:
     """Tests for task tag extraction."""
@@ -434,6 +873,73 @@ class TestMacroInducer:
         assert len(reflect_candidates) > 0
         assert reflect_candidates[0].frequency == 5
 
+    def test_subprogram_windows(self):
+        """Windows and primitive calls should be counted per occurrence."""
+        inducer = MacroInducer(min_frequency=1, max_length=2)
+        inducer.process_trace({
+            "success": True,
+            "task_id": "windows",
+            "final_program": "rotate90(1) >> reflect_h >> recolor(1, 2)",
+            "entries": [],
+        })
+
+        frequencies = {c.code: c.frequency for c in inducer.extract_candidates()}
+
+        assert frequencies == {
+            "rotate90(1) >> reflect_h >> recolor(1, 2)": 1,
+            "rotate90(1)": 2,
+            "reflect_h": 1,
+            "recolor(1, 2)": 2,
+            "rotate90(1) >> reflect_h": 1,
+            "reflect_h >> recolor(1, 2)": 1,
+        }
+
+    def test_state_round_trip(self, temp_trace_dir):
+        """Saved statistics should continue exactly where they stopped."""
+        traces = [
+            {"success": True, "task_id": f"task_{i % 4}",
+             "final_program": ["reflect_h >> transpose", "rotate90(1) >> reflect_h"][i % 2],
+             "entries": [], "final_metrics": {"exact_match": i % 3 == 0}}
+            for i in range(10)
+        ]
+        state_path = str(Path(temp_trace_dir) / "induction.json")
+
+        expected = MacroInducer()
+        expected.process_traces(traces)
+        first = MacroInducer(state_path=state_path)
+        first.process_traces(traces[:6])
+        first.save()
+        resumed = MacroInducer(state_path=state_path)
+        resumed.process_traces(traces[6:])
+
+        assert resumed.extract_candidates() == expected.extract_candidates()
+        with pytest.raises(ValueError):
+            MacroInducer(state_path=state_path, max_length=2)
+
+    def test_process_new_traces(self, temp_trace_dir):
+        """Only traces written since the last run should be processed."""
+        writer = JSONLTraceWriter(temp_trace_dir)
+        reader = JSONLTraceReader(temp_trace_dir)
+        state_path = str(Path(temp_trace_dir) / "induction.json")
+        for i in range(3):
+            trace = SolveTrace.start(f"new_task_{i}")
+            trace.finalize(success=True, program="reflect_h >> transpose")
+            writer.write_trace(trace, session_id="induction")
+
+        inducer = MacroInducer(state_path=state_path)
+        assert inducer.process_new_traces(reader) == 3
+        inducer.save()
+
+        trace = SolveTrace.start("new_task_3")
+        trace.finalize(success=True, program="reflect_h >> transpose")
+        writer.write_trace(trace, session_id="induction")
+        resumed = MacroInducer(state_path=state_path)
+
+        assert resumed.process_new_traces(reader) == 1
+        assert resumed.process_new_traces(reader) == 0
+        full = [c for c in resumed.extract_candidates() if c.code == "reflect_h >> transpose"]
+        assert full[0].frequency == 8  # Full program and its length-2 window, 4 traces
+
 
 class TestExtractCandidateMacros:
     """Tests for convenience function."""
@@ -7,6 +7,7 @@ heuristic fallbacks (always available).
 
 import pytest
 import numpy as np
+from unittest.mock import patch
 
 from juris_agi.core.types import Grid, ARCTask, ARCPair
 from juris_agi.dsl.ast import PrimitiveNode, ComposeNode, LiteralNode
@@ -381,6 +382,84 @@ class TestPyTorchModels:
         assert isinstance(sketches, list)
         assert len(sketches) >= 1
 
+    def test_sketcher_incremental_decoding_matches_forward(self, simple_task):
+        """Cached one-token decode steps should reproduce the full forward pass."""
+        import torch
+        from juris_agi.cre.sketcher_model import SOS_ID, NeuralSketcherImpl
+
+        config = SketcherConfig(embed_dim=32, num_heads=2, num_layers=2, hidden_dim=64)
+        sketcher = NeuralSketcherImpl(config=config)
+        model = sketcher.model.eval()
+        inputs = [sketcher._grid_to_tensor(p.input).unsqueeze(0) for p in simple_task.train]
+        outputs = [sketcher._grid_to_tensor(p.output).unsqueeze(0) for p in simple_task.train]
+        target = torch.tensor([[SOS_ID, 3, 7, 1, 5], [SOS_ID, 2, 2, 4, 0]])
+
+        with torch.no_grad():
+            full = model(
+                [g.repeat(2, 1, 1) for g in inputs], [g.repeat(2, 1, 1) for g in outputs], target,
+            )
+            caches = model._start_decoding(model.task_encoder(inputs, outputs).unsqueeze(1))
+            steps = [model._decode_step(target[:, i], i, caches) for i in range(target.shape[1])]
+
+        assert torch.allclose(torch.stack(steps, dim=1), full, atol=1e-5)
+
+    def test_sketcher_generate_pads_after_eos(self, simple_task):
+        """Sampled sequences should stop at EOS and pad the remainder."""
+        import torch
+        from juris_agi.cre.sketcher_model import EOS_ID, PAD_ID, NeuralSketcherImpl
+
+        config = SketcherConfig(embed_dim=32, num_heads=2, num_layers=1, hidden_dim=64)
+        sketcher = NeuralSketcherImpl(config=config)
+        sketcher.model.output_proj.bias.data[EOS_ID] = 3.0
+        inputs = [sketcher._grid_to_tensor(p.input).unsqueeze(0) for p in simple_task.train]
+        outputs = [sketcher._grid_to_tensor(p.output).unsqueeze(0) for p in simple_task.train]
+
+        torch.manual_seed(0)
+        sequences, log_probs = sketcher.model.generate(inputs, outputs, num_samples=16)
+
+        assert sequences.shape[0] == log_probs.shape[0] == 16
+        assert sequences.shape[1] <= config.max_seq_len
+        assert (log_probs <= 0).all()
+        for seq in sequences.tolist():
+            if EOS_ID in seq:
+                assert all(t == PAD_ID for t in seq[seq.index(EOS_ID) + 1:])
+
+    def test_sketcher_beam_search(self, simple_task):
+        """Beam search should return distinct best-first sequences with exact scores."""
+        import torch
+        import torch.nn.functional as F
+        from juris_agi.cre.sketcher_model import EOS_ID, PAD_ID, SOS_ID, NeuralSketcherImpl
+
+        config = SketcherConfig(embed_dim=32, num_heads=2, num_layers=1, hidden_dim=64, max_seq_len=4)
+        sketcher = NeuralSketcherImpl(config=config)
+        sketcher.model.output_proj.bias.data[EOS_ID] = 2.0
+        inputs = [sketcher._grid_to_tensor(p.input).unsqueeze(0) for p in simple_task.train]
+        outputs = [sketcher._grid_to_tensor(p.output).unsqueeze(0) for p in simple_task.train]
+
+        sequences, log_probs = sketcher.model.beam_search(inputs, outputs, beam_width=5)
+
+        assert len(sequences) == 5
+        assert log_probs.tolist() == sorted(log_probs.tolist(), reverse=True)
+        decoded = [tuple(t for t in seq.tolist() if t != PAD_ID) for seq in sequences]
+        assert len(set(decoded)) == 5
+        for tokens, log_prob in zip(decoded, log_probs):
+            assert tokens[0] != EOS_ID
+            with torch.no_grad():
+                logits = sketcher.model(inputs, outputs, torch.tensor([(SOS_ID,) + tokens[:-1]]))
+            expected = F.log_softmax(logits[0], dim=-1).gather(1, torch.tensor(tokens).unsqueeze(1)).sum()
+            assert float(log_prob) == pytest.approx(float(expected), abs=1e-4)
+
+    def test_neural_sketcher_beam_sketches(self, simple_task):
+        """generate_sketches with beam_search should return distinct sketches."""
+        from juris_agi.cre.sketcher_model import NeuralSketcherImpl
+
+        config = SketcherConfig(embed_dim=32, num_heads=2, num_layers=1, hidden_dim=64)
+        sketcher = NeuralSketcherImpl(config=config)
+        sketches = sketcher.generate_sketches(simple_task, num_sketches=4, beam_search=True)
+
+        assert 1 <= len(sketches) <= 4
+        assert len({str(s.ast) for s in sketches}) == len(sketches)
+
     def test_neural_critic_can_be_created(self):
         """NeuralCriticImpl should be creatable."""
         from juris_agi.cre.critic_neural import NeuralCriticImpl
@@ -426,6 +505,51 @@ class TestPyTorchModels:
         assert len(scores) == 2
         assert all(isinstance(s, NeuralCriticScore) for s in scores)
 
+    def test_neural_critic_caches_task_context(self, simple_program, complex_program, simple_task):
+        """The task context should be encoded once and reused."""
+        from juris_agi.cre.critic_neural import NeuralCriticImpl
+
+        config = CriticConfig(embed_dim=32, num_heads=2, num_layers=1, hidden_dim=64)
+        critic = NeuralCriticImpl(config=config, device="cpu")
+        batch = critic.score_batch([simple_program, complex_program], simple_task)
+        single = critic.score(complex_program, simple_task)
+
+        assert len(critic._context_cache) == 1
+        assert single.overall == pytest.approx(batch[1].overall, abs=1e-6)
+
+        critic.clear_cache()
+        assert not critic._context_cache
+
+    def test_neural_critic_quantized(self, simple_program, complex_program, simple_task, tmp_path):
+        """Int8 quantization should stay close to the float model."""
+        import torch
+        from juris_agi.cre.critic_neural import NeuralCriticImpl
+
+        config = CriticConfig(embed_dim=32, num_heads=2, num_layers=1, hidden_dim=64)
+        float_critic = NeuralCriticImpl(config=config, device="cpu")
+        weights = tmp_path / "critic.pt"
+        torch.save(float_critic.model.state_dict(), weights)
+        quantized = NeuralCriticImpl(
+            config=config, model_path=str(weights), device="cpu", quantize=True,
+        )
+
+        programs = [simple_program, complex_program]
+        for f, q in zip(float_critic.score_batch(programs, simple_task),
+                        quantized.score_batch(programs, simple_task)):
+            assert q.overall == pytest.approx(f.overall, abs=0.02)
+
+    def test_program_encoder_padding(self, simple_program, complex_program):
+        """tokenize should pad to the longest program and mask the rest."""
+        from juris_agi.cre.critic_neural import ProgramEncoder
+
+        encoder = ProgramEncoder(CriticConfig(embed_dim=32, num_heads=2, num_layers=1, hidden_dim=64))
+        tokens, mask = encoder.tokenize([simple_program, complex_program])
+        lengths = [len(encoder._ast_to_token_ids(p)) for p in (simple_program, complex_program)]
+
+        assert tokens.shape == mask.shape == (2, max(lengths))
+        assert (~mask).sum(dim=1).tolist() == lengths
+        assert (tokens[mask] == 0).all()
+
     def test_get_sketcher_returns_neural_when_available(self):
         """get_sketcher with use_neural=True should return neural model."""
         sketcher = get_sketcher(use_neural=True)
@@ -459,6 +583,31 @@ class TestTrainingUtilities:
         assert program is not None
         assert len(primitives) > 0
 
+    def test_synthetic_outputs_follow_program(self):
+        """Training outputs should be the program applied to the inputs."""
+        import random
+        from juris_agi.dsl.interpreter import run_on_grid
+        from juris_agi.train.train_critic import CriticTrainingConfig, generate_critic_sample
+        from juris_agi.train.train_sketcher import SketcherTrainingConfig, generate_synthetic_task
+
+        random.seed(0)
+        changed = 0
+        for _ in range(20):
+            task, program, _ = generate_synthetic_task(SketcherTrainingConfig(min_grid_size=4))
+            for pair in task.train:
+                assert pair.output == run_on_grid(program, pair.input)
+                changed += pair.output != pair.input
+        assert changed > 0
+
+        # A "negative" program that happens to be the correct one is caught
+        with patch("juris_agi.train.train_critic.generate_synthetic_task",
+                   return_value=(task, program, [])), \
+                patch("juris_agi.train.train_critic.mutate_program", return_value=program), \
+                patch("juris_agi.train.train_critic.generate_negative_program", return_value=program):
+            sample = generate_critic_sample(CriticTrainingConfig(negative_ratio=1.0))
+        assert not sample["is_positive"]
+        assert sample["plausibility"] == 0.7
+
     def test_generate_random_grid(self):
         """Random grid generation should work."""
         from juris_agi.train.train_sketcher import generate_random_grid
@@ -479,6 +628,59 @@ class TestTrainingUtilities:
         assert len(primitives) >= 1
         assert len(primitives) <= 3
 
+    def test_packed_samples_round_trip(self):
+        """Packed shards should decode to the generated tasks and programs."""
+        import random
+        from juris_agi.train.data_cache import PackedSamples, pack_samples
+        from juris_agi.train.train_sketcher import generate_sketcher_sample, SketcherTrainingConfig
+
+        random.seed(0)
+        samples = [generate_sketcher_sample(SketcherTrainingConfig()) for _ in range(20)]
+        packed = PackedSamples(pack_samples(samples))
+
+        assert len(packed) == 20
+        for i, sample in enumerate(samples):
+            assert str(packed.program(i)) == str(sample["program"])
+            assert packed.task(i).task_id == sample["task"].task_id
+            assert packed.task(i).train == sample["task"].train
+
+    def test_sharded_generation_independent_of_workers(self):
+        """Shard seeds should make the data independent of the worker count."""
+        from functools import partial
+        from juris_agi.train.data_cache import load_or_generate
+        from juris_agi.train.train_sketcher import generate_sketcher_sample, SketcherTrainingConfig
+
+        config = SketcherTrainingConfig()
+        generator = partial(generate_sketcher_sample, config)
+        serial = load_or_generate("sketcher", generator, 30, config.data_params(), seed=3, shard_size=8)
+        parallel = load_or_generate("sketcher", generator, 30, config.data_params(), seed=3,
+                                    shard_size=8, workers=2)
+
+        assert len(serial) == len(parallel) == 30
+        for name, array in serial.arrays.items():
+            assert (array == parallel.arrays[name]).all()
+
+    def test_critic_dataset_cache(self, tmp_path):
+        """A second dataset with the same parameters should load from the cache."""
+        from functools import partial
+        from juris_agi.train.train_critic import CriticTrainingConfig, generate_critic_sample
+        from juris_agi.train.data_cache import load_or_generate
+
+        config = CriticTrainingConfig(data_cache_dir=str(tmp_path))
+        first = load_or_generate("critic", partial(generate_critic_sample, config), 12, config.data_params(),
+                                 seed=5, shard_size=5, cache_dir=config.data_cache_dir)
+        (cache,) = tmp_path.iterdir()
+        assert len(list(cache.glob("shard_*.npz"))) == 3
+
+        def fail():
+            raise AssertionError("cached samples should not be regenerated")
+
+        second = load_or_generate("critic", fail, 12, config.data_params(),
+                                  seed=5, shard_size=5, cache_dir=config.data_cache_dir)
+        for name, array in first.arrays.items():
+            assert (array == second.arrays[name]).all()
+        assert {"plausibility", "generalization", "confidence", "is_positive"} <= set(second.arrays)
+
 
 # =============================================================================
 # Integration Tests
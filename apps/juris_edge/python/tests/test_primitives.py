@@ -2,8 +2,10 @@
 
 import pytest
 import numpy as np
+from collections import deque
 
 from juris_agi.core.types import Grid, BoundingBox
+from juris_agi.representation import objects as objects_module
 from juris_agi.dsl.primitives import (
     PRIMITIVES,
     get_primitive,
@@ -15,6 +17,7 @@ from juris_agi.dsl.primitives import (
     prim_transpose,
     prim_crop_to_content,
     prim_paste,
+    prim_translate,
     prim_scale,
     prim_tile_h,
     prim_tile_v,
@@ -614,3 +617,111 @@ class TestAnalysisPrimitives:
             [4, 5, 6],
         ])
         assert prim_unique_colors(grid) == 6
+
+
+# ============================================================================
+# Conformance with the reference (per-pixel) implementations
+# ============================================================================
+
+def _reference_flood_fill(grid, row, col, fill_color):
+    """BFS flood fill over a visited set."""
+    if not (0 <= row < grid.height and 0 <= col < grid.width):
+        return grid.copy()
+    result = grid.copy()
+    target_color = int(grid[row, col])
+    if target_color == fill_color:
+        return result
+    visited = {(row, col)}
+    queue = deque([(row, col)])
+    while queue:
+        r, c = queue.popleft()
+        result[r, c] = fill_color
+        for dr, dc in [(-1, 0), (1, 0), (0, -1), (0, 1)]:
+            nr, nc = r + dr, c + dc
+            if (0 <= nr < grid.height and 0 <= nc < grid.width and
+                    (nr, nc) not in visited and int(grid[nr, nc]) == target_color):
+                visited.add((nr, nc))
+                queue.append((nr, nc))
+    return result
+
+
+def _reference_translate(grid, dr, dc, background=0):
+    """Per-pixel translate."""
+    result = Grid.full(grid.height, grid.width, background)
+    for r in range(grid.height):
+        for c in range(grid.width):
+            nr, nc = r + dr, c + dc
+            if 0 <= nr < grid.height and 0 <= nc < grid.width:
+                result[nr, nc] = grid[r, c]
+    return result
+
+
+def _reference_paste(target, source, row, col):
+    """Per-pixel paste skipping background."""
+    result = target.copy()
+    for r in range(source.height):
+        for c in range(source.width):
+            tr, tc = row + r, col + c
+            if 0 <= tr < result.height and 0 <= tc < result.width:
+                if source[r, c] != 0:
+                    result[tr, tc] = source[r, c]
+    return result
+
+
+def _random_grid(rng, max_size=30, num_colors=4):
+    height, width = rng.integers(1, max_size + 1, 2)
+    return Grid(rng.integers(0, num_colors, (height, width)).astype(np.int32))
+
+
+class TestRegionPrimitiveConformance:
+    """Array-based region primitives must match the per-pixel versions."""
+
+    @pytest.mark.parametrize("use_scipy", [True, False])
+    def test_flood_fill_matches_bfs(self, monkeypatch, use_scipy):
+        """Flood fill should match BFS with both labelling backends."""
+        if use_scipy and not objects_module.HAS_SCIPY:
+            pytest.skip("scipy not installed")
+        monkeypatch.setattr(objects_module, "HAS_SCIPY", use_scipy)
+        rng = np.random.default_rng(0)
+        for _ in range(200):
+            grid = _random_grid(rng, num_colors=int(rng.integers(1, 4)))
+            row = int(rng.integers(-1, grid.height + 1))
+            col = int(rng.integers(-1, grid.width + 1))
+            color = int(rng.integers(0, 4))
+            assert prim_flood_fill(grid, row, col, color) == _reference_flood_fill(
+                grid, row, col, color
+            )
+
+    def test_flood_fill_winding_region(self):
+        """Flood fill follows a serpentine region end to end."""
+        data = np.zeros((9, 10), dtype=np.int32)
+        data[::2] = 1
+        data[1::4, -1] = 1
+        data[3::4, 0] = 1
+        grid = Grid(data)
+        assert prim_flood_fill(grid, 0, 0, 7) == _reference_flood_fill(grid, 0, 0, 7)
+        assert prim_count_color(prim_flood_fill(grid, 0, 0, 7), 7) == int(data.sum())
+
+    def test_translate_matches_reference(self):
+        """Translate should match the per-pixel version for any offset."""
+        rng = np.random.default_rng(1)
+        for _ in range(200):
+            grid = _random_grid(rng, max_size=12)
+            dr = int(rng.integers(-grid.height - 1, grid.height + 2))
+            dc = int(rng.integers(-grid.width - 1, grid.width + 2))
+            background = int(rng.integers(0, 3))
+            assert prim_translate(grid, dr, dc, background) == _reference_translate(
+                grid, dr, dc, background
+            )
+
+    def test_paste_matches_reference(self):
+        """Paste should match the per-pixel version, including clipping."""
+        rng = np.random.default_rng(2)
+        for _ in range(200):
+            target = _random_grid(rng, max_size=12)
+            source = _random_grid(rng, max_size=8)
+            row = int(rng.integers(-source.height - 1, target.height + 2))
+            col = int(rng.integers(-source.width - 1, target.width + 2))
+            assert prim_paste(target, source, row, col) == _reference_paste(
+                target, source, row, col
+            )
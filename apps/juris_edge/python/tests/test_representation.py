@@ -3,19 +3,23 @@
 import pytest
 import numpy as np
 
-from juris_agi.core.types import Grid, BoundingBox
+from juris_agi.core.types import Grid, BoundingBox, ARCTask, ARCPair
+from juris_agi.representation import objects as objects_module
 from juris_agi.representation.objects import (
     extract_connected_objects,
     extract_objects_by_color,
     find_bounding_box,
     extract_single_object,
+    label_components,
 )
 from juris_agi.representation.features import (
     compute_grid_features,
     compute_object_features,
     compute_comparative_features,
     shapes_match,
+    compute_task_features,
 )
+from juris_agi.representation.task_context import TaskFeatureCache, get_task_feature_cache
 
 
 class TestObjectExtraction:
@@ -119,6 +123,98 @@ class TestObjectExtraction:
         assert bbox.width == 3
 
 
+class TestComponentLabelling:
+    """Test array-based connected-component labelling."""
+
+    GRID = [
+        [1, 1, 0, 2],
+        [0, 1, 0, 2],
+        [3, 0, 4, 0],
+        [3, 0, 0, 5],
+    ]
+
+    def test_label_map_and_stats(self):
+        """Labels, bboxes, sizes and colors follow raster discovery order."""
+        labels = label_components(Grid.from_list(self.GRID), connectivity=4)
+
+        assert labels.count == 5
+        assert labels.labels.tolist() == [
+            [1, 1, 0, 2],
+            [0, 1, 0, 2],
+            [3, 0, 4, 0],
+            [3, 0, 0, 5],
+        ]
+        assert labels.sizes.tolist() == [3, 2, 2, 1, 1]
+        assert labels.colors.tolist() == [1, 2, 3, 4, 5]
+        assert labels.bboxes[0] == BoundingBox(0, 0, 1, 1)
+        assert labels.bboxes[1] == BoundingBox(0, 3, 1, 3)
+
+    def test_8_connectivity(self):
+        """Diagonal neighbors merge under 8-connectivity."""
+        grid = Grid.from_list([
+            [1, 0, 0],
+            [0, 1, 0],
+            [0, 0, 0],
+            [2, 0, 0],
+        ])
+        assert label_components(grid, connectivity=4).count == 3
+        labels = label_components(grid, connectivity=8)
+
+        assert labels.count == 2
+        assert labels.sizes.tolist() == [2, 1]
+        assert labels.bboxes[0] == BoundingBox(0, 0, 1, 1)
+        assert labels.labels[1, 1] == 1
+
+    def test_by_color(self):
+        """by_color only connects neighbors of the same color."""
+        grid = Grid.from_list([
+            [1, 2, 2],
+            [1, 1, 2],
+        ])
+        assert label_components(grid).count == 1
+        labels = label_components(grid, by_color=True)
+        assert labels.count == 2
+        assert labels.colors.tolist() == [1, 2]
+
+    @pytest.mark.parametrize("connectivity", [4, 8])
+    def test_union_find_matches_scipy(self, monkeypatch, connectivity):
+        """The NumPy fallback should label exactly like scipy."""
+        if not objects_module.HAS_SCIPY:
+            pytest.skip("scipy not installed")
+        rng = np.random.default_rng(0)
+        for _ in range(50):
+            data = rng.integers(0, 4, (rng.integers(1, 31), rng.integers(1, 31)))
+            grid = Grid(data.astype(np.int32))
+            expected = extract_connected_objects(grid, connectivity=connectivity)
+            expected_by_color = extract_objects_by_color(grid)
+            with monkeypatch.context() as patch:
+                patch.setattr(objects_module, "HAS_SCIPY", False)
+                assert extract_connected_objects(grid, connectivity=connectivity) == expected
+                assert extract_objects_by_color(grid) == expected_by_color
+
+    def test_long_winding_component(self):
+        """A serpentine path is a single component."""
+        data = np.zeros((29, 30), dtype=np.int32)
+        data[::2] = 1
+        data[1::4, -1] = 1
+        data[3::4, 0] = 1
+        objects = extract_connected_objects(Grid(data))
+
+        assert len(objects) == 1
+        assert len(objects[0].pixels) == int(data.sum())
+
+    def test_by_color_nonzero_background(self):
+        """With a non-zero background, color 0 pixels form no objects."""
+        grid = Grid.from_list([
+            [0, 5, 1],
+            [0, 5, 1],
+        ])
+        objects = extract_objects_by_color(grid, background_color=5)
+
+        assert len(objects) == 1
+        assert objects[0].primary_color == 1
+
+
 class TestGridFeatures:
     """Test grid feature computation."""
 
@@ -278,3 +374,112 @@ class TestShapeMatching:
         obj2 = extract_connected_objects(grid2)[0]
 
         assert not shapes_match(obj1, obj2)
+
+
+def _make_task(task_id: str = "ctx") -> ARCTask:
+    return ARCTask(
+        task_id=task_id,
+        train=[
+            ARCPair(Grid.from_list([[1, 0], [0, 1]]), Grid.from_list([[2, 0], [0, 2]])),
+            ARCPair(Grid.from_list([[3, 3], [0, 0]]), Grid.from_list([[2, 2], [0, 0]])),
+        ],
+        test=[ARCPair(Grid.from_list([[1, 1], [1, 0]]), Grid.from_list([[0]]))],
+    )
+
+
+class TestTaskFeatureContext:
+    """Test the shared per-task feature context."""
+
+    @pytest.fixture(autouse=True)
+    def clear_cache(self):
+        get_task_feature_cache().clear()
+        yield
+        get_task_feature_cache().enabled = True
+        get_task_feature_cache().clear()
+
+    def test_keyed_by_content(self):
+        """Tasks with the same grids should share a context."""
+        cache = TaskFeatureCache(maxsize=2)
+        first = cache.context(_make_task("a"))
+        assert cache.context(_make_task("b")) is first
+
+        other = _make_task("c")
+        other.train[0].output[0, 0] = 5
+        assert cache.context(other) is not first
+        assert cache.stats()["hits"] == 1
+
+    def test_consumers_share_features(self):
+        """Consumers should reuse each other's grid statistics and agree with uncached results."""
+        from juris_agi.controller.refusal import RefusalChecker
+        from juris_agi.controller.router import determine_regime
+        from juris_agi.mal.retrieval import InMemoryStore, extract_task_tags
+        from juris_agi.wme.world_model import HeuristicWorldModel
+
+        def run_all(task):
+            return (
+                compute_task_features(task).to_dict(),
+                extract_task_tags(task),
+                InMemoryStore()._extract_features(task),
+                HeuristicWorldModel().analyze_task(task).task_features,
+                RefusalChecker().estimate_difficulty(task),
+                determine_regime(task).to_dict(),
+            )
+
+        cache = get_task_feature_cache()
+        cache.enabled = False
+        uncached = run_all(_make_task())
+        cache.enabled = True
+
+        task = _make_task()
+        assert run_all(task) == uncached
+        assert run_all(task) == uncached
+
+        stats = cache.context(task).stats()
+        assert stats["by_feature"]["palette"] == {"hits": 20, "misses": 4}
+        assert stats["by_feature"]["regime"] == {"hits": 1, "misses": 1}
+
+    def test_results_are_copied(self):
+        """Modifying a returned result should not change the cached one."""
+        from juris_agi.mal.retrieval import extract_task_tags
+
+        task = _make_task()
+        extract_task_tags(task).append("bogus")
+        assert "bogus" not in extract_task_tags(task)
+
+        features = compute_task_features(task)
+        features.input_palette.add(9)
+        features.input_dims.clear()
+        features.input_bbox_stats["count"] = -1
+        fresh = compute_task_features(task)
+        assert 9 not in fresh.input_palette
+        assert fresh.input_dims
+        assert fresh.input_bbox_stats["count"] != -1
+
+    def test_solve_logs_its_own_lookups(self, monkeypatch):
+        """Each solve's trace should count only the lookups made during that solve."""
+        from juris_agi.controller import router
+
+        traces = []
+        start = router.SolveTrace.start
+
+        def record(task_id):
+            traces.append(start(task_id))
+            return traces[-1]
+
+        monkeypatch.setattr(router.SolveTrace, "start", record)
+        task = _make_task()
+        config = router.ControllerConfig(
+            max_synthesis_depth=1, max_synthesis_iterations=20,
+            enable_refinement=False, compute_robustness=False,
+        )
+        for _ in range(2):
+            router.MetaController(config).solve(task)
+
+        first, second = (
+            next(e.details for e in trace.entries if e.event_type == "feature_cache")
+            for trace in traces
+        )
+        total = get_task_feature_cache().context(task).stats()
+        assert first["hits"] + second["hits"] == total["hits"]
+        assert first["misses"] == total["misses"] > 0
+        assert second["misses"] == 0 < second["hits"]
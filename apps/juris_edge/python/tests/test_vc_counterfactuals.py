@@ -13,6 +13,7 @@ from juris_agi.vc import (
     # Counterfactuals
     PerturbationType,
     ClaimPerturbation,
+    ClaimOverlay,
     CounterfactualEvidenceGraph,
     EvidenceCounterfactualGenerator,
     generate_counterfactuals,
@@ -120,6 +121,16 @@ def simple_decision_fn():
     return decision_fn
 
 
+def support_ratio_decision(graph: EvidenceGraph) -> Tuple[DecisionOutcome, float]:
+    """Module-level (picklable) decision function for worker-pool tests."""
+    if not graph.claims:
+        return DecisionOutcome.DEFER, 0.5
+    support_ratio = len(graph.get_supportive_claims()) / len(graph.claims)
+    if support_ratio > 0.5:
+        return DecisionOutcome.INVEST, 0.8
+    return DecisionOutcome.PASS, 0.6
+
+
 # =============================================================================
 # Counterfactual Generation Tests
 # =============================================================================
@@ -199,6 +210,23 @@ class TestCounterfactualGeneration:
         assert cf.perturbations[0].perturbation_type == PerturbationType.CLAIM_REMOVAL
         assert len(cf.modified_graph.claims) == original_count - 1
 
+    def test_counterfactual_graphs_are_editable(self, sample_graph):
+        """Returned graphs should hold real claim lists that can be edited."""
+        generator = EvidenceCounterfactualGenerator(seed=42)
+        changed = generator._create_confidence_change(sample_graph, 0, 0.3).modified_graph
+        removed = generator._create_claim_removal(sample_graph, 0).modified_graph
+        original = list(sample_graph.claims)
+
+        changed.add_claim(sample_graph.claims[1])
+        removed.claims.remove(removed.claims[0])
+
+        assert isinstance(changed.claims, list)
+        assert len(changed.claims) == len(original) + 1
+        assert len(removed.claims) == len(original) - 2
+        assert sample_graph.claims == original
+        for cf in generate_counterfactuals(sample_graph, num_counterfactuals=5, seed=42):
+            assert isinstance(cf.modified_graph.claims, list)
+
     def test_perturbation_summary(self, sample_graph):
         """Test perturbation summary generation."""
         counterfactuals = generate_counterfactuals(sample_graph, num_counterfactuals=3, seed=42)
@@ -231,6 +259,129 @@ class TestCounterfactualGeneration:
             assert cf.num_perturbations > 0
 
 
+class TestGuidedMinimalFlip:
+    """Tests for the rule-guided minimal flip search."""
+
+    @staticmethod
+    def _rule_decision_fn(rules):
+        from juris_agi.vc_dsl import Decision, EvalContext, FieldValue, RuleEngine
+
+        engine = RuleEngine(rules, default_decision=Decision.DEFER)
+
+        def decision_fn(graph: EvidenceGraph) -> Decision:
+            fields = {
+                f"{c.claim_type.value}.{c.field}": FieldValue(
+                    value=c.value, confidence=c.confidence
+                )
+                for c in graph.claims
+            }
+            return engine.evaluate(EvalContext(fields=fields)).final_decision
+
+        return decision_fn
+
+    def test_single_threshold_flip(self, sample_graph):
+        """Finds the smallest threshold crossing on a referenced field."""
+        from juris_agi.vc_dsl import Decision, Ge, Le, Rule
+
+        rules = [
+            Rule("high_mrr", "High MRR", Ge("traction.mrr", 120000), Decision.INVEST),
+            Rule("low_mrr", "Low MRR", Le("traction.mrr", 50000), Decision.PASS),
+        ]
+        generator = EvidenceCounterfactualGenerator(seed=42)
+
+        cf = generator.generate_minimal_flip(
+            sample_graph, self._rule_decision_fn(rules), rules=rules
+        )
+
+        assert cf is not None
+        assert cf.num_perturbations == 1
+        p = cf.perturbations[0]
+        assert p.perturbation_type == PerturbationType.VALUE_CHANGE
+        assert p.claim_index == 0
+        assert p.new_value == 120000
+        assert cf.total_perturbation_magnitude == pytest.approx(0.2)
+        # Only the referenced claim is searched
+        assert generator.flip_search_stats["evaluations"] <= 3
+
+    def test_multi_claim_flip_is_minimal(self, sample_graph):
+        """Conjunctive rules need a joint perturbation of both fields."""
+        from juris_agi.vc_dsl import And, Decision, Ge, Rule
+
+        rules = [
+            Rule(
+                "scale", "Scale",
+                And([Ge("traction.mrr", 120000), Ge("market_scope.tam", 20000000000)]),
+                Decision.INVEST,
+            ),
+        ]
+        generator = EvidenceCounterfactualGenerator(seed=42)
+
+        cf = generator.generate_minimal_flip(
+            sample_graph, self._rule_decision_fn(rules), rules=rules
+        )
+
+        assert cf is not None
+        assert {p.claim_index for p in cf.perturbations} == {0, 2}
+        assert cf.total_perturbation_magnitude == pytest.approx(1.2)
+        assert cf.modified_graph.claims[0].value == 120000
+        assert sample_graph.claims[0].value == 100000
+
+    def test_confidence_gate_flip(self, sample_graph):
+        """conf_ge gates produce confidence perturbations just below the gate."""
+        from juris_agi.vc_dsl import And, ConfGe, Decision, Ge, Rule
+
+        rules = [
+            Rule(
+                "trusted_mrr", "Trusted MRR",
+                And([ConfGe("traction.mrr", 0.85), Ge("traction.mrr", 50000)]),
+                Decision.INVEST,
+            ),
+        ]
+        generator = EvidenceCounterfactualGenerator(seed=42)
+
+        cf = generator.generate_minimal_flip(
+            sample_graph, self._rule_decision_fn(rules), rules=rules
+        )
+
+        assert cf is not None
+        p = cf.perturbations[0]
+        assert p.perturbation_type == PerturbationType.CONFIDENCE_CHANGE
+        assert p.new_value == pytest.approx(0.84)
+
+    def test_shared_thresholds_evaluated_once(self, sample_graph):
+        """Rules repeating a threshold or gate add no duplicate candidates."""
+        from juris_agi.vc_dsl import And, ConfGe, Decision, Ge, Rule
+
+        gate = And([ConfGe("traction.mrr", 0.85), Ge("traction.mrr", 500000)])
+        once = [Rule("a", "A", gate, Decision.INVEST)]
+        twice = once + [Rule("b", "B", gate, Decision.INVEST)]
+
+        stats = []
+        for rules in (once, twice):
+            generator = EvidenceCounterfactualGenerator(seed=42)
+            generator.generate_minimal_flip(
+                sample_graph, self._rule_decision_fn(rules), rules=rules
+            )
+            stats.append(generator.flip_search_stats)
+
+        assert stats[0]["candidates"] == stats[1]["candidates"]
+        assert stats[0]["evaluations"] == stats[1]["evaluations"]
+
+    def test_no_flip_when_rules_unreachable(self, sample_graph):
+        """Returns None when no referenced claim exists."""
+        from juris_agi.vc_dsl import Decision, Ge, Rule
+
+        rules = [Rule("arr", "ARR", Ge("traction.arr", 1), Decision.INVEST)]
+        generator = EvidenceCounterfactualGenerator(seed=42)
+
+        cf = generator.generate_minimal_flip(
+            sample_graph, self._rule_decision_fn(rules), rules=rules
+        )
+
+        assert cf is None
+        assert generator.flip_search_stats["evaluations"] == 0
+
+
 # =============================================================================
 # Decision Analysis Tests
 # =============================================================================
@@ -310,6 +461,79 @@ class TestDecisionAnalysis:
                 assert 0 <= score <= 1
 
 
+class TestBatchedDecisionAnalysis:
+    """Tests for batched counterfactual evaluation."""
+
+    def test_claim_overlay_shares_unchanged_claims(self, sample_graph):
+        """Overlay views share the base claims and apply overrides."""
+        generator = EvidenceCounterfactualGenerator(seed=42)
+        cf = generator._create_confidence_change(sample_graph, 2, 0.3, view=True)
+
+        claims = cf.modified_graph.claims
+        assert isinstance(claims, ClaimOverlay)
+        assert claims[0] is sample_graph.claims[0]
+        assert claims[2].confidence == pytest.approx(0.3)
+        assert sample_graph.claims[2].confidence == pytest.approx(0.7)
+
+    def test_claim_overlay_removal_indexing(self, sample_graph):
+        """Removal views skip the removed claim in indexing and iteration."""
+        overlay = ClaimOverlay(sample_graph.claims, removed=(1,))
+        expected = [c for i, c in enumerate(sample_graph.claims) if i != 1]
+
+        assert len(overlay) == len(expected)
+        assert list(overlay) == expected
+        assert [overlay[i] for i in range(len(overlay))] == expected
+        assert overlay[-1] is expected[-1]
+        assert overlay == expected
+
+    def test_chained_overlays_flatten(self, sample_graph):
+        """Chained perturbations compose onto the original claim list."""
+        generator = EvidenceCounterfactualGenerator(seed=42)
+        first = generator._create_confidence_change(sample_graph, 0, 0.3, view=True)
+        second = generator._create_confidence_change(first.modified_graph, 1, 0.4, view=True)
+
+        claims = second.modified_graph.claims
+        assert claims[0].confidence == pytest.approx(0.3)
+        assert claims[1].confidence == pytest.approx(0.4)
+        assert claims[2] is sample_graph.claims[2]
+
+    def test_batch_fn_matches_serial(self, sample_graph, simple_decision_fn):
+        """Batched evaluation gives the same analysis as per-graph calls."""
+        batch_sizes = []
+
+        def batch_fn(graphs):
+            batch_sizes.append(len(graphs))
+            return [simple_decision_fn(g) for g in graphs]
+
+        serial = analyze_decision(sample_graph, simple_decision_fn, seed=42)
+        batched = analyze_decision(
+            sample_graph, simple_decision_fn, seed=42, decision_fn_batch=batch_fn
+        )
+
+        assert batched.to_dict() == serial.to_dict()
+        # One batch each for criticality, robustness and explanations
+        assert len(batch_sizes) <= 3
+        assert batch_sizes[0] > len(sample_graph.claims)
+
+    def test_worker_pool_matches_serial(self, sample_graph):
+        """Fanning out across worker processes preserves results."""
+        serial = DecisionAnalyzer(support_ratio_decision, seed=7).analyze(sample_graph)
+        analyzer = DecisionAnalyzer(
+            support_ratio_decision, seed=7, max_workers=2, min_parallel_batch=1
+        )
+        parallel = analyzer.analyze(sample_graph)
+
+        assert parallel.to_dict() == serial.to_dict()
+        assert analyzer.decisions_evaluated > 0
+
+    def test_unpicklable_decision_fn_falls_back(self, sample_graph, simple_decision_fn):
+        """Local decision functions are evaluated in-process."""
+        analyzer = DecisionAnalyzer(simple_decision_fn, seed=42, max_workers=2)
+        result = analyzer.analyze(sample_graph)
+
+        assert result.robustness.perturbations_tested > 0
+
+
 # =============================================================================
 # Trace Tests
 # =============================================================================
@@ -14,6 +14,10 @@ from typing import List, Dict, Any
 
 from juris_agi.core.types import Grid, ARCTask, ARCPair
 from juris_agi.dsl.ast import PrimitiveNode, ComposeNode, LiteralNode
+from juris_agi.wme.counterfactuals import (
+    GridPerturbationGenerator,
+    StructuralCounterfactualGenerator,
+)
 from juris_agi.wme import (
     # Priors
     ProposedPriors,
@@ -29,6 +33,7 @@ from juris_agi.wme import (
     InvariantPreservingGenerator,
     generate_counterfactuals,
     # Robustness
+    RobustnessChecker,
     CounterfactualRobustnessResult,
     robustness_check,
     quick_robustness_check,
@@ -495,6 +500,103 @@ class TestQuickRobustnessCheck:
         assert score > 0.5
 
 
+class TestRobustnessChecker:
+    """Tests for RobustnessChecker suites, deduplication and early exit."""
+
+    @staticmethod
+    def make_checker(**kwargs) -> RobustnessChecker:
+        return RobustnessChecker(
+            generators=[GridPerturbationGenerator(seed=0), StructuralCounterfactualGenerator(seed=0)],
+            **kwargs,
+        )
+
+    @staticmethod
+    def make_task(simple_grid, larger_grid) -> ARCTask:
+        return ARCTask(
+            task_id="robustness",
+            train=[
+                ARCPair(input=simple_grid, output=simple_grid),
+                ARCPair(input=larger_grid, output=larger_grid),
+            ],
+            test=[],
+        )
+
+    def test_identical_counterfactuals_run_once(self, simple_grid, larger_grid, monkeypatch):
+        """The program runs once per distinct counterfactual grid."""
+        checker = self.make_checker(num_tests_per_generator=20)
+        runs = []
+        run = checker._run
+        monkeypatch.setattr(checker, "_run", lambda fn, grid: runs.append(grid) or run(fn, grid))
+        task = self.make_task(simple_grid, larger_grid)
+
+        suite = checker.generate_suite(task)
+        result = checker.check_robustness(PrimitiveNode("identity"), task, suite)
+
+        assert result.num_tests == len(suite.entries)
+        assert len(runs) == suite.num_unique_inputs < len(suite.entries)
+
+    def test_suite_shared_between_programs(self, simple_grid, larger_grid):
+        """check_programs tests every program on the same counterfactuals."""
+        checker = self.make_checker()
+        task = self.make_task(simple_grid, larger_grid)
+        programs = [PrimitiveNode("no_such_primitive"), PrimitiveNode("identity"), PrimitiveNode("reflect_h")]
+
+        results = checker.check_programs(programs, task)
+
+        assert results[0].num_errors == results[0].num_tests > 0
+        assert results[1].num_tests == results[2].num_tests > 0
+        inputs = [[r.counterfactual.modified for r in res.test_results] for res in results[1:]]
+        assert inputs[0] == inputs[1]
+
+    def test_generator_timing(self, simple_grid, larger_grid):
+        """Results report timing and test counts per generator."""
+        result = self.make_checker().check_robustness(
+            PrimitiveNode("identity"), self.make_task(simple_grid, larger_grid)
+        )
+
+        timing = result.generator_timing
+        assert set(timing) == {"GridPerturbationGenerator", "StructuralCounterfactualGenerator"}
+        assert sum(t["tests"] for t in timing.values()) == result.num_tests
+        assert all(t["generate_ms"] >= 0.0 and t["test_ms"] >= 0.0 for t in timing.values())
+
+    def test_exact_early_exit(self, simple_grid, larger_grid):
+        """Testing stops once the remaining tests cannot change the verdict."""
+        task = self.make_task(simple_grid, larger_grid)
+        full = self.make_checker().check_robustness(PrimitiveNode("identity"), task)
+
+        result = self.make_checker(pass_threshold=0.1).check_robustness(
+            PrimitiveNode("identity"), task
+        )
+
+        assert full.overall_score >= 0.1
+        assert result.analysis["verdict"] == "pass"
+        assert result.analysis["tests_skipped"] > 0
+        assert result.num_tests + result.analysis["tests_skipped"] == full.num_tests
+
+    def test_statistical_early_exit(self, simple_grid, larger_grid):
+        """A confidence below 1 settles clear verdicts sooner."""
+        task = self.make_task(simple_grid, larger_grid)
+        kwargs = {"num_tests_per_generator": 50, "pass_threshold": 0.2}
+        exact = self.make_checker(**kwargs).check_robustness(PrimitiveNode("identity"), task)
+        sequential = self.make_checker(confidence=0.9, **kwargs).check_robustness(
+            PrimitiveNode("identity"), task
+        )
+
+        assert sequential.analysis["verdict"] == exact.analysis["verdict"] == "pass"
+        assert sequential.num_tests <= exact.num_tests
+
+    def test_no_threshold_runs_everything(self, simple_grid, larger_grid):
+        """Without a pass threshold every counterfactual is tested."""
+        checker = self.make_checker()
+        task = self.make_task(simple_grid, larger_grid)
+        suite = checker.generate_suite(task)
+
+        result = checker.check_robustness(PrimitiveNode("identity"), task, suite)
+
+        assert result.num_tests == len(suite.entries)
+        assert "verdict" not in result.analysis
+
+
 # ============================================================================
 # Tests for Hard/Soft Veto Selection
 # ============================================================================
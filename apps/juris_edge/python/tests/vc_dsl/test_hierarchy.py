@@ -10,6 +10,7 @@ Tests cover:
 """
 
 import pytest
+from unittest.mock import patch
 
 from juris_agi.vc_dsl import (
     # Predicates
@@ -29,6 +30,7 @@ from juris_agi.vc_dsl import (
     HierarchicalLearningConfig,
     HierarchicalLearningEngine,
     learn_hierarchical_policy,
+    update_hierarchical_policy,
     evaluate_with_hierarchy,
     summarize_policy,
 )
@@ -725,6 +727,94 @@ class TestBiotechVsSaas:
         assert summary["global_policy"]["num_rules"] > 0
 
 
+class TestIncrementalUpdate:
+    """Tests for incremental hierarchical policy updates."""
+
+    @pytest.fixture
+    def config(self):
+        return HierarchicalLearningConfig(
+            partition_keys=[PartitionKey.SECTOR],
+            min_partition_size=5,
+            global_min_coverage=0.3,
+            global_min_accuracy=0.3,
+        )
+
+    def _saas_deal(self, deal_id, arr, decision):
+        return HistoricalDecision(
+            deal_id=deal_id,
+            decision=decision,
+            context=build_context_from_dict({
+                "deal.sector": "saas",
+                "deal.stage": "series_a",
+                "traction.arr": arr,
+            }),
+        )
+
+    def test_update_matches_full_global_stats(
+        self, mixed_sector_dataset, saas_invest_rules, biotech_invest_rules, config
+    ):
+        """Global stats after an update match a full relearn."""
+        base = DecisionDataset(decisions=list(mixed_sector_dataset.decisions))
+        policy = learn_hierarchical_policy(
+            base, [saas_invest_rules], biotech_invest_rules, config=config
+        )
+
+        new = [self._saas_deal("saas_new", 3_000_000, Decision.INVEST)]
+        full = DecisionDataset(decisions=base.decisions + new)
+        updated = update_hierarchical_policy(
+            policy, full, new, [saas_invest_rules], biotech_invest_rules, config=config
+        )
+        relearned = learn_hierarchical_policy(
+            full, [saas_invest_rules], biotech_invest_rules, config=config
+        )
+
+        assert updated is policy
+        assert updated.global_coverage_stats == relearned.global_coverage_stats
+        assert updated.global_mdl_score == pytest.approx(relearned.global_mdl_score)
+        assert set(updated.overrides) == set(relearned.overrides)
+
+    def test_update_only_touches_delta_partitions(
+        self, mixed_sector_dataset, saas_invest_rules, biotech_invest_rules, config
+    ):
+        """Overrides for partitions without new decisions are left alone."""
+        engine = HierarchicalLearningEngine(config=config)
+        policy = engine.learn_hierarchical_policy(
+            mixed_sector_dataset, [saas_invest_rules], biotech_invest_rules
+        )
+        biotech_override = policy.overrides.get("sector:biotech")
+
+        new = [self._saas_deal("saas_new", 2_500_000, Decision.INVEST)]
+        full = DecisionDataset(decisions=mixed_sector_dataset.decisions + new)
+        with patch.object(engine, "learn_override", wraps=engine.learn_override) as learn:
+            engine.update_hierarchical_policy(
+                policy, full, new, [saas_invest_rules], biotech_invest_rules
+            )
+
+        searched = [call.kwargs["partition"].name for call in learn.call_args_list]
+        assert "sector:biotech" not in searched
+        assert policy.overrides.get("sector:biotech") is biotech_override
+
+    def test_global_drift_triggers_relearn(
+        self, mixed_sector_dataset, saas_invest_rules, biotech_invest_rules, config
+    ):
+        """Contradicting decisions past the threshold relearn the policy."""
+        policy = learn_hierarchical_policy(
+            mixed_sector_dataset, [saas_invest_rules], biotech_invest_rules, config=config
+        )
+
+        new = [
+            self._saas_deal(f"contra_{i}", 5_000_000, Decision.PASS)
+            for i in range(10)
+        ]
+        full = DecisionDataset(decisions=mixed_sector_dataset.decisions + new)
+        updated = update_hierarchical_policy(
+            policy, full, new, [saas_invest_rules], biotech_invest_rules, config=config
+        )
+
+        assert updated is not policy
+        assert updated.global_coverage_stats.total_decisions == len(full)
+
+
 class TestHierarchyToDict:
     """Tests for serialization."""
 
@@ -11,6 +11,7 @@ Tests cover:
 
 import pytest
 from datetime import datetime
+from unittest.mock import patch
 
 from juris_agi.vc_dsl import (
     # Predicates
@@ -716,6 +717,102 @@ class TestMultiHypothesisEngine:
         assert "consensus" in result
 
 
+class TestIncrementalLearning:
+    """Tests for incremental updates with new decisions."""
+
+    def _split(self, dataset, n_new):
+        base = DecisionDataset(decisions=dataset.decisions[:-n_new])
+        return base, dataset.decisions[-n_new:]
+
+    def test_update_coverage_matches_full_score(self, simple_rules, inconsistent_dataset):
+        """Incremental coverage equals a full re-score over all decisions."""
+        scorer = MDLScorer()
+        base, delta = self._split(inconsistent_dataset, 6)
+
+        stats, exceptions, breakdown = scorer.score_coverage(simple_rules, base)
+        scorer.update_coverage(
+            simple_rules, DecisionDataset(decisions=delta), stats, exceptions, breakdown
+        )
+        full_stats, full_exceptions, full_breakdown = scorer.score_coverage(
+            simple_rules, inconsistent_dataset
+        )
+
+        assert stats == full_stats
+        assert [e.deal_id for e in exceptions] == [e.deal_id for e in full_exceptions]
+        assert breakdown.total_score == pytest.approx(full_breakdown.total_score)
+        assert breakdown.confidence_bonus == pytest.approx(full_breakdown.confidence_bonus)
+
+    def test_update_without_drift_skips_research(
+        self, coherent_dataset, simple_rules, growth_focused_rules
+    ):
+        """Consistent new decisions update stats in place without re-search."""
+        config = HypothesisSetConfig(min_coverage=0.3, min_accuracy=0.5)
+        engine = MultiHypothesisEngine(config=config)
+        base, delta = self._split(coherent_dataset, 2)
+
+        engine.learn_from_dataset(base, [simple_rules, growth_focused_rules])
+        best = engine.hypothesis_set.get_best()
+
+        hyp_set = engine.hypothesis_set
+        with patch.object(hyp_set, "add_hypothesis", wraps=hyp_set.add_hypothesis) as add:
+            engine.update_from_decisions(delta)
+
+        add.assert_not_called()
+        assert best.coverage_stats.total_decisions == len(coherent_dataset)
+        assert best in engine.hypothesis_set.hypotheses
+
+    def test_update_with_drift_researches_candidates(self, coherent_dataset, simple_rules):
+        """Contradicting decisions drop the hypothesis and re-search finds a replacement."""
+        config = HypothesisSetConfig(min_coverage=0.3, min_accuracy=0.9)
+        engine = MultiHypothesisEngine(config=config)
+        # Stalled growth covers no historical deal, so it is rejected at first
+        stalled_rules = [
+            Rule(
+                rule_id="stalled_growth",
+                name="Stalled Growth",
+                predicate=Le("traction.growth_rate", 5),
+                decision=Decision.PASS,
+                priority=5,
+            ),
+        ]
+        engine.learn_from_dataset(coherent_dataset, [simple_rules, stalled_rules])
+        assert len(engine.hypothesis_set.hypotheses) == 1
+        assert engine.hypothesis_set.contains_rules(simple_rules)
+
+        # High ARR deals with stalled growth that were passed on contradict
+        # the learned policy
+        contradicting = [
+            HistoricalDecision(
+                deal_id=f"contra_{i}",
+                decision=Decision.PASS,
+                context=build_context_from_dict({
+                    "traction.arr": 5_000_000,
+                    "traction.growth_rate": 0,
+                }),
+            )
+            for i in range(10)
+        ]
+        hyp_set = engine.update_from_decisions(contradicting)
+
+        assert not hyp_set.contains_rules(simple_rules)
+        assert len(hyp_set.hypotheses) == 1
+        assert hyp_set.contains_rules(stalled_rules)
+        replacement = hyp_set.hypotheses[0]
+        assert replacement.coverage_stats.total_decisions == len(coherent_dataset) + 10
+
+    def test_new_candidates_scored_against_full_history(self, coherent_dataset, simple_rules):
+        """Candidates supplied with an update are evaluated on all decisions."""
+        config = HypothesisSetConfig(min_coverage=0.3, min_accuracy=0.5)
+        engine = MultiHypothesisEngine(config=config)
+        base, delta = self._split(coherent_dataset, 3)
+        engine.learn_from_dataset(base, [])
+
+        hyp_set = engine.update_from_decisions(delta, candidate_rules=[simple_rules])
+
+        assert len(hyp_set.hypotheses) == 1
+        assert hyp_set.hypotheses[0].coverage_stats.total_decisions == len(coherent_dataset)
+
+
 # =============================================================================
 # Policy Hypothesis Tests
 # =============================================================================
@@ -14,7 +14,7 @@ from juris_agi.vc_dsl import (
     # Predicates
     Ge, Le, Has, And,
     # Evaluation
-    Decision, Rule, EvalContext, FieldValue,
+    Decision, Rule, RuleEngine, EvalContext, FieldValue,
     build_context_from_dict,
     # Hypothesis
     HistoricalDecision,
@@ -30,6 +30,8 @@ from juris_agi.vc_dsl import (
     UncertaintyReport,
     UncertaintyConfig,
     UncertaintyAnalyzer,
+    FieldSensitivity,
+    SensitivityEngine,
     analyze_uncertainty,
     should_request_more_info,
     get_top_information_requests,
@@ -755,6 +757,139 @@ class TestUncertaintyIntegration:
                 assert req.reason != ""
 
 
+class TestSensitivityEngine:
+    """Tests for memoized claim-removal sensitivity."""
+
+    @staticmethod
+    def _reference_sensitivity(context, rules, fields):
+        """Sensitivity computed by copying the context for each removal."""
+        engine = RuleEngine(rules)
+        original = engine.evaluate(context)
+        sensitive = []
+        max_sensitivity = 0.0
+        for field_name in fields:
+            modified = EvalContext(fields={
+                k: v for k, v in context.fields.items() if k != field_name
+            })
+            trace = engine.evaluate(modified)
+            if trace.final_decision != original.final_decision:
+                sensitive.append(field_name)
+                max_sensitivity = 1.0
+            elif trace.decision_confidence < original.decision_confidence - 0.1:
+                max_sensitivity = max(max_sensitivity, 0.5)
+        return original.final_decision, sensitive, max_sensitivity
+
+    def test_matches_context_copy(self, hypothesis_set_single, simple_rules):
+        """Masked evaluation agrees with removing the field from a copy."""
+        rules = simple_rules + [
+            Rule(
+                rule_id="runway",
+                name="Long Runway",
+                predicate=And([
+                    Ge("financial.runway_months", 18),
+                    Has("team.size"),
+                ]),
+                decision=Decision.INVEST,
+                priority=6,
+            ),
+        ]
+        ctx = build_context_from_dict({
+            "traction.arr": 2_000_000,
+            "financial.runway_months": 24,
+            "team.size": 12,
+        })
+        hyp = hypothesis_set_single.get_best()
+        hyp.rules = rules
+
+        sens = SensitivityEngine(ctx, sample_count=10).analyze_hypothesis(hyp)
+        decision, sensitive, max_sensitivity = self._reference_sensitivity(
+            ctx, rules, sens.fields_tested
+        )
+
+        assert isinstance(sens, FieldSensitivity)
+        assert set(sens.fields_tested) == {
+            "traction.arr", "financial.runway_months", "team.size",
+        }
+        assert sens.decision == decision
+        assert sens.sensitive_fields == sensitive
+        assert sens.max_sensitivity == max_sensitivity
+
+    def test_shared_predicates_evaluated_once(self, simple_rules):
+        """Policies sharing predicates reuse cached results."""
+        ctx = build_context_from_dict({"traction.arr": 50_000})
+        decisions = [
+            HistoricalDecision(
+                deal_id="d1",
+                decision=Decision.PASS,
+                context=build_context_from_dict({"traction.arr": 50_000}),
+            ),
+        ]
+        dataset = DecisionDataset(decisions=decisions)
+        hyp_set = HypothesisSet(config=HypothesisSetConfig(
+            min_coverage=0.0, min_accuracy=0.0, diversity_threshold=0.5,
+        ))
+        hyp_set.add_hypothesis(simple_rules, dataset, name="A")
+        hyp_set.add_hypothesis(simple_rules[1:], dataset, name="B")
+        assert len(hyp_set.get_all()) == 2
+
+        engine = SensitivityEngine(ctx)
+        results = engine.analyze(hyp_set.get_all())
+
+        assert [r.decision for r in results] == [Decision.PASS, Decision.PASS]
+        # Two predicates, each unmasked and with traction.arr masked
+        assert engine.evaluations == 4
+        assert engine.cache_hits > 0
+
+    def test_sampling_limits_fields(self):
+        """Only sample_count fields are masked when many are used."""
+        rules = [
+            Rule(
+                rule_id=f"r{i}",
+                name=f"Rule {i}",
+                predicate=Has(f"metric.m{i}"),
+                decision=Decision.INVEST,
+                priority=1,
+            )
+            for i in range(8)
+        ]
+        ctx = build_context_from_dict({f"metric.m{i}": i for i in range(8)})
+        hyp_set = HypothesisSet(config=HypothesisSetConfig(
+            min_coverage=0.0, min_accuracy=0.0,
+        ))
+        dataset = DecisionDataset(decisions=[
+            HistoricalDecision(deal_id="d1", decision=Decision.INVEST, context=ctx),
+        ])
+        hyp_set.add_hypothesis(rules, dataset)
+        hyp = hyp_set.get_best()
+
+        ranked = SensitivityEngine(ctx, sample_count=3).analyze_hypothesis(hyp)
+        sampled_a = SensitivityEngine(
+            ctx, sample_count=3, sampling="random", seed=7
+        ).analyze_hypothesis(hyp)
+        sampled_b = SensitivityEngine(
+            ctx, sample_count=3, sampling="random", seed=7
+        ).analyze_hypothesis(hyp)
+
+        assert ranked.fields_tested == ["metric.m0", "metric.m1", "metric.m2"]
+        assert len(sampled_a.fields_tested) == 3
+        assert sampled_a.fields_tested == sampled_b.fields_tested
+
+    def test_invalid_sampling_rejected(self):
+        """Unknown sampling modes raise."""
+        with pytest.raises(ValueError):
+            SensitivityEngine(EvalContext(), sampling="stratified")
+
+    def test_epistemic_reports_all_policies(self, hypothesis_set_multiple, high_confidence_context):
+        """Epistemic analysis reports sensitivity for every policy."""
+        analyzer = UncertaintyAnalyzer()
+        epistemic = analyzer.analyze_epistemic(high_confidence_context, hypothesis_set_multiple)
+
+        hyp_ids = [h.hypothesis_id for h in hypothesis_set_multiple.get_all()]
+        assert list(epistemic.policy_sensitivity) == hyp_ids
+        assert epistemic.max_sensitivity == epistemic.policy_sensitivity[hyp_ids[0]]
+        assert "policy_sensitivity" in epistemic.to_dict()
+
+
 class TestEdgeCases:
     """Edge case tests."""
 